@@ -0,0 +1,99 @@
+"""Benchmark canonical_hash against deepdiff's DeepHash.
+
+Hashes recorded desired states (JSON files, e.g. desired states downloaded
+from the early exit cache or the integrations' state bucket) or, if no files
+are given, a synthetic saas-file like desired state. Reports duration and
+peak memory of both hashers.
+
+Usage:
+    python dev/benchmarks/canonical_hash.py [desired-state.json ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from reconcile.utils.canonical_hash import (
+    CanonicalHasher,
+    canonical_hash,
+    deephash_hexdigest,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def synthetic_desired_state(saas_files: int = 2000) -> dict[str, Any]:
+    return {
+        "saas_files": [
+            {
+                "name": f"saas-{i}",
+                "app": {"name": f"app-{i % 100}", "parentApp": None},
+                "managedResourceTypes": ["Deployment", "Service", "ConfigMap"],
+                "parameters": {f"PARAM_{p}": f"value-{p}" for p in range(10)},
+                "resourceTemplates": [
+                    {
+                        "name": f"rt-{r}",
+                        "url": f"https://github.com/app-sre/repo-{i}",
+                        "path": "/openshift/template.yaml",
+                        "targets": [
+                            {
+                                "namespace": {
+                                    "name": f"ns-{t}",
+                                    "cluster": {"name": f"cluster-{t % 5}"},
+                                },
+                                "ref": "a" * 40,
+                                "parameters": {"REPLICAS": t},
+                                "upstream": None,
+                            }
+                            for t in range(5)
+                        ],
+                    }
+                    for r in range(3)
+                ],
+            }
+            for i in range(saas_files)
+        ]
+    }
+
+
+def measure(name: str, func: Callable[[], str]) -> None:
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    # separate run, tracemalloc slows down the hashing considerably
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<40} {duration:8.2f}s {peak / 1024 / 1024:10.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("desired_states", nargs="*", type=Path)
+    args = parser.parse_args()
+
+    states = {
+        str(path): json.loads(path.read_text()) for path in args.desired_states
+    } or {"synthetic": synthetic_desired_state()}
+
+    for name, state in states.items():
+        print(f"{name}:")
+        measure("DeepHash", lambda state=state: deephash_hexdigest(state))
+        measure("canonical_hash", lambda state=state: canonical_hash(state))
+        hasher = CanonicalHasher()
+        hasher.hexdigest(state)
+        measure(
+            "canonical_hash (cached subtrees)",
+            lambda state=state, hasher=hasher: hasher.hexdigest(state),
+        )
+
+
+if __name__ == "__main__":
+    main()
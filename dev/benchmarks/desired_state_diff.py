@@ -0,0 +1,126 @@
+"""Benchmark the Merkle desired state diff against deepdiff based extract_diffs.
+
+Compares two recorded desired states (JSON files, e.g. desired states of the
+early exit compare bundle and the MR bundle) or, if no files are given, a
+synthetic sharded desired state with a single changed shard. Reports the
+duration of the diff extractions and the detected shards.
+
+Usage:
+    python dev/benchmarks/desired_state_diff.py [previous.json current.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from reconcile.change_owners.diff import IDENTIFIER_FIELD_NAME, extract_diffs
+from reconcile.utils.canonical_hash import CanonicalHasher
+from reconcile.utils.runtime.desired_state_diff import (
+    extract_merkle_diffs,
+    find_changed_shards,
+)
+from reconcile.utils.runtime.integration import DesiredStateShardConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from reconcile.change_owners.diff import Diff
+
+
+def synthetic_desired_states(
+    shards: int = 500,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    previous = {
+        "state": {
+            f"resource-{i}": {
+                "shard": f"account-{i % shards}",
+                "spec": {
+                    "parameters": {f"PARAM_{p}": f"value-{p}" for p in range(20)},
+                    "targets": [
+                        {
+                            IDENTIFIER_FIELD_NAME: f"target-{t}",
+                            "namespace": f"ns-{t}",
+                            "ref": "a" * 40,
+                        }
+                        for t in range(10)
+                    ],
+                },
+            }
+            for i in range(shards * 10)
+        }
+    }
+    current = copy.deepcopy(previous)
+    current["state"]["resource-42"]["spec"]["targets"][3]["ref"] = "b" * 40
+    return previous, current
+
+
+def measure(
+    name: str,
+    func: Callable[[], Iterable[Diff]],
+    previous: dict[str, Any],
+    current: dict[str, Any],
+    sharding_config: DesiredStateShardConfig,
+) -> None:
+    start = time.perf_counter()
+    diffs = list(func())
+    duration = time.perf_counter() - start
+    shards = find_changed_shards(diffs, previous, current, sharding_config)
+    print(f"{name:<30} {duration:8.3f}s {len(diffs):6d} diffs  shards={shards}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("desired_states", nargs="*", type=Path)
+    parser.add_argument(
+        "--shard-path-selector",
+        action="append",
+        default=[],
+        help="shard path selector, defaults to state.*.shard",
+    )
+    args = parser.parse_args()
+
+    if args.desired_states:
+        previous, current = (json.loads(p.read_text()) for p in args.desired_states)
+    else:
+        previous, current = synthetic_desired_states()
+    sharding_config = DesiredStateShardConfig(
+        shard_arg_name="shard",
+        shard_path_selectors=set(args.shard_path_selector or ["state.*.shard"]),
+        sharded_run_review=lambda proposal: True,
+    )
+
+    measure(
+        "extract_diffs",
+        lambda: extract_diffs(previous, current),
+        previous,
+        current,
+        sharding_config,
+    )
+    measure(
+        "extract_merkle_diffs",
+        lambda: extract_merkle_diffs(previous, current),
+        previous,
+        current,
+        sharding_config,
+    )
+    # build_desired_state_diff compares the desired states by digest first
+    # and hands the hasher with all subtree digests to the diff extraction
+    hasher = CanonicalHasher()
+    hasher.digest(previous)
+    hasher.digest(current)
+    measure(
+        "extract_merkle_diffs (hashed)",
+        lambda: extract_merkle_diffs(previous, current, hasher=hasher),
+        previous,
+        current,
+        sharding_config,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""Benchmark OpenshiftResource canonicalization and sha256sum calculation.
+
+Compares the rule table based, copy-on-write OpenshiftResource.canonicalize
+(with memoized canonical JSON/sha256sum) with the previous implementation
+(full deepcopy and a chain of per kind branches) on mixed-kind objects and
+verifies both produce the same canonical bodies.
+
+Usage:
+    python dev/benchmarks/openshift_resource_canonicalize.py [--objects 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+from reconcile.external_resources.meta import SECRET_UPDATED_AT
+from reconcile.utils.openshift_resource import (
+    QONTRACT_ANNOTATIONS,
+    base64_encode_secret_field_value,
+)
+from reconcile.utils.openshift_resource import OpenshiftResource as OR
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def legacy_canonicalize(body: dict[str, Any]) -> dict[str, Any]:
+    """OpenshiftResource.canonicalize before the rule table (deepcopy + if chain)."""
+    body = copy.deepcopy(body)
+
+    # create annotations if not present
+    body["metadata"].setdefault("annotations", {})
+    if body["metadata"]["annotations"] is None:
+        body["metadata"]["annotations"] = {}
+    annotations = body["metadata"]["annotations"]
+
+    # remove openshift specific params
+    body["metadata"].pop("creationTimestamp", None)
+    body["metadata"].pop("resourceVersion", None)
+    body["metadata"].pop("generation", None)
+    body["metadata"].pop("selfLink", None)
+    body["metadata"].pop("uid", None)
+    body["metadata"].pop("namespace", None)
+    body["metadata"].pop("managedFields", None)
+    annotations.pop("kubectl.kubernetes.io/last-applied-configuration", None)
+
+    # remove status
+    body.pop("status", None)
+
+    # remove controller managed labels
+    labels = body["metadata"].get("labels", {})
+    for label in set(labels.keys()):
+        if OR.is_controller_managed_label(body["kind"], label):
+            labels.pop(label)
+
+    # Default fields for specific resource types
+    # ConfigMaps and Secrets are by default Opaque
+    if body["kind"] in {"ConfigMap", "Secret"} and body.get("type") == "Opaque":
+        body.pop("type")
+
+    if body["kind"] == "Secret":
+        string_data = body.pop("stringData", None)
+        if string_data:
+            body.setdefault("data", {})
+            for k, v in string_data.items():
+                v = base64_encode_secret_field_value(str(v))
+                body["data"][k] = v
+
+    if body["kind"] == "Deployment":
+        annotations.pop("deployment.kubernetes.io/revision", None)
+
+    if body["kind"] == "Route":
+        if body["spec"].get("wildcardPolicy") == "None":
+            body["spec"].pop("wildcardPolicy")
+        # remove tls-acme specific params from Route
+        if "kubernetes.io/tls-acme" in annotations:
+            annotations.pop("kubernetes.io/tls-acme-awaiting-authorization-owner", None)
+            annotations.pop(
+                "kubernetes.io/tls-acme-awaiting-authorization-at-url", None
+            )
+            if "tls" in body["spec"]:
+                tls = body["spec"]["tls"]
+                tls.pop("key", None)
+                tls.pop("certificate", None)
+        subdomain = body["spec"].get("subdomain", None)
+        if not subdomain:
+            body["spec"].pop("subdomain", None)
+
+    if body["kind"] == "ServiceAccount":
+        if "imagePullSecrets" in body:
+            # remove default pull secrets added by k8s
+            if imagepullsecrets := [
+                s
+                for s in body.pop("imagePullSecrets")
+                if "-dockercfg-" not in s["name"]
+            ]:
+                body["imagePullSecrets"] = imagepullsecrets
+        if "secrets" in body:
+            body.pop("secrets")
+
+    if body["kind"] == "Role":
+        for rule in body["rules"]:
+            if "resources" in rule:
+                rule["resources"].sort()
+
+            if "verbs" in rule:
+                rule["verbs"].sort()
+
+            if "attributeRestrictions" in rule and not rule["attributeRestrictions"]:
+                rule.pop("attributeRestrictions")
+
+    if body["kind"] == "OperatorGroup":
+        annotations.pop("olm.providedAPIs", None)
+
+    if body["kind"] == "RoleBinding":
+        if "groupNames" in body:
+            body.pop("groupNames")
+        if "userNames" in body:
+            body.pop("userNames")
+        if "roleRef" in body:
+            if "namespace" in body["roleRef"]:
+                body["roleRef"].pop("namespace")
+            if (
+                "apiGroup" in body["roleRef"]
+                and body["roleRef"]["apiGroup"] in body["apiVersion"]
+            ):
+                body["roleRef"].pop("apiGroup")
+            if "kind" in body["roleRef"]:
+                body["roleRef"].pop("kind")
+        for subject in body["subjects"]:
+            if "namespace" in subject:
+                subject.pop("namespace")
+            if "apiGroup" in subject and (
+                not subject["apiGroup"] or subject["apiGroup"] in body["apiVersion"]
+            ):
+                subject.pop("apiGroup")
+
+    if body["kind"] == "ClusterRoleBinding":
+        if "userNames" in body:
+            body.pop("userNames")
+        if "roleRef" in body:
+            if (
+                "apiGroup" in body["roleRef"]
+                and body["roleRef"]["apiGroup"] in body["apiVersion"]
+            ):
+                body["roleRef"].pop("apiGroup")
+            if "kind" in body["roleRef"]:
+                body["roleRef"].pop("kind")
+        if "groupNames" in body:
+            body.pop("groupNames")
+    if body["kind"] == "Service":
+        spec = body["spec"]
+        if spec.get("sessionAffinity") == "None":
+            spec.pop("sessionAffinity")
+        if spec.get("type") == "ClusterIP":
+            spec.pop("clusterIP", None)
+
+    # remove qontract specific params
+    for a in QONTRACT_ANNOTATIONS:
+        annotations.pop(a, None)
+
+    # Remove external resources annotation used for optimistic locking
+    annotations.pop(SECRET_UPDATED_AT, None)
+    return body
+
+
+def _metadata(i: int) -> dict[str, Any]:
+    return {
+        "name": f"resource-{i}",
+        "namespace": "app-sre",
+        "uid": f"uid-{i}",
+        "resourceVersion": str(i),
+        "creationTimestamp": "2026-01-01T00:00:00Z",
+        "labels": {"app": "test", "feature.open-cluster-management.io/x": "y"},
+        "annotations": {
+            "qontract.integration": "openshift-resources",
+            "qontract.sha256sum": "abc",
+            "kubectl.kubernetes.io/last-applied-configuration": "{}" * 200,
+        },
+        "managedFields": [{"manager": "kubectl", "fieldsV1": {"f:data": {}}}] * 5,
+    }
+
+
+def _containers() -> list[dict[str, Any]]:
+    return [
+        {
+            "name": f"container-{c}",
+            "image": "quay.io/app-sre/test:latest",
+            "env": [{"name": f"ENV_{e}", "value": str(e)} for e in range(20)],
+            "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}},
+        }
+        for c in range(2)
+    ]
+
+
+BUILDERS: dict[str, Callable[[int], dict[str, Any]]] = {
+    "ConfigMap": lambda i: {
+        "data": {f"key-{k}": "value" * 20 for k in range(10)},
+        "type": "Opaque",
+    },
+    "Secret": lambda i: {
+        "type": "Opaque",
+        "stringData": {f"key-{k}": f"value-{k}" for k in range(5)},
+    },
+    "Deployment": lambda i: {
+        "apiVersion": "apps/v1",
+        "spec": {
+            "replicas": 3,
+            "template": {"spec": {"containers": _containers()}},
+        },
+        "status": {"replicas": 3, "conditions": [{"type": "Available"}] * 3},
+    },
+    "Route": lambda i: {
+        "spec": {
+            "host": f"r{i}.example.com",
+            "wildcardPolicy": "None",
+            "tls": {"termination": "edge", "key": "k", "certificate": "c"},
+        }
+    },
+    "ServiceAccount": lambda i: {
+        "imagePullSecrets": [{"name": f"sa-{i}-dockercfg-abc"}, {"name": "pull"}],
+        "secrets": [{"name": f"sa-{i}-token"}],
+    },
+    "Role": lambda i: {
+        "apiVersion": "rbac.authorization.k8s.io/v1",
+        "rules": [
+            {"resources": ["pods", "configmaps"], "verbs": ["list", "get"]},
+            {"resources": ["secrets"], "verbs": ["get"], "attributeRestrictions": None},
+        ],
+    },
+    "RoleBinding": lambda i: {
+        "apiVersion": "rbac.authorization.k8s.io/v1",
+        "roleRef": {
+            "apiGroup": "rbac.authorization.k8s.io",
+            "kind": "Role",
+            "name": "r",
+            "namespace": "ns",
+        },
+        "subjects": [{"kind": "User", "name": "u", "namespace": "ns", "apiGroup": ""}],
+        "userNames": ["u"],
+    },
+    "Service": lambda i: {
+        "spec": {
+            "type": "ClusterIP",
+            "clusterIP": "10.0.0.1",
+            "sessionAffinity": "None",
+            "ports": [{"port": 8080}],
+        }
+    },
+    "ManagedCluster": lambda i: {"spec": {"hubAcceptsClient": True}},
+}
+
+
+def generate(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    rnd = random.Random(seed)
+    kinds = sorted(BUILDERS)
+    bodies = []
+    for i in range(count):
+        kind = rnd.choice(kinds)
+        body = {"apiVersion": "v1", "kind": kind, "metadata": _metadata(i)}
+        body |= BUILDERS[kind](i)
+        bodies.append(body)
+    return bodies
+
+
+def _legacy_sha256sum(body: dict[str, Any]) -> str:
+    """sha256sum before memoization: annotate() deep copies the body again."""
+    sha256sum = OR.calculate_sha256sum(OR.serialize(legacy_canonicalize(body)))
+    copy.deepcopy(body)
+    return sha256sum
+
+
+def _timeit(name: str, func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    print(f"{name:<45} {duration:8.2f}s")
+    return duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=100_000)
+    args = parser.parse_args()
+
+    bodies = generate(args.objects)
+    for body in bodies[:1000]:
+        assert OR.canonicalize(body) == legacy_canonicalize(body), body["kind"]
+
+    print(f"{args.objects} objects, {len(BUILDERS)} kinds")
+    legacy = _timeit(
+        "canonicalize (deepcopy + if chain)",
+        lambda: [legacy_canonicalize(b) for b in bodies],
+    )
+    new = _timeit(
+        "canonicalize (rule table + copy-on-write)",
+        lambda: [OR.canonicalize(b) for b in bodies],
+    )
+    print(f"{'speedup':<45} {legacy / new:8.2f}x")
+
+    # sha256sum is calculated for the comparison and again by annotate()
+    legacy = _timeit(
+        "sha256sum + annotate (previous)",
+        lambda: [(_legacy_sha256sum(b), _legacy_sha256sum(b)) for b in bodies],
+    )
+    resources = [OR(b, "bench", "0.0.1", validate_k8s_object=False) for b in bodies]
+    new = _timeit(
+        "sha256sum + annotate (memoized)",
+        lambda: [(r.sha256sum(), r.annotate().sha256sum()) for r in resources],
+    )
+    print(f"{'speedup':<45} {legacy / new:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
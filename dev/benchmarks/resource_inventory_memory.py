@@ -0,0 +1,144 @@
+"""Benchmark the memory usage of a ResourceInventory with and without compaction.
+
+Fills a ResourceInventory with synthetic current and desired Deployments,
+ConfigMaps and Secrets and reports the memory allocated by the inventory
+(measured with tracemalloc), the time to fill it and the time to diff all
+resources with the 3-way diff used by realize_data.
+
+Usage:
+    python dev/benchmarks/resource_inventory_memory.py [--objects 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any
+
+from qontract_utils.differ import diff_mappings
+
+from reconcile.utils.openshift_resource import OpenshiftResource, ResourceInventory
+from reconcile.utils.three_way_diff_strategy import three_way_diff_using_hash
+
+INTEGRATION = "benchmark"
+INTEGRATION_VERSION = "0.1.0"
+NAMESPACES = 200
+KINDS = ("Deployment", "ConfigMap", "Secret")
+
+
+def build_body(kind: str, name: str, i: int) -> dict[str, Any]:
+    metadata = {
+        "name": name,
+        "labels": {"app": f"app-{i % 100}", "component": "benchmark"},
+    }
+    if kind == "ConfigMap":
+        return {
+            "apiVersion": "v1",
+            "kind": kind,
+            "metadata": metadata,
+            "data": {f"key-{k}": f"value-{i}-{k}" * 4 for k in range(10)},
+        }
+    if kind == "Secret":
+        return {
+            "apiVersion": "v1",
+            "kind": kind,
+            "type": "Opaque",
+            "metadata": metadata,
+            "data": {f"key-{k}": "c2VjcmV0LXZhbHVl" * 4 for k in range(5)},
+        }
+    return {
+        "apiVersion": "apps/v1",
+        "kind": kind,
+        "metadata": metadata,
+        "spec": {
+            "replicas": 3,
+            "selector": {"matchLabels": {"app": f"app-{i % 100}"}},
+            "template": {
+                "metadata": {"labels": {"app": f"app-{i % 100}"}},
+                "spec": {
+                    "containers": [
+                        {
+                            "name": "app",
+                            "image": f"quay.io/app-sre/app-{i % 100}:{'a' * 7}",
+                            "env": [
+                                {"name": f"ENV_{e}", "value": f"value-{e}"}
+                                for e in range(10)
+                            ],
+                            "resources": {
+                                "limits": {"cpu": "1", "memory": "1Gi"},
+                                "requests": {"cpu": "100m", "memory": "512Mi"},
+                            },
+                        }
+                    ]
+                },
+            },
+        },
+    }
+
+
+def fill_inventory(objects: int, compact: bool) -> ResourceInventory:
+    ri = ResourceInventory(compact=compact)
+    # current and desired resources count as one object each
+    for i in range(objects // 2):
+        namespace = f"ns-{i % NAMESPACES}"
+        kind = KINDS[i % len(KINDS)]
+        name = f"resource-{i}"
+        ri.initialize_resource_type("cluster", namespace, kind)
+        desired = OpenshiftResource(
+            build_body(kind, name, i), INTEGRATION, INTEGRATION_VERSION
+        ).annotate()
+        current = OpenshiftResource(
+            desired.body, INTEGRATION, INTEGRATION_VERSION
+        ).annotate()
+        ri.add_desired_resource("cluster", namespace, desired)
+        ri.add_current("cluster", namespace, kind, name, current)
+    return ri
+
+
+def diff_inventory(ri: ResourceInventory) -> int:
+    changes = 0
+    for _, _, _, data in ri:
+        result = diff_mappings(
+            data["current"], data["desired"], equal=three_way_diff_using_hash
+        )
+        changes += len(result.add) + len(result.change) + len(result.delete)
+        ri.compact_resources(data)
+    return changes
+
+
+def measure(objects: int, compact: bool) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    ri = fill_inventory(objects, compact)
+    fill_duration = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    changes = diff_inventory(ri)
+    diff_duration = time.perf_counter() - start
+    _, diff_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mode = "compact" if compact else "default"
+    print(
+        f"{mode:<8} {size / 2**20:9.1f} MiB  diff peak {diff_peak / 2**20:9.1f} MiB  "
+        f"fill {fill_duration:7.2f}s  diff {diff_duration:7.2f}s  changes={changes}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=200_000)
+    args = parser.parse_args()
+
+    measure(args.objects, compact=False)
+    measure(args.objects, compact=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -317,7 +317,9 @@ class CacheBackend(ABC):
 
     @abstractmethod
     @contextmanager
-    def lock(self, key: str, timeout: float = 300) -> Generator[None]:
+    def lock(
+        self, key: str, timeout: float = 300, *, blocking: bool = True
+    ) -> Generator[None]:
         """Distributed lock context manager for thread-safe operations.
 
         Backend-specific implementation using native locking mechanisms:
@@ -332,6 +334,8 @@ class CacheBackend(ABC):
         Args:
             key: Cache key to lock (same key used for get/set)
             timeout: Lock timeout in seconds
+            blocking: Wait until the lock is released by its current holder.
+                If False, fail immediately if the lock is held.
 
         Yields:
             None (lock is acquired)
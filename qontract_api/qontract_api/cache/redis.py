@@ -119,7 +119,9 @@ class RedisCacheBackend(CacheBackend):
         return self._client
 
     @contextmanager
-    def lock(self, key: str, timeout: float = 300) -> Generator[None]:
+    def lock(
+        self, key: str, timeout: float = 300, *, blocking: bool = True
+    ) -> Generator[None]:
         """Distributed lock using Valkey's native lock (Lua scripts + watch-dog).
 
         Uses valkey.lock() which provides:
@@ -131,6 +133,7 @@ class RedisCacheBackend(CacheBackend):
         Args:
             key: Lock key
             timeout: Lock timeout in seconds
+            blocking: Wait for the lock, fail immediately if False
 
         Yields:
             None (lock is acquired)
@@ -139,7 +142,7 @@ class RedisCacheBackend(CacheBackend):
             RuntimeError: If lock could not be acquired
         """
         lock_key = f"{key}:lock"
-        lock = self.client.lock(lock_key, timeout=timeout, blocking=True)
+        lock = self.client.lock(lock_key, timeout=timeout, blocking=blocking)
 
         if not lock.acquire():
             msg = f"Could not acquire lock for {key}"
@@ -10,6 +10,7 @@ from pydantic_settings import (
     SettingsConfigDict,
     YamlConfigSettingsSource,
 )
+from qontract_utils.secret_reader.cache import SecretCacheSettings
 
 
 class Secret(BaseModel):
@@ -265,6 +266,11 @@ class GlitchtipSettings(BaseModel):
         description="Glitchtip organization/team users cache TTL in seconds (one hour)",
     )
 
+    current_state_max_concurrency: int = Field(
+        default=10,
+        description="Max concurrent Glitchtip API calls per instance while loading the current state",
+    )
+
 
 class KubernetesSettings(BaseModel):
     """Kubernetes namespace cache configuration."""
@@ -359,6 +365,10 @@ class VaultSettings(BaseModel):
         default=True,
         description="Auto-refresh Vault token in background thread",
     )
+    cache: SecretCacheSettings | None = Field(
+        None,
+        description="Encrypted on-disk cache for KV v2 secret versions",
+    )
 
 
 class SecretSettings(BaseModel):
@@ -517,6 +527,14 @@ class Settings(BaseSettings):
         default=None,
         description="Default timeout for blocking GET requests. None = non-blocking by default.",
     )
+    task_completion_notifications: bool = Field(
+        default=True,
+        description="Wake up blocking GET requests via Redis pub/sub when the task finished",
+    )
+    task_completion_fallback_poll_interval: float = Field(
+        default=5.0,
+        description="Seconds between task status checks of blocking GET requests while waiting for the completion notification",
+    )
 
     # Slack Configuration (nested)
     slack: SlackSettings = Field(
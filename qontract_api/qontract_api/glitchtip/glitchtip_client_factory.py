@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
-from qontract_utils.glitchtip_api import GlitchtipApi
+from qontract_utils.glitchtip_api import AsyncGlitchtipApi, GlitchtipApi
 
 from qontract_api.glitchtip.glitchtip_workspace_client import (
     GlitchtipWorkspaceClient,
@@ -57,6 +58,31 @@ class GlitchtipClientFactory:
             max_retries=max_retries,
         )
 
+    @staticmethod
+    def create_async_glitchtip_api(
+        host: str,
+        token: str,
+        read_timeout: int = 30,
+        max_retries: int = 3,
+    ) -> AsyncGlitchtipApi:
+        """Create an AsyncGlitchtipApi instance.
+
+        Args:
+            host: Glitchtip instance host URL
+            token: Glitchtip API token
+            read_timeout: HTTP read timeout in seconds
+            max_retries: Max HTTP retries
+
+        Returns:
+            AsyncGlitchtipApi instance
+        """
+        return AsyncGlitchtipApi(
+            host=host,
+            token=token,
+            timeout=read_timeout,
+            max_retries=max_retries,
+        )
+
     def create_workspace_client(
         self,
         instance_name: str,
@@ -92,4 +118,11 @@ class GlitchtipClientFactory:
             instance_name=instance_name,
             cache=self.cache,
             settings=self.settings,
+            async_glitchtip_api_factory=partial(
+                self.create_async_glitchtip_api,
+                host=host,
+                token=token,
+                read_timeout=read_timeout,
+                max_retries=max_retries,
+            ),
         )
@@ -4,10 +4,12 @@ This layer sits between the stateless GlitchtipApi and business logic, providing
 - Two-tier caching (memory + Redis) for Glitchtip data
 - Distributed locking for thread-safe cache updates
 - Write-through cache invalidation after mutations
+- Concurrent prefetch of the current state via AsyncGlitchtipApi
 """
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
@@ -22,7 +24,9 @@ from qontract_utils.glitchtip_api.models import (
 from qontract_api.logger import get_logger
 
 if TYPE_CHECKING:
-    from qontract_utils.glitchtip_api import GlitchtipApi
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from qontract_utils.glitchtip_api import AsyncGlitchtipApi, GlitchtipApi
 
     from qontract_api.cache.base import CacheBackend
     from qontract_api.config import Settings
@@ -75,6 +79,7 @@ class GlitchtipWorkspaceClient:
         instance_name: str,
         cache: CacheBackend,
         settings: Settings,
+        async_glitchtip_api_factory: Callable[[], AsyncGlitchtipApi] | None = None,
     ) -> None:
         """Initialize GlitchtipWorkspaceClient.
 
@@ -83,11 +88,14 @@ class GlitchtipWorkspaceClient:
             instance_name: Glitchtip instance name (for cache key namespacing)
             cache: Cache backend with two-tier caching (memory + Redis)
             settings: Application settings with Glitchtip config
+            async_glitchtip_api_factory: Creates an AsyncGlitchtipApi for
+                prefetch_current_state (prefetching is disabled if None)
         """
         self.glitchtip_api = glitchtip_api
         self.instance_name = instance_name
         self.cache = cache
         self.settings = settings
+        self.async_glitchtip_api_factory = async_glitchtip_api_factory
 
     # CACHE KEY HELPERS
     def _cache_key_organizations(self) -> str:
@@ -195,6 +203,101 @@ class GlitchtipWorkspaceClient:
             )
             return alerts
 
+    # CONCURRENT PREFETCH
+    def prefetch_current_state(self, org_names: Iterable[str]) -> None:
+        """Load the current state of organizations concurrently into the cache.
+
+        Fetches organizations, then users, teams, team users and projects of
+        all given (existing) organizations in parallel, with at most
+        settings.glitchtip.current_state_max_concurrency API calls in flight.
+        Already cached entries are not fetched again. The get_* methods serve
+        the prefetched data from the cache afterwards.
+
+        Args:
+            org_names: Names of the organizations to prefetch
+        """
+        if self.async_glitchtip_api_factory is None:
+            return
+        asyncio.run(
+            self._prefetch_current_state(
+                self.async_glitchtip_api_factory(), set(org_names)
+            )
+        )
+
+    async def _prefetch_current_state(
+        self, async_glitchtip_api: AsyncGlitchtipApi, org_names: set[str]
+    ) -> None:
+        semaphore = asyncio.Semaphore(
+            self.settings.glitchtip.current_state_max_concurrency
+        )
+
+        async def fetch[
+            T: CachedOrganizations | CachedProjects | CachedTeams | CachedUsers
+        ](
+            cache_key: str,
+            cls: type[T],
+            ttl: int,
+            call: Callable[[], Awaitable[list]],
+        ) -> T:
+            if cached := self.cache.get_obj(cache_key, cls):
+                return cached
+            async with semaphore:
+                items = cls(items=await call())
+            self.cache.set_obj(cache_key, items, ttl)
+            return items
+
+        ttls = self.settings.glitchtip
+        async with async_glitchtip_api as api:
+
+            async def prefetch_organization(org_slug: str) -> None:
+                _, teams, _ = await asyncio.gather(
+                    fetch(
+                        self._cache_key_org_users(org_slug),
+                        CachedUsers,
+                        ttls.users_cache_ttl,
+                        lambda: api.organization_users(org_slug),
+                    ),
+                    fetch(
+                        self._cache_key_teams(org_slug),
+                        CachedTeams,
+                        ttls.teams_cache_ttl,
+                        lambda: api.teams(org_slug),
+                    ),
+                    fetch(
+                        self._cache_key_projects(org_slug),
+                        CachedProjects,
+                        ttls.projects_cache_ttl,
+                        lambda: api.projects(org_slug),
+                    ),
+                )
+                await asyncio.gather(
+                    *(
+                        fetch(
+                            self._cache_key_team_users(org_slug, team.slug),
+                            CachedUsers,
+                            ttls.users_cache_ttl,
+                            lambda team_slug=team.slug: api.team_users(
+                                org_slug, team_slug
+                            ),
+                        )
+                        for team in teams.items
+                    )
+                )
+
+            organizations = await fetch(
+                self._cache_key_organizations(),
+                CachedOrganizations,
+                ttls.organizations_cache_ttl,
+                api.organizations,
+            )
+            await asyncio.gather(
+                *(
+                    prefetch_organization(org.slug)
+                    for org in organizations.items
+                    if org.name in org_names
+                )
+            )
+
     # WRITE-THROUGH METHODS (clear cache after mutation)
     def create_project_alert(
         self, org_slug: str, project_slug: str, alert: ProjectAlert
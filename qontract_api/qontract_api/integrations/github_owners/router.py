@@ -115,4 +115,5 @@ async def github_owners_task_status(
     return await wait_for_task_completion(
         get_task_status=lambda: get_celery_task_result(task_id, GithubOwnersTaskResult),
         timeout_seconds=timeout,
+        task_id=task_id,
     )
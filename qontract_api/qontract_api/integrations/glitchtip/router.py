@@ -108,4 +108,5 @@ async def glitchtip_reconcile_task_status(
     return await wait_for_task_completion(
         get_task_status=lambda: get_celery_task_result(task_id, GlitchtipTaskResult),
         timeout_seconds=timeout,
+        task_id=task_id,
     )
@@ -670,6 +670,7 @@ class GlitchtipService:
             try:
                 ignore_email = self.secret_manager.read(instance.automation_user_email)
                 glitchtip = self._create_glitchtip_client(instance)
+                glitchtip.prefetch_current_state(o.name for o in instance.organizations)
                 instance_actions = self._calculate_actions(
                     instance_name=instance.name,
                     glitchtip=glitchtip,
@@ -32,7 +32,7 @@ def generate_lock_key(_self: Task, instances: list[GIInstance], **_: Any) -> str
 
 
 @celery_app.task(bind=True, name="glitchtip.reconcile", acks_late=True)
-@deduplicated_task(lock_key_fn=generate_lock_key, timeout=600)
+@deduplicated_task(lock_key_fn=generate_lock_key, timeout=600, coalesce=True)
 def reconcile_glitchtip_task(
     self: Any,
     instances: list[GIInstance],
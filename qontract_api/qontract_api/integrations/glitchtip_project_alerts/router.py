@@ -117,4 +117,5 @@ async def glitchtip_project_alerts_task_status(
             task_id, GlitchtipProjectAlertsTaskResult
         ),
         timeout_seconds=timeout,
+        task_id=task_id,
     )
@@ -88,4 +88,5 @@ async def ocm_groups_task_status(
     return await wait_for_task_completion(
         get_task_status=lambda: get_celery_task_result(task_id, OcmGroupsTaskResult),
         timeout_seconds=timeout,
+        task_id=task_id,
     )
@@ -90,4 +90,5 @@ async def ocm_oidc_idp_task_status(
     return await wait_for_task_completion(
         get_task_status=lambda: get_celery_task_result(task_id, OcmOidcIdpTaskResult),
         timeout_seconds=timeout,
+        task_id=task_id,
     )
@@ -83,4 +83,5 @@ async def openshift_namespaces_reconcile_task_status(
             task_id, OpenShiftNamespacesTaskResult
         ),
         timeout_seconds=timeout,
+        task_id=task_id,
     )
@@ -118,4 +118,5 @@ async def slack_usergroups_task_status(
             task_id, SlackUsergroupsTaskResult
         ),
         timeout_seconds=timeout,
+        task_id=task_id,
     )
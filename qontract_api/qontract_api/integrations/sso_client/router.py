@@ -88,4 +88,5 @@ async def sso_client_task_status(
     return await wait_for_task_completion(
         get_task_status=lambda: get_celery_task_result(task_id, SsoClientTaskResult),
         timeout_seconds=timeout,
+        task_id=task_id,
     )
@@ -47,7 +47,7 @@ def generate_lock_key(
 
 
 @celery_app.task(bind=True, name="sso-client.reconcile", acks_late=True)
-@deduplicated_task(lock_key_fn=generate_lock_key, timeout=600)
+@deduplicated_task(lock_key_fn=generate_lock_key, timeout=600, coalesce=True)
 def reconcile_sso_client_task(
     self: Any,  # Celery Task instance (bind=True)
     ocm_environment: str,
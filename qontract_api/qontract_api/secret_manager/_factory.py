@@ -34,6 +34,7 @@ def get_secret_manager(cache: CacheBackend) -> SecretManager:
                             kube_auth_mount=provider.kube_auth_mount,
                             kube_sa_token_path=provider.kube_sa_token_path,
                             auto_refresh=provider.auto_refresh,
+                            cache=provider.cache,
                         ),
                         hooks=Hooks(retry_config=DEFAULT_RETRY_CONFIG),
                     )
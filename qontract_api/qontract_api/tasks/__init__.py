@@ -13,6 +13,7 @@ from qontract_api.config import settings
 from qontract_api.logger import get_logger, setup_logger, setup_logging
 from qontract_api.models import TaskResult
 from qontract_api.tasks._deduplication import deduplicated_task
+from qontract_api.tasks._notifications import publish_task_completion
 from qontract_api.tasks._utils import (
     BackgroundTask,
     get_celery_task_result,
@@ -128,6 +129,9 @@ def on_task_postrun(
 
         task_applied_actions_count.labels(name=task.name).inc(retval.applied_count)
 
+    if settings.task_completion_notifications:
+        publish_task_completion(task.request.id, state)
+
 
 # Create Celery app
 celery_app = Celery(
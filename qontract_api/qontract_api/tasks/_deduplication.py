@@ -6,23 +6,164 @@ task execution using distributed locking through the CacheBackend abstraction.
 Uses global cache instance (get_cache()) to avoid creating multiple connections.
 """
 
+from __future__ import annotations
+
+import base64
+import pickle  # ruff: ignore[suspicious-pickle-import] - same trust level as the Celery pickle serializer
 from collections.abc import Callable
 from functools import wraps
-from typing import ParamSpec, TypeVar, cast, get_type_hints
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast, get_type_hints
+
+from prometheus_client import Counter
 
 from qontract_api.cache.factory import get_cache
 from qontract_api.logger import get_logger
 from qontract_api.models import TaskResult, TaskStatus
 
+if TYPE_CHECKING:
+    from qontract_api.cache.base import CacheBackend
+
 logger = get_logger(__name__)
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Lock timeout for reading/writing a pending payload (short critical section)
+PENDING_LOCK_TIMEOUT = 10
+
+task_coalesced_count = Counter(
+    name="qontract_reconcile_worker_task_coalesced_total",
+    documentation="Total number of duplicate worker tasks coalesced into a running task.",
+    labelnames=["name"],
+)
+task_coalesced_rerun_count = Counter(
+    name="qontract_reconcile_worker_task_coalesced_reruns_total",
+    documentation="Total number of worker task re-runs with a coalesced payload.",
+    labelnames=["name"],
+)
+
+type _Payload = tuple[tuple[Any, ...], dict[str, Any]]
+
+
+def _push_pending(
+    cache: CacheBackend, pending_key: str, payload: _Payload, ttl: int
+) -> None:
+    """Store payload as the pending payload, replacing an older one.
+
+    The payload expires with the task lock, a payload of a crashed lock
+    holder is not run anymore.
+    """
+    data = base64.b64encode(pickle.dumps(payload)).decode()
+    with cache.lock(pending_key, timeout=PENDING_LOCK_TIMEOUT):
+        cache.set(pending_key, data, ttl=ttl)
+
+
+def _pop_pending(cache: CacheBackend, pending_key: str) -> _Payload | None:
+    """Remove and return the pending payload, if any."""
+    with cache.lock(pending_key, timeout=PENDING_LOCK_TIMEOUT):
+        data = cache.get(pending_key)
+        if data is None:
+            return None
+        cache.delete(pending_key)
+    return pickle.loads(base64.b64decode(data))  # ruff: ignore[suspicious-pickle-usage] - written by _push_pending
+
+
+def _run_payload(
+    func: Callable[..., Any],
+    cache: CacheBackend,
+    pending_key: str,
+    payload: _Payload | None,
+) -> tuple[bool, Any]:
+    """Run payload, or the pending payload if None. The task lock must be held."""
+    if payload is None:
+        if (payload := _pop_pending(cache, pending_key)) is None:
+            return False, None
+        task_coalesced_rerun_count.labels(name=func.__name__).inc()
+    else:
+        # the own payload is newer than a pending one
+        cache.delete(pending_key)
+    args, kwargs = payload
+    return True, func(*args, **kwargs)
+
+
+def _run_locked(
+    func: Callable[..., Any],
+    lock_key: str,
+    pending_key: str,
+    timeout: int,
+    payload: _Payload | None,
+) -> tuple[bool, Any]:
+    """Run payload, or the pending payload if None, while holding the task lock.
+
+    Every run acquires the task lock again, so the lock timeout applies to
+    a single run.
+
+    Args:
+        func: Task function
+        lock_key: Task lock key
+        pending_key: Key of the pending payload
+        timeout: Task lock timeout in seconds
+        payload: Own (args, kwargs) to run, None to run the pending payload
+
+    Returns:
+        Tuple of (ran, result). ran is False if the lock is held by another
+        worker or nothing was pending.
+    """
+    cache = get_cache()
+    acquired = False
+    try:
+        with cache.lock(lock_key, timeout=timeout, blocking=False):
+            acquired = True
+            return _run_payload(func, cache, pending_key, payload)
+    except RuntimeError:
+        if acquired:
+            raise
+        return False, None
+
+
+def _run_coalesced(
+    func: Callable[..., Any],
+    lock_key: str,
+    pending_key: str,
+    timeout: int,
+    payload: _Payload,
+) -> tuple[bool, Any]:
+    """Run payload, then re-run with the newest pending payload while there is one.
+
+    Pending payloads are stored by duplicates arriving while the lock is held.
+    Every re-run runs the newest of them, so a burst of duplicates results in
+    a single re-run.
+
+    Args:
+        func: Task function
+        lock_key: Task lock key
+        pending_key: Key of the pending payload
+        timeout: Task lock timeout in seconds
+        payload: Own (args, kwargs) to run first
+
+    Returns:
+        Tuple of (ran, result of the last run). ran is False if the lock is
+        held by another worker.
+    """
+    ran, result = _run_locked(func, lock_key, pending_key, timeout, payload)
+    if not ran:
+        return False, None
+    # duplicates arrived during the run and handed over their payload. A
+    # duplicate storing its payload after this check runs it itself.
+    while get_cache().exists(pending_key):
+        reran, rerun_result = _run_locked(func, lock_key, pending_key, timeout, None)
+        if not reran:
+            # another worker holds the lock and takes care of the payload
+            break
+        result = rerun_result
+    return True, result
+
 
 def deduplicated_task(
     lock_key_fn: Callable[..., str],
     timeout: int = 600,
+    *,
+    coalesce: bool = False,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """Decorator for task deduplication using distributed locks via CacheBackend.
 
@@ -36,11 +177,20 @@ def deduplicated_task(
     only applies to production (`dry_run=False`) runs, where concurrent
     writes to the same resource must be prevented.
 
+    With `coalesce=True` a duplicate does not wait for the lock. It stores
+    its arguments as the pending payload of the lock key and returns a
+    SKIPPED result without errors immediately. When the running task
+    finishes, it re-runs itself with the newest pending payload until none
+    is left. A burst of N requests arriving during a run results in at most
+    two executions.
+
     Args:
         lock_key_fn: Function to generate lock key from task arguments.
                     Example: `lambda workspace, **kw: workspace`
         timeout: Lock timeout in seconds (default: 600 = 10 minutes).
                 TTL ensures lock is released even if task crashes.
+        coalesce: Coalesce duplicates into the running task instead of
+                waiting for the lock (default: False).
 
     Returns:
         Decorated function that skips execution if lock cannot be acquired
@@ -54,6 +204,7 @@ def deduplicated_task(
 
     Usage Notes:
         - Lock key is: task_lock:{function_name}:{lock_key}
+        - Pending payload key (coalesce=True) is: task_pending:{function_name}:{lock_key}
         - Non-blocking: Returns the function's own result type with SKIPPED status if duplicate detected
         - Lock is automatically released when function returns
         - Uses global cache (get_cache()) - shared across all tasks in worker
@@ -96,6 +247,9 @@ def deduplicated_task(
                 timeout=timeout,
             )
 
+            if coalesce:
+                return run_coalesced(lock_key, lock_key_suffix, args, kwargs)
+
             # Try to acquire lock (non-blocking via exception handling)
             cache = get_cache()
             try:
@@ -132,6 +286,37 @@ def deduplicated_task(
                     ),
                 )
 
+        def run_coalesced(
+            lock_key: str,
+            lock_key_suffix: str,
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+        ) -> R:
+            pending_key = (
+                f"task_pending:{func.__name__}:dry_run=false:{lock_key_suffix}"
+            )
+            ran, result = _run_coalesced(
+                func, lock_key, pending_key, timeout, (args, kwargs)
+            )
+            if ran:
+                return cast("R", result)
+
+            # Task is running - hand over the payload to the lock holder
+            _push_pending(get_cache(), pending_key, (args, kwargs), timeout)
+            task_coalesced_count.labels(name=func.__name__).inc()
+            logger.info(
+                f"Task {func.__name__} already running, coalescing duplicate",
+                lock_key=lock_key,
+                lock_key_suffix=lock_key_suffix,
+            )
+
+            # The lock holder may have finished in the meantime
+            ran, result = _run_locked(func, lock_key, pending_key, timeout, None)
+            if ran:
+                return cast("R", result)
+            # The payload is applied by the lock holder, this is no error
+            return cast("R", skip_result_cls(status=TaskStatus.SKIPPED))
+
         return wrapper
 
     return decorator
@@ -0,0 +1,78 @@
+"""Task completion notifications via Redis/Valkey pub/sub.
+
+Workers publish a message on a per-task channel when a task finishes
+(task_postrun signal). Blocking GET endpoints subscribe to that channel
+while waiting, so they are woken up as soon as the result is available
+instead of polling the result backend on a fixed interval.
+
+Notifications are best effort - waiters still poll on a longer fallback
+interval to cover lost messages (e.g. worker crashes, Redis hiccups).
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+from qontract_api.cache.factory import get_cache
+from qontract_api.config import settings
+from qontract_api.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+logger = get_logger(__name__)
+
+
+def task_completion_channel(task_id: str) -> str:
+    """Pub/sub channel notified when the task with task_id finished."""
+    return f"task_done:{task_id}"
+
+
+def publish_task_completion(task_id: str, state: str) -> None:
+    """Notify waiters that a task finished (called in the worker).
+
+    Args:
+        task_id: Celery task ID
+        state: Final Celery task state
+    """
+    try:
+        get_cache().client.publish(task_completion_channel(task_id), state)
+    except (RedisError, OSError, NotImplementedError) as e:
+        logger.warning(
+            f"Could not publish completion of task {task_id}: {e}", task_id=task_id
+        )
+
+
+@asynccontextmanager
+async def task_completion_listener(
+    task_id: str,
+) -> AsyncIterator[Callable[[float], Awaitable[bool]]]:
+    """Subscribe to the completion channel of a task.
+
+    Subscribe before checking the task status for the first time, otherwise
+    a notification published in between would be missed.
+
+    Args:
+        task_id: Celery task ID
+
+    Yields:
+        Async function waiting up to N seconds for the completion
+        notification. Returns True if notified, False on timeout.
+
+    Raises:
+        redis.RedisError, OSError: If the subscription fails
+    """
+    async with (
+        AsyncRedis.from_url(settings.cache_broker_url) as client,
+        client.pubsub(ignore_subscribe_messages=True) as pubsub,
+    ):
+        await pubsub.subscribe(task_completion_channel(task_id))
+
+        async def wait(timeout: float) -> bool:
+            return await pubsub.get_message(timeout=timeout) is not None
+
+        yield wait
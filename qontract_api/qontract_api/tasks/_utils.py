@@ -3,7 +3,7 @@
 # ruff: file-ignore[no-self-use, unused-method-argument]
 import asyncio
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any, Protocol, TypeVar, runtime_checkable
 
 from billiard.einfo import ExceptionInfo
@@ -11,10 +11,13 @@ from celery import Task, states
 from celery.result import AsyncResult
 from fastapi import HTTPException, status
 from hvac.exceptions import VaultError
+from redis.exceptions import RedisError
 
+from qontract_api.config import settings
 from qontract_api.logger import get_logger
 from qontract_api.models import TaskResult as TaskResultModel
 from qontract_api.models import TaskStatus
+from qontract_api.tasks._notifications import task_completion_listener
 
 logger = get_logger(__name__)
 
@@ -62,17 +65,24 @@ async def wait_for_task_completion[T: TaskResult](
     get_task_status: Callable[[], T],
     timeout_seconds: int | None,
     poll_interval: float = 0.5,
+    task_id: str | None = None,
 ) -> T:
     """Wait for task completion with optional timeout.
 
     Generic helper for blocking GET endpoints. Works with any task result model
     that has a 'status' field using TaskStatus enum.
 
+    If task_id is given, waits for the task completion notification published
+    by the worker (see _notifications) and only polls every
+    settings.task_completion_fallback_poll_interval seconds. Falls back to
+    polling every poll_interval seconds if the subscription fails.
+
     Args:
         get_task_status: Function that returns current task status/result.
                         Must return object with .status attribute.
         timeout_seconds: Seconds to wait. None = return immediately (non-blocking).
         poll_interval: Seconds between status checks (default: 0.5s)
+        task_id: Celery task ID to wait for completion notifications (optional)
 
     Returns:
         Task result when complete (status = SUCCESS or FAILED) or immediately if timeout_seconds=None
@@ -84,25 +94,57 @@ async def wait_for_task_completion[T: TaskResult](
         result = await wait_for_task_completion(
             get_task_status=lambda: get_slack_task(task_id, cache),
             timeout_seconds=60,
+            task_id=task_id,
         )
     """
     # Non-blocking: return current status immediately
     if timeout_seconds is None:
         return get_task_status()
 
-    # Blocking: poll until complete or timeout
-    start_time = time.time()
+    deadline = time.monotonic() + timeout_seconds
+
+    if task_id is not None and settings.task_completion_notifications:
+        try:
+            async with task_completion_listener(task_id) as wait_for_notification:
+                return await _wait_until_complete(
+                    get_task_status,
+                    deadline,
+                    wait=lambda remaining: wait_for_notification(
+                        min(remaining, settings.task_completion_fallback_poll_interval)
+                    ),
+                    timeout_seconds=timeout_seconds,
+                )
+        except (RedisError, OSError) as e:
+            logger.warning(
+                f"Task completion notifications unavailable, polling: {e}",
+                task_id=task_id,
+            )
 
-    while time.time() - start_time < timeout_seconds:
+    return await _wait_until_complete(
+        get_task_status,
+        deadline,
+        wait=lambda remaining: asyncio.sleep(min(remaining, poll_interval)),
+        timeout_seconds=timeout_seconds,
+    )
+
+
+async def _wait_until_complete[T: TaskResult](
+    get_task_status: Callable[[], T],
+    deadline: float,
+    wait: Callable[[float], Awaitable[Any]],
+    timeout_seconds: int,
+) -> T:
+    """Check the task status until it is complete, waiting in between."""
+    completed_statuses = {TaskStatus.SUCCESS, TaskStatus.FAILED}
+    while (remaining := deadline - time.monotonic()) > 0:
         result = get_task_status()
 
         # Task complete (success or failed)
-        completed_statuses = {TaskStatus.SUCCESS, TaskStatus.FAILED}
         if result.status in completed_statuses:
             return result
 
         # Still pending, wait before next check
-        await asyncio.sleep(poll_interval)
+        await wait(remaining)
 
     # Timeout reached, task still pending
     raise HTTPException(
@@ -1,14 +1,20 @@
-"""Unit tests for GlitchtipWorkspaceClient cache invalidation."""
+"""Unit tests for GlitchtipWorkspaceClient cache invalidation and prefetching."""
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from qontract_utils.glitchtip_api import GlitchtipApi
-from qontract_utils.glitchtip_api.models import Team
+from qontract_utils.glitchtip_api import AsyncGlitchtipApi, GlitchtipApi
+from qontract_utils.glitchtip_api.models import Organization, Project, Team, User
 
 from qontract_api.cache.base import CacheBackend
-from qontract_api.config import Settings
-from qontract_api.glitchtip.glitchtip_workspace_client import GlitchtipWorkspaceClient
+from qontract_api.config import GlitchtipSettings, Settings
+from qontract_api.glitchtip.glitchtip_workspace_client import (
+    CachedOrganizations,
+    CachedTeams,
+    CachedUsers,
+    GlitchtipWorkspaceClient,
+)
 
 
 @pytest.fixture
@@ -57,3 +63,122 @@ def test_delete_user_clears_team_user_caches(
     assert "glitchtip:test-instance:my-org:users" in deleted_keys
     assert "glitchtip:test-instance:my-org:team-alpha:team_users" in deleted_keys
     assert "glitchtip:test-instance:my-org:team-beta:team_users" in deleted_keys
+
+
+@pytest.fixture
+def mock_async_api() -> AsyncMock:
+    m = AsyncMock(spec=AsyncGlitchtipApi)
+    m.__aenter__.return_value = m
+    m.organizations.return_value = [
+        Organization(pk=1, name="org-a", slug="org-a"),
+        Organization(pk=2, name="org-b", slug="org-b"),
+    ]
+    m.organization_users.return_value = [User(pk=1, email="jane@example.com")]
+    m.teams.return_value = [Team(pk=1, slug="team-1"), Team(pk=2, slug="team-2")]
+    m.projects.return_value = [Project(pk=1, name="project", slug="project")]
+    m.team_users.return_value = [User(pk=1, email="jane@example.com")]
+    return m
+
+
+@pytest.fixture
+def prefetch_client(
+    mock_api: MagicMock, mock_cache: MagicMock, mock_async_api: AsyncMock
+) -> GlitchtipWorkspaceClient:
+    return GlitchtipWorkspaceClient(
+        glitchtip_api=mock_api,
+        instance_name="test-instance",
+        cache=mock_cache,
+        settings=Settings(),
+        async_glitchtip_api_factory=lambda: mock_async_api,
+    )
+
+
+def test_prefetch_current_state_caches_desired_organizations(
+    prefetch_client: GlitchtipWorkspaceClient,
+    mock_api: MagicMock,
+    mock_cache: MagicMock,
+    mock_async_api: AsyncMock,
+) -> None:
+    prefetch_client.prefetch_current_state(["org-a", "org-missing"])
+
+    cached = {c.args[0]: c.args[1] for c in mock_cache.set_obj.call_args_list}
+    assert set(cached) == {
+        "glitchtip:test-instance:organizations",
+        "glitchtip:test-instance:org-a:users",
+        "glitchtip:test-instance:org-a:teams",
+        "glitchtip:test-instance:org-a:projects",
+        "glitchtip:test-instance:org-a:team-1:team_users",
+        "glitchtip:test-instance:org-a:team-2:team_users",
+    }
+    assert cached["glitchtip:test-instance:org-a:teams"] == CachedTeams(
+        items=mock_async_api.teams.return_value
+    )
+    mock_async_api.teams.assert_awaited_once_with("org-a")
+    mock_async_api.__aexit__.assert_awaited_once()
+    mock_api.organizations.assert_not_called()
+
+
+def test_prefetch_current_state_skips_cached_entries(
+    prefetch_client: GlitchtipWorkspaceClient,
+    mock_cache: MagicMock,
+    mock_async_api: AsyncMock,
+) -> None:
+    cached = {
+        "glitchtip:test-instance:organizations": CachedOrganizations(
+            items=[Organization(pk=1, name="org-a", slug="org-a")]
+        ),
+        "glitchtip:test-instance:org-a:teams": CachedTeams(
+            items=[Team(pk=1, slug="team-1")]
+        ),
+        "glitchtip:test-instance:org-a:team-1:team_users": CachedUsers(),
+    }
+    mock_cache.get_obj.side_effect = lambda key, _cls: cached.get(key)
+
+    prefetch_client.prefetch_current_state(["org-a"])
+
+    mock_async_api.organizations.assert_not_awaited()
+    mock_async_api.teams.assert_not_awaited()
+    mock_async_api.team_users.assert_not_awaited()
+    mock_async_api.organization_users.assert_awaited_once_with("org-a")
+    mock_async_api.projects.assert_awaited_once_with("org-a")
+
+
+def test_prefetch_current_state_limits_concurrency(
+    mock_api: MagicMock, mock_cache: MagicMock, mock_async_api: AsyncMock
+) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def team_users(_org_slug: str, _team_slug: str) -> list[User]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    mock_async_api.teams.return_value = [
+        Team(pk=i, slug=f"team-{i}") for i in range(10)
+    ]
+    mock_async_api.team_users.side_effect = team_users
+    client = GlitchtipWorkspaceClient(
+        glitchtip_api=mock_api,
+        instance_name="test-instance",
+        cache=mock_cache,
+        settings=Settings(glitchtip=GlitchtipSettings(current_state_max_concurrency=3)),
+        async_glitchtip_api_factory=lambda: mock_async_api,
+    )
+
+    client.prefetch_current_state(["org-a", "org-b"])
+
+    assert mock_async_api.team_users.await_count == 20
+    assert max_in_flight == 3
+
+
+def test_prefetch_current_state_without_async_api_is_noop(
+    client: GlitchtipWorkspaceClient, mock_api: MagicMock, mock_cache: MagicMock
+) -> None:
+    client.prefetch_current_state(["org-a"])
+
+    mock_cache.set_obj.assert_not_called()
+    mock_api.organizations.assert_not_called()
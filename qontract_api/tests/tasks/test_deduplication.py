@@ -1,11 +1,17 @@
 """Unit tests for task deduplication decorator."""
 
+from collections.abc import Generator
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from qontract_api.models import TaskResult, TaskStatus
 from qontract_api.tasks import deduplicated_task
+from qontract_api.tasks._deduplication import (
+    task_coalesced_count,
+    task_coalesced_rerun_count,
+)
 
 
 @pytest.fixture
@@ -251,3 +257,157 @@ def test_deduplicated_task_with_complex_lock_key(mock_cache: MagicMock) -> None:
     mock_cache.lock.assert_called_once_with(
         "task_lock:test_task:dry_run=false:ws-a,ws-b", timeout=600
     )
+
+
+# --- Coalescing ---
+
+
+class FakeLockingCache:
+    """In-memory cache with non-reentrant locks, like the Redis backend."""
+
+    def __init__(self) -> None:
+        self.storage: dict[str, str] = {}
+        self.locks: set[str] = set()
+
+    def get(self, key: str) -> str | None:
+        return self.storage.get(key)
+
+    def set(self, key: str, value: str, ttl: int | None = None) -> None:  # ruff: ignore[unused-method-argument]
+        self.storage[key] = value
+
+    def delete(self, key: str) -> None:
+        self.storage.pop(key, None)
+
+    def exists(self, key: str) -> bool:
+        return key in self.storage
+
+    @contextmanager
+    def lock(
+        self,
+        key: str,
+        timeout: float = 300,  # ruff: ignore[unused-method-argument]
+        *,
+        blocking: bool = True,  # ruff: ignore[unused-method-argument]
+    ) -> Generator[None]:
+        if key in self.locks:
+            msg = f"Could not acquire lock for {key}"
+            raise RuntimeError(msg)
+        self.locks.add(key)
+        try:
+            yield
+        finally:
+            self.locks.discard(key)
+
+
+@pytest.fixture
+def fake_cache() -> Generator[FakeLockingCache]:
+    cache = FakeLockingCache()
+    with patch("qontract_api.tasks._deduplication.get_cache", return_value=cache):
+        yield cache
+
+
+def test_deduplicated_task_coalesces_duplicates_into_one_rerun(
+    fake_cache: FakeLockingCache,
+) -> None:
+    """A burst of duplicates results in a single re-run with the newest payload."""
+    executions: list[str] = []
+    duplicate_results: list[TaskResult] = []
+
+    @deduplicated_task(lock_key_fn=lambda ws, *_, **__: ws, timeout=60, coalesce=True)
+    def coalesced_task(ws: str, payload: str, *, dry_run: bool = False) -> TaskResult:
+        executions.append(payload)
+        if payload == "first":
+            # duplicates arriving while the first run holds the lock
+            duplicate_results.extend(
+                coalesced_task(ws, p, dry_run=False) for p in ("second", "third")
+            )
+        return TaskResult(status=TaskStatus.SUCCESS, errors=[payload])
+
+    coalesced_before = task_coalesced_count.labels(name="coalesced_task")._value.get()
+    reruns_before = task_coalesced_rerun_count.labels(
+        name="coalesced_task"
+    )._value.get()
+
+    result = coalesced_task("ws-1", "first", dry_run=False)
+
+    assert executions == ["first", "third"]
+    assert result.errors == ["third"]
+    assert [r.status for r in duplicate_results] == [TaskStatus.SKIPPED] * 2
+    assert all(not r.errors for r in duplicate_results)
+    assert not fake_cache.storage
+    assert not fake_cache.locks
+    assert (
+        task_coalesced_count.labels(name="coalesced_task")._value.get()
+        == coalesced_before + 2
+    )
+    assert (
+        task_coalesced_rerun_count.labels(name="coalesced_task")._value.get()
+        == reruns_before + 1
+    )
+
+
+def test_deduplicated_task_coalesce_drops_leftover_pending_payload(
+    fake_cache: FakeLockingCache,
+) -> None:
+    """A pending payload left over by a crashed lock holder is superseded."""
+    executions: list[str] = []
+
+    @deduplicated_task(lock_key_fn=lambda ws, *_, **__: ws, timeout=60, coalesce=True)
+    def coalesced_task(ws: str, payload: str, *, dry_run: bool = False) -> str:
+        executions.append(payload)
+        return payload
+
+    # store a pending payload without a lock holder
+    with fake_cache.lock("task_lock:coalesced_task:dry_run=false:ws-1"):
+        coalesced_task("ws-1", "stale", dry_run=False)
+
+    assert executions == []
+    assert coalesced_task("ws-1", "new", dry_run=False) == "new"
+    assert executions == ["new"]
+    assert not fake_cache.storage
+
+
+def test_deduplicated_task_coalesce_reruns_until_nothing_is_pending(
+    fake_cache: FakeLockingCache,
+) -> None:
+    """Duplicates arriving during a re-run are run by another re-run."""
+    executions: list[str] = []
+    duplicates = {"first": "second", "second": "third"}
+
+    @deduplicated_task(lock_key_fn=lambda ws, *_, **__: ws, timeout=60, coalesce=True)
+    def coalesced_task(ws: str, payload: str, *, dry_run: bool = False) -> str:
+        executions.append(payload)
+        if duplicate := duplicates.get(payload):
+            coalesced_task(ws, duplicate, dry_run=False)
+        return payload
+
+    assert coalesced_task("ws-1", "first", dry_run=False) == "third"
+    assert executions == ["first", "second", "third"]
+    assert not fake_cache.storage
+    assert not fake_cache.locks
+
+
+def test_deduplicated_task_coalesce_propagates_task_runtime_error(
+    fake_cache: FakeLockingCache,
+) -> None:
+    """A RuntimeError raised by the task is not mistaken for a held lock."""
+
+    @deduplicated_task(lock_key_fn=lambda ws, *_, **__: ws, timeout=60, coalesce=True)
+    def coalesced_task(ws: str, *, dry_run: bool = False) -> str:
+        raise RuntimeError("task failed")
+
+    with pytest.raises(RuntimeError, match="task failed"):
+        coalesced_task("ws-1", dry_run=False)
+    assert not fake_cache.locks
+
+
+def test_deduplicated_task_coalesce_dry_run_never_locks(
+    fake_cache: FakeLockingCache,
+) -> None:
+    @deduplicated_task(lock_key_fn=lambda ws, *_, **__: ws, timeout=60, coalesce=True)
+    def coalesced_task(ws: str, *, dry_run: bool = True) -> str:
+        return ws
+
+    with fake_cache.lock("task_lock:coalesced_task:dry_run=false:ws-1"):
+        assert coalesced_task("ws-1", dry_run=True) == "ws-1"
+    assert not fake_cache.storage
@@ -1,11 +1,19 @@
 """Tests for task utilities."""
 
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
 import pytest
 from fastapi import HTTPException
 from pydantic import Field
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from qontract_api.models import TaskResult, TaskStatus
 from qontract_api.tasks import wait_for_task_completion
+from qontract_api.tasks._notifications import publish_task_completion
 
 
 class MockTaskResult(TaskResult):
@@ -98,3 +106,97 @@ async def test_wait_for_task_eventually_completes() -> None:
     assert result.errors == []
     assert result.actions == ["completed"]
     assert call_count >= 3
+
+
+@pytest.mark.asyncio
+async def test_wait_for_task_woken_up_by_completion_notification() -> None:
+    """A completion notification wakes the waiter before the next poll."""
+    done = asyncio.Event()
+    task_status = TaskStatus.PENDING
+    call_count = 0
+
+    def get_status() -> MockTaskResult:
+        nonlocal call_count
+        call_count += 1
+        return MockTaskResult(status=task_status)
+
+    @asynccontextmanager
+    async def listener(
+        task_id: str,
+    ) -> AsyncIterator[Callable[[float], Awaitable[bool]]]:
+        assert task_id == "task-1"
+
+        async def wait(timeout: float) -> bool:
+            try:
+                await asyncio.wait_for(done.wait(), timeout)
+            except TimeoutError:
+                return False
+            return True
+
+        yield wait
+
+    async def complete_task() -> None:
+        nonlocal task_status
+        await asyncio.sleep(0.1)
+        task_status = TaskStatus.SUCCESS
+        done.set()
+
+    with patch("qontract_api.tasks._utils.task_completion_listener", listener):
+        start = time.monotonic()
+        completer = asyncio.create_task(complete_task())
+        result = await wait_for_task_completion(
+            get_task_status=get_status,
+            timeout_seconds=10,
+            task_id="task-1",
+        )
+        await completer
+
+    assert result.status == TaskStatus.SUCCESS
+    assert call_count == 2
+    assert time.monotonic() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_task_falls_back_to_polling() -> None:
+    """Polling is used if the completion channel can't be subscribed."""
+    call_count = 0
+
+    def get_status() -> MockTaskResult:
+        nonlocal call_count
+        call_count += 1
+        if call_count <= 2:
+            return MockTaskResult(status=TaskStatus.PENDING)
+        return MockTaskResult(status=TaskStatus.SUCCESS)
+
+    @asynccontextmanager
+    async def listener(
+        _task_id: str,
+    ) -> AsyncIterator[Callable[[float], Awaitable[bool]]]:
+        raise RedisConnectionError("connection refused")
+        yield  # pragma: no cover
+
+    with patch("qontract_api.tasks._utils.task_completion_listener", listener):
+        result = await wait_for_task_completion(
+            get_task_status=get_status,
+            timeout_seconds=5,
+            poll_interval=0.1,
+            task_id="task-1",
+        )
+
+    assert result.status == TaskStatus.SUCCESS
+    assert call_count == 3
+
+
+def test_publish_task_completion() -> None:
+    cache = MagicMock()
+    with patch("qontract_api.tasks._notifications.get_cache", return_value=cache):
+        publish_task_completion("task-1", "SUCCESS")
+
+    cache.client.publish.assert_called_once_with("task_done:task-1", "SUCCESS")
+
+
+def test_publish_task_completion_ignores_redis_errors() -> None:
+    cache = MagicMock()
+    cache.client.publish.side_effect = RedisConnectionError("connection refused")
+    with patch("qontract_api.tasks._notifications.get_cache", return_value=cache):
+        publish_task_completion("task-1", "SUCCESS")
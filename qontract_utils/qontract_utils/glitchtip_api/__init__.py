@@ -5,6 +5,7 @@ architecture pattern (ADR-014).
 
 Layer 1 (Pure Communication):
 - GlitchtipApi: Stateless API client with hooks for metrics and logging
+- AsyncGlitchtipApi: Read-only asyncio variant of GlitchtipApi
 - Models: Pydantic models for organizations, projects, and alerts
 
 Hook System (ADR-006):
@@ -19,6 +20,7 @@ Example:
     ...     print(org.name)
 """
 
+from qontract_utils.glitchtip_api.async_client import AsyncGlitchtipApi
 from qontract_utils.glitchtip_api.client import (
     TIMEOUT,
     GlitchtipApi,
@@ -37,6 +39,7 @@ from qontract_utils.glitchtip_api.models import (
 
 __all__ = [
     "TIMEOUT",
+    "AsyncGlitchtipApi",
     "GlitchtipApi",
     "GlitchtipApiCallContext",
     "Organization",
@@ -0,0 +1,186 @@
+"""Async Glitchtip API client with hook system.
+
+Following ADR-014 (Three-Layer Architecture) - Layer 1: Pure Communication.
+Read-only asyncio counterpart of GlitchtipApi for fetching the current state
+of many organizations, teams and projects concurrently. Uses the same
+built-in hooks (metrics, logging, latency) as GlitchtipApi (ADR-006).
+"""
+
+from typing import Any, Self
+
+import httpx2
+
+from qontract_utils.glitchtip_api.client import (
+    TIMEOUT,
+    GlitchtipApiCallContext,
+    _latency_end_hook,
+    _latency_start_hook,
+    _metrics_hook,
+    _request_log_hook,
+    get_next_url,
+)
+from qontract_utils.glitchtip_api.models import Organization, Project, Team, User
+from qontract_utils.hooks import Hooks, invoke_with_hooks, with_hooks
+from qontract_utils.user_agent import DEFAULT_USER_AGENT
+
+
+@with_hooks(
+    hooks=Hooks(
+        pre_hooks=[
+            _metrics_hook,
+            _request_log_hook,
+            _latency_start_hook,
+        ],
+        post_hooks=[_latency_end_hook],
+    )
+)
+class AsyncGlitchtipApi:
+    """Stateless async Glitchtip API client with hook system.
+
+    Provides the list methods of GlitchtipApi as coroutines. The underlying
+    httpx2.AsyncClient is bound to the event loop it is used in, use the
+    client as an async context manager within a single event loop.
+
+    Example:
+        >>> async with AsyncGlitchtipApi(host="https://glitchtip.example.com", token="...") as api:
+        ...     orgs = await api.organizations()
+        ...     teams = await asyncio.gather(*(api.teams(o.slug) for o in orgs))
+    """
+
+    # Set by @with_hooks decorator
+    _hooks: Hooks
+
+    def __init__(
+        self,
+        host: str,
+        token: str,
+        timeout: int = TIMEOUT,
+        max_retries: int = 3,
+        hooks: Hooks | None = None,  # ruff: ignore[unused-method-argument] - Handled by @with_hooks decorator
+        user_agent: str = DEFAULT_USER_AGENT,
+    ) -> None:
+        """Initialize async Glitchtip API client.
+
+        Args:
+            host: Glitchtip instance host URL (e.g., "https://glitchtip.example.com")
+            token: Glitchtip API token (Bearer token)
+            timeout: API request timeout in seconds (default: 30)
+            max_retries: Number of retries for failed requests (default: 3)
+            hooks: Optional custom hooks to merge with built-in hooks.
+            user_agent: User-Agent header sent with every request.
+        """
+        self.host = host.rstrip("/")
+        self._client = httpx2.AsyncClient(
+            base_url=self.host,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "User-Agent": user_agent,
+            },
+            timeout=timeout,
+            transport=httpx2.AsyncHTTPTransport(retries=max_retries),
+        )
+
+    async def _list(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch all pages from a paginated endpoint.
+
+        Args:
+            path: API path (e.g., "/api/0/organizations/")
+            params: Optional query parameters
+
+        Returns:
+            Flat list of all items across all pages
+        """
+        results: list[dict[str, Any]] = []
+        url: str | None = path
+        while url:
+            response = await self._client.get(
+                url, params=params if url == path else None
+            )
+            response.raise_for_status()
+            results.extend(response.json())
+            url = get_next_url(response)
+        return results
+
+    @invoke_with_hooks(
+        lambda self: GlitchtipApiCallContext(
+            method="organizations.list", verb="GET", id=self.host
+        )
+    )
+    async def organizations(self) -> list[Organization]:
+        """List all organizations."""
+        return [
+            Organization.model_validate(r)
+            for r in await self._list("/api/0/organizations/", params={"limit": 100})
+        ]
+
+    @invoke_with_hooks(
+        lambda self: GlitchtipApiCallContext(
+            method="projects.list", verb="GET", id=self.host
+        )
+    )
+    async def projects(self, organization_slug: str) -> list[Project]:
+        """List projects in an organization."""
+        return [
+            Project.model_validate(r)
+            for r in await self._list(
+                f"/api/0/organizations/{organization_slug}/projects/",
+                params={"limit": 100},
+            )
+        ]
+
+    @invoke_with_hooks(
+        lambda self: GlitchtipApiCallContext(
+            method="teams.list", verb="GET", id=self.host
+        )
+    )
+    async def teams(self, organization_slug: str) -> list[Team]:
+        """List teams in an organization."""
+        return [
+            Team.model_validate(r)
+            for r in await self._list(
+                f"/api/0/organizations/{organization_slug}/teams/",
+                params={"limit": 100},
+            )
+        ]
+
+    @invoke_with_hooks(
+        lambda self: GlitchtipApiCallContext(
+            method="organization_users.list", verb="GET", id=self.host
+        )
+    )
+    async def organization_users(self, organization_slug: str) -> list[User]:
+        """List organization members."""
+        return [
+            User.model_validate(r)
+            for r in await self._list(
+                f"/api/0/organizations/{organization_slug}/members/",
+                params={"limit": 100},
+            )
+        ]
+
+    @invoke_with_hooks(
+        lambda self: GlitchtipApiCallContext(
+            method="team_users.list", verb="GET", id=self.host
+        )
+    )
+    async def team_users(self, organization_slug: str, team_slug: str) -> list[User]:
+        """List members of a team."""
+        return [
+            User.model_validate(r)
+            for r in await self._list(
+                f"/api/0/teams/{organization_slug}/{team_slug}/members/",
+                params={"limit": 100},
+            )
+        ]
+
+    async def close(self) -> None:
+        """Close the underlying httpx2 client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
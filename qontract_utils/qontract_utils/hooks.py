@@ -462,6 +462,9 @@ class InvokeWithHooksMethod:
         self.__module__ = func.__module__
         self.__qualname__ = func.__qualname__
         self.__annotations__ = func.__annotations__
+        if inspect.iscoroutinefunction(func):
+            # keep coroutine methods detectable via inspect.iscoroutinefunction
+            inspect.markcoroutinefunction(self)
 
     def _create_wrapper(
         self,
@@ -481,6 +484,10 @@ class InvokeWithHooksMethod:
                 )
                 raise ValueError(msg)
             return self._create_generator_wrapper(hooks, instance, prepend_args)
+        if inspect.iscoroutinefunction(self.func):
+            return self._create_async_wrapper(
+                hooks, instance, callable_name, prepend_args
+            )
         return self._create_sync_wrapper(hooks, instance, callable_name, prepend_args)
 
     def _create_generator_wrapper(
@@ -580,6 +587,62 @@ class InvokeWithHooksMethod:
 
         return wrapper
 
+    def _create_async_wrapper(
+        self,
+        hooks: Hooks,
+        instance: Any | None,
+        callable_name: str,
+        prepend_args: tuple[Any, ...] = (),
+    ) -> Callable[..., Any]:
+        """Create wrapper for coroutine functions.
+
+        Same semantics as the sync wrapper, hooks stay synchronous. Retries
+        wait with asyncio.sleep instead of blocking the event loop.
+        """
+
+        @functools.wraps(self.func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if self.context_factory is not None:
+                context = _build_context_from_args(
+                    self.context_factory, instance, self.func, args, kwargs
+                )
+            else:
+                context = None
+
+            hook_args = (context,) if context is not None else ()
+            retry_config = self.retry_config or hooks.retry_config or NO_RETRY_CONFIG
+
+            for hook in hooks.pre_hooks:
+                hook(*hook_args)
+
+            try:
+                retry_ctx = stamina.retry_context(
+                    on=retry_config.on,
+                    attempts=retry_config.attempts,
+                    timeout=retry_config.timeout,
+                    wait_initial=retry_config.wait_initial,
+                    wait_max=retry_config.wait_max,
+                    wait_jitter=retry_config.wait_jitter,
+                    wait_exp_base=retry_config.wait_exp_base,
+                )
+
+                async for attempt in retry_ctx.with_name(callable_name, (), {}):
+                    with attempt:
+                        if attempt.num > 1:
+                            for retry_hook in hooks.retry_hooks:
+                                retry_hook(*hook_args, attempt.num)
+
+                        return await self.func(*prepend_args, *args, **kwargs)
+            except Exception:
+                for hook in hooks.error_hooks:
+                    hook(*hook_args)
+                raise
+            finally:
+                for hook in hooks.post_hooks:
+                    hook(*hook_args)
+
+        return wrapper
+
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Direct call - for standalone functions and static methods."""
         if self.hooks is None:
@@ -0,0 +1,145 @@
+"""Encrypted on-disk cache for version pinned secrets.
+
+A KV v2 secret version is immutable, so a version pinned read can be served
+from a local cache instead of Vault. The cache is a directory of Fernet
+encrypted files, one per (server, path, version), which makes it shareable
+between all processes on a node that use the same directory and key.
+
+Entries expire after `ttl` seconds (e.g., to pick up destroyed versions) and
+the oldest entries are evicted once the cache holds more than `max_entries`.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Self
+
+import structlog
+from cryptography.fernet import Fernet, InvalidToken
+from prometheus_client import Counter
+from pydantic import BaseModel, Field
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_SECRET_CACHE_TTL = 24 * 60 * 60
+DEFAULT_SECRET_CACHE_MAX_ENTRIES = 10_000
+# scanning the cache directory is O(entries), don't do it on every write
+EVICT_EVERY_N_WRITES = 100
+
+secret_cache_request = Counter(
+    "qontract_reconcile_secret_cache_requests_total",
+    "Total number of secret cache lookups",
+    ["result"],
+)
+
+
+class SecretCacheSettings(BaseModel):
+    directory: str = Field(..., description="Cache directory, shared per node")
+    key: str = Field(..., description="Fernet key used to encrypt cache entries")
+    ttl: int = Field(DEFAULT_SECRET_CACHE_TTL, description="Cache entry TTL in seconds")
+    max_entries: int = Field(
+        DEFAULT_SECRET_CACHE_MAX_ENTRIES,
+        description="Maximum number of cached secret versions",
+    )
+
+
+class SecretCache:
+    """Encrypted file cache for immutable (version pinned) secrets.
+
+    Writes are atomic (temp file + rename), so concurrent processes never see
+    partial entries. Entries which can't be decrypted (expired, corrupted or
+    written with another key) are treated as cache misses.
+
+    Example:
+        cache = SecretCache.from_settings(settings)
+        data = cache.get(server, "secret/ws1/token", 3)
+        if data is None:
+            data = read_from_vault(...)
+            cache.set(server, "secret/ws1/token", 3, data)
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        key: str | bytes,
+        ttl: int = DEFAULT_SECRET_CACHE_TTL,
+        max_entries: int = DEFAULT_SECRET_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._directory = directory
+        self._fernet = Fernet(key)
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._writes = 0
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    @classmethod
+    def from_settings(cls, settings: SecretCacheSettings) -> Self:
+        return cls(
+            directory=Path(settings.directory),
+            key=settings.key,
+            ttl=settings.ttl,
+            max_entries=settings.max_entries,
+        )
+
+    def _entry_path(self, server: str, path: str, version: int) -> Path:
+        # hash the secret coordinates to not leak secret paths via file names
+        digest = hashlib.sha256(f"{server}\0{path}\0{version}".encode()).hexdigest()
+        return self._directory / f"{digest}.secret"
+
+    def get(self, server: str, path: str, version: int) -> dict[str, Any] | None:
+        """Return the cached secret data or None on a cache miss."""
+        entry = self._entry_path(server, path, version)
+        try:
+            token = entry.read_bytes()
+            data = json.loads(self._fernet.decrypt(token, ttl=self._ttl))
+        except FileNotFoundError:
+            secret_cache_request.labels("miss").inc()
+            return None
+        except InvalidToken, ValueError:
+            secret_cache_request.labels("invalid").inc()
+            entry.unlink(missing_ok=True)
+            return None
+        secret_cache_request.labels("hit").inc()
+        return data
+
+    def set(self, server: str, path: str, version: int, data: dict[str, Any]) -> None:
+        """Store secret data for a version pinned secret."""
+        token = self._fernet.encrypt(json.dumps(data).encode())
+        fd, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            Path(tmp_name).replace(self._entry_path(server, path, version))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        if self._writes % EVICT_EVERY_N_WRITES == 0:
+            self.evict()
+        self._writes += 1
+
+    def evict(self) -> None:
+        """Remove expired entries and the oldest entries above max_entries."""
+        entries: list[tuple[float, Path]] = []
+        now = time.time()
+        for entry in self._directory.glob("*.secret"):
+            try:
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                # removed by another process in the meantime
+                continue
+            if now - mtime > self._ttl:
+                entry.unlink(missing_ok=True)
+            else:
+                entries.append((mtime, entry))
+        if len(entries) <= self._max_entries:
+            return
+        entries.sort()
+        for _, entry in entries[: len(entries) - self._max_entries]:
+            entry.unlink(missing_ok=True)
+        logger.debug(
+            "Evicted secret cache entries",
+            count=len(entries) - self._max_entries,
+        )
@@ -7,6 +7,7 @@ Features:
 - Kubernetes authentication (service account token)
 - Auto-refresh of authentication token (background thread)
 - KV v2 version support (read specific versions or latest)
+- Optional encrypted on-disk cache for KV v2 secret versions
 - Thread-safe operations
 """
 
@@ -38,6 +39,7 @@ from qontract_utils.secret_reader.base import (
     SecretBackendError,
     SecretNotFoundError,
 )
+from qontract_utils.secret_reader.cache import SecretCache, SecretCacheSettings
 
 logger = structlog.get_logger(__name__)
 
@@ -86,6 +88,7 @@ class VaultSecretBackendSettings(BaseModel):
     kube_auth_mount: str = "kubernetes"
     kube_sa_token_path: str = DEFAULT_KUBE_SA_TOKEN_PATH
     auto_refresh: bool = True
+    cache: SecretCacheSettings | None = None
 
 
 @dataclass(frozen=True)
@@ -274,6 +277,9 @@ class VaultSecretBackend(SecretBackend):
         self._auth_lock = threading.Lock()  # Lock for authentication operations
         self._closed = False
         self._refresh_interval = 300  # 5 minutes
+        self._secret_cache = (
+            SecretCache.from_settings(settings.cache) if settings.cache else None
+        )
 
         # Initial authentication
         self._authenticate()
@@ -505,6 +511,61 @@ class VaultSecretBackend(SecretBackend):
         )
         return response["data"]["data"]
 
+    @invoke_with_hooks(
+        lambda self, path, mount_point: VaultApiCallContext(
+            method="secrets.kv.v2.read_secret_metadata",
+            id=self._settings.server,
+            path=path,
+            mount_point=mount_point,
+        ),
+        retry_config=VAULT_READ_RETRY_CONFIG,
+    )
+    def _read_kv_v2_current_version(self, path: str, mount_point: str) -> int:
+        """Read KV v2 secret metadata API call."""
+        response = self._client.secrets.kv.v2.read_secret_metadata(
+            path=path, mount_point=mount_point
+        )
+        return response["data"]["current_version"]
+
+    def _read_kv_v2(
+        self, vault_secret: VaultSecret, version: int | None
+    ) -> dict[str, Any]:
+        """Read a KV v2 secret, using the secret cache if configured.
+
+        Secret versions are immutable, so pinned versions are served from the
+        cache. Latest reads resolve the current version via the (cheap)
+        metadata endpoint first. If the metadata isn't readable, fall back to
+        an uncached read.
+        """
+        if not self._secret_cache:
+            return self._read_kv_v2_secret(
+                vault_secret.read_path, vault_secret.mount_point, version
+            )
+
+        if version is None:
+            try:
+                version = self._read_kv_v2_current_version(
+                    vault_secret.read_path, vault_secret.mount_point
+                )
+            except Forbidden:
+                logger.debug(
+                    "Secret metadata not readable, skipping cache",
+                    path=vault_secret.read_path,
+                    mount_point=vault_secret.mount_point,
+                )
+                return self._read_kv_v2_secret(
+                    vault_secret.read_path, vault_secret.mount_point, None
+                )
+
+        path = f"{vault_secret.mount_point}/{vault_secret.read_path}"
+        data = self._secret_cache.get(self._settings.server, path, version)
+        if data is None:
+            data = self._read_kv_v2_secret(
+                vault_secret.read_path, vault_secret.mount_point, version
+            )
+            self._secret_cache.set(self._settings.server, path, version, data)
+        return data
+
     @invoke_with_hooks(
         lambda self, path, mount_point: VaultApiCallContext(
             method="secrets.kv.v1.read_secret",
@@ -555,9 +616,7 @@ class VaultSecretBackend(SecretBackend):
         # hvac.Client is thread-safe for authenticated operations
         try:
             if vault_secret.kv_version == KV_VERSION_2:
-                return self._read_kv_v2_secret(
-                    vault_secret.read_path, vault_secret.mount_point, secret.version
-                )
+                return self._read_kv_v2(vault_secret, secret.version)
             return self._read_kv_v1_secret(
                 vault_secret.read_path, vault_secret.mount_point
             )
@@ -0,0 +1,87 @@
+"""Tests for @invoke_with_hooks on coroutine functions."""
+
+import inspect
+
+import pytest
+from qontract_utils.hooks import NO_RETRY_CONFIG, Hooks, RetryConfig, invoke_with_hooks
+
+
+@pytest.mark.asyncio
+async def test_async_method_hooks_fire_around_await() -> None:
+    execution_order: list[str] = []
+
+    class TestApi:
+        def __init__(self) -> None:
+            self._hooks = Hooks(
+                pre_hooks=[lambda: execution_order.append("pre")],
+                post_hooks=[lambda: execution_order.append("post")],
+                retry_config=NO_RETRY_CONFIG,
+            )
+
+        @invoke_with_hooks()
+        async def fetch(self, value: int) -> int:
+            execution_order.append("fetch")
+            return value * 2
+
+    api = TestApi()
+    coro = api.fetch(21)
+    assert execution_order == []
+    assert await coro == 42
+    assert execution_order == ["pre", "fetch", "post"]
+
+
+@pytest.mark.asyncio
+async def test_async_method_error_hooks() -> None:
+    execution_order: list[str] = []
+
+    class TestApi:
+        def __init__(self) -> None:
+            self._hooks = Hooks(
+                error_hooks=[lambda: execution_order.append("error")],
+                post_hooks=[lambda: execution_order.append("post")],
+                retry_config=NO_RETRY_CONFIG,
+            )
+
+        @invoke_with_hooks()
+        async def fetch(self) -> None:
+            raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await TestApi().fetch()
+    assert execution_order == ["error", "post"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("enable_retry")
+async def test_async_method_retries() -> None:
+    attempts: list[int] = []
+
+    class TestApi:
+        def __init__(self) -> None:
+            self._hooks = Hooks(
+                retry_hooks=[attempts.append],
+                retry_config=RetryConfig(on=ValueError, attempts=3),
+            )
+            self.calls = 0
+
+        @invoke_with_hooks()
+        async def fetch(self) -> str:
+            self.calls += 1
+            if self.calls < 3:
+                raise ValueError("transient")
+            return "ok"
+
+    assert await TestApi().fetch() == "ok"
+    assert attempts == [2, 3]
+
+
+def test_async_method_is_coroutine_function() -> None:
+    class TestApi:
+        @invoke_with_hooks()
+        async def fetch(self) -> None: ...
+
+        @invoke_with_hooks()
+        def fetch_sync(self) -> None: ...
+
+    assert inspect.iscoroutinefunction(TestApi.fetch)
+    assert not inspect.iscoroutinefunction(TestApi.fetch_sync)
@@ -0,0 +1,97 @@
+"""Unit tests for secret_reader.cache module."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from cryptography.fernet import Fernet
+from qontract_utils.secret_reader.cache import SecretCache
+
+SERVER = "https://vault.test"
+
+
+@pytest.fixture
+def key() -> bytes:
+    return Fernet.generate_key()
+
+
+@pytest.fixture
+def cache(tmp_path: Path, key: bytes) -> SecretCache:
+    return SecretCache(directory=tmp_path, key=key)
+
+
+def test_get_miss(cache: SecretCache) -> None:
+    assert cache.get(SERVER, "secret/ws1/token", 1) is None
+
+
+def test_set_and_get(cache: SecretCache) -> None:
+    cache.set(SERVER, "secret/ws1/token", 1, {"token": "xoxb-1"})
+
+    assert cache.get(SERVER, "secret/ws1/token", 1) == {"token": "xoxb-1"}
+    assert cache.get(SERVER, "secret/ws1/token", 2) is None
+    assert cache.get("https://other.test", "secret/ws1/token", 1) is None
+
+
+def test_entries_are_encrypted(cache: SecretCache, tmp_path: Path) -> None:
+    cache.set(SERVER, "secret/ws1/token", 1, {"token": "xoxb-1"})
+
+    [entry] = tmp_path.glob("*.secret")
+    assert "ws1" not in entry.name
+    assert b"xoxb-1" not in entry.read_bytes()
+
+
+def test_shared_between_instances(tmp_path: Path, key: bytes) -> None:
+    SecretCache(directory=tmp_path, key=key).set(
+        SERVER, "secret/ws1/token", 1, {"token": "xoxb-1"}
+    )
+
+    assert SecretCache(directory=tmp_path, key=key).get(
+        SERVER, "secret/ws1/token", 1
+    ) == {"token": "xoxb-1"}
+
+
+def test_wrong_key_is_a_miss(cache: SecretCache, tmp_path: Path) -> None:
+    cache.set(SERVER, "secret/ws1/token", 1, {"token": "xoxb-1"})
+
+    other = SecretCache(directory=tmp_path, key=Fernet.generate_key())
+
+    assert other.get(SERVER, "secret/ws1/token", 1) is None
+    assert not list(tmp_path.glob("*.secret"))
+
+
+def test_expired_entry_is_a_miss(tmp_path: Path, key: bytes) -> None:
+    cache = SecretCache(directory=tmp_path, key=key, ttl=60)
+    fernet = Fernet(key)
+    entry = cache._entry_path(SERVER, "secret/ws1/token", 1)
+    entry.write_bytes(
+        fernet.encrypt_at_time(b'{"token": "xoxb-1"}', int(time.time()) - 120)
+    )
+
+    assert cache.get(SERVER, "secret/ws1/token", 1) is None
+
+
+def test_evict_max_entries(tmp_path: Path, key: bytes) -> None:
+    cache = SecretCache(directory=tmp_path, key=key, max_entries=2)
+    now = time.time()
+    for version in range(1, 4):
+        cache.set(SERVER, "secret/ws1/token", version, {"token": str(version)})
+        entry = cache._entry_path(SERVER, "secret/ws1/token", version)
+        os.utime(entry, (now - 10 + version, now - 10 + version))
+
+    cache.evict()
+
+    assert cache.get(SERVER, "secret/ws1/token", 1) is None
+    assert cache.get(SERVER, "secret/ws1/token", 2) == {"token": "2"}
+    assert cache.get(SERVER, "secret/ws1/token", 3) == {"token": "3"}
+
+
+def test_evict_expired(tmp_path: Path, key: bytes) -> None:
+    cache = SecretCache(directory=tmp_path, key=key, ttl=60)
+    cache.set(SERVER, "secret/ws1/token", 1, {"token": "1"})
+    entry = cache._entry_path(SERVER, "secret/ws1/token", 1)
+    os.utime(entry, (time.time() - 120, time.time() - 120))
+
+    cache.evict()
+
+    assert not entry.exists()
@@ -1,10 +1,12 @@
 """Tests for qontract_utils.glitchtip_api module."""
 
+from collections.abc import Callable
 from unittest.mock import MagicMock, patch
 
 import httpx2
 import pytest
 from qontract_utils.glitchtip_api import (
+    AsyncGlitchtipApi,
     GlitchtipApi,
     GlitchtipApiCallContext,
     Organization,
@@ -592,3 +594,71 @@ def test_api_call_context() -> None:
     assert ctx.method == "organizations.list"
     assert ctx.verb == "GET"
     assert ctx.id == "https://example.com"
+
+
+# --- Async Client Tests ---
+
+
+def _async_glitchtip_api(
+    handler: Callable[[httpx2.Request], httpx2.Response],
+) -> AsyncGlitchtipApi:
+    """Create AsyncGlitchtipApi instance serving requests with handler."""
+    transport = httpx2.MockTransport(handler)
+    with patch(
+        "qontract_utils.glitchtip_api.async_client.httpx2.AsyncHTTPTransport",
+        return_value=transport,
+    ):
+        return AsyncGlitchtipApi(host="https://glitchtip.example.com/", token="token")
+
+
+@pytest.mark.asyncio
+async def test_async_organizations_pagination() -> None:
+    """Test AsyncGlitchtipApi.organizations() fetches all pages."""
+    requests: list[httpx2.Request] = []
+
+    def handler(request: httpx2.Request) -> httpx2.Response:
+        requests.append(request)
+        if "cursor" not in request.url.params:
+            return httpx2.Response(
+                200,
+                json=[{"id": 1, "name": "org-1", "slug": "org-1"}],
+                headers={
+                    "Link": '<https://glitchtip.example.com/api/0/organizations/?cursor=abc>; rel="next"; results="true"'
+                },
+            )
+        return httpx2.Response(200, json=[{"id": 2, "name": "org-2", "slug": "org-2"}])
+
+    async with _async_glitchtip_api(handler) as api:
+        orgs = await api.organizations()
+
+    assert [o.name for o in orgs] == ["org-1", "org-2"]
+    assert len(requests) == 2
+    assert requests[0].url.params["limit"] == "100"
+    assert requests[0].headers["Authorization"] == "Bearer token"
+    assert "limit" not in requests[1].url.params
+
+
+@pytest.mark.asyncio
+async def test_async_team_users() -> None:
+    """Test AsyncGlitchtipApi.team_users() GETs the team members."""
+
+    def handler(request: httpx2.Request) -> httpx2.Response:
+        assert request.url.path == "/api/0/teams/my-org/my-team/members/"
+        return httpx2.Response(
+            200, json=[{"id": 1, "email": "jane@example.com", "role": "member"}]
+        )
+
+    async with _async_glitchtip_api(handler) as api:
+        users = await api.team_users("my-org", "my-team")
+
+    assert [u.email for u in users] == ["jane@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_async_api_error_raises() -> None:
+    """Test AsyncGlitchtipApi raises on HTTP errors."""
+    api = _async_glitchtip_api(lambda _: httpx2.Response(500))
+
+    with pytest.raises(httpx2.HTTPStatusError):
+        await api.projects("my-org")
+    await api.close()
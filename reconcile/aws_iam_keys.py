@@ -42,6 +42,17 @@ def should_run(state: State, keys_to_delete: dict[str, list[str]]) -> bool:
     return False
 
 
+def get_new_keys(
+    state: State, keys_to_delete: dict[str, list[str]]
+) -> dict[str, list[str]]:
+    """Keys added since the last completed run, they are expected to exist."""
+    new_keys = {}
+    for account_name, keys in keys_to_delete.items():
+        processed = set(state.get(account_name, []))
+        new_keys[account_name] = [k for k in keys if k not in processed]
+    return new_keys
+
+
 def update_state(state: State, keys_to_update: dict[str, list[str]]) -> None:
     for account_name, keys in keys_to_update.items():
         if state.get(account_name, []) != keys:
@@ -113,7 +124,11 @@ def run(
 
     with AWSApi(thread_pool_size, accounts, settings=settings) as aws:
         error, service_account_recycle_complete = aws.delete_keys(
-            dry_run, keys_to_delete, working_dirs, disable_service_account_keys
+            dry_run,
+            keys_to_delete,
+            working_dirs,
+            disable_service_account_keys,
+            expected_keys=get_new_keys(state, keys_to_delete),
         )
     if error:
         sys.exit(1)
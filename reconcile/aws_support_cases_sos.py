@@ -85,20 +85,27 @@ def run(
     deleted_keys = get_deleted_keys(accounts)
     with AWSApi(thread_pool_size, accounts, settings=settings) as aws:
         aws_support_cases = aws.get_support_cases()
-        keys_to_delete_from_cases = get_keys_to_delete(aws_support_cases)
+        # keys deleted in earlier runs are gone and must not be verified
+        keys_to_delete_from_cases = [
+            ktd
+            for ktd in get_keys_to_delete(aws_support_cases)
+            if ktd["key"] not in deleted_keys.get(ktd["account"], [])
+        ]
         # only fetch existing keys for accounts that actually have a candidate
         # leaked key to verify, instead of every account in the fleet
         accounts_to_check = {ktd["account"] for ktd in keys_to_delete_from_cases}
+        expected_keys: dict[str, list[str]] = {}
+        for ktd in keys_to_delete_from_cases:
+            expected_keys.setdefault(ktd["account"], []).append(ktd["key"])
         existing_keys = (
-            aws.get_users_keys(accounts_to_check) if accounts_to_check else {}
+            aws.get_users_keys(accounts_to_check, expected_keys=expected_keys)
+            if accounts_to_check
+            else {}
         )
     keys_to_delete = []
     for ktd in keys_to_delete_from_cases:
         ktd_account = ktd["account"]
         ktd_key = ktd["key"]
-        account_deleted_keys = deleted_keys.get(ktd_account)
-        if account_deleted_keys and ktd_key in account_deleted_keys:
-            continue
         account_existing_keys = existing_keys.get(ktd_account)
         if account_existing_keys:
             keys_only = itertools.chain.from_iterable(account_existing_keys.values())
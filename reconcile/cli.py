@@ -1093,6 +1093,12 @@ def jenkins_worker_fleets(ctx: click.Context) -> None:
 @job_name
 @instance_name
 @throughput
+@click.option(
+    "--incremental/--no-incremental",
+    default=False,
+    help="only update jobs whose generated XML changed since the last run.",
+)
+@threaded()
 @click.pass_context
 def jenkins_job_builder(
     ctx: click.Context,
@@ -1101,6 +1107,8 @@ def jenkins_job_builder(
     config_name: str | None,
     job_name: str | None,
     instance_name: str | None,
+    incremental: bool,
+    thread_pool_size: int,
 ) -> None:
     import reconcile.jenkins_job_builder
 
@@ -1112,6 +1120,8 @@ def jenkins_job_builder(
         config_name,
         job_name,
         instance_name,
+        incremental,
+        thread_pool_size,
     )
 
 
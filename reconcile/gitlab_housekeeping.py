@@ -52,6 +52,7 @@ from reconcile.utils.mr.labels import (
 from reconcile.utils.sharding import is_in_shard
 from reconcile.utils.state import State, init_state
 from reconcile.utils.unleash import get_feature_variant
+from reconcile.utils.weighted_sharding import shard_key_durations
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -1697,7 +1698,7 @@ def run(dry_run: bool, wait_for_pipeline: bool) -> None:
     rebase_strategy = get_rebase_strategy()
     state = init_state(QONTRACT_INTEGRATION)
 
-    for repo in repos:
+    for repo in shard_key_durations.iterate(repos, key=itemgetter("url")):
         hk = repo["housekeeping"]
         project_url = repo["url"]
         days_interval = hk.get("days_interval") or default_days_interval
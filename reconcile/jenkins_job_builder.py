@@ -5,6 +5,7 @@ import sys
 from typing import TYPE_CHECKING, Any
 
 from reconcile import queries
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.defer import defer
 from reconcile.utils.jjb_client import JJB
 from reconcile.utils.secret_reader import (
@@ -80,6 +81,8 @@ def run(
     config_name: str | None = None,
     job_name: str | None = None,
     instance_name: str | None = None,
+    incremental: bool = False,
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
     defer: Callable | None = None,
 ) -> None:
     if not print_only and config_name is not None:
@@ -106,7 +109,7 @@ def run(
         jjb.generate(io_dir, "current")
         jjb.print_diffs(io_dir, instance_name)
     else:
-        jjb.update()
+        jjb.update(state if incremental else None, thread_pool_size)
         configs = jjb.get_configs()
         for name, desired_config in configs.items():
             state.add(name, value=desired_config, force=True)
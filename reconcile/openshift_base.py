@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import itertools
 import logging
-from collections import Counter
+import time
+from collections import Counter, defaultdict
 from collections.abc import (
     Iterable,
     Mapping,
@@ -27,7 +28,8 @@ from sretoolbox.utils import (
 )
 
 from reconcile import queries
-from reconcile.utils import metrics
+from reconcile.status import RunningState
+from reconcile.utils import io_scheduler, metrics
 from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.oc import (
     POD_RECYCLE_SUPPORTED_OWNER_KINDS,
@@ -396,10 +398,11 @@ def fetch_current_state(
         cluster_admin=cluster_admin,
         cluster_scope_resource_validation=cluster_scope_resource_validation,
     )
-    threaded.run(
+    io_scheduler.run(
         populate_current_state,
         state_specs,
         thread_pool_size,
+        endpoint=lambda spec: f"cluster:{spec.cluster}",
         ri=ri,
         integration=integration,
         integration_version=integration_version,
@@ -854,16 +857,16 @@ def patch_desired_resource_for_recycle_annotations(
         if (value := current_annotations.get(k))
     }
     if patch_annotations:
-        desired_annotations = (
-            desired.body
-            .setdefault("spec", {})
-            .setdefault("template", {})
-            .setdefault("metadata", {})
-            .setdefault("annotations", {})
-        )
-        desired.body["spec"]["template"]["metadata"]["annotations"] = (
-            patch_annotations | desired_annotations
-        )
+        with desired.edit_body() as body:
+            template_metadata = (
+                body
+                .setdefault("spec", {})
+                .setdefault("template", {})
+                .setdefault("metadata", {})
+            )
+            template_metadata["annotations"] = patch_annotations | (
+                template_metadata.get("annotations") or {}
+            )
     return desired
 
 
@@ -1040,9 +1043,13 @@ def _realize_resource_data(
         privileged=False,
         enable_deletion=False,
     )
-    return _realize_resource_data_3way_diff(
-        ri_item=ri_item, oc_map=oc_map, ri=ri, options=options
-    )
+    try:
+        return _realize_resource_data_3way_diff(
+            ri_item=ri_item, oc_map=oc_map, ri=ri, options=options
+        )
+    finally:
+        # drop the bodies inflated to diff and apply the resources
+        ri.compact_resources(ri_item[3])
 
 
 def _realize_resource_data_3way_diff(
@@ -1197,8 +1204,7 @@ def _validate_resources_used_exist(
                     service_resources.extend(res["desired"].values())
             # Check serving-cert-secret-name annotation on every considered resource
             for service in service_resources:
-                metadata = service.body.get("metadata", {})
-                annotations = metadata.get("annotations") or {}
+                annotations = service.annotations or {}
                 serving_cert_alpha_secret_name = annotations.get(
                     "service.alpha.openshift.io/serving-cert-secret-name", False
                 )
@@ -1218,7 +1224,7 @@ def _validate_resources_used_exist(
 
         if desired_resource:
             # get the body to match with the possible result from oc.get
-            resource = desired_resource.body
+            resource = desired_resource.read_body()
         else:
             # no. perhaps used resource exists in the namespace?
             resource = oc.get(
@@ -1248,7 +1254,7 @@ def validate_planned_data(ri: ResourceInventory, oc_map: ClusterMap) -> None:
 
         for name, d_item in data["desired"].items():
             if kind in {"Deployment", "DeploymentConfig"}:
-                spec = d_item.body["spec"]["template"]["spec"]
+                spec = d_item.read_body()["spec"]["template"]["spec"]
                 _validate_resources_used_exist(
                     ri, oc, spec, cluster, namespace, kind, name, "Secret"
                 )
@@ -1257,121 +1263,204 @@ def validate_planned_data(ri: ResourceInventory, oc_map: ClusterMap) -> None:
                 )
 
 
-@retry(exceptions=(ValidationError), max_attempts=200)
+VALIDATE_REALIZED_DATA_KINDS = {
+    "Deployment",
+    "DeploymentConfig",
+    "StatefulSet",
+    "Subscription",
+    "Job",
+    "ClowdApp",
+    "ClowdJobInvocation",
+}
+# roughly the time the former retry based validation waited at most
+VALIDATE_REALIZED_DATA_TIMEOUT = 6 * 60 * 60
+VALIDATE_REALIZED_DATA_MAX_POLL_INTERVAL = 30
+
+type RolloutGroup = tuple[str, str, str]
+
+
+def _is_realized(kind: str, name: str, resource: Mapping[str, Any]) -> bool:
+    """
+    Whether the rollout of an applied resource is complete.
+
+    :raises ValidationErrorJobFailedError: a job failed and will never complete
+    """
+    status = resource.get("status")
+    if not status:
+        return False
+    # add elif to validate additional resource kinds
+    if kind in {"Deployment", "DeploymentConfig", "StatefulSet"}:
+        desired_replicas = resource["spec"]["replicas"]
+        if desired_replicas == 0:
+            return True
+        replicas = status.get("replicas")
+        if replicas == 0:
+            return True
+        updated_replicas = status.get("updatedReplicas")
+        ready_replicas = status.get("readyReplicas")
+        if not desired_replicas == replicas == ready_replicas == updated_replicas:
+            logging.info(
+                f"{kind} {name} has replicas that are not ready "
+                f"({ready_replicas} ready / {desired_replicas} total)"
+            )
+            return False
+    elif kind == "Subscription":
+        state = status.get("state")
+        if state != "AtLatestKnown":
+            logging.info(
+                f"Subscription {name} state is invalid. Current state: {state}"
+            )
+            return False
+    elif kind == "Job":
+        succeeded = status.get("succeeded")
+        if not succeeded:
+            logging.info(f"Job {name} has not succeeded")
+            conditions = status.get("conditions")
+            if conditions:
+                logging.info(f"Job conditions are: {conditions}")
+                logging.info(yaml.safe_dump(conditions))
+                for c in conditions:
+                    if c.get("type") == "Failed":
+                        msg = f"{name}: {c.get('reason')}"
+                        raise ValidationErrorJobFailedError(msg)
+            return False
+    elif kind == "ClowdApp":
+        deployments = status.get("deployments")
+        if not deployments:
+            logging.info("ClowdApp has no deployments, status is invalid")
+            return False
+        managed_deployments = deployments.get("managedDeployments")
+        ready_deployments = deployments.get("readyDeployments")
+        if managed_deployments != ready_deployments:
+            logging.info(
+                f"ClowdApp has deployments that are not ready "
+                f"({ready_deployments} ready / "
+                f"{managed_deployments} total)"
+            )
+            return False
+    elif kind == "ClowdJobInvocation":
+        completed = status.get("completed")
+        jobs = status.get("jobMap", {})
+        if jobs:
+            logging.info(f"CJI {name} jobs are: {jobs}")
+            logging.info(yaml.safe_dump(jobs))
+        if not completed:
+            logging.info(f"CJI {name} has not completed")
+            conditions = status.get("conditions")
+            if conditions:
+                logging.info(f"CJI conditions are: {conditions}")
+                logging.info(yaml.safe_dump(conditions))
+            return False
+        failed_jobs = [
+            job_name for job_name, job_state in jobs.items() if job_state == "Failed"
+        ]
+        if failed_jobs:
+            raise ValidationErrorJobFailedError(
+                f"CJI {name} failed jobs: {failed_jobs}"
+            )
+    return True
+
+
+def _list_rollout_group(
+    group: RolloutGroup, oc_map: ClusterMap
+) -> dict[str, dict[str, Any]]:
+    cluster, namespace, kind = group
+    oc = oc_map.get_cluster(cluster)
+    return {item["metadata"]["name"]: item for item in oc.get(namespace, kind)["items"]}
+
+
 def validate_realized_data(
-    actions: Iterable[dict[str, str]], oc_map: ClusterMap
+    actions: Iterable[dict[str, str]],
+    oc_map: ClusterMap,
+    thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+    timeout: float = VALIDATE_REALIZED_DATA_TIMEOUT,
 ) -> None:
     """
     Validate the realized desired state.
 
+    Applied resources are grouped by cluster, namespace and kind. Each round
+    lists every group with pending resources once (concurrently) and
+    evaluates all of its pending resources, until all are realized or the
+    timeout is reached.
+
     :param oc_map: a dictionary containing oc client per cluster
     :param actions: a dictionary of performed actions
+    :param thread_pool_size: number of groups listed concurrently
+    :param timeout: seconds to wait for all resources to be realized
+    :raises ValidationError: resources are not realized within the timeout
+    :raises ValidationErrorJobFailedError: a Job or CJI failed
     """
-
-    supported_kinds = [
-        "Deployment",
-        "DeploymentConfig",
-        "StatefulSet",
-        "Subscription",
-        "Job",
-        "ClowdApp",
-        "ClowdJobInvocation",
-    ]
+    pending: dict[RolloutGroup, set[str]] = defaultdict(set)
     for action in actions:
-        if action["action"] == ACTION_APPLIED:
-            kind = action["kind"]
-            if kind not in supported_kinds:
-                continue
-            cluster = action["cluster"]
-            namespace = action["namespace"]
-            name = action["name"]
-            logging.info(["validating", cluster, namespace, kind, name])
-
-            oc = oc_map.get(cluster)
-            if isinstance(oc, OCLogMsg):
-                logging.log(level=oc.log_level, msg=oc.message)
-                continue
-            resource = oc.get(namespace, kind, name=name)
-            status = resource.get("status")
-            if not status:
-                raise ValidationError("status")
-            # add elif to validate additional resource kinds
-            if kind in {"Deployment", "DeploymentConfig", "StatefulSet"}:
-                desired_replicas = resource["spec"]["replicas"]
-                if desired_replicas == 0:
-                    continue
-                replicas = status.get("replicas")
-                if replicas == 0:
-                    continue
-                updated_replicas = status.get("updatedReplicas")
-                ready_replicas = status.get("readyReplicas")
-                if (
-                    not desired_replicas
-                    == replicas
-                    == ready_replicas
-                    == updated_replicas
-                ):
-                    logging.info(
-                        f"{kind} {name} has replicas that are not ready "
-                        f"({ready_replicas} ready / {desired_replicas} total)"
-                    )
-                    raise ValidationError(name)
-            elif kind == "Subscription":
-                state = status.get("state")
-                if state != "AtLatestKnown":
-                    logging.info(
-                        f"Subscription {name} state is invalid. Current state: {state}"
-                    )
-                    raise ValidationError(name)
-            elif kind == "Job":
-                succeeded = status.get("succeeded")
-                if not succeeded:
-                    logging.info(f"Job {name} has not succeeded")
-                    conditions = status.get("conditions")
-                    if conditions:
-                        logging.info(f"Job conditions are: {conditions}")
-                        logging.info(yaml.safe_dump(conditions))
-                        for c in conditions:
-                            if c.get("type") == "Failed":
-                                msg = f"{name}: {c.get('reason')}"
-                                raise ValidationErrorJobFailedError(msg)
-                    raise ValidationError(name)
-            elif kind == "ClowdApp":
-                deployments = status.get("deployments")
-                if not deployments:
-                    logging.info("ClowdApp has no deployments, status is invalid")
-                    raise ValidationError(name)
-                managed_deployments = deployments.get("managedDeployments")
-                ready_deployments = deployments.get("readyDeployments")
-                if managed_deployments != ready_deployments:
-                    logging.info(
-                        f"ClowdApp has deployments that are not ready "
-                        f"({ready_deployments} ready / "
-                        f"{managed_deployments} total)"
+        if action["action"] != ACTION_APPLIED:
+            continue
+        kind = action["kind"]
+        if kind not in VALIDATE_REALIZED_DATA_KINDS:
+            continue
+        cluster = action["cluster"]
+        namespace = action["namespace"]
+        name = action["name"]
+        oc = oc_map.get(cluster)
+        if isinstance(oc, OCLogMsg):
+            logging.log(level=oc.log_level, msg=oc.message)
+            continue
+        logging.info(["validating", cluster, namespace, kind, name])
+        pending[cluster, namespace, kind].add(name)
+
+    integration = RunningState().integration
+    start = time.monotonic()
+    deadline = start + timeout
+    for attempt in itertools.count(1):
+        groups = list(pending)
+        listings = threaded.run(
+            _list_rollout_group, groups, thread_pool_size, oc_map=oc_map
+        )
+        for group, resources in zip(groups, listings, strict=True):
+            cluster, namespace, kind = group
+            for name in sorted(pending[group]):
+                resource = resources.get(name)
+                if resource is None:
+                    raise StatusCodeError(
+                        f"[{cluster}/{namespace}] {kind} {name} not found"
                     )
-                    raise ValidationError(name)
-            elif kind == "ClowdJobInvocation":
-                completed = status.get("completed")
-                jobs = status.get("jobMap", {})
-                if jobs:
-                    logging.info(f"CJI {name} jobs are: {jobs}")
-                    logging.info(yaml.safe_dump(jobs))
-                if completed:
-                    failed_jobs = []
-                    for job_name, job_state in jobs.items():
-                        if job_state == "Failed":
-                            failed_jobs.append(job_name)
-                    if failed_jobs:
-                        raise ValidationErrorJobFailedError(
-                            f"CJI {name} failed jobs: {failed_jobs}"
-                        )
-                else:
-                    logging.info(f"CJI {name} has not completed")
-                    conditions = status.get("conditions")
-                    if conditions:
-                        logging.info(f"CJI conditions are: {conditions}")
-                        logging.info(yaml.safe_dump(conditions))
-                    raise ValidationError(name)
+                try:
+                    realized = _is_realized(kind, name, resource)
+                except ValidationErrorJobFailedError:
+                    metrics.rollout_validation_result.labels(
+                        integration, kind, "failed"
+                    ).inc()
+                    raise
+                if realized:
+                    pending[group].discard(name)
+                    metrics.rollout_validation_ready_duration.labels(
+                        integration, kind
+                    ).observe(time.monotonic() - start)
+                    metrics.rollout_validation_result.labels(
+                        integration, kind, "ready"
+                    ).inc()
+            if not pending[group]:
+                del pending[group]
+
+        if not pending:
+            return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            for (_, _, kind), names in pending.items():
+                metrics.rollout_validation_result.labels(
+                    integration, kind, "timeout"
+                ).inc(len(names))
+            raise ValidationError(
+                ", ".join(
+                    f"{cluster}/{namespace}/{kind}/{name}"
+                    for (cluster, namespace, kind), names in pending.items()
+                    for name in sorted(names)
+                )
+            )
+        logging.info(
+            f"waiting for {sum(len(names) for names in pending.values())} "
+            "resources to be realized"
+        )
+        time.sleep(min(attempt, VALIDATE_REALIZED_DATA_MAX_POLL_INTERVAL, remaining))
 
 
 def follow_logs(
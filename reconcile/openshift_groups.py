@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import itertools
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sretoolbox.utils import threaded
 
@@ -23,6 +23,7 @@ from reconcile.utils import (
 )
 from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.defer import defer
+from reconcile.utils.metrics import oc_request
 from reconcile.utils.oc_map import (
     OCLogMsg,
     OCMap,
@@ -31,6 +32,7 @@ from reconcile.utils.oc_map import (
 from reconcile.utils.ocm.base import OCMClusterGroupId
 from reconcile.utils.secret_reader import create_secret_reader
 from reconcile.utils.sharding import is_in_shard
+from reconcile.utils.weighted_sharding import shard_key_durations
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -46,25 +48,45 @@ QONTRACT_INTEGRATION = "openshift-groups"
 
 
 def get_cluster_state(
-    group_items: Mapping[str, str], oc_map: ClusterMap
+    cluster_groups: Mapping[str, Any], oc_map: ClusterMap
 ) -> list[dict[str, str]]:
-    cluster = group_items["cluster"]
+    """
+    Get the users of all managed groups of a cluster with a single LIST of
+    Group objects, filtering the managed groups locally.
+    """
+    cluster = cluster_groups["cluster"]
     oc = oc_map.get(cluster)
     if isinstance(oc, OCLogMsg):
         logging.log(level=oc.log_level, msg=oc.message)
         return []
-    group_name = group_items["group_name"]
+    managed_groups = set(cluster_groups["groups"])
+    oc_request.labels(
+        integration=QONTRACT_INTEGRATION, cluster=cluster, kind="Group"
+    ).inc()
     try:
-        group = oc.get_group_if_exists(group_name)
+        with shard_key_durations.measure(cluster):
+            groups = oc.get_groups()
     except Exception:
-        msg = f"could not get group state for cluster/group combination: {cluster}/{group_name}"
+        msg = f"could not get groups state for cluster: {cluster}"
         logging.error(msg)
         raise
-    if group is None:
-        return []
     return [
-        {"cluster": cluster, "group": group_name, "user": user}
-        for user in group["users"] or []
+        {"cluster": cluster, "group": group["metadata"]["name"], "user": user}
+        for group in groups
+        if group["metadata"]["name"] in managed_groups
+        for user in group.get("users") or []
+    ]
+
+
+def create_cluster_groups_list(
+    groups_list: Iterable[Mapping[str, str]],
+) -> list[dict[str, Any]]:
+    cluster_groups: dict[str, list[str]] = {}
+    for item in groups_list:
+        cluster_groups.setdefault(item["cluster"], []).append(item["group_name"])
+    return [
+        {"cluster": cluster, "groups": groups}
+        for cluster, groups in cluster_groups.items()
     ]
 
 
@@ -101,7 +123,10 @@ def fetch_current_state(
 
     groups_list = create_groups_list(clusters, oc_map)
     results = threaded.run(
-        get_cluster_state, groups_list, thread_pool_size, oc_map=oc_map
+        get_cluster_state,
+        create_cluster_groups_list(groups_list),
+        thread_pool_size,
+        oc_map=oc_map,
     )
 
     current_state = list(itertools.chain.from_iterable(results))
@@ -304,4 +329,5 @@ def run(
         logging.info(list(diff.values()))
 
         if not dry_run:
-            act(diff, oc_map)
+            with shard_key_durations.measure(diff["cluster"] or ""):
+                act(diff, oc_map)
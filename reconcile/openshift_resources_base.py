@@ -6,6 +6,7 @@ import json
 import logging
 import re
 import sys
+import time
 from collections import defaultdict
 from collections.abc import (
     Callable,
@@ -41,15 +42,26 @@ from reconcile.utils import (
     gql,
     openssl,
 )
+from reconcile.utils.canonical_hash import canonical_hash
 from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.defer import defer
+from reconcile.utils.desired_state_snapshot import (
+    DesiredStateSnapshots,
+    code_version,
+    init_snapshot_store,
+)
 from reconcile.utils.exceptions import FetchResourceError
 from reconcile.utils.jinja2.utils import (
     FetchSecretError,
     Jinja2TemplateCache,
+    find_vault_lookups,
+    is_static_template,
     process_extracurlyjinja2_template,
     process_jinja2_template,
+    read_vault_secret,
+    vault_cache_key,
 )
+from reconcile.utils.metrics import vault_cache_hit_rate, vault_prefetch_duration
 from reconcile.utils.oc import (
     OC_Map,
     OCClient,
@@ -403,6 +415,7 @@ def fetch_provider_vault_secret(
     alertmanager_config_key: str = "alertmanager.yaml",
     settings: Mapping[str, Any] | None = None,
     secret_reader: SecretReaderBase | None = None,
+    cache: Jinja2TemplateCache | None = None,
 ) -> OR:
     if not secret_reader and not settings:
         raise Exception(
@@ -412,10 +425,13 @@ def fetch_provider_vault_secret(
     if not secret_reader:
         # get the fields from vault
         secret_reader = SecretReader(settings)
+    secret_data = (
+        read_vault_secret(secret_reader, path, version, cache)
+        if cache
+        else secret_reader.read_all({"path": path, "version": version})
+    )
     raw_data = {
-        k: v
-        for k, v in secret_reader.read_all({"path": path, "version": version}).items()
-        if k not in VAULT_SECRETS_EXCLUDED_KEYS
+        k: v for k, v in secret_data.items() if k not in VAULT_SECRETS_EXCLUDED_KEYS
     }
 
     if validate_alertmanager_config:
@@ -466,6 +482,7 @@ def fetch_provider_route(
     tls_path: str | None,
     tls_version: str | None,
     settings: Mapping | None = None,
+    cache: Jinja2TemplateCache | None = None,
 ) -> OR:
     path = resource["path"]
     openshift_resource = fetch_provider_resource(resource)
@@ -473,12 +490,13 @@ def fetch_provider_route(
     if tls_path is None or tls_version is None:
         return openshift_resource
 
-    # override existing tls fields from vault secret
-    openshift_resource.body["spec"].setdefault("tls", {})
-    tls = openshift_resource.body["spec"]["tls"]
     # get tls fields from vault
     secret_reader = SecretReader(settings)
-    raw_data = secret_reader.read_all({"path": tls_path, "version": tls_version})
+    raw_data = (
+        read_vault_secret(secret_reader, tls_path, tls_version, cache)
+        if cache
+        else secret_reader.read_all({"path": tls_path, "version": tls_version})
+    )
     valid_keys = [
         "termination",
         "insecureEdgeTerminationPolicy",
@@ -487,13 +505,16 @@ def fetch_provider_route(
         "caCertificate",
         "destinationCACertificate",
     ]
-    for k, v in raw_data.items():
-        if k in valid_keys:
-            tls[k] = v
-            continue
+    # override existing tls fields from vault secret
+    with openshift_resource.edit_body() as body:
+        tls = body["spec"].setdefault("tls", {})
+        for k, v in raw_data.items():
+            if k in valid_keys:
+                tls[k] = v
+                continue
 
-        msg = f"Route secret '{tls_path}' key '{k}' not in valid keys {valid_keys}"
-        _locked_info_log(msg)
+            msg = f"Route secret '{tls_path}' key '{k}' not in valid keys {valid_keys}"
+            _locked_info_log(msg)
 
     host = openshift_resource.body["spec"].get("host")
     certificate = openshift_resource.body["spec"]["tls"].get("certificate")
@@ -602,6 +623,7 @@ def fetch_openshift_resource(
                 validate_alertmanager_config=validate_alertmanager_config,
                 alertmanager_config_key=alertmanager_config_key,
                 settings=settings,
+                cache=cache,
             )
         except (SecretVersionNotFoundError, SecretVersionIsNoneError) as e:
             raise FetchSecretError(e) from None
@@ -611,7 +633,7 @@ def fetch_openshift_resource(
         tls_path = resource["vault_tls_secret_path"]
         tls_version = resource["vault_tls_secret_version"]
         openshift_resource = fetch_provider_route(
-            resource["resource"], tls_path, tls_version, settings
+            resource["resource"], tls_path, tls_version, settings, cache=cache
         )
     elif provider == "prometheus-rule":
         path = resource["resource"]["path"]
@@ -706,11 +728,29 @@ def fetch_desired_state(
     privileged: bool,
     cache: Jinja2TemplateCache,
     settings: Mapping[str, Any] | None = None,
+    snapshots: DesiredStateSnapshots | None = None,
 ) -> None:
+    if snapshots is not None and not is_snapshot_safe(resource):
+        snapshots = None
+    snapshot_key = f"{cluster}/{namespace}"
+    # the digest must be taken before rendering links the namespace into
+    # the resource
+    item_key = canonical_hash(resource) if snapshots is not None else ""
     try:
-        openshift_resource = fetch_openshift_resource(
-            resource, parent, settings, cache=cache
-        )
+        body = snapshots.get(snapshot_key, item_key) if snapshots else None
+        if body is not None:
+            openshift_resource = OR(
+                body,
+                QONTRACT_INTEGRATION,
+                QONTRACT_INTEGRATION_VERSION,
+                error_details=resource["resource"]["path"],
+            )
+        else:
+            openshift_resource = fetch_openshift_resource(
+                resource, parent, settings, cache=cache
+            )
+        if snapshots is not None:
+            snapshots.record(snapshot_key, item_key, openshift_resource.body)
     except (
         FetchResourceError,
         FetchSecretError,
@@ -760,6 +800,7 @@ def fetch_states(
     ri: ResourceInventory,
     cache: Jinja2TemplateCache,
     settings: Mapping[str, Any] | None = None,
+    snapshots: DesiredStateSnapshots | None = None,
 ) -> None:
     try:
         if isinstance(spec, ob.CurrentStateSpec):
@@ -782,6 +823,7 @@ def fetch_states(
                 spec.privileged,
                 cache=cache,
                 settings=settings,
+                snapshots=snapshots,
             )
 
     except StatusCodeError as e:
@@ -789,6 +831,116 @@ def fetch_states(
         logging.error(f"{spec} - exception: {e!s}")
 
 
+def collect_vault_secret_refs(
+    namespaces: Iterable[Mapping[str, Any]],
+) -> set[tuple[str, str | None]]:
+    """
+    Collect the vault cache keys of all secrets referenced by the
+    openshiftResources of the namespaces: vault-secret and route providers
+    as well as vault() lookups with literal arguments in templates.
+    """
+    refs: set[tuple[str, str | None]] = set()
+    for namespace_info in namespaces:
+        for resource in namespace_info.get("openshiftResources") or []:
+            provider = resource["provider"]
+            if provider == "vault-secret":
+                refs.add(vault_cache_key(resource["path"], resource["version"]))
+            elif provider == "route":
+                tls_path = resource["vault_tls_secret_path"]
+                tls_version = resource["vault_tls_secret_version"]
+                if tls_path is not None and tls_version is not None:
+                    refs.add(vault_cache_key(tls_path, tls_version))
+            elif provider in {"resource-template", "prometheus-rule"}:
+                tt = resource["type"]
+                if tt == "resource":
+                    continue
+                refs |= find_vault_lookups(
+                    resource["resource"]["content"],
+                    extra_curly=tt is not None and "extracurly" in tt,
+                )
+    return refs
+
+
+def prefetch_vault_secrets(
+    namespaces: Iterable[Mapping[str, Any]],
+    thread_pool_size: int,
+    cache: Jinja2TemplateCache,
+    settings: Mapping[str, Any] | None = None,
+) -> None:
+    """
+    Read all secrets referenced by the namespaces concurrently into the cache
+    before rendering. Secrets that can't be read are skipped here, rendering
+    reports the error for the affected resource.
+    """
+    refs = collect_vault_secret_refs(namespaces)
+    if not refs:
+        return
+    secret_reader = SecretReader(settings, thread_pool_size=thread_pool_size)
+
+    def _prefetch(ref: tuple[str, str | None]) -> bool:
+        path, version = ref
+        try:
+            read_vault_secret(secret_reader, path, version, cache)
+        except Exception as e:
+            _locked_debug_log(f"could not prefetch secret {path} ({version}): {e}")
+            return False
+        return True
+
+    start_time = time.monotonic()
+    results = threaded.run(_prefetch, refs, thread_pool_size)
+    duration = time.monotonic() - start_time
+    vault_prefetch_duration.labels(integration=QONTRACT_INTEGRATION).observe(duration)
+    logging.debug(
+        f"prefetched {sum(results)}/{len(refs)} vault secrets in {duration:.2f}s"
+    )
+
+
+def is_snapshot_safe(resource: Mapping[str, Any]) -> bool:
+    """
+    Check if the rendered resource is a pure function of the namespace
+    data and contains no secrets, so it can be stored in a snapshot.
+    """
+    provider = resource["provider"]
+    if provider == "resource":
+        return True
+    if provider == "route":
+        return (
+            resource["vault_tls_secret_path"] is None
+            or resource["vault_tls_secret_version"] is None
+        )
+    if provider in {"resource-template", "prometheus-rule"}:
+        tt = resource["type"]
+        if tt == "resource":
+            return True
+        return is_static_template(
+            resource["resource"]["content"],
+            extra_curly=tt is not None and "extracurly" in tt,
+        )
+    # vault-secret
+    return False
+
+
+def snapshot_inputs(
+    namespaces: Iterable[Mapping[str, Any]],
+    settings: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Everything the resources of a namespace are rendered from, by snapshot
+    key. Must be called before rendering, which links the namespace into
+    its resources.
+    """
+    return {
+        f"{ns['cluster']['name']}/{ns['name']}": {
+            "namespace": ns,
+            "repo_url": (settings or {}).get("repoUrl"),
+            "integration": QONTRACT_INTEGRATION,
+            "integration_version": QONTRACT_INTEGRATION_VERSION,
+            "code_version": code_version(),
+        }
+        for ns in namespaces
+    }
+
+
 def fetch_data(
     namespaces: Iterable[Mapping[str, Any]],
     thread_pool_size: int,
@@ -796,6 +948,7 @@ def fetch_data(
     cache: Jinja2TemplateCache,
     init_api_resources: bool = False,
     overrides: Iterable[str] | None = None,
+    snapshots: DesiredStateSnapshots | None = None,
 ) -> tuple[OC_Map, ResourceInventory]:
     ri = ResourceInventory()
     settings = queries.get_app_interface_settings()
@@ -815,6 +968,11 @@ def fetch_data(
         override_managed_types=overrides,
         cluster_scope_resource_validation=True,
     )
+    if snapshots:
+        snapshots.load(snapshot_inputs(namespaces, settings))
+    prefetch_vault_secrets(namespaces, thread_pool_size, cache, settings=settings)
+    # only report the hit rate of the lookups done while rendering
+    cache.reset_stats()
     threaded.run(
         fetch_states,
         state_specs,
@@ -822,6 +980,12 @@ def fetch_data(
         ri=ri,
         settings=settings,
         cache=cache,
+        snapshots=snapshots,
+    )
+    if snapshots:
+        snapshots.save()
+    vault_cache_hit_rate.labels(integration=QONTRACT_INTEGRATION).set(
+        cache.hit_rate(Jinja2TemplateCache.VAULT)
     )
 
     return oc_map, ri
@@ -955,6 +1119,7 @@ def run(
             "Exiting."
         )
         return None
+    snapshot_store = init_snapshot_store(QONTRACT_INTEGRATION)
     oc_map, ri = fetch_data(
         namespaces,
         thread_pool_size,
@@ -962,6 +1127,11 @@ def run(
         init_api_resources=init_api_resources,
         overrides=overrides,
         cache=Jinja2TemplateCache(),
+        snapshots=DesiredStateSnapshots(
+            snapshot_store, thread_pool_size, read_only=dry_run
+        )
+        if snapshot_store
+        else None,
     )
     if defer:
         defer(oc_map.cleanup)
@@ -340,7 +340,7 @@ def run(
                 logging.error(str(e))
                 ri.register_error()
         try:
-            ob.validate_realized_data(actions, oc_map)
+            ob.validate_realized_data(actions, oc_map, thread_pool_size)
         except Exception as e:
             logging.error(str(e))
             ri.register_error()
@@ -104,6 +104,8 @@ def run(
         defer(saasherder.cleanup)
         defer(oc_map.cleanup)
 
+    # state markers are written right after each trigger, a run killed
+    # partway must not trigger the pipelines again
     trigger_specs, diff_err = saasherder.get_diff(trigger_type, dry_run)
     # This will be populated by 'trigger' in the below loop and
     # we need it to be consistent across all iterations
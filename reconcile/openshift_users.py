@@ -32,6 +32,7 @@ from reconcile.typed_queries.clusters_minimal import get_clusters_minimal
 from reconcile.utils import expiration
 from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.defer import defer
+from reconcile.utils.metrics import oc_request
 from reconcile.utils.oc_map import (
     OCLogMsg,
     OCMap,
@@ -62,6 +63,9 @@ def get_cluster_users(
         if isinstance(auth, ClusterAuthOIDCV1 | ClusterAuthRHIDPV1)
     )
 
+    oc_request.labels(
+        integration=QONTRACT_INTEGRATION, cluster=cluster, kind="User"
+    ).inc()
     for u in oc.get_users():
         if u["metadata"].get("labels", {}).get("admin", ""):
             # ignore admins
@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 import difflib
 import logging
 import sys
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
@@ -9,8 +12,12 @@ import reconcile.openshift_resources_base as orb
 from reconcile import queries
 from reconcile.status import ExitCodes
 from reconcile.utils import gql
+from reconcile.utils.render_cache import RenderCache, init_render_cache
 from reconcile.utils.semver_helper import make_semver
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 QONTRACT_INTEGRATION = "resource-template-tester"
 QONTRACT_INTEGRATION_VERSION = make_semver(0, 1, 0)
 
@@ -30,17 +37,33 @@ def load_resource(path: str) -> dict:
     return yaml.safe_load(gql.get_resource(path)["content"])
 
 
+def template_test_digest(
+    resource: Mapping[str, Any], namespace: Mapping[str, Any], expected_result: dict
+) -> str:
+    # rendering adds the namespace to the resource, which in turn references
+    # the resource via its openshiftResources
+    return RenderCache.digest(
+        QONTRACT_INTEGRATION_VERSION,
+        {k: v for k, v in resource.items() if k != "namespace"},
+        {k: v for k, v in namespace.items() if k != "openshiftResources"},
+        expected_result,
+    )
+
+
 def run(dry_run: bool) -> None:
     gqlapi = gql.get_api()
     template_tests = gqlapi.query(TEMPLATE_TESTS_QUERY)["tests"]
     settings = queries.get_app_interface_settings()
+    namespaces = gqlapi.query(orb.NAMESPACES_QUERY)["namespaces"]
+    for n in namespaces:
+        ob.aggregate_shared_resources(n, "openshiftResources")
+    render_cache = init_render_cache(QONTRACT_INTEGRATION)
     error = False
     for tt in template_tests:
         found = False
         resource_path = tt["resourcePath"]
         expected_result = load_resource(tt["expectedResult"])
-        for n in gqlapi.query(orb.NAMESPACES_QUERY)["namespaces"]:
-            ob.aggregate_shared_resources(n, "openshiftResources")
+        for n in namespaces:
             openshift_resources = n.get("openshiftResources")
             if not openshift_resources:
                 continue
@@ -50,6 +73,9 @@ def run(dry_run: bool) -> None:
                     continue
 
                 found = True
+                digest = template_test_digest(r, n, expected_result)
+                if render_cache.passed(digest):
+                    continue
                 openshift_resource = orb.fetch_openshift_resource(r, n, settings)
                 if openshift_resource.body != expected_result:
                     diff = difflib.unified_diff(
@@ -65,6 +91,9 @@ def run(dry_run: bool) -> None:
                         f"{''.join(diff)}"
                     )
                     error = True
+                elif orb.is_snapshot_safe(r):
+                    # lookups done while rendering are not part of the digest
+                    render_cache.record_passed(digest)
 
         if not found:
             logging.error(
@@ -72,5 +101,9 @@ def run(dry_run: bool) -> None:
             )
             error = True
 
+    logging.info(
+        f"render cache: {render_cache.hits} template tests skipped, "
+        f"{render_cache.misses} rendered"
+    )
     if error:
         sys.exit(ExitCodes.ERROR)
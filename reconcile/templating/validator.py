@@ -14,7 +14,8 @@ from reconcile.gql_definitions.templating.templates import (
 )
 from reconcile.templating.lib.rendering import Renderer, TemplateData, create_renderer
 from reconcile.utils import gql
-from reconcile.utils.jinja2.utils import TemplateRenderOptions
+from reconcile.utils.jinja2.utils import TemplateRenderOptions, is_static_template
+from reconcile.utils.render_cache import RenderCache, init_render_cache
 from reconcile.utils.runtime.integration import (
     QontractReconcileIntegration,
 )
@@ -35,6 +36,20 @@ def get_templates(
     return query(query_func).template_v1 or []
 
 
+def is_static(template: TemplateV1) -> bool:
+    """
+    Check if the rendering results of the template only depend on the
+    template and its test data, i.e. if its test results can be cached.
+    """
+    bodies = [
+        template.template,
+        template.target_path,
+        template.condition or "",
+        template.patch.path if template.patch else "",
+    ]
+    return all(is_static_template(body) for body in bodies)
+
+
 class TemplateDiff(BaseModel):
     template: str
     test: str
@@ -133,15 +148,31 @@ class TemplateValidatorIntegration(QontractReconcileIntegration):
     def run(self, dry_run: bool) -> None:
         diffs: list[TemplateDiff] = []
         ruaml_instance = create_ruamel_instance(explicit_start=True)
+        render_cache = init_render_cache(
+            QONTRACT_INTEGRATION, secret_reader=self.secret_reader
+        )
 
         for template in get_templates():
+            cacheable = is_static(template)
             for test in template.template_test:
-                logging.info(f"Running test {test.name} for template {template.name}")
-                diffs.extend(
-                    self.validate_template(
-                        template, test, ruaml_instance, self.secret_reader
+                digest = RenderCache.digest(template, test)
+                if render_cache.passed(digest):
+                    logging.debug(
+                        f"Skipping unchanged test {test.name} for template {template.name}"
                     )
+                    continue
+                logging.info(f"Running test {test.name} for template {template.name}")
+                test_diffs = self.validate_template(
+                    template, test, ruaml_instance, self.secret_reader
                 )
+                if test_diffs:
+                    diffs.extend(test_diffs)
+                elif cacheable:
+                    render_cache.record_passed(digest)
+        logging.info(
+            f"render cache: {render_cache.hits} template tests skipped, "
+            f"{render_cache.misses} rendered"
+        )
 
         if diffs:
             for diff in diffs:
@@ -18,6 +18,7 @@ from pydantic import BaseModel, ValidationError
 from reconcile.gql_definitions.fragments.vault_secret import VaultSecret
 from reconcile.utils.gql import GqlApi
 from reconcile.utils.models import data_default_none
+from reconcile.utils.ocm.inventory_cache import ocm_inventory_cache
 from reconcile.utils.state import State
 
 if TYPE_CHECKING:
@@ -27,6 +28,12 @@ if TYPE_CHECKING:
     from reconcile.test.fixtures import Fixtures
 
 
+@pytest.fixture(autouse=True)
+def clear_ocm_inventory_cache() -> Generator[None]:
+    yield
+    ocm_inventory_cache.clear()
+
+
 @pytest.fixture
 def patch_sleep(mocker: MockerFixture) -> Generator[MagicMock]:
     yield mocker.patch.object(time, "sleep")
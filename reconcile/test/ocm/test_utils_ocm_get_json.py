@@ -73,6 +73,39 @@ def test_get_json_pagination(
     assert len(ocm_calls) == (nr_of_items // page_size) + 1
 
 
+@pytest.mark.parametrize(
+    "nr_of_items, page_size",
+    [(10, 3), (10, 2), (1, 10), (10, 10)],
+)
+def test_get_json_pagination_concurrent(
+    nr_of_items: int,
+    page_size: int,
+    ocm: OCM,
+    register_ocm_url_responses: Callable[[list[OcmUrl], int], int],
+    find_all_ocm_http_requests: Callable[[str, str], list[Request]],
+) -> None:
+    register_ocm_url_responses(
+        [
+            OcmUrl(
+                method="GET",
+                uri="/api",
+                responses=build_paged_ocm_response(
+                    nr_of_items=nr_of_items, page_size=page_size
+                ),
+            )
+        ],
+        page_size,
+    )
+
+    resp = ocm._get_json("/api", page_size=page_size, max_workers=4)
+
+    assert [item["id"] for item in resp["items"]] == list(range(nr_of_items))
+    assert resp["total"] == nr_of_items
+
+    ocm_calls = find_all_ocm_http_requests("GET", "/api")
+    assert len(ocm_calls) == (nr_of_items // page_size) + 1
+
+
 def test_get_json_empty_list(
     ocm: OCM,
     register_ocm_url_responses: Callable[[list[OcmUrl], int], int],
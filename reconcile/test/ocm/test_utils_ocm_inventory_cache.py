@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from reconcile.utils.ocm import inventory_cache
+from reconcile.utils.ocm.inventory_cache import OCMInventoryCache
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from reconcile.utils.ocm import OCM
+
+
+def test_ocm_inventory_cache_hit(mocker: MockerFixture) -> None:
+    cache = OCMInventoryCache(ttl=60)
+    fetch = mocker.Mock(return_value=[{"name": "c1"}])
+
+    assert cache.get_or_fetch(("url", "org"), fetch) == [{"name": "c1"}]
+    assert cache.get_or_fetch(("url", "org"), fetch) == [{"name": "c1"}]
+
+    fetch.assert_called_once()
+
+
+def test_ocm_inventory_cache_returns_copies() -> None:
+    cache = OCMInventoryCache(ttl=60)
+
+    clusters = cache.get_or_fetch(("url", "org"), lambda: [{"name": "c1"}])
+    clusters[0]["name"] = "changed"
+
+    assert cache.get_or_fetch(("url", "org"), list) == [{"name": "c1"}]
+
+
+def test_ocm_inventory_cache_expired(mocker: MockerFixture) -> None:
+    monotonic = mocker.patch.object(inventory_cache.time, "monotonic")
+    monotonic.return_value = 100.0
+    cache = OCMInventoryCache(ttl=60)
+    fetch = mocker.Mock(return_value=[])
+
+    cache.get_or_fetch(("url", "org"), fetch)
+    monotonic.return_value = 161.0
+    cache.get_or_fetch(("url", "org"), fetch)
+
+    assert fetch.call_count == 2
+
+
+def test_ocm_inventory_cache_invalidate(mocker: MockerFixture) -> None:
+    cache = OCMInventoryCache(ttl=60)
+    fetch = mocker.Mock(return_value=[])
+    cache.get_or_fetch(("url", "org-1", "clusters"), fetch)
+    cache.get_or_fetch(("url", "org-2", "clusters"), fetch)
+
+    cache.invalidate("url", "org-1")
+    cache.get_or_fetch(("url", "org-1", "clusters"), fetch)
+    cache.get_or_fetch(("url", "org-2", "clusters"), fetch)
+
+    assert fetch.call_count == 3
+
+
+def test_ocm_inventory_cache_disabled(mocker: MockerFixture) -> None:
+    cache = OCMInventoryCache(ttl=0)
+    fetch = mocker.Mock(return_value=[])
+
+    cache.get_or_fetch(("url", "org"), fetch)
+    cache.get_or_fetch(("url", "org"), fetch)
+
+    assert fetch.call_count == 2
+
+
+def test_ocm_write_invalidates_inventory_cache(ocm: OCM, mocker: MockerFixture) -> None:
+    mocker.patch.object(ocm._ocm_client, "delete")
+    fetch = mocker.Mock(return_value=[])
+    key = ocm._inventory_cache_key("clusters")
+    mocker.patch.object(inventory_cache.ocm_inventory_cache, "ttl", 60)
+    inventory_cache.ocm_inventory_cache.get_or_fetch(key, fetch)
+
+    ocm._delete("/api/some-resource")
+    inventory_cache.ocm_inventory_cache.get_or_fetch(key, fetch)
+
+    assert fetch.call_count == 2
@@ -1,22 +1,21 @@
 from __future__ import annotations
 
-from time import sleep
 from typing import TYPE_CHECKING, Any
 
-import jsonpath_ng
 import pytest
+from jsonpath_ng import Root, parse
 
 from reconcile.change_owners.diff import (
     IDENTIFIER_FIELD_NAME,
     Diff,
     DiffType,
 )
+from reconcile.utils import canonical_hash
+from reconcile.utils.canonical_hash import HashMode
 from reconcile.utils.runtime import desired_state_diff
 from reconcile.utils.runtime.desired_state_diff import (
-    DiffDetectionFailureError,
-    DiffDetectionTimeoutError,
     build_desired_state_diff,
-    extract_diffs_with_timeout,
+    extract_merkle_diffs,
 )
 from reconcile.utils.runtime.integration import DesiredStateShardConfig
 
@@ -99,39 +98,36 @@ def test_desired_state_diff_building_shardable_integration(
     assert desired_state_diff.affected_shards == {"b"}
 
 
-def diff_extration_with_3_second_sleep(
-    old_file_content: Any, new_file_content: Any
-) -> list[Diff]:
-    sleep(3)
-    return [
-        Diff(
-            diff_type=DiffType.CHANGED,
-            path=jsonpath_ng.parse("shards[1].value"),
-            old="old",
-            new="new",
-        )
-    ]
-
-
-def diff_extration_with_endless_recursion(
-    old_file_content: Any, new_file_content: Any
-) -> list[Diff]:
-    return diff_extration_with_endless_recursion(old_file_content, new_file_content)
-
-
-def diff_extration_with_exception(
-    old_file_content: Any, new_file_content: Any
-) -> list[Diff]:
-    raise Exception("something went wrong")
+def test_desired_state_diff_building_deephash_mode(
+    monkeypatch: pytest.MonkeyPatch,
+    shardable_test_integration: ShardableTestIntegration,
+) -> None:
+    monkeypatch.setattr(canonical_hash, "DEFAULT_HASH_MODE", HashMode.DEEPHASH)
+    desired_state_diff = build_desired_state_diff(
+        shardable_test_integration.get_desired_state_shard_config(),
+        previous_desired_state={
+            "shards": [
+                {"shard": "a", "value": "old"},
+                {"shard": "b", "value": "old"},
+            ]
+        },
+        current_desired_state={
+            "shards": [
+                {"shard": "b", "value": "new"},
+                {"shard": "a", "value": "old"},
+            ]
+        },
+    )
+    assert desired_state_diff.affected_shards == {"b"}
 
 
-def test_desired_state_diff_building_time(
+def test_desired_state_diff_building_extraction_failure(
     mocker: MockerFixture, shardable_test_integration: ShardableTestIntegration
 ) -> None:
-    extract_diffs_with_timeout_mock = mocker.patch.object(
-        desired_state_diff, "extract_diffs_with_timeout"
+    extract_merkle_diffs_mock = mocker.patch.object(
+        desired_state_diff, "extract_merkle_diffs"
     )
-    extract_diffs_with_timeout_mock.side_effect = DiffDetectionTimeoutError()
+    extract_merkle_diffs_mock.side_effect = RecursionError()
     diff = build_desired_state_diff(
         shardable_test_integration.get_desired_state_shard_config(),
         previous_desired_state={
@@ -147,6 +143,7 @@ def test_desired_state_diff_building_time(
             ]
         },
     )
+    assert diff.diff_found
     assert diff.affected_shards == set()
 
 
@@ -155,67 +152,135 @@ def test_desired_state_diff_building_time(
 #
 
 
-def test_extract_diffs_with_timeout() -> None:
-    """
-    test timeout behaviour of diff extraction
-    """
-    previous_desired_state = {
-        "shards": [
-            {"shard": "a", "value": "old"},
-            {"shard": "b", "value": "old"},
-        ]
-    }
-    current_desired_state = {
-        "shards": [
-            {"shard": "a", "value": "old"},
-            {"shard": "b", "value": "new"},
-        ]
-    }
+def _diffs(diffs: list[Diff]) -> set[tuple[str, DiffType, Any, Any]]:
+    return {(d.path_str(), d.diff_type, d.old, d.new) for d in diffs}
+
+
+def test_extract_merkle_diffs_no_diff() -> None:
+    assert not extract_merkle_diffs(
+        {"data": [{"name": "a"}, {"name": "b"}]},
+        {"data": [{"name": "a"}, {"name": "b"}]},
+    )
 
-    # the timeout is lower than the extraction duration -> TIMEOUT
-    with pytest.raises(DiffDetectionTimeoutError):
-        extract_diffs_with_timeout(
-            diff_extration_with_3_second_sleep,
-            previous_desired_state=previous_desired_state,
-            current_desired_state=current_desired_state,
-            timeout_seconds=1,
+
+def test_extract_merkle_diffs_changed_leaf() -> None:
+    assert _diffs(
+        extract_merkle_diffs(
+            {"data": {"a": {"value": 1}, "b": {"value": 1}}},
+            {"data": {"a": {"value": 1}, "b": {"value": 2}}},
         )
+    ) == {("data.b.value", DiffType.CHANGED, 1, 2)}
+
 
-    # the timeout is higher than the extraction duration -> NO TIMEOUT
-    diffs = extract_diffs_with_timeout(
-        diff_extration_with_3_second_sleep,
-        previous_desired_state=previous_desired_state,
-        current_desired_state=current_desired_state,
-        timeout_seconds=5,
+def test_extract_merkle_diffs_added_and_removed_keys() -> None:
+    assert _diffs(
+        extract_merkle_diffs(
+            {"data": {"a": 1, "b": 2}},
+            {"data": {"a": 1, "c": 3}},
+        )
+    ) == {
+        ("data.b", DiffType.REMOVED, 2, None),
+        ("data.c", DiffType.ADDED, None, 3),
+    }
+
+
+def test_extract_merkle_diffs_ignores_list_order() -> None:
+    assert not extract_merkle_diffs(
+        {"data": [{"name": "a"}, {"name": "b"}, "c"]},
+        {"data": ["c", {"name": "b"}, {"name": "a"}]},
     )
-    assert diffs
-    assert isinstance(diffs[0], Diff)
 
 
-def test_extract_diffs_with_recursion_issue() -> None:
-    """
-    test if a max recursion issue is caught properly
-    """
-    with pytest.raises(DiffDetectionFailureError):
-        extract_diffs_with_timeout(
-            diff_extration_with_endless_recursion,
-            previous_desired_state={},
-            current_desired_state={},
-            timeout_seconds=100,
+def test_extract_merkle_diffs_list_items() -> None:
+    assert _diffs(
+        extract_merkle_diffs(
+            {"data": ["a", "b", "c"]},
+            {"data": ["c", "a", "d"]},
         )
+    ) == {
+        ("data.[1]", DiffType.REMOVED, "b", None),
+        ("data.[2]", DiffType.ADDED, None, "d"),
+    }
 
 
-def test_extract_diffs_with_exception() -> None:
+def test_extract_merkle_diffs_matches_identifiers() -> None:
+    assert _diffs(
+        extract_merkle_diffs(
+            {
+                "data": [
+                    {"value": "a", IDENTIFIER_FIELD_NAME: "a"},
+                    {"value": "b", IDENTIFIER_FIELD_NAME: "b"},
+                ]
+            },
+            {
+                "data": [
+                    {"value": "a", IDENTIFIER_FIELD_NAME: "a"},
+                    {"value": "c", IDENTIFIER_FIELD_NAME: "b"},
+                ]
+            },
+        )
+    ) == {("data.[1].value", DiffType.CHANGED, "b", "c")}
+
+
+def test_extract_merkle_diffs_moved_item_changed() -> None:
     """
-    test with exception
+    a changed item that moved within a list is reported on its previous
+    and on its current path
     """
-    with pytest.raises(DiffDetectionFailureError):
-        extract_diffs_with_timeout(
-            diff_extration_with_exception,
-            previous_desired_state={},
-            current_desired_state={},
-            timeout_seconds=100,
+    assert _diffs(
+        extract_merkle_diffs(
+            {
+                "data": [
+                    {"value": "a", IDENTIFIER_FIELD_NAME: "a"},
+                    {"value": "b", IDENTIFIER_FIELD_NAME: "b"},
+                ]
+            },
+            {
+                "data": [
+                    {"value": "c", IDENTIFIER_FIELD_NAME: "b"},
+                    {"value": "a", IDENTIFIER_FIELD_NAME: "a"},
+                ]
+            },
         )
+    ) == {
+        ("data.[1].value", DiffType.REMOVED, "b", None),
+        ("data.[0].value", DiffType.ADDED, None, "c"),
+    }
+
+
+def test_extract_merkle_diffs_objects_without_identifier() -> None:
+    assert _diffs(
+        extract_merkle_diffs(
+            {"data": [{"name": "a", "value": 1}, {"name": "b", "value": 1}]},
+            {"data": [{"name": "a", "value": 1}, {"name": "b", "value": 2}]},
+        )
+    ) == {("data.[1].value", DiffType.CHANGED, 1, 2)}
+
+
+def test_extract_merkle_diffs_type_change() -> None:
+    assert extract_merkle_diffs({"data": {"a": 1}}, {"data": ["a"]}) == [
+        Diff(path=parse("data"), diff_type=DiffType.CHANGED, old={"a": 1}, new=["a"])
+    ]
+
+
+@pytest.mark.parametrize("mode", list(HashMode))
+def test_extract_merkle_diffs_hash_modes(mode: HashMode) -> None:
+    assert _diffs(
+        extract_merkle_diffs(
+            {"data": [{"name": "a", "value": 1}, {"name": "b", "value": 1}]},
+            {"data": [{"name": "b", "value": 1}, {"name": "a", "value": 2}]},
+            mode=mode,
+        )
+    ) == {
+        ("data.[0].value", DiffType.REMOVED, 1, None),
+        ("data.[1].value", DiffType.ADDED, None, 2),
+    }
+
+
+def test_extract_merkle_diffs_empty_desired_state() -> None:
+    assert extract_merkle_diffs({}, {"data": 1}) == [
+        Diff(path=Root(), diff_type=DiffType.ADDED, old=None, new={"data": 1})
+    ]
 
 
 #
@@ -5,11 +5,16 @@ from typing import TYPE_CHECKING
 import pytest
 
 from reconcile.gql_definitions.templating.templates import TemplateTestV1, TemplateV1
-from reconcile.templating.validator import TemplateValidatorIntegration
+from reconcile.templating.validator import TemplateValidatorIntegration, is_static
+from reconcile.utils.desired_state_snapshot import FileSnapshotStore
+from reconcile.utils.render_cache import RenderCache
+from reconcile.utils.runtime.integration import PydanticRunParams
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
 
+    from pytest_mock import MockerFixture
     from qontract_utils.ruamel import yaml
 
 
@@ -142,3 +147,76 @@ def test_validate_target_path_diff(
         diff[0].diff
         == "Target path mismatch, got: /bar/bar.yml, expected: /foo/bar.yml"
     )
+
+
+def test_run_skips_passed_tests(
+    simple_template: TemplateV1,
+    simple_template_test: TemplateTestV1,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    simple_template.template_test = [simple_template_test]
+    mocker.patch(
+        "reconcile.templating.validator.get_templates", return_value=[simple_template]
+    )
+    mocker.patch(
+        "reconcile.templating.validator.init_render_cache",
+        side_effect=lambda *_, **__: RenderCache(FileSnapshotStore(tmp_path)),
+    )
+    validate_template = mocker.spy(TemplateValidatorIntegration, "validate_template")
+    integration = TemplateValidatorIntegration(PydanticRunParams())
+    integration._secret_reader = mocker.Mock()
+
+    integration.run(dry_run=True)
+    assert validate_template.call_count == 1
+
+    integration.run(dry_run=True)
+    assert validate_template.call_count == 1
+
+    simple_template.template = "{{foo}}-changed"
+    with pytest.raises(ValueError, match="Template validation failed"):
+        integration.run(dry_run=True)
+    assert validate_template.call_count == 2
+
+
+def test_run_always_renders_templates_with_lookups(
+    simple_template: TemplateV1,
+    simple_template_test: TemplateTestV1,
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    simple_template.condition = "{{ query('/foo.yml') is none or foo == 'bar' }}"
+    simple_template.template_test = [simple_template_test]
+    mocker.patch(
+        "reconcile.templating.validator.get_templates", return_value=[simple_template]
+    )
+    mocker.patch(
+        "reconcile.templating.validator.init_render_cache",
+        side_effect=lambda *_, **__: RenderCache(FileSnapshotStore(tmp_path)),
+    )
+    validate_template = mocker.patch.object(
+        TemplateValidatorIntegration, "validate_template", return_value=[]
+    )
+    integration = TemplateValidatorIntegration(PydanticRunParams())
+    integration._secret_reader = mocker.Mock()
+
+    integration.run(dry_run=True)
+    integration.run(dry_run=True)
+    assert validate_template.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "field, body, expected",
+    [
+        pytest.param("template", "{{foo}}", True, id="static"),
+        pytest.param("template", "{{ vault('path', 'key') }}", False, id="vault"),
+        pytest.param("target_path", "{{ url('https://x') }}", False, id="url"),
+        pytest.param("condition", "{{ query('/foo.yml') }}", False, id="query"),
+    ],
+)
+def test_is_static(
+    simple_template: TemplateV1, field: str, body: str, expected: bool
+) -> None:
+    setattr(simple_template, field, body)
+
+    assert is_static(simple_template) == expected
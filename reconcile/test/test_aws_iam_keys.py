@@ -82,3 +82,9 @@ def test_update_state(state: StateMock) -> None:
     keys_to_update = {"a": ["k1"]}
     integ.update_state(state, keys_to_update)
     assert state.data == keys_to_update
+
+
+def test_get_new_keys(state: StateMock) -> None:
+    state.data.update({"a": ["k1"]})
+    keys_to_delete = {"a": ["k1", "k2"], "b": ["k3"]}
+    assert integ.get_new_keys(state, keys_to_delete) == {"a": ["k2"], "b": ["k3"]}
@@ -67,7 +67,9 @@ def test_run_scopes_get_users_keys_to_accounts_with_candidate_keys(
 
     integ.run(dry_run=True)
 
-    mock_aws.get_users_keys.assert_called_once_with({"acct-a"})
+    mock_aws.get_users_keys.assert_called_once_with(
+        {"acct-a"}, expected_keys={"acct-a": ["AKIA123"]}
+    )
 
 
 def test_run_skips_get_users_keys_when_no_candidate_keys(
@@ -98,3 +100,44 @@ def test_run_skips_get_users_keys_when_no_candidate_keys(
     integ.run(dry_run=True)
 
     mock_aws.get_users_keys.assert_not_called()
+
+
+def test_run_skips_get_users_keys_for_already_deleted_keys(
+    mocker: MockerFixture,
+) -> None:
+    account: dict[str, Any] = {
+        "name": "acct-a",
+        "premiumSupport": True,
+        "deleteKeys": ["AKIA123"],
+        "path": "/x",
+    }
+    mocker.patch(
+        "reconcile.aws_support_cases_sos.queries.get_aws_accounts",
+        return_value=[account],
+    )
+    mocker.patch(
+        "reconcile.aws_support_cases_sos.queries.get_app_interface_settings",
+        return_value={},
+    )
+    mock_act = mocker.patch("reconcile.aws_support_cases_sos.act")
+
+    fake_case = {
+        "recentCommunications": {
+            "communications": [
+                {
+                    "body": "We have become aware that the AWS Access Key "
+                    "AKIA123 was leaked"
+                }
+            ]
+        }
+    }
+    mock_aws = mocker.MagicMock()
+    mock_aws.get_support_cases.return_value = {"acct-a": [fake_case]}
+    mock_aws.__enter__.return_value = mock_aws
+    mock_aws.__exit__.return_value = False
+    mocker.patch("reconcile.aws_support_cases_sos.AWSApi", return_value=mock_aws)
+
+    integ.run(dry_run=True)
+
+    mock_aws.get_users_keys.assert_not_called()
+    mock_act.assert_called_once_with(True, None, [account], [])
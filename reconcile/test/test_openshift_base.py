@@ -1516,3 +1516,122 @@ def test_aggregate_shared_resources_typed_openshift_service_account_token() -> N
     )
     sut.aggregate_shared_resources_typed(namespace=namespace)
     assert namespace.openshift_service_account_tokens == [1, 2]
+
+
+#
+# validate_realized_data tests
+#
+
+
+def build_deployment(name: str, ready_replicas: int) -> dict[str, Any]:
+    return {
+        "metadata": {"name": name},
+        "spec": {"replicas": 2},
+        "status": {
+            "replicas": 2,
+            "updatedReplicas": 2,
+            "readyReplicas": ready_replicas,
+        },
+    }
+
+
+def build_applied_action(kind: str, name: str) -> dict[str, str]:
+    return {
+        "action": sut.ACTION_APPLIED,
+        "cluster": "cs1",
+        "namespace": "ns1",
+        "kind": kind,
+        "name": name,
+    }
+
+
+@pytest.fixture
+def validate_oc_map(mocker: MockerFixture) -> MagicMock:
+    oc_map = mocker.MagicMock()
+    oc_map.get.return_value = oc_map.get_cluster.return_value
+    return oc_map
+
+
+def test_validate_realized_data_lists_groups_once(
+    mocker: MockerFixture, validate_oc_map: MagicMock
+) -> None:
+    sleep = mocker.patch.object(sut.time, "sleep")
+    oc_client = validate_oc_map.get_cluster.return_value
+    oc_client.get.return_value = {
+        "items": [build_deployment("a", 2), build_deployment("b", 2)]
+    }
+
+    sut.validate_realized_data(
+        [
+            build_applied_action("Deployment", "a"),
+            build_applied_action("Deployment", "b"),
+            build_applied_action("ConfigMap", "c"),
+        ],
+        validate_oc_map,
+    )
+
+    oc_client.get.assert_called_once_with("ns1", "Deployment")
+    sleep.assert_not_called()
+
+
+def test_validate_realized_data_waits_for_pending(
+    mocker: MockerFixture, validate_oc_map: MagicMock
+) -> None:
+    sleep = mocker.patch.object(sut.time, "sleep")
+    oc_client = validate_oc_map.get_cluster.return_value
+    oc_client.get.side_effect = [
+        {"items": [build_deployment("a", 2), build_deployment("b", 1)]},
+        {"items": [build_deployment("a", 2), build_deployment("b", 2)]},
+    ]
+
+    sut.validate_realized_data(
+        [
+            build_applied_action("Deployment", "a"),
+            build_applied_action("Deployment", "b"),
+        ],
+        validate_oc_map,
+    )
+
+    assert oc_client.get.call_count == 2
+    sleep.assert_called_once_with(1)
+
+
+def test_validate_realized_data_timeout(
+    mocker: MockerFixture, validate_oc_map: MagicMock
+) -> None:
+    mocker.patch.object(sut.time, "sleep")
+    oc_client = validate_oc_map.get_cluster.return_value
+    oc_client.get.return_value = {"items": [build_deployment("a", 1)]}
+
+    with pytest.raises(sut.ValidationError, match="cs1/ns1/Deployment/a"):
+        sut.validate_realized_data(
+            [build_applied_action("Deployment", "a")], validate_oc_map, timeout=0
+        )
+
+
+def test_validate_realized_data_job_failed(
+    mocker: MockerFixture, validate_oc_map: MagicMock
+) -> None:
+    oc_client = validate_oc_map.get_cluster.return_value
+    oc_client.get.return_value = {
+        "items": [
+            {
+                "metadata": {"name": "job"},
+                "status": {"conditions": [{"type": "Failed", "reason": "Boom"}]},
+            }
+        ]
+    }
+
+    with pytest.raises(sut.ValidationErrorJobFailedError, match="job: Boom"):
+        sut.validate_realized_data(
+            [build_applied_action("Job", "job")], validate_oc_map
+        )
+
+
+def test_validate_realized_data_not_found(validate_oc_map: MagicMock) -> None:
+    validate_oc_map.get_cluster.return_value.get.return_value = {"items": []}
+
+    with pytest.raises(oc.StatusCodeError):
+        sut.validate_realized_data(
+            [build_applied_action("Deployment", "a")], validate_oc_map
+        )
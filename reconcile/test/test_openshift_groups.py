@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from reconcile import openshift_groups
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_create_cluster_groups_list() -> None:
+    groups_list = [
+        {"cluster": "c1", "group_name": "g1"},
+        {"cluster": "c2", "group_name": "g1"},
+        {"cluster": "c1", "group_name": "g2"},
+    ]
+
+    assert openshift_groups.create_cluster_groups_list(groups_list) == [
+        {"cluster": "c1", "groups": ["g1", "g2"]},
+        {"cluster": "c2", "groups": ["g1"]},
+    ]
+
+
+def test_get_cluster_state_single_list(mocker: MockerFixture) -> None:
+    oc = mocker.MagicMock()
+    oc.get_groups.return_value = [
+        {"metadata": {"name": "g1"}, "users": ["u1", "u2"]},
+        {"metadata": {"name": "g2"}, "users": None},
+        {"metadata": {"name": "unmanaged"}, "users": ["u3"]},
+    ]
+    oc_map = mocker.MagicMock()
+    oc_map.get.return_value = oc
+
+    state = openshift_groups.get_cluster_state(
+        {"cluster": "c1", "groups": ["g1", "g2", "missing"]}, oc_map
+    )
+
+    assert state == [
+        {"cluster": "c1", "group": "g1", "user": "u1"},
+        {"cluster": "c1", "group": "g1", "user": "u2"},
+    ]
+    oc.get_groups.assert_called_once_with()
+    oc.get_group_if_exists.assert_not_called()
@@ -1,10 +1,16 @@
+import copy
+
 import pytest
 
 from reconcile.utils.openshift_resource import (
+    COMMON_CANONICALIZE_RULES,
     ConstructResourceError,
     ResourceInventory,
     ResourceNotManagedError,
+    _compile_canonicalize_rules,
+    _drop_controller_managed_labels,
     build_secret,
+    drop_fields,
 )
 from reconcile.utils.openshift_resource import OpenshiftResource as OR
 from reconcile.utils.semver_helper import make_semver
@@ -218,6 +224,143 @@ def test_secret_string_data() -> None:
     assert result == expected
 
 
+def test_canonicalize_copy_on_write() -> None:
+    resource = {
+        "apiVersion": "rbac.authorization.k8s.io/v1",
+        "kind": "RoleBinding",
+        "metadata": {
+            "name": "resource",
+            "namespace": "ns",
+            "labels": {"app": "test"},
+            "annotations": {"qontract.sha256sum": "abc"},
+        },
+        "roleRef": {
+            "apiGroup": "rbac.authorization.k8s.io",
+            "kind": "Role",
+            "name": "role",
+        },
+        "subjects": [{"kind": "User", "name": "user", "namespace": "ns"}],
+        "userNames": ["user"],
+    }
+    original = copy.deepcopy(resource)
+
+    result = OR.canonicalize(resource)
+
+    assert resource == original
+    assert result == {
+        "apiVersion": "rbac.authorization.k8s.io/v1",
+        "kind": "RoleBinding",
+        "metadata": {
+            "name": "resource",
+            "labels": {"app": "test"},
+            "annotations": {},
+        },
+        "roleRef": {"name": "role"},
+        "subjects": [{"kind": "User", "name": "user"}],
+    }
+    # unmodified subtrees are shared
+    assert result["metadata"]["labels"] is resource["metadata"]["labels"]
+
+
+def test_sha256sum_memoized() -> None:
+    resource = OR(fxt.get_anymarkup("sha256sum.yml"), TEST_INT, TEST_INT_VER)
+    sha256sum = resource.sha256sum()
+
+    resource.body["metadata"]["labels"] = {"new": "label"}
+    assert resource.sha256sum() == sha256sum
+
+    resource.invalidate_cache()
+    assert resource.sha256sum() != sha256sum
+
+    resource.body = fxt.get_anymarkup("sha256sum.yml")
+    assert resource.sha256sum() == sha256sum
+
+
+def test_annotate_keeps_sha256sum() -> None:
+    resource = OR(fxt.get_anymarkup("sha256sum.yml"), TEST_INT, TEST_INT_VER)
+
+    annotated = resource.annotate()
+
+    assert annotated.canonical_json() == resource.canonical_json()
+    annotated.invalidate_cache()
+    assert annotated.sha256sum() == resource.sha256sum()
+
+
+def test_compact_inflates_body_on_access() -> None:
+    body = fxt.get_anymarkup("sha256sum.yml")
+    resource = OR(copy.deepcopy(body), TEST_INT, TEST_INT_VER)
+    sha256sum = resource.sha256sum()
+
+    resource.compact()
+
+    assert resource.compacted
+    assert resource.name == body["metadata"]["name"]
+    assert resource.kind_and_group == OR(body, TEST_INT, TEST_INT_VER).kind_and_group
+    assert resource.annotations == body["metadata"].get("annotations", {})
+    assert resource.sha256sum() == sha256sum
+    assert resource.compacted
+
+    assert resource.body == body
+    assert not resource.compacted
+
+
+def test_compact_memoizes_sha256sum() -> None:
+    body = fxt.get_anymarkup("sha256sum.yml")
+    resource = OR(copy.deepcopy(body), TEST_INT, TEST_INT_VER)
+
+    resource.compact()
+
+    assert resource.sha256sum() == OR(body, TEST_INT, TEST_INT_VER).sha256sum()
+    assert resource.compacted
+
+
+def test_read_body_keeps_resource_compacted() -> None:
+    body = fxt.get_anymarkup("sha256sum.yml")
+    resource = OR(copy.deepcopy(body), TEST_INT, TEST_INT_VER)
+    assert resource.read_body() is resource.body
+
+    resource.compact()
+
+    assert resource.read_body() == body
+    assert resource.compacted
+
+
+def test_compact_keeps_in_place_changes() -> None:
+    resource = OR(fxt.get_anymarkup("sha256sum.yml"), TEST_INT, TEST_INT_VER)
+    resource.compact()
+    sha256sum = resource.sha256sum()
+
+    with resource.edit_body() as body:
+        body["metadata"]["labels"] = {"new": "label"}
+    resource.compact()
+
+    assert resource.body["metadata"]["labels"] == {"new": "label"}
+    assert resource.sha256sum() != sha256sum
+    assert resource.sha256sum() == OR(resource.body, TEST_INT, TEST_INT_VER).sha256sum()
+
+
+def test_compile_canonicalize_rules_merges_controller_managed_labels() -> None:
+    kind_rule = drop_fields((), "field")
+
+    rules = _compile_canonicalize_rules(
+        {"Deployment": (kind_rule,), "Service": (kind_rule,)},
+        ["Deployment", "ManagedCluster"],
+    )
+
+    assert rules == {
+        "Deployment": (
+            *COMMON_CANONICALIZE_RULES,
+            kind_rule,
+            _drop_controller_managed_labels,
+        ),
+        "Service": (*COMMON_CANONICALIZE_RULES, kind_rule),
+        "ManagedCluster": (
+            *COMMON_CANONICALIZE_RULES,
+            _drop_controller_managed_labels,
+        ),
+    }
+
+
 def test_managed_cluster_label_ignore() -> None:
     desired = {
         "apiVersion": "cluster.open-cluster-management.io/v1",
@@ -440,3 +583,23 @@ def test_resource_inventory_add_desired_resource_mixed_kinds() -> None:
             assert resource["desired"].get("foo")
         elif resource_type == "Deployment":
             assert len(resource["desired"]) == 0
+
+
+def test_resource_inventory_compact() -> None:
+    ri = ResourceInventory(compact=True)
+    ri.initialize_resource_type(
+        cluster="cl", namespace="ns", resource_type="Deployment"
+    )
+    desired = build_resource("Deployment", "apps/v1", "name")
+    current = build_resource("Deployment", "apps/v1", "name")
+    ri.add_desired_resource("cl", "ns", desired)
+    ri.add_current("cl", "ns", "Deployment", "name", current)
+
+    assert desired.compacted
+    assert current.compacted
+    assert ri.get_desired("cl", "ns", "Deployment", "name") == current
+
+    _, _, _, data = next(iter(ri))
+    ri.compact_resources(data)
+    assert desired.compacted
+    assert current.compacted
@@ -24,11 +24,16 @@ from reconcile.openshift_resources_base import (
 )
 from reconcile.test.fixtures import Fixtures
 from reconcile.utils import oc
+from reconcile.utils.desired_state_snapshot import (
+    DesiredStateSnapshots,
+    FileSnapshotStore,
+)
 from reconcile.utils.openshift_resource import OpenshiftResource as OR
 from reconcile.utils.openshift_resource import ResourceInventory
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
+    from pathlib import Path
 
     from pytest_mock import MockerFixture
 
@@ -563,3 +568,217 @@ def test_fetch_current_state_skips_argocd_managed(oc_cs1: oc.OCClient) -> None:
 
     _, _, _, resource = next(iter(ri))
     assert len(resource["current"]) == 0
+
+
+def test_collect_vault_secret_refs() -> None:
+    namespaces = [
+        {
+            "openshiftResources": [
+                {"provider": "vault-secret", "path": "secret/a", "version": 2},
+                {
+                    "provider": "route",
+                    "vault_tls_secret_path": "secret/tls",
+                    "vault_tls_secret_version": 1,
+                },
+                {
+                    "provider": "resource-template",
+                    "type": None,
+                    "resource": {
+                        "content": "{{ vault('secret/b', 'key', 3) }}"
+                        "{{ vault('secret/c', 'key') }}"
+                        "{{ vault(path, 'key') }}"
+                    },
+                },
+                {
+                    "provider": "resource-template",
+                    "type": "extracurlyjinja2",
+                    "resource": {"content": "{{{ vault('secret/d', 'k', v=4) }}}"},
+                },
+                {
+                    "provider": "prometheus-rule",
+                    "type": "resource",
+                    "resource": {"content": "{{ vault('secret/e', 'key') }}"},
+                },
+            ]
+        },
+        {"openshiftResources": None},
+    ]
+
+    assert orb.collect_vault_secret_refs(namespaces) == {
+        ("secret/a", "2"),
+        ("secret/tls", "1"),
+        ("secret/b", "3"),
+        ("secret/c", None),
+        ("secret/d", "4"),
+    }
+
+
+def test_prefetch_vault_secrets(mocker: MockerFixture) -> None:
+    secret_reader = mocker.patch.object(orb, "SecretReader", autospec=True)
+    secret_reader.return_value.read_all.side_effect = lambda secret: {
+        "path": secret["path"]
+    }
+    namespaces = [
+        {
+            "openshiftResources": [
+                {"provider": "vault-secret", "path": "secret/a", "version": 2},
+                {"provider": "vault-secret", "path": "secret/a", "version": 2},
+            ]
+        }
+    ]
+    cache = orb.Jinja2TemplateCache()
+
+    orb.prefetch_vault_secrets(namespaces, 2, cache)
+
+    secret_reader.return_value.read_all.assert_called_once_with({
+        "path": "secret/a",
+        "version": "2",
+    })
+    resource = orb.fetch_provider_vault_secret(
+        "secret/a",
+        2,
+        "a",
+        None,
+        {},
+        "Opaque",
+        integration="integration",
+        integration_version="1",
+        secret_reader=secret_reader.return_value,
+        cache=cache,
+    )
+    assert resource.body["data"] == {"path": "c2VjcmV0L2E="}
+    assert cache.hit_rate(orb.Jinja2TemplateCache.VAULT) == 0.5
+    secret_reader.return_value.read_all.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "resource, expected",
+    [
+        ({"provider": "resource"}, True),
+        ({"provider": "vault-secret"}, False),
+        (
+            {
+                "provider": "route",
+                "vault_tls_secret_path": None,
+                "vault_tls_secret_version": None,
+            },
+            True,
+        ),
+        (
+            {
+                "provider": "route",
+                "vault_tls_secret_path": "secret/tls",
+                "vault_tls_secret_version": 1,
+            },
+            False,
+        ),
+        (
+            {
+                "provider": "resource-template",
+                "type": None,
+                "resource": {"content": "{{ resource.namespace.name }}"},
+            },
+            True,
+        ),
+        (
+            {
+                "provider": "resource-template",
+                "type": None,
+                "resource": {"content": "{{ vault('secret/a', 'key', 1) }}"},
+            },
+            False,
+        ),
+        (
+            {
+                "provider": "resource-template",
+                "type": "extracurlyjinja2",
+                "resource": {"content": "{{{ query('/q.graphql') }}}"},
+            },
+            False,
+        ),
+        (
+            {
+                "provider": "resource-template",
+                "type": None,
+                "resource": {"content": "{{ github('org/repo', 'f.yml', 'main') }}"},
+            },
+            False,
+        ),
+        (
+            {
+                "provider": "resource-template",
+                "type": None,
+                "resource": {
+                    "content": "{{ github('org/repo', 'f.yml', '" + "a" * 40 + "') }}"
+                },
+            },
+            True,
+        ),
+        (
+            {
+                "provider": "prometheus-rule",
+                "type": "resource",
+                "resource": {"content": "{{ vault('secret/a', 'key') }}"},
+            },
+            True,
+        ),
+    ],
+)
+def test_is_snapshot_safe(resource: dict[str, Any], expected: bool) -> None:
+    assert orb.is_snapshot_safe(resource) is expected
+
+
+def test_fetch_desired_state_from_snapshot(
+    namespaces: list[dict[str, Any]], tmp_path: Path, mocker: MockerFixture
+) -> None:
+    store = FileSnapshotStore(tmp_path)
+    namespace = namespaces[0]
+    resource = {
+        "provider": "resource-template",
+        "type": None,
+        "variables": None,
+        "resource": {
+            "path": "/cm.yml",
+            "content": (
+                "apiVersion: v1\n"
+                "kind: ConfigMap\n"
+                "metadata:\n"
+                "  name: cm\n"
+                "data:\n"
+                "  namespace: {{ resource.namespace.name }}\n"
+            ),
+        },
+    }
+
+    def fetch(resource: dict[str, Any], namespace: dict[str, Any]) -> OR:
+        ri = ResourceInventory()
+        ri.initialize_resource_type("cs1", "ns1", "ConfigMap")
+        snapshots = DesiredStateSnapshots(store)
+        snapshots.load(orb.snapshot_inputs([namespace]))
+        orb.fetch_desired_state(
+            oc=None,  # type: ignore[arg-type]
+            ri=ri,
+            cluster="cs1",
+            namespace="ns1",
+            resource=resource,
+            parent=namespace,
+            privileged=False,
+            cache=orb.Jinja2TemplateCache(),
+            snapshots=snapshots,
+        )
+        snapshots.save()
+        _, _, _, data = next(iter(ri))
+        return data["desired"]["cm"]
+
+    rendered = fetch(copy.deepcopy(resource), copy.deepcopy(namespace))
+    fetch_openshift_resource = mocker.spy(orb, "fetch_openshift_resource")
+    loaded = fetch(copy.deepcopy(resource), copy.deepcopy(namespace))
+
+    fetch_openshift_resource.assert_not_called()
+    assert loaded.body == rendered.body
+    assert loaded.body["data"] == {"namespace": namespace["name"]}
+
+    # changed namespace inputs render again
+    namespace["labels"] = {"changed": "true"}
+    fetch(copy.deepcopy(resource), namespace)
+    fetch_openshift_resource.assert_called_once()
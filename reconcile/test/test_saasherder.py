@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import base64
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 from unittest import TestCase
@@ -1959,3 +1960,83 @@ def test_render_templated_parameters_in_init(
             },
         ),
     ]
+
+
+@pytest.fixture
+def directory_saasherder(
+    gql_class_factory: Callable[..., SaasFile],
+) -> SaasHerder:
+    saas_file = gql_class_factory(
+        SaasFile, Fixtures("saasherder").get_anymarkup("saas-trigger.gql.yml")
+    )
+    saasherder = SaasHerder(
+        [saas_file],
+        secret_reader=MockSecretReader(),
+        thread_pool_size=1,
+        integration="",
+        integration_version="",
+        hash_length=7,
+        repo_url="https://repo-url.com",
+    )
+    saasherder._get_commit_sha = MagicMock(return_value="abcd4242")  # type: ignore[method-assign]
+    return saasherder
+
+
+def test_get_directory_contents_github(directory_saasherder: SaasHerder) -> None:
+    github = MagicMock()
+    repo = github.get_repo.return_value
+    repo.get_contents.return_value = [
+        MagicMock(type="file", path="deploy/a.yaml", sha="sha-a"),
+        MagicMock(type="file", path="deploy/b.yaml", sha="sha-b"),
+    ]
+    blobs = {
+        "sha-a": b"kind: ConfigMap\n---\nkind: Secret\n",
+        "sha-b": b"kind: Deployment\n",
+    }
+    repo.get_git_blob.side_effect = lambda sha: MagicMock(
+        content=base64.b64encode(blobs[sha]).decode()
+    )
+
+    resources, commit_sha = directory_saasherder._get_directory_contents(
+        url="https://github.com/app-sre/test-saas-deployments",
+        path="deploy",
+        ref="main",
+        github=github,
+    )
+
+    assert commit_sha == "abcd4242"
+    repo.get_contents.assert_called_once_with("deploy", "abcd4242")
+    # files are fetched while iterating the resources
+    repo.get_git_blob.assert_not_called()
+    assert list(resources) == [
+        {"kind": "ConfigMap"},
+        {"kind": "Secret"},
+        {"kind": "Deployment"},
+    ]
+    assert repo.get_git_blob.call_count == 2
+
+
+def test_get_directory_contents_gitlab(directory_saasherder: SaasHerder) -> None:
+    gitlab = MagicMock()
+    gitlab.iter_directory_contents.return_value = iter([
+        ("deploy/a.yaml", b"kind: ConfigMap\n"),
+        ("deploy/b.yaml", b"kind: Deployment\n---\nkind: Service\n"),
+    ])
+    directory_saasherder.gitlab = gitlab
+
+    resources, commit_sha = directory_saasherder._get_directory_contents(
+        url="https://gitlab.com/app-sre/test-saas-deployments",
+        path="deploy",
+        ref="main",
+        github=MagicMock(),
+    )
+
+    assert commit_sha == "abcd4242"
+    gitlab.iter_directory_contents.assert_called_once_with(
+        gitlab.get_project.return_value, ref="abcd4242", path="deploy"
+    )
+    assert list(resources) == [
+        {"kind": "ConfigMap"},
+        {"kind": "Deployment"},
+        {"kind": "Service"},
+    ]
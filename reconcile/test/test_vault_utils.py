@@ -1,7 +1,9 @@
 import importlib
 import logging
 import os
+import threading
 import time
+from pathlib import Path
 from unittest.mock import (
     MagicMock,
     patch,
@@ -9,6 +11,9 @@ from unittest.mock import (
 
 import hvac.exceptions
 import pytest
+import requests
+from cryptography.fernet import Fernet
+from qontract_utils.secret_reader.cache import SecretCache
 
 from reconcile.utils import vault
 
@@ -132,3 +137,89 @@ def test_empty_kv2_engine(
     ):
         result = getattr(kv2_client_invalid_path, method_name)("engine/some/path")
         assert result == expected
+
+
+@pytest.fixture
+def kv2_client_with_cache(tmp_path: os.PathLike[str]) -> vault.VaultClient:
+    """VaultClient with an on-disk secret cache."""
+    with patch("reconcile.utils.vault.VaultClient.__init__", return_value=None):
+        client = vault.VaultClient()
+    client._client = MagicMock()
+    client._client.url = "https://vault.test"
+    client._client.secrets.kv.v2.read_secret_metadata.return_value = {
+        "data": {"current_version": 3}
+    }
+    client._client.secrets.kv.v2.read_secret_version.return_value = {
+        "data": {"data": {"key": "value"}, "metadata": {"version": 3}}
+    }
+    client._secret_cache = SecretCache(
+        directory=Path(tmp_path), key=Fernet.generate_key()
+    )
+    return client
+
+
+def test_read_all_v2_cached_version(kv2_client_with_cache: vault.VaultClient) -> None:
+    client = kv2_client_with_cache
+    read_all_v2 = client._VaultClient__read_all_v2  # type: ignore[attr-defined]
+
+    assert read_all_v2("engine/some/path", "3") == ({"key": "value"}, 3)
+    assert read_all_v2("engine/some/path", "3") == ({"key": "value"}, 3)
+
+    client._client.secrets.kv.v2.read_secret_version.assert_called_once_with(
+        mount_point="engine", path="some/path", version="3"
+    )
+    client._client.secrets.kv.v2.read_secret_metadata.assert_not_called()
+
+
+def test_read_all_v2_cached_latest(kv2_client_with_cache: vault.VaultClient) -> None:
+    client = kv2_client_with_cache
+    read_all_v2 = client._VaultClient__read_all_v2  # type: ignore[attr-defined]
+
+    assert read_all_v2("engine/some/path", vault.SECRET_VERSION_LATEST) == (
+        {"key": "value"},
+        3,
+    )
+    assert read_all_v2("engine/some/path", vault.SECRET_VERSION_LATEST) == (
+        {"key": "value"},
+        3,
+    )
+
+    client._client.secrets.kv.v2.read_secret_version.assert_called_once_with(
+        mount_point="engine", path="some/path", version="3"
+    )
+    assert client._client.secrets.kv.v2.read_secret_metadata.call_count == 2
+
+
+def test_read_all_v2_cached_latest_metadata_forbidden(
+    kv2_client_with_cache: vault.VaultClient,
+) -> None:
+    client = kv2_client_with_cache
+    client._client.secrets.kv.v2.read_secret_metadata.side_effect = (
+        hvac.exceptions.Forbidden()
+    )
+    read_all_v2 = client._VaultClient__read_all_v2  # type: ignore[attr-defined]
+
+    assert read_all_v2("engine/some/path", vault.SECRET_VERSION_LATEST) == (
+        {"key": "value"},
+        3,
+    )
+    client._client.secrets.kv.v2.read_secret_version.assert_called_once_with(
+        mount_point="engine", path="some/path", version=None
+    )
+    # the read version is cached nevertheless
+    assert read_all_v2("engine/some/path", "3") == ({"key": "value"}, 3)
+    client._client.secrets.kv.v2.read_secret_version.assert_called_once()
+
+
+def test_ensure_pool_size_grows_pool() -> None:
+    with patch("reconcile.utils.vault.VaultClient.__init__", return_value=None):
+        client = vault.VaultClient()
+    client._session = requests.Session()
+    client._pool_lock = threading.Lock()
+    client._mount_pool(vault.VAULT_POOL_MAXSIZE)
+
+    client.ensure_pool_size(4)
+    assert client._session.get_adapter("https://vault.test")._pool_maxsize == 11
+
+    client.ensure_pool_size(20)
+    assert client._session.get_adapter("https://vault.test")._pool_maxsize == 21
@@ -17,6 +17,8 @@ from reconcile.utils.jobcontroller.models import (
 )
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from reconcile.test.utils.jobcontroller.conftest import OCItemSetter
     from reconcile.utils.jobcontroller.controller import K8sJobController
 
@@ -433,3 +435,47 @@ def test_get_job_status_no_job_resource_status(
     job = SomeJob(identifying_attribute="some-id")
     set_oc_get_items_side_effect([[build_job_resource(job)]])
     assert controller.get_job_status(job_name=job.name()) == JobStatus.IN_PROGRESS
+
+
+#
+# job watcher
+#
+
+
+def test_controller_wait_for_completion_with_job_watcher(
+    controller: K8sJobController, mocker: MockerFixture
+) -> None:
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    watcher = mocker.Mock(generation=1)
+    watcher.jobs.side_effect = [
+        {job.name(): build_job_resource(job, build_job_status(active=1))},
+        {job.name(): build_job_resource(job, build_job_status(succeeded=1))},
+    ]
+    mocker.patch.object(controller, "_job_watcher", return_value=watcher)
+
+    assert controller.wait_for_job_completion(
+        job.name(), check_interval_seconds=5, timeout_seconds=100
+    )
+    watcher.wait_for_change.assert_called_once_with(1, 5)
+    controller.oc.get_items.assert_not_called()  # type: ignore[attr-defined]
+
+
+def test_controller_job_watcher_out_of_sync_falls_back_to_polling(
+    controller: K8sJobController,
+    set_oc_get_items_side_effect: OCItemSetter,
+    mocker: MockerFixture,
+) -> None:
+    job = SomeJob(identifying_attribute="some-id", description="some-description")
+    watcher = mocker.Mock(generation=1)
+    watcher.jobs.return_value = None
+    mocker.patch.object(controller, "_job_watcher", return_value=watcher)
+    set_oc_get_items_side_effect([
+        [build_job_resource(job, build_job_status(active=1))],  # 0 seconds
+        [build_job_resource(job, build_job_status(succeeded=1))],  # 5 seconds
+    ])
+
+    assert controller.wait_for_job_completion(
+        job.name(), check_interval_seconds=5, timeout_seconds=100
+    )
+    watcher.wait_for_change.assert_not_called()
+    assert controller.time_module.time() == 5
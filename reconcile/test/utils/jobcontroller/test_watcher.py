@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from reconcile.utils.jobcontroller import watcher as watcher_module
+from reconcile.utils.jobcontroller.watcher import (
+    JobWatcher,
+    get_job_watcher,
+    stop_job_watchers,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def build_job(name: str, resource_version: str, succeeded: int = 0) -> dict[str, Any]:
+    return {
+        "metadata": {"name": name, "resourceVersion": resource_version},
+        "status": {"succeeded": succeeded},
+    }
+
+
+class FakeOC:
+    """
+    Serves a job list and a scripted watch stream. After the scripted events
+    the stream blocks until the test releases it.
+    """
+
+    cluster_name = "cluster"
+
+    def __init__(
+        self, items: list[dict[str, Any]], events: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        self.items = items
+        self.events = events
+        self.release = threading.Event()
+        self.get_calls = 0
+
+    def get(self, namespace: str, kind: str) -> dict[str, Any]:
+        self.get_calls += 1
+        return {"metadata": {"resourceVersion": "1"}, "items": self.items}
+
+    def watch_items(
+        self, kind: str, namespace: str, resource_version: str | None = None
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        events, self.events = self.events, []
+        yield from events
+        self.release.wait(5)
+
+
+@pytest.fixture(autouse=True)
+def stop_watchers() -> Iterator[None]:
+    yield
+    stop_job_watchers()
+
+
+def wait_for_jobs(
+    watcher: JobWatcher, predicate: Any, timeout: float = 5
+) -> dict[str, dict[str, Any]]:
+    for _ in range(100):
+        generation = watcher.generation
+        jobs = watcher.jobs()
+        if jobs is not None and predicate(jobs):
+            return jobs
+        watcher.wait_for_change(generation, timeout / 100)
+    raise AssertionError("watcher did not reach the expected state")
+
+
+def test_job_watcher_applies_events() -> None:
+    oc = FakeOC(
+        items=[build_job("a", "1"), build_job("b", "1")],
+        events=[
+            ("MODIFIED", build_job("a", "2", succeeded=1)),
+            ("DELETED", build_job("b", "3")),
+            ("ADDED", build_job("c", "4")),
+        ],
+    )
+    watcher = JobWatcher(oc, "ns")  # type: ignore[arg-type]
+    watcher.start()
+
+    jobs = wait_for_jobs(watcher, lambda jobs: "c" in jobs)
+
+    assert set(jobs) == {"a", "c"}
+    assert jobs["a"]["status"]["succeeded"] == 1
+    watcher.stop()
+    oc.release.set()
+    assert watcher.jobs() is None
+
+
+def test_job_watcher_relists_after_watch_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(watcher_module, "RESTART_BACKOFF_SECONDS", 0)
+    oc = FakeOC(
+        items=[build_job("a", "1")],
+        events=[("ERROR", {"message": "too old resource version"})],
+    )
+    watcher = JobWatcher(oc, "ns")  # type: ignore[arg-type]
+    watcher.start()
+
+    wait_for_jobs(watcher, lambda jobs: oc.get_calls >= 2)
+
+    watcher.stop()
+    oc.release.set()
+
+
+def test_get_job_watcher_is_shared_per_namespace() -> None:
+    oc = FakeOC(items=[], events=[])
+
+    watcher = get_job_watcher(oc, "ns")  # type: ignore[arg-type]
+
+    assert get_job_watcher(oc, "ns") is watcher  # type: ignore[arg-type]
+    assert get_job_watcher(oc, "other-ns") is not watcher  # type: ignore[arg-type]
+    oc.release.set()
+
+
+def test_get_job_watcher_replaces_watcher_of_other_client() -> None:
+    oc = FakeOC(items=[], events=[])
+    watcher = get_job_watcher(oc, "ns")  # type: ignore[arg-type]
+    new_oc = FakeOC(items=[], events=[])
+
+    new_watcher = get_job_watcher(new_oc, "ns")  # type: ignore[arg-type]
+
+    assert new_watcher is not watcher
+    assert new_watcher.oc is new_oc
+    assert watcher.stopped
+    oc.release.set()
+    new_oc.release.set()
+
+
+def test_stop_job_watchers_of_client() -> None:
+    oc = FakeOC(items=[], events=[])
+    other_oc = FakeOC(items=[], events=[])
+    other_oc.cluster_name = "other-cluster"
+    watcher = get_job_watcher(oc, "ns")  # type: ignore[arg-type]
+    other_watcher = get_job_watcher(other_oc, "ns")  # type: ignore[arg-type]
+
+    stop_job_watchers(oc)  # type: ignore[arg-type]
+
+    assert watcher.stopped
+    assert not other_watcher.stopped
+    assert get_job_watcher(other_oc, "ns") is other_watcher  # type: ignore[arg-type]
+    oc.release.set()
+    other_oc.release.set()
@@ -167,6 +167,69 @@ def test_get_users_keys_can_still_scope_to_every_session_explicitly(
     assert set(result.keys()) == {"account-a", "account-b"}
 
 
+@pytest.fixture
+def credential_report_users(
+    aws_api: AWSApi, iam_client: IAMClient, mocker: MockerFixture
+) -> dict[str, list[str]]:
+    mocker.patch("reconcile.utils.aws_api.IAM_CREDENTIAL_REPORT_RETRY_SECONDS", 0)
+    iam_client.create_user(UserName="with-key")
+    iam_client.create_user(UserName="without-key")
+    key = iam_client.create_access_key(UserName="with-key")["AccessKey"]
+    return {"with-key": [key["AccessKeyId"]], "without-key": []}
+
+
+def test_get_users_keys_from_credential_report(
+    aws_api: AWSApi,
+    iam_client: IAMClient,
+    credential_report_users: dict[str, list[str]],
+    mocker: MockerFixture,
+) -> None:
+    iam_client.generate_credential_report()
+    generated_time = iam_client.get_credential_report()["GeneratedTime"]
+    mocker.patch("reconcile.utils.aws_api.utc_now", return_value=generated_time)
+    get_user_keys = mocker.spy(aws_api, "get_user_keys")
+
+    result = aws_api.get_users_keys(["some-account"], credential_report=True)
+
+    assert result == {"some-account": credential_report_users}
+    get_user_keys.assert_called_once_with(mocker.ANY, "with-key")
+    assert aws_api._get_account_users.cache_info().currsize == 0  # type: ignore[attr-defined]
+
+
+def test_get_users_keys_credential_report_misses_expected_key(
+    aws_api: AWSApi,
+    iam_client: IAMClient,
+    credential_report_users: dict[str, list[str]],
+    mocker: MockerFixture,
+) -> None:
+    iam_client.generate_credential_report()
+    report = iam_client.get_credential_report()["Content"].decode()
+    mocker.patch.object(AWSApi, "_get_credential_report", return_value=report)
+    # created after the report was generated
+    key = iam_client.create_access_key(UserName="without-key")["AccessKey"]
+
+    result = aws_api.get_users_keys(
+        ["some-account"],
+        credential_report=True,
+        expected_keys={"some-account": [key["AccessKeyId"]]},
+    )
+
+    assert result == {
+        "some-account": credential_report_users | {"without-key": [key["AccessKeyId"]]}
+    }
+    assert aws_api._get_account_users.cache_info().currsize == 1  # type: ignore[attr-defined]
+
+
+def test_get_users_keys_stale_credential_report(
+    aws_api: AWSApi, credential_report_users: dict[str, list[str]]
+) -> None:
+    # moto reports a GeneratedTime far in the past
+    result = aws_api.get_users_keys(["some-account"], credential_report=True)
+
+    assert result == {"some-account": credential_report_users}
+    assert aws_api._get_account_users.cache_info().currsize == 1  # type: ignore[attr-defined]
+
+
 def test_get_support_cases_excludes_resolved_and_paginates(
     aws_api: AWSApi, mocker: MockerFixture
 ) -> None:
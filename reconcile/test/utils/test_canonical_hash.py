@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any
+
+import pytest
+from deepdiff import DeepHash
+from pydantic import BaseModel
+
+from reconcile.utils import canonical_hash as canonical_hash_module
+from reconcile.utils.canonical_hash import (
+    CanonicalHasher,
+    DeepHasher,
+    HashMode,
+    canonical_hash,
+    new_hasher,
+)
+
+DESIRED_STATE: dict[str, Any] = {
+    "namespaces": [
+        {"name": "ns-1", "cluster": {"name": "c1"}, "labels": {"a": "b"}},
+        {"name": "ns-2", "cluster": {"name": "c2"}, "labels": None},
+    ],
+    "count": 2,
+    "ratio": 0.5,
+    "enabled": True,
+}
+
+
+class Color(StrEnum):
+    RED = "red"
+
+
+class Model(BaseModel):
+    name: str
+    color: Color
+
+
+@dataclass
+class Spec:
+    name: str
+    values: tuple[int, ...]
+
+
+def test_canonical_hash_is_stable() -> None:
+    assert canonical_hash(DESIRED_STATE) == canonical_hash(
+        json.loads(json.dumps(DESIRED_STATE))
+    )
+
+
+def test_canonical_hash_ignores_key_order() -> None:
+    assert canonical_hash({"a": 1, "b": 2}) == canonical_hash({"b": 2, "a": 1})
+
+
+def test_canonical_hash_list_order_matters() -> None:
+    assert canonical_hash([1, 2]) != canonical_hash([2, 1])
+
+
+def test_canonical_hash_list_and_tuple_are_equal() -> None:
+    assert canonical_hash({"a": [1, 2]}) == canonical_hash({"a": (1, 2)})
+
+
+def test_canonical_hash_set_order_independent() -> None:
+    assert canonical_hash({"a", "b", "c"}) == canonical_hash({"c", "b", "a"})
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        (1, "1"),
+        (1, 1.0),
+        (1, True),
+        (None, "None"),
+        ("", None),
+        (["a", "b"], ["ab"]),
+        ({"a": "b"}, ["a", "b"]),
+        ({"a": None}, {}),
+        ({"a": {"b": 1}}, {"a": {"b": 2}}),
+    ],
+)
+def test_canonical_hash_differs(a: Any, b: Any) -> None:
+    assert canonical_hash(a) != canonical_hash(b)
+
+
+def test_canonical_hash_objects() -> None:
+    assert canonical_hash(Model(name="a", color=Color.RED)) == canonical_hash({
+        "name": "a",
+        "color": "red",
+    })
+    assert canonical_hash(Spec(name="a", values=(1, 2))) == canonical_hash(
+        Spec(name="a", values=(1, 2))
+    )
+    assert canonical_hash(Spec(name="a", values=(1, 2))) != canonical_hash({
+        "name": "a",
+        "values": [1, 2],
+    })
+    assert canonical_hash(datetime(2026, 1, 1, tzinfo=UTC)) == canonical_hash(
+        datetime(2026, 1, 1, tzinfo=UTC)
+    )
+
+
+def test_canonical_hash_unsupported_type() -> None:
+    with pytest.raises(TypeError):
+        canonical_hash({"a": object()})
+
+
+def test_canonical_hasher_caches_subtrees() -> None:
+    hasher = CanonicalHasher()
+    namespaces = DESIRED_STATE["namespaces"]
+
+    digest = hasher.digest(DESIRED_STATE)
+
+    assert hasher._digests[id(namespaces)] == (namespaces, hasher.digest(namespaces))
+    assert hasher.digest(DESIRED_STATE) == digest
+    assert len(digest) == 32
+
+
+def test_canonical_hash_deephash_mode() -> None:
+    assert (
+        canonical_hash(DESIRED_STATE, mode=HashMode.DEEPHASH)
+        == DeepHash(DESIRED_STATE)[DESIRED_STATE]
+    )
+
+
+def test_deep_hasher_shares_subtree_hashes() -> None:
+    hasher = new_hasher(HashMode.DEEPHASH)
+    namespaces = DESIRED_STATE["namespaces"]
+
+    assert isinstance(hasher, DeepHasher)
+    assert hasher.hexdigest(DESIRED_STATE) == DeepHash(DESIRED_STATE)[DESIRED_STATE]
+    assert hasher.digest(namespaces).hex() == DeepHash(namespaces)[namespaces]
+    assert hasher.digest(DESIRED_STATE) != hasher.digest(namespaces)
+
+
+def test_new_hasher_defaults_to_canonical_hash_mode(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(canonical_hash_module, "DEFAULT_HASH_MODE", HashMode.DEEPHASH)
+    assert isinstance(new_hasher(), DeepHasher)
+    assert canonical_hash(DESIRED_STATE) == DeepHash(DESIRED_STATE)[DESIRED_STATE]
+
+    monkeypatch.setattr(canonical_hash_module, "DEFAULT_HASH_MODE", HashMode.CANONICAL)
+    assert isinstance(new_hasher(), CanonicalHasher)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from reconcile.utils.desired_state_snapshot import (
+    DesiredStateSnapshots,
+    FileSnapshotStore,
+    decode_snapshot,
+    encode_snapshot,
+    init_snapshot_store,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_encode_decode_snapshot() -> None:
+    snapshot = {"digest": "d", "items": {"a": {"kind": "ConfigMap"}}}
+
+    assert decode_snapshot(encode_snapshot(snapshot)) == snapshot
+
+
+def test_file_snapshot_store(tmp_path: Path) -> None:
+    store = FileSnapshotStore(tmp_path)
+
+    assert store.get("cluster/namespace") is None
+    store.put("cluster/namespace", b"data")
+    assert store.get("cluster/namespace") == b"data"
+
+
+def test_init_snapshot_store_disabled() -> None:
+    assert init_snapshot_store("integration", location=None) is None
+
+
+def test_init_snapshot_store_directory(tmp_path: Path) -> None:
+    store = init_snapshot_store("integration", location=str(tmp_path))
+
+    assert isinstance(store, FileSnapshotStore)
+    assert store.directory == tmp_path / "integration"
+
+
+def test_desired_state_snapshots(tmp_path: Path) -> None:
+    store = FileSnapshotStore(tmp_path)
+    snapshots = DesiredStateSnapshots(store)
+    snapshots.load({"ns-1": {"input": 1}, "ns-2": {"input": 2}})
+    assert snapshots.get("ns-1", "item") is None
+    snapshots.record("ns-1", "item", {"rendered": 1})
+    snapshots.record("ns-2", "item", {"rendered": 2})
+    snapshots.save()
+
+    snapshots = DesiredStateSnapshots(store)
+    snapshots.load({"ns-1": {"input": 1}, "ns-2": {"input": "changed"}})
+
+    assert snapshots.get("ns-1", "item") == {"rendered": 1}
+    assert snapshots.get("ns-2", "item") is None
+    assert (snapshots.hits, snapshots.misses) == (1, 1)
+
+
+def test_desired_state_snapshots_save_changed_only(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    store = FileSnapshotStore(tmp_path)
+    snapshots = DesiredStateSnapshots(store)
+    snapshots.load({"ns-1": {}, "ns-2": {}})
+    snapshots.record("ns-1", "item", {"rendered": 1})
+    snapshots.record("ns-2", "item", {"rendered": 2})
+    snapshots.save()
+    put = mocker.spy(store, "put")
+
+    snapshots = DesiredStateSnapshots(store)
+    snapshots.load({"ns-1": {}, "ns-2": {"input": "changed"}})
+    snapshots.record("ns-1", "item", snapshots.get("ns-1", "item"))
+    snapshots.record("ns-2", "item", {"rendered": "changed"})
+    snapshots.save()
+
+    put.assert_called_once()
+    assert put.call_args.args[0] == "ns-2"
+
+
+def test_desired_state_snapshots_broken_snapshot(tmp_path: Path) -> None:
+    store = FileSnapshotStore(tmp_path)
+    store.put("ns-1", b"garbage")
+    snapshots = DesiredStateSnapshots(store)
+
+    snapshots.load({"ns-1": {}})
+
+    assert snapshots.get("ns-1", "item") is None
+
+
+def test_desired_state_snapshots_record_copies_new_items_only(
+    tmp_path: Path,
+) -> None:
+    store = FileSnapshotStore(tmp_path)
+    snapshots = DesiredStateSnapshots(store)
+    snapshots.load({"ns-1": {}})
+    item = {"rendered": 1}
+    snapshots.record("ns-1", "item", item)
+    item["rendered"] = 2
+    snapshots.save()
+
+    snapshots = DesiredStateSnapshots(store)
+    snapshots.load({"ns-1": {}})
+    snapshots.record("ns-1", "item", snapshots.get("ns-1", "item"))
+    snapshots.record("ns-1", "other", {"rendered": 3})
+
+    assert snapshots._recorded == {"ns-1": {"other": {"rendered": 3}}}
+    snapshots.save()
+    snapshots = DesiredStateSnapshots(store)
+    snapshots.load({"ns-1": {}})
+    assert snapshots.get("ns-1", "item") == {"rendered": 1}
+    assert snapshots.get("ns-1", "other") == {"rendered": 3}
+
+
+def test_desired_state_snapshots_read_only(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    store = FileSnapshotStore(tmp_path)
+    put = mocker.spy(store, "put")
+    snapshots = DesiredStateSnapshots(store, read_only=True)
+    snapshots.load({"ns-1": {}})
+    snapshots.record("ns-1", "item", {"rendered": 1})
+
+    snapshots.save()
+
+    put.assert_not_called()
@@ -5,8 +5,8 @@ from typing import TYPE_CHECKING, Any
 from unittest.mock import call, create_autospec
 
 import pytest
-from deepdiff import DeepHash
 
+from reconcile.utils.canonical_hash import canonical_hash
 from reconcile.utils.early_exit_cache import (
     CacheHeadResult,
     CacheKey,
@@ -23,7 +23,7 @@ if TYPE_CHECKING:
 INTEGRATION_NAME = "some-integration"
 INTEGRATION_VERSION = "some-integration-version"
 CACHE_SOURCE = {"k": "v"}
-CACHE_SOURCE_DIGEST = DeepHash(CACHE_SOURCE)[CACHE_SOURCE]
+CACHE_SOURCE_DIGEST = canonical_hash(CACHE_SOURCE)
 LATEST_CACHE_SOURCE_DIGEST = "latest-cache-source-digest"
 
 DRY_RUN_CACHE_KEY = CacheKey(
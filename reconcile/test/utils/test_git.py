@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from subprocess import CompletedProcess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from reconcile.utils import git
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize(
+    "stdout, expected",
+    [
+        pytest.param("abc\trefs/heads/main\n", "abc", id="branch"),
+        pytest.param(
+            "tag\trefs/tags/main\ncommit\trefs/tags/main^{}\n",
+            "commit",
+            id="annotated-tag",
+        ),
+        pytest.param(
+            "other\trefs/heads/feature/main\nabc\trefs/heads/main\n",
+            "abc",
+            id="suffix-match",
+        ),
+        pytest.param(
+            "tag\trefs/tags/main\ncommit\trefs/tags/main^{}\nabc\trefs/heads/main\n",
+            "abc",
+            id="branch-before-tag",
+        ),
+        pytest.param("abc\trefs/heads/feature/main\n", None, id="suffix-only"),
+        pytest.param("", None, id="not-a-ref"),
+    ],
+)
+def test_ls_remote(mocker: MockerFixture, stdout: str, expected: str | None) -> None:
+    run = mocker.patch.object(
+        git.subprocess, "run", return_value=CompletedProcess([], 0, stdout=stdout)
+    )
+
+    assert git.ls_remote("https://github.com/app-sre/repo", "main") == expected
+    assert run.call_args.args[0] == [
+        "git",
+        "ls-remote",
+        "https://github.com/app-sre/repo",
+        "main",
+    ]
+
+
+def test_ls_remote_error(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        git.subprocess,
+        "run",
+        return_value=CompletedProcess([], 128, stdout="", stderr="not found"),
+    )
+
+    with pytest.raises(git.GitError, match="not found"):
+        git.ls_remote("https://github.com/app-sre/repo", "main", verify=False)
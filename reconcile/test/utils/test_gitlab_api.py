@@ -775,6 +775,31 @@ def test_get_directory_contents() -> None:
     )
 
 
+def test_iter_directory_contents() -> None:
+    project = create_autospec(Project)
+    tar_bytes = io.BytesIO()
+    with tarfile.open(fileobj=tar_bytes, mode="w:gz") as tar:
+        dirinfo = tarfile.TarInfo(name="prefix/dir1")
+        dirinfo.type = tarfile.DIRTYPE
+        tar.addfile(dirinfo)
+        for name in ("dir1/hello1.yaml", "dir1/hello2.yaml"):
+            tarinfo = tarfile.TarInfo(name=f"prefix/{name}")
+            tarinfo.size = len(name)
+            tar.addfile(tarinfo, io.BytesIO(name.encode()))
+    project.repository_archive.return_value = tar_bytes.getvalue()
+
+    files = GitLabApi.iter_directory_contents(project, ref="main", path="dir1")
+
+    # the archive is downloaded right away
+    project.repository_archive.assert_called_once_with(
+        format="tar.gz",
+        sha="main",
+        path="dir1",
+    )
+    assert next(files) == ("dir1/hello1.yaml", b"dir1/hello1.yaml")
+    assert list(files) == [("dir1/hello2.yaml", b"dir1/hello2.yaml")]
+
+
 def test_get_file_as_git_cli_interface(
     mocked_gitlab_api: GitLabApi,
     mocked_gl: Mock,
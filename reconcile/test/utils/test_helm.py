@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+from subprocess import CalledProcessError, CompletedProcess
 from typing import TYPE_CHECKING
 
 import pytest
@@ -23,6 +25,9 @@ if TYPE_CHECKING:
         Callable,
         Sequence,
     )
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
 
 fxt = Fixtures("helm")
 
@@ -463,3 +468,97 @@ def test_template_cron_enable_pushgateway(
     template = helm.template(build_helm_values(helm_integration_specs_cron))
     expected = yaml.safe_load(fxt.get("enable_pushgateway.yml"))
     assert template == expected
+
+
+@pytest.fixture
+def chart_repo(mocker: MockerFixture, tmp_path: Path) -> MagicMock:
+    mocker.patch.object(
+        helm, "_chart_cache", helm.ChartCache(str(tmp_path), max_checkouts=1)
+    )
+    helm._render.cache_clear()
+    git = mocker.patch.object(helm, "git", autospec=True)
+    git.ls_remote.side_effect = lambda url, ref, verify: f"sha-of-{ref}"
+
+    def clone(url: str, wd: str, depth: int, verify: bool) -> None:
+        (Path(wd) / "chart").mkdir()
+        (Path(wd) / "chart" / "Chart.yaml").write_text(
+            "dependencies:\n- name: dep\n  repository: https://charts.example.com\n"
+        )
+
+    git.clone.side_effect = clone
+    return git
+
+
+@pytest.fixture
+def run_helm(mocker: MockerFixture) -> MagicMock:
+    def run(cmd: list[str]) -> CompletedProcess[bytes]:
+        stdout = b""
+        if cmd[1] == "template":
+            namespace = cmd[cmd.index("--namespace") + 1]
+            stdout = f"kind: ConfigMap\nmetadata:\n  namespace: {namespace}\n".encode()
+        return CompletedProcess(cmd, 0, stdout=stdout)
+
+    return mocker.patch.object(helm, "_run_helm", side_effect=run)
+
+
+def helm_commands(run_helm: MagicMock) -> list[str]:
+    return [call.args[0][1] for call in run_helm.call_args_list]
+
+
+def test_template_all(chart_repo: MagicMock, run_helm: MagicMock) -> None:
+    resources = helm.template_all(
+        url="https://github.com/app-sre/charts",
+        path="/chart",
+        ref="main",
+        namespace="ns",
+        values={"replicas": 1},
+    )
+
+    assert list(resources) == [{"kind": "ConfigMap", "metadata": {"namespace": "ns"}}]
+    chart_repo.checkout.assert_called_once()
+    assert chart_repo.checkout.call_args.args[0] == "sha-of-main"
+    assert helm_commands(run_helm) == ["repo", "dependency", "template"]
+
+
+def test_template_all_caches_renders_and_checkouts(
+    chart_repo: MagicMock, run_helm: MagicMock
+) -> None:
+    def template_all(namespace: str, ref: str = "main") -> None:
+        list(
+            helm.template_all(
+                url="https://github.com/app-sre/charts",
+                path="/chart",
+                ref=ref,
+                namespace=namespace,
+                values={"replicas": 1},
+            )
+        )
+
+    template_all("ns-1")
+    template_all("ns-1")
+    template_all("ns-2")
+
+    # the checkout and its dependencies are reused, only ns-2 is rendered again
+    chart_repo.clone.assert_called_once()
+    assert helm_commands(run_helm) == ["repo", "dependency", "template", "template"]
+
+    # a new commit gets a new checkout and replaces the old one
+    template_all("ns-1", ref="next")
+    assert chart_repo.clone.call_count == 2
+    assert helm_commands(run_helm)[4:] == ["repo", "dependency", "template"]
+    assert len(list(Path(helm._chart_cache.directory).iterdir())) == 1
+
+
+def test_template_all_error(chart_repo: MagicMock, run_helm: MagicMock) -> None:
+    run_helm.side_effect = CalledProcessError(
+        1, ["helm", "repo", "add"], stderr=b"boom"
+    )
+
+    with pytest.raises(helm.HelmTemplateError, match="boom"):
+        helm.template_all(
+            url="https://github.com/app-sre/charts",
+            path="/chart",
+            ref="main",
+            namespace="ns",
+            values={},
+        )
@@ -0,0 +1,198 @@
+import threading
+import time
+
+import pytest
+from requests import HTTPError, Response
+
+from reconcile.utils.io_scheduler import (
+    IOScheduler,
+    is_throttled,
+    parse_endpoint_limits,
+    report_throttled,
+)
+
+
+def throttled_error() -> HTTPError:
+    response = Response()
+    response.status_code = 429
+    return HTTPError(response=response)
+
+
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.current = 0
+        self.max = 0
+
+    def __call__(self, item: int) -> int:
+        with self.lock:
+            self.current += 1
+            self.max = max(self.max, self.current)
+        time.sleep(0.01)
+        with self.lock:
+            self.current -= 1
+        return item * 2
+
+
+def test_parse_endpoint_limits() -> None:
+    assert parse_endpoint_limits("") == {}
+    assert parse_endpoint_limits("github=5, registry:quay.io=8") == {
+        "github": 5,
+        "registry:quay.io": 8,
+    }
+
+
+def test_is_throttled() -> None:
+    assert is_throttled(throttled_error())
+    assert not is_throttled(HTTPError(response=Response()))
+    assert not is_throttled(ValueError("boom"))
+
+
+def test_limiter_limit_of_endpoint_and_kind() -> None:
+    scheduler = IOScheduler(
+        default_limit=10, limits={"registry": 5, "registry:quay.io": 8}
+    )
+    assert scheduler.limiter("registry:quay.io").limit == 8
+    assert scheduler.limiter("registry:docker.io").limit == 5
+    assert scheduler.limiter("cluster:c1").limit == 10
+    assert scheduler.limiter("registry:docker.io") is scheduler.limiter(
+        "registry:docker.io"
+    )
+
+
+def test_run_results_in_order() -> None:
+    scheduler = IOScheduler(default_limit=2)
+
+    def f(i: int, prefix: str) -> str:
+        return f"{prefix}-{i}"
+
+    assert scheduler.run(f, range(10), 4, endpoint="e", prefix="item") == [
+        f"item-{i}" for i in range(10)
+    ]
+
+
+def test_run_respects_endpoint_limit() -> None:
+    scheduler = IOScheduler(default_limit=2)
+    tracker = ConcurrencyTracker()
+    scheduler.run(tracker, range(20), 10, endpoint="cluster:c1")
+    assert tracker.max == 2
+
+
+def test_run_without_limit_does_not_wait() -> None:
+    scheduler = IOScheduler(default_limit=0, limits={"github": 1})
+    tracker = ConcurrencyTracker()
+    scheduler.run(tracker, range(20), 10, endpoint="cluster:c1")
+    assert tracker.max > 1
+    assert scheduler.limit_of("cluster:c1") == 0
+    assert scheduler.limit_of("github") == 1
+
+
+def test_run_limit_is_shared_between_runs() -> None:
+    scheduler = IOScheduler(default_limit=3)
+    tracker = ConcurrencyTracker()
+    threads = [
+        threading.Thread(
+            target=scheduler.run, args=(tracker, range(20), 10, "cluster:c1")
+        )
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert tracker.max == 3
+
+
+def test_run_limits_per_endpoint() -> None:
+    scheduler = IOScheduler(default_limit=1)
+    tracker = ConcurrencyTracker()
+    scheduler.run(tracker, range(20), 10, endpoint=lambda i: f"cluster:c{i % 2}")
+    assert tracker.max == 2
+
+
+def test_run_nested_on_held_endpoint_does_not_deadlock() -> None:
+    scheduler = IOScheduler(default_limit=1)
+
+    def outer(i: int) -> list[int]:
+        return scheduler.run(lambda j: i + j, range(3), 3, endpoint="cluster:c1")
+
+    assert scheduler.run(outer, [0, 10], 2, endpoint="cluster:c1") == [
+        [0, 1, 2],
+        [10, 11, 12],
+    ]
+    assert scheduler.limiter("cluster:c1").in_flight == 0
+
+
+def test_run_return_exceptions() -> None:
+    scheduler = IOScheduler(default_limit=2)
+
+    def f(i: int) -> int:
+        if i == 1:
+            raise ValueError("boom")
+        return i
+
+    results = scheduler.run(f, range(3), 3, endpoint="e", return_exceptions=True)
+    assert results[0] == 0
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 2
+    with pytest.raises(ValueError, match="boom"):
+        scheduler.run(f, range(3), 3, endpoint="e")
+    assert scheduler.limiter("e").in_flight == 0
+
+
+def test_throttling_halves_limit_and_recovers() -> None:
+    scheduler = IOScheduler(default_limit=8)
+
+    def f(i: int) -> int:
+        if i < 0:
+            raise throttled_error()
+        return i
+
+    scheduler.run(f, [-1], 1, endpoint="github", return_exceptions=True)
+    assert scheduler.limiter("github").limit == 4
+    scheduler.run(f, [-1, -1], 1, endpoint="github", return_exceptions=True)
+    assert scheduler.limiter("github").limit == 1
+    # additive increase: one more slot per limit-many successes
+    scheduler.run(f, range(1 + 2 + 3), 1, endpoint="github")
+    assert scheduler.limiter("github").limit == 4
+    scheduler.run(f, range(100), 1, endpoint="github")
+    assert scheduler.limiter("github").limit == 8
+
+
+def test_throttling_not_adaptive() -> None:
+    scheduler = IOScheduler(default_limit=8, adaptive=False)
+
+    def f(i: int) -> int:
+        raise throttled_error()
+
+    scheduler.run(f, [1], 1, endpoint="github", return_exceptions=True)
+    assert scheduler.limiter("github").limit == 8
+
+
+def test_report_throttled_for_handled_errors() -> None:
+    scheduler = IOScheduler(default_limit=8)
+
+    def f(i: int) -> int:
+        try:
+            raise throttled_error()
+        except HTTPError:
+            report_throttled()
+        return i
+
+    assert scheduler.run(f, [1], 1, endpoint="github") == [1]
+    assert scheduler.limiter("github").limit == 4
+
+
+def test_report_throttled_of_endpoint() -> None:
+    scheduler = IOScheduler(default_limit=8)
+
+    def inner(i: int) -> int:
+        report_throttled("registry")
+        return i
+
+    def outer(i: int) -> list[int]:
+        return scheduler.run(inner, [i], 1, endpoint="registry")
+
+    scheduler.run(outer, [1], 1, endpoint="github")
+    assert scheduler.limiter("github").limit == 8
+    assert scheduler.limiter("registry").limit == 4
@@ -226,6 +226,63 @@ def test_get_jobs_parses_jjb_templates() -> None:
             )
 
 
+@pytest.fixture
+def incremental_jjb(patch_jjb: Any, mocker: MockerFixture) -> JJB:
+    jjb = JJB([])
+    jjb.working_dirs = {"ci": "/wd"}
+    jjb.instances = {"ci": {"delete_method": "automatic"}}
+    jjb.python_https_verify = "1"
+    mocker.patch.object(
+        jjb, "get_job_digests", return_value={"job-a": "a", "job-b": "b2"}
+    )
+    return jjb
+
+
+@pytest.fixture
+def patch_subprocess_run(mocker: MockerFixture) -> MagicMock:
+    run = mocker.patch("reconcile.utils.jjb_client.subprocess.run")
+    run.return_value.stdout = ""
+    return run
+
+
+@pytest.mark.parametrize(
+    "previous_digests, expected_args",
+    [
+        ({"job-a": "a", "job-b": "b1"}, ["job-b"]),
+        (None, ["--delete-old"]),
+        ({"job-a": "a", "job-b": "b2", "job-c": "c"}, ["--delete-old"]),
+    ],
+)
+def test_update_incremental(
+    incremental_jjb: JJB,
+    patch_subprocess_run: MagicMock,
+    mocker: MockerFixture,
+    previous_digests: dict[str, str] | None,
+    expected_args: list[str],
+) -> None:
+    state = mocker.MagicMock()
+    state.get.return_value = previous_digests
+
+    incremental_jjb.update(state, thread_pool_size=1)
+
+    cmd = patch_subprocess_run.call_args.args[0]
+    assert cmd[cmd.index("update") + 2 :] == expected_args
+    state.add.assert_called_once_with(
+        "job-digests/ci", value={"job-a": "a", "job-b": "b2"}, force=True
+    )
+
+
+def test_update_incremental_unchanged(
+    incremental_jjb: JJB, patch_subprocess_run: MagicMock, mocker: MockerFixture
+) -> None:
+    state = mocker.MagicMock()
+    state.get.return_value = {"job-a": "a", "job-b": "b2"}
+
+    incremental_jjb.update(state, thread_pool_size=1)
+
+    patch_subprocess_run.assert_not_called()
+
+
 def test_get_repo_url_ghprb(fxt: Fixtures) -> None:
     url = JJB.get_repo_url(fxt.get_anymarkup("ghprb-job.yaml"))
     assert url == "https://github.com/RedHatInsights/acs-ui"
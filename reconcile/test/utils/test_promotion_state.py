@@ -40,7 +40,7 @@ def test_key_exists_v1(s3_state_builder: Callable[[Mapping[str, Any]], State]) -
         saas_file="saas_file",
         check_in="2024-04-30 13:47:31.722437+00:00",
     )
-    state.ls.assert_called_once_with()  # type: ignore[attr-defined]
+    state.ls.assert_called_once_with("promotions_v2/")  # type: ignore[attr-defined]
     state.get.assert_called_once_with("promotions_v2/channel/uid/sha", None)  # type: ignore[attr-defined]
 
 
@@ -65,7 +65,7 @@ def test_key_exists_v2(s3_state_builder: Callable[[Mapping[str, Any]], State]) -
         target_config_hash="hash",
         saas_file="saas_file",
     )
-    state.ls.assert_called_once_with()  # type: ignore[attr-defined]
+    state.ls.assert_called_once_with("promotions_v2/")  # type: ignore[attr-defined]
     state.get.assert_called_once_with("promotions_v2/channel/uid/sha", None)  # type: ignore[attr-defined]
 
 
@@ -82,7 +82,7 @@ def test_key_does_not_exist(
         channel="channel", sha="sha", target_uid="uid", pre_check_sha_exists=False
     )
     assert deployment_info is None
-    state.ls.assert_called_once_with()  # type: ignore[attr-defined]
+    state.ls.assert_called_once_with("promotions_v2/")  # type: ignore[attr-defined]
     state.get.assert_called_once_with("promotions_v2/channel/uid/sha", None)  # type: ignore[attr-defined]
 
 
@@ -99,7 +99,7 @@ def test_key_does_not_exist_in_commit_shas(
         channel="channel", sha="sha", target_uid="uid"
     )
     assert deployment_info is None
-    state.ls.assert_called_once_with()  # type: ignore[attr-defined]
+    state.ls.assert_called_once_with("promotions_v2/")  # type: ignore[attr-defined]
     state.get.assert_not_called()  # type: ignore[attr-defined]
 
 
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from reconcile.utils.datetime_util import utc_now
+from reconcile.utils.desired_state_snapshot import FileSnapshotStore
+from reconcile.utils.render_cache import RenderCache, init_render_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+def test_render_cache_digest() -> None:
+    assert RenderCache.digest("template", {"a": 1, "b": 2}) == RenderCache.digest(
+        "template", {"b": 2, "a": 1}
+    )
+    assert RenderCache.digest("template", {"a": 1}) != RenderCache.digest(
+        "template", {"a": 2}
+    )
+
+
+def test_render_cache_digest_includes_code_version(mocker: MockerFixture) -> None:
+    digest = RenderCache.digest("template")
+    mocker.patch(
+        "reconcile.utils.render_cache.code_version", return_value="another-version"
+    )
+
+    assert RenderCache.digest("template") != digest
+
+
+def test_render_cache_passed(tmp_path: Path) -> None:
+    cache = RenderCache(FileSnapshotStore(tmp_path))
+    digest = RenderCache.digest("template")
+
+    assert not cache.passed(digest)
+    cache.record_passed(digest)
+    assert cache.passed(digest)
+    assert not cache.passed(RenderCache.digest("changed template"))
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_render_cache_passed_expired(tmp_path: Path, mocker: MockerFixture) -> None:
+    cache = RenderCache(FileSnapshotStore(tmp_path), ttl_seconds=60)
+    digest = RenderCache.digest("template")
+    cache.record_passed(digest)
+    mocker.patch(
+        "reconcile.utils.render_cache.utc_now",
+        return_value=utc_now() + timedelta(seconds=61),
+    )
+
+    assert not cache.passed(digest)
+
+
+def test_render_cache_corrupt_entry(tmp_path: Path) -> None:
+    store = FileSnapshotStore(tmp_path)
+    cache = RenderCache(store)
+    digest = RenderCache.digest("template")
+    store.put(digest, b"not json")
+
+    assert not cache.passed(digest)
+
+
+def test_init_render_cache_disabled() -> None:
+    cache = init_render_cache("integration", location=None)
+    digest = RenderCache.digest("template")
+    cache.record_passed(digest)
+
+    assert cache.store is None
+    assert not cache.passed(digest)
+
+
+def test_init_render_cache_directory(tmp_path: Path) -> None:
+    cache = init_render_cache("integration", location=str(tmp_path))
+
+    assert isinstance(cache.store, FileSnapshotStore)
+    assert cache.store.directory == tmp_path / "render-cache" / "integration"
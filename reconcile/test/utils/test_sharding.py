@@ -36,3 +36,54 @@ def test_is_in_shard_three_shards_fail(monkeypatch: MonkeyPatch) -> None:
     importlib.reload(sharding)
 
     assert sharding.is_in_shard(VALUE) is False
+
+
+def test_is_in_shard_weighted_assignment(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("SHARDS", "3")
+    monkeypatch.setenv("SHARD_ID", "2")
+    importlib.reload(sharding)
+
+    sharding.set_weighted_assignment({VALUE: 2})
+    assert sharding.is_in_shard(VALUE) is True
+    sharding.set_weighted_assignment({})
+    assert sharding.is_in_shard(VALUE) is False
+
+
+def test_balance_shards_spreads_heavy_keys() -> None:
+    weights = {"giant": 100.0} | {f"key-{i}": 10.0 for i in range(10)}
+
+    assignment = sharding.balance_shards(weights, 2, tolerance=0.0)
+
+    loads = sharding.shard_loads(weights, 2, assignment)
+    giant_shard = assignment["giant"]
+    assert loads[giant_shard] == 100.0
+    assert all(
+        shard != giant_shard for key, shard in assignment.items() if key != "giant"
+    )
+
+
+def test_balance_shards_keeps_previous_assignment() -> None:
+    weights = {f"key-{i}": 10.0 for i in range(8)}
+    previous = sharding.balance_shards(weights, 4)
+
+    weights["key-0"] = 11.0
+    assignment = sharding.balance_shards(weights, 4, previous=previous)
+
+    assert assignment == previous
+
+
+def test_balance_shards_is_deterministic() -> None:
+    weights = {f"key-{i}": float(i % 5) for i in range(50)}
+
+    assert sharding.balance_shards(weights, 3) == sharding.balance_shards(
+        dict(reversed(weights.items())), 3
+    )
+
+
+def test_shard_loads_md5_fallback() -> None:
+    weights = {VALUE: 5.0}
+
+    loads = sharding.shard_loads(weights, 3)
+
+    assert loads[sharding.shard_for_key(VALUE, 3)] == 5.0
+    assert sum(loads) == 5.0
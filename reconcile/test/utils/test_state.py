@@ -174,6 +174,153 @@ def test_ls_when_that_are_more_than_1000_keys(
     assert keys == expected
 
 
+def test_ls_with_prefix(integration_state: State, s3_client: S3Client) -> None:
+    for key in ["a/1", "a/2", "b/1"]:
+        s3_client.put_object(
+            Bucket=integration_state.bucket,
+            Key=f"state/integration-name/{key}",
+            Body="test",
+        )
+
+    assert integration_state.ls("a/") == ["/a/1", "/a/2"]
+
+
+def test_get_all(integration_state: State, s3_client: S3Client) -> None:
+    for key, body in [("a/1", '"v1"'), ("a/2", '"v2"'), ("b/1", '"v3"')]:
+        s3_client.put_object(
+            Bucket=integration_state.bucket,
+            Key=f"state/integration-name/{key}",
+            Body=body,
+        )
+
+    assert integration_state.get_all("a") == {"1": "v1", "2": "v2"}
+    assert integration_state.get_all("b") == {"1": "v3"}
+
+
+def test_get_all_skips_unchanged_objects(
+    integration_state: State, s3_client: S3Client, mocker: MockerFixture
+) -> None:
+    integration_state["a/1"] = "v1"
+    integration_state["a/2"] = "v2"
+    s3_client.put_object(
+        Bucket=integration_state.bucket,
+        Key="state/integration-name/a/2",
+        Body='"changed"',
+    )
+    get_object = mocker.spy(integration_state.client, "get_object")
+
+    assert integration_state.get_all("a") == {"1": "v1", "2": "changed"}
+    get_object.assert_called_once()
+
+
+def test_get_many(integration_state: State) -> None:
+    integration_state["a"] = "v1"
+    integration_state["b"] = {"v": 2}
+
+    assert integration_state.get_many(["a", "b", "missing"]) == {
+        "a": "v1",
+        "b": {"v": 2},
+    }
+
+
+def test_get_uses_conditional_get(
+    integration_state: State, s3_client: S3Client, mocker: MockerFixture
+) -> None:
+    integration_state["k"] = {"v": 1}
+    get_object = mocker.spy(integration_state.client, "get_object")
+
+    value = integration_state["k"]
+    value["v"] = 2
+
+    assert integration_state["k"] == {"v": 1}
+    assert all("IfNoneMatch" in call.kwargs for call in get_object.call_args_list)
+
+    s3_client.put_object(
+        Bucket=integration_state.bucket,
+        Key="state/integration-name/k",
+        Body='{"v": 3}',
+    )
+    assert integration_state["k"] == {"v": 3}
+
+
+def test_object_cache_evicts_least_recently_used(
+    integration_state: State, mocker: MockerFixture
+) -> None:
+    integration_state._object_cache.max_bytes = 20
+    integration_state["a"] = "x" * 8
+    integration_state["b"] = "y" * 8
+    assert integration_state["a"] == "x" * 8
+    integration_state["c"] = "z" * 8
+    get_object = mocker.spy(integration_state.client, "get_object")
+
+    assert integration_state["a"] == "x" * 8
+    assert "IfNoneMatch" in get_object.call_args.kwargs
+    assert integration_state["b"] == "y" * 8
+    assert "IfNoneMatch" not in get_object.call_args.kwargs
+    assert integration_state._object_cache.size <= 20
+
+
+def test_get_removed_key(integration_state: State) -> None:
+    integration_state["k"] = "v"
+    integration_state.rm("k")
+
+    with pytest.raises(KeyError):
+        integration_state["k"]
+
+
+def test_write_behind_flushes_on_exit(
+    integration_state: State, mocker: MockerFixture
+) -> None:
+    put_object = mocker.spy(integration_state.client, "put_object")
+
+    with integration_state.write_behind():
+        integration_state["a"] = "v1"
+        integration_state.add("b", "v2", metadata={"m": "1"}, force=True)
+        integration_state["a"] = "v3"
+        # buffered writes are visible to reads
+        assert integration_state["a"] == "v3"
+        assert integration_state.head("b") == (True, {"m": "1"})
+        put_object.assert_not_called()
+
+    assert put_object.call_count == 2
+    assert integration_state.get_all("") == {"a": "v3", "b": "v2"}
+    assert integration_state.head("b") == (True, {"m": "1"})
+
+
+def test_write_behind_skips_unchanged_content(
+    integration_state: State, mocker: MockerFixture
+) -> None:
+    integration_state["a"] = {"v": 1}
+    integration_state.add("b", "v", metadata={"m": "1"}, force=True)
+    put_object = mocker.spy(integration_state.client, "put_object")
+
+    with integration_state.write_behind():
+        integration_state["a"] = {"v": 1}
+        integration_state["b"] = "v"
+
+    # the metadata of b changed
+    put_object.assert_called_once()
+    assert integration_state.head("b") == (True, {})
+
+
+def test_write_behind_flushes_on_exception(integration_state: State) -> None:
+    with pytest.raises(FileNotFoundError), integration_state.write_behind():
+        with integration_state.transaction("done", "set"):
+            pass
+        with integration_state.transaction("failed", "set"):
+            raise FileNotFoundError("Some error")
+
+    assert integration_state.get_all("") == {"done": "set"}
+
+
+def test_write_behind_rm_pending_key(integration_state: State) -> None:
+    with integration_state.write_behind():
+        integration_state["a"] = "v"
+        integration_state.rm("a")
+
+    assert integration_state.ls() == []
+
+
 def test_exists_for_existing_key(integration_state: State, s3_client: S3Client) -> None:
     key = "some-key"
 
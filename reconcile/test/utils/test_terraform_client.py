@@ -239,6 +239,38 @@ def test_populate_terraform_output_secret_with_replica_credentials() -> None:
     assert replica.get_secret_field("db.password") == "password"
 
 
+def test_populate_terraform_output_secrets_per_account(
+    tf: TerraformClient, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(tf, "init_outputs")
+    tf.outputs = {
+        "a1": {
+            "id-provider__key": {"value": "a1-value"},
+            "integ_pfx_enc-passwords__user": {"value": "password"},
+        },
+        "a2": {
+            "id-provider__key": {"value": "a2-value"},
+            "id-provider__db_user": {"value": "user"},
+            "no-resource-output": {"value": "ignored"},
+        },
+    }
+    specs = [
+        ExternalResourceSpec(
+            provision_provider="aws",
+            provisioner={"name": account},
+            resource={"identifier": "id", "provider": "provider"},
+            namespace={},
+        )
+        for account in ["a1", "a2", "a3"]
+    ]
+
+    tf.populate_terraform_output_secrets({s.id_object(): s for s in specs})
+
+    assert specs[0].secret == {"key": "a1-value"}
+    assert specs[1].secret == {"key": "a2-value", "db.user": "user"}
+    assert not specs[2].secret
+
+
 def test__resource_diff_changed_fields(tf: TerraformClient) -> None:
     changed = tf._resource_diff_changed_fields(
         "update",
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from reconcile.utils import sharding, weighted_sharding
+from reconcile.utils.state import State
+from reconcile.utils.weighted_sharding import ShardKeyDurations, ShardWeights
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from pytest import MonkeyPatch
+    from pytest_mock import MockerFixture
+
+INTEGRATION = "some-integration"
+
+
+class FakeState(State):
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+
+    def __getitem__(self, item: str) -> Any:
+        return self.data[item]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.data[key] = value
+
+    def get_all(self, path: str, thread_pool_size: int = 1) -> dict[str, Any]:
+        return {
+            k.removeprefix(f"{path}/"): v
+            for k, v in self.data.items()
+            if k.startswith(f"{path}/")
+        }
+
+    def cleanup(self) -> None:
+        pass
+
+
+@pytest.fixture
+def state() -> FakeState:
+    return FakeState()
+
+
+@pytest.fixture
+def shard_weights(state: FakeState) -> ShardWeights:
+    return ShardWeights(state, INTEGRATION)
+
+
+@pytest.fixture(autouse=True)
+def epoch(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch(
+        "reconcile.utils.weighted_sharding.current_epoch", return_value=10
+    )
+
+
+def test_record_new_keys(shard_weights: ShardWeights, state: FakeState) -> None:
+    shard_weights.record({"a": 10.0, "b": 2.0}, shard_id=1)
+
+    assert state.data[f"{INTEGRATION}/durations/1"] == {"a": 10.0, "b": 2.0}
+
+
+def test_record_smooths_existing_keys(
+    shard_weights: ShardWeights, state: FakeState
+) -> None:
+    state.data[f"{INTEGRATION}/durations/0"] = {"a": 10.0, "b": 2.0}
+
+    shard_weights.record({"a": 20.0}, shard_id=0, smoothing=0.5)
+
+    # b moved to another shard
+    assert state.data[f"{INTEGRATION}/durations/0"] == {"a": 15.0}
+
+
+def test_get_weights_merges_shards(
+    shard_weights: ShardWeights, state: FakeState
+) -> None:
+    state.data[f"{INTEGRATION}/durations/0"] = {"a": 1.0, "b": 2.0}
+    state.data[f"{INTEGRATION}/durations/1"] = {"b": 3.0, "c": 4.0}
+
+    assert shard_weights.get_weights() == {"a": 1.0, "b": 3.0, "c": 4.0}
+
+
+def test_get_assignment_ignores_other_shard_count(
+    shard_weights: ShardWeights,
+) -> None:
+    shard_weights.set_assignment(3, {"a": 1})
+
+    assert shard_weights.get_assignment(3, epoch=11) == {"a": 1}
+    assert shard_weights.get_assignment(2, epoch=11) == {}
+
+
+def test_set_assignment_activates_in_next_epoch(
+    shard_weights: ShardWeights, epoch: MagicMock
+) -> None:
+    shard_weights.set_assignment(2, {"a": 1})
+    epoch.return_value = 11
+    shard_weights.set_assignment(2, {"a": 0})
+
+    assert shard_weights.get_assignment(2) == {"a": 1}
+    assert shard_weights.get_assignment(2, epoch=12) == {"a": 0}
+
+
+def test_plan_uses_weights(shard_weights: ShardWeights, state: FakeState) -> None:
+    state.data[f"{INTEGRATION}/durations/0"] = {"a": 10.0, "b": 10.0}
+
+    assignment = shard_weights.plan(2)
+
+    assert sorted(assignment.values()) == [0, 1]
+
+
+def test_rebalance(shard_weights: ShardWeights, state: FakeState) -> None:
+    state.data[f"{INTEGRATION}/durations/0"] = {"a": 10.0, "b": 10.0}
+
+    assert shard_weights.rebalance(2)
+    assert shard_weights.get_assignment(2) == {}
+    assert shard_weights.get_assignment(2, epoch=11) == shard_weights.plan(2)
+    assert not shard_weights.rebalance(2)
+
+
+def test_rebalance_keeps_pending_assignment(
+    shard_weights: ShardWeights, state: FakeState, epoch: MagicMock
+) -> None:
+    state.data[f"{INTEGRATION}/durations/0"] = {"a": 10.0, "b": 10.0}
+    assert shard_weights.rebalance(2)
+    pending = shard_weights.get_assignment(2, epoch=11)
+    state.data[f"{INTEGRATION}/durations/0"] = {"a": 10.0, "b": 10.0, "c": 30.0}
+
+    assert not shard_weights.rebalance(2)
+    assert shard_weights.get_assignment(2, epoch=11) == pending
+
+    epoch.return_value = 11
+    assert shard_weights.rebalance(2)
+    assert shard_weights.get_assignment(2) == pending
+    assert "c" in shard_weights.get_assignment(2, epoch=12)
+
+
+def test_activate(
+    shard_weights: ShardWeights, monkeypatch: MonkeyPatch, epoch: MagicMock
+) -> None:
+    monkeypatch.setenv("SHARDS", "2")
+    monkeypatch.setenv("SHARD_ID", "1")
+    importlib.reload(sharding)
+    other_shard = 1 - sharding.shard_for_key("a", 2)
+    shard_weights.set_assignment(2, {"a": other_shard})
+    epoch.return_value = 11
+
+    shard_weights.activate()
+
+    assert sharding.is_in_shard("a") is (other_shard == 1)
+    sharding.set_weighted_assignment({})
+
+
+def test_shard_key_durations(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "reconcile.utils.weighted_sharding.time.monotonic",
+        side_effect=[1.0, 3.0, 10.0, 11.0],
+    )
+    durations = ShardKeyDurations()
+
+    with durations.measure("a"):
+        pass
+    with durations.measure("a"):
+        pass
+
+    assert durations.durations == {"a": 3.0}
+
+
+def test_shard_key_durations_iterate(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "reconcile.utils.weighted_sharding.time.monotonic",
+        side_effect=[1.0, 3.0, 10.0, 11.0],
+    )
+    durations = ShardKeyDurations()
+
+    assert list(durations.iterate(["a", "b"], key=str.upper)) == ["a", "b"]
+
+    assert durations.durations == {"A": 2.0, "B": 1.0}
+
+
+@pytest.fixture
+def weighted_shard_0(
+    shard_weights: ShardWeights, monkeypatch: MonkeyPatch, mocker: MockerFixture
+) -> None:
+    monkeypatch.setattr(weighted_sharding, "WEIGHTED_SHARDING", True)
+    monkeypatch.setattr(sharding, "SHARDS", 2)
+    monkeypatch.setattr(sharding, "SHARD_ID", 0)
+    mocker.patch.object(ShardWeights, "build", return_value=shard_weights)
+
+
+@pytest.mark.usefixtures("weighted_shard_0")
+def test_weighted_sharding_records_and_rebalances(
+    shard_weights: ShardWeights, state: FakeState, epoch: MagicMock
+) -> None:
+    other_shard_key = next(
+        k for k in ("a", "b", "c", "d") if sharding.shard_for_key(k, 2) == 1
+    )
+    shard_weights.set_assignment(2, {other_shard_key: 0})
+    epoch.return_value = 11
+
+    with weighted_sharding.weighted_sharding(INTEGRATION, record=True):
+        assert sharding.is_in_shard(other_shard_key)
+        weighted_sharding.shard_key_durations.durations["x"] = 5.0
+
+    assert not sharding.is_in_shard(other_shard_key)
+    assert state.data[f"{INTEGRATION}/durations/0"] == {"x": 5.0}
+    assert shard_weights.get_assignment(2) == {other_shard_key: 0}
+    assert shard_weights.get_assignment(2, epoch=12) == {
+        "x": sharding.shard_for_key("x", 2)
+    }
+
+
+@pytest.mark.usefixtures("weighted_shard_0")
+def test_weighted_sharding_dry_run_does_not_record(state: FakeState) -> None:
+    with weighted_sharding.weighted_sharding(INTEGRATION, record=False):
+        weighted_sharding.shard_key_durations.durations["x"] = 5.0
+
+    assert state.data == {}
+
+
+def test_weighted_sharding_disabled(mocker: MockerFixture) -> None:
+    build = mocker.patch.object(ShardWeights, "build")
+
+    with weighted_sharding.weighted_sharding(INTEGRATION, record=True):
+        pass
+
+    build.assert_not_called()
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import csv
+import itertools
 import logging
 import operator
 import os
+import time
+from datetime import timedelta
 from functools import lru_cache
 from threading import Lock
 from typing import (
@@ -21,6 +25,7 @@ from sretoolbox.utils import threaded
 
 import reconcile.utils.aws_helper as awsh
 import reconcile.utils.lean_terraform_client as terraform
+from reconcile.utils.datetime_util import utc_now
 from reconcile.utils.secret_reader import SecretReader, SecretReaderBase
 
 if TYPE_CHECKING:
@@ -94,6 +99,20 @@ KeyStatus = Literal["Active", "Expired", "Inactive"]
 
 GOVCLOUD_PARTITION = "aws-us-gov"
 
+# use the IAM credential report to find the users with access keys in
+# get_users_keys instead of listing the keys of every user
+IAM_CREDENTIAL_REPORT = os.environ.get("AWS_IAM_CREDENTIAL_REPORT") == "true"
+# AWS regenerates the credential report at most every 4 hours. users which
+# got their first access key after the report was generated are missed, fall
+# back to listing the keys of all users if the report is older than this or
+# misses an expected key.
+IAM_CREDENTIAL_REPORT_MAX_AGE = timedelta(
+    seconds=int(os.environ.get("AWS_IAM_CREDENTIAL_REPORT_MAX_AGE", "14400"))
+)
+IAM_CREDENTIAL_REPORT_ATTEMPTS = 20
+IAM_CREDENTIAL_REPORT_RETRY_SECONDS = 3
+IAM_CREDENTIAL_REPORT_ROOT_USER = "<root_account>"
+
 
 class AmiTag(BaseModel):
     name: str
@@ -512,10 +531,17 @@ class AWSApi:
         keys_to_delete: Mapping,
         working_dirs: Mapping[str, str],
         disable_service_account_keys: bool,
+        expected_keys: Mapping[str, Iterable[str]] | None = None,
     ) -> tuple[bool, bool]:
+        """
+        expected_keys are the keys_to_delete expected to still exist, see
+        get_users_keys. Keys deleted in earlier runs must not be part of it.
+        """
         error = False
         service_account_recycle_complete = True
-        users_keys = self.get_users_keys(keys_to_delete.keys())
+        users_keys = self.get_users_keys(
+            keys_to_delete.keys(), expected_keys=expected_keys
+        )
         for account, s in self.sessions.items():
             iam = self.get_session_client(s, "iam")
             keys = keys_to_delete.get(account, [])
@@ -594,16 +620,91 @@ class AWSApi:
 
         return error, service_account_recycle_complete
 
-    def get_users_keys(self, accounts: Iterable[str]) -> dict:
-        users_keys = {}
-        for account in accounts:
-            iam = self.get_session_client(self.sessions[account], "iam")
-            users_keys[account] = {
-                user: self.get_user_keys(iam, user)
-                for user in self._get_account_users(account)
+    @staticmethod
+    def _get_credential_report(iam: IAMClient) -> str | None:
+        """
+        Returns the CSV credential report of the account, generating it if
+        needed. None if the report is not ready in time or too old.
+        """
+        for _ in range(IAM_CREDENTIAL_REPORT_ATTEMPTS):
+            if iam.generate_credential_report()["State"] == "COMPLETE":
+                break
+            time.sleep(IAM_CREDENTIAL_REPORT_RETRY_SECONDS)
+        else:
+            return None
+        report = iam.get_credential_report()
+        if utc_now() - report["GeneratedTime"] > IAM_CREDENTIAL_REPORT_MAX_AGE:
+            return None
+        return report["Content"].decode()
+
+    @staticmethod
+    def _parse_credential_report(report: str) -> dict[str, bool]:
+        """Maps the users in a credential report to whether they have keys."""
+        return {
+            row["user"]: any(
+                row[f"access_key_{i}_last_rotated"] != "N/A" for i in (1, 2)
+            )
+            for row in csv.DictReader(report.splitlines())
+            if row["user"] != IAM_CREDENTIAL_REPORT_ROOT_USER
+        }
+
+    def _get_account_users_keys(
+        self, account: str, credential_report: bool, expected_keys: Iterable[str]
+    ) -> tuple[str, dict[str, list[str]]]:
+        iam = self.get_session_client(self.sessions[account], "iam")
+        report = None
+        if credential_report:
+            try:
+                report = self._get_credential_report(iam)
+            except Exception as e:
+                logging.warning(f"[{account}] error getting credential report: {e}")
+            if report is None:
+                logging.info(
+                    f"[{account}] credential report not available, "
+                    "listing the keys of all users"
+                )
+        if report is not None:
+            # only users with keys need a list_access_keys call
+            users_keys = {
+                user: self.get_user_keys(iam, user) if has_keys else []
+                for user, has_keys in self._parse_credential_report(report).items()
             }
+            found_keys = set(itertools.chain.from_iterable(users_keys.values()))
+            if set(expected_keys) <= found_keys:
+                return account, users_keys
+            # users created or keys added after the report was generated
+            logging.info(
+                f"[{account}] keys missing in credential report, "
+                "listing the keys of all users"
+            )
+        return account, {
+            user: self.get_user_keys(iam, user)
+            for user in self._get_account_users(account)
+        }
 
-        return users_keys
+    def get_users_keys(
+        self,
+        accounts: Iterable[str],
+        credential_report: bool = IAM_CREDENTIAL_REPORT,
+        expected_keys: Mapping[str, Iterable[str]] | None = None,
+    ) -> dict:
+        """
+        Returns the access key ids per user per account. With
+        credential_report, the users with keys are looked up in the IAM
+        credential report of the account, falling back to listing the keys
+        of all users if the report is not available, stale or misses one of
+        the expected_keys of the account. expected_keys must only contain
+        keys expected to exist, e.g. not the already deleted ones.
+        """
+        expected_keys = expected_keys or {}
+        results = threaded.run(
+            lambda account: self._get_account_users_keys(
+                account, credential_report, expected_keys.get(account, [])
+            ),
+            accounts,
+            self.thread_pool_size,
+        )
+        return dict(results)
 
     def reset_password(self, account: str, user_name: str) -> None:
         s = self.sessions[account]
@@ -0,0 +1,189 @@
+"""
+Canonical, content based hashing of (desired state) data structures.
+
+The digest of a value only depends on its content: mapping keys are ordered,
+lists and tuples are treated alike (desired states are compared with their
+JSON round-tripped counterparts) and sets are order independent.
+
+Values are fed as a compact, type tagged and length prefixed encoding into a
+streaming hash. Every container gets its own digest (Merkle style), which is
+cached per hasher by object identity, so shared or repeatedly hashed
+subtrees are only hashed once.
+
+For a transition period, CANONICAL_HASH_MODE=deephash switches back to
+deepdiff's DeepHash, e.g. to keep existing early exit cache keys valid.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum, StrEnum
+from typing import Any
+
+from deepdiff import DeepHash
+from pydantic import BaseModel
+
+
+class HashMode(StrEnum):
+    CANONICAL = "canonical"
+    DEEPHASH = "deephash"
+
+
+DEFAULT_HASH_MODE = HashMode(os.getenv("CANONICAL_HASH_MODE") or HashMode.CANONICAL)
+
+# blake2b is faster than sha256 in pure python land and can produce 32 bytes
+# digests, which keeps the hexdigest length of sha256 (and DeepHash).
+DIGEST_SIZE = 32
+
+_NONE = b"N"
+_TRUE = b"T"
+_FALSE = b"F"
+
+
+def _new_hash() -> Any:
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def _len_prefixed(tag: bytes, data: bytes) -> bytes:
+    return b"%s%d:%s" % (tag, len(data), data)
+
+
+class CanonicalHasher:
+    """
+    Calculates canonical digests. Container digests are cached by object
+    identity for the lifetime of the hasher, so a hasher must not outlive
+    modifications of the hashed data.
+    """
+
+    def __init__(self) -> None:
+        # id(obj) -> (obj, digest); obj is kept alive to keep its id unique
+        self._digests: dict[int, tuple[Any, bytes]] = {}
+
+    def hexdigest(self, obj: Any) -> str:
+        return self.digest(obj).hex()
+
+    def digest(self, obj: Any) -> bytes:
+        """The digest of obj. Leaf values are hashed via their encoding."""
+        encoded = self._encode(obj)
+        if encoded[:1] == b"h":
+            return encoded[1:]
+        h = _new_hash()
+        h.update(encoded)
+        return h.digest()
+
+    def _encode(self, obj: Any) -> bytes:
+        """
+        The compact encoding of a leaf value or b"h" + digest for containers.
+        """
+        # fast path for the JSON types, which make up most of desired states
+        t = type(obj)
+        if t is str:
+            return _len_prefixed(b"s", obj.encode())
+        if t is dict or t is list:
+            return b"h" + self._container_digest(obj)
+        if t is int:
+            return b"i%d;" % obj
+        # order matters: bool is an int, StrEnum is a str
+        if obj is None:
+            return _NONE
+        if obj is True:
+            return _TRUE
+        if obj is False:
+            return _FALSE
+        if isinstance(obj, Enum):
+            return self._encode(obj.value)
+        if isinstance(obj, str):
+            return _len_prefixed(b"s", obj.encode())
+        if isinstance(obj, int):
+            return b"i%d;" % obj
+        if isinstance(obj, float):
+            return b"f%s;" % repr(obj).encode()
+        if isinstance(obj, bytes):
+            return _len_prefixed(b"b", obj)
+        if isinstance(obj, datetime | date | time):
+            return _len_prefixed(b"d", obj.isoformat().encode())
+        if isinstance(obj, Decimal):
+            return b"D%s;" % str(obj).encode()
+        return b"h" + self._container_digest(obj)
+
+    def _container_digest(self, obj: Any) -> bytes:
+        cached = self._digests.get(id(obj))
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+
+        h = _new_hash()
+        if isinstance(obj, list | tuple):
+            h.update(b"l%d:" % len(obj))
+            h.update(b"".join([self._encode(item) for item in obj]))
+        elif isinstance(obj, Mapping):
+            self._update_mapping(h, b"m", obj)
+        elif isinstance(obj, AbstractSet):
+            items = sorted(self._encode(item) for item in obj)
+            h.update(b"S%d:" % len(items))
+            h.update(b"".join(items))
+        elif isinstance(obj, BaseModel):
+            self._update_mapping(h, b"m", obj.model_dump())
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            self._update_mapping(
+                h,
+                _len_prefixed(b"o", type(obj).__qualname__.encode()),
+                {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)},
+            )
+        elif hasattr(obj, "__dict__"):
+            self._update_mapping(
+                h, _len_prefixed(b"o", type(obj).__qualname__.encode()), vars(obj)
+            )
+        else:
+            raise TypeError(f"unsupported type for canonical hashing: {type(obj)}")
+
+        digest = h.digest()
+        self._digests[id(obj)] = (obj, digest)
+        return digest
+
+    def _update_mapping(self, h: Any, tag: bytes, obj: Mapping[Any, Any]) -> None:
+        items = sorted((self._encode(k), self._encode(v)) for k, v in obj.items())
+        h.update(b"%s%d:" % (tag, len(items)))
+        h.update(b"".join([key + value for key, value in items]))
+
+
+class DeepHasher:
+    """
+    The CanonicalHasher interface on top of deepdiff's DeepHash. The hashes of
+    all visited subtrees are shared between calls, with the same lifetime
+    restrictions as for CanonicalHasher.
+    """
+
+    def __init__(self) -> None:
+        self._hashes: dict[Any, Any] = {}
+
+    def hexdigest(self, obj: Any) -> str:
+        return DeepHash(obj, hashes=self._hashes)[obj]
+
+    def digest(self, obj: Any) -> bytes:
+        return bytes.fromhex(self.hexdigest(obj))
+
+
+def new_hasher(mode: HashMode | None = None) -> CanonicalHasher | DeepHasher:
+    """
+    Returns a hasher for mode, which defaults to CANONICAL_HASH_MODE.
+    """
+    if (mode or DEFAULT_HASH_MODE) == HashMode.DEEPHASH:
+        return DeepHasher()
+    return CanonicalHasher()
+
+
+def deephash_hexdigest(obj: Any) -> str:
+    return DeepHash(obj)[obj]
+
+
+def canonical_hash(obj: Any, mode: HashMode | None = None) -> str:
+    """
+    Returns the hex digest of obj. mode defaults to CANONICAL_HASH_MODE.
+    """
+    return new_hasher(mode).hexdigest(obj)
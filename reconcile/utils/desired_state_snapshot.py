@@ -0,0 +1,211 @@
+"""
+Snapshots of rendered desired state, e.g. the OpenshiftResources rendered
+from the openshiftResources of a namespace.
+
+A snapshot is stored per key (e.g. cluster/namespace) together with the
+digest of the inputs it was rendered from. As long as the inputs of a key do
+not change, the rendered items can be loaded from its snapshot instead of
+rendering them again. Snapshots are stored as zlib compressed JSON in a local
+directory or in the app-interface state bucket, see
+DESIRED_STATE_SNAPSHOT_LOCATION.
+
+Snapshots must only hold items which are a pure function of the digested
+inputs and must never hold secret values.
+"""
+
+from __future__ import annotations
+
+import base64
+import copy
+import json
+import logging
+import os
+import threading
+import zlib
+from collections import defaultdict
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from sretoolbox.utils import threaded
+
+from reconcile.utils.canonical_hash import canonical_hash
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
+from reconcile.utils.json import json_dumps
+from reconcile.utils.state import init_state
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from reconcile.utils.secret_reader import SecretReaderBase
+    from reconcile.utils.state import State
+
+# "s3" for the app-interface state bucket or a local directory.
+# snapshots are disabled if not set.
+DESIRED_STATE_SNAPSHOT_LOCATION = os.environ.get("DESIRED_STATE_SNAPSHOT_LOCATION")
+SNAPSHOT_STATE_INTEGRATION = "desired-state-snapshots"
+
+
+def code_version() -> str:
+    """
+    The version of qontract-reconcile. Part of the snapshot digests, so
+    changes to the rendering code invalidate all snapshots.
+    """
+    try:
+        return version("qontract-reconcile")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SnapshotStore(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def put(self, key: str, data: bytes) -> None: ...
+
+
+class FileSnapshotStore:
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json.zz"
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+
+class StateSnapshotStore:
+    """Stores snapshots base64 encoded in the app-interface state."""
+
+    def __init__(self, state: State, prefix: str) -> None:
+        self.state = state
+        self.prefix = prefix
+
+    def get(self, key: str) -> bytes | None:
+        data = self.state.get(f"{self.prefix}/{key}", None)
+        return base64.b64decode(data) if data is not None else None
+
+    def put(self, key: str, data: bytes) -> None:
+        self.state[f"{self.prefix}/{key}"] = base64.b64encode(data).decode()
+
+
+def init_snapshot_store(
+    prefix: str,
+    location: str | None = DESIRED_STATE_SNAPSHOT_LOCATION,
+    secret_reader: SecretReaderBase | None = None,
+) -> SnapshotStore | None:
+    if not location:
+        return None
+    if location == "s3":
+        return StateSnapshotStore(
+            init_state(SNAPSHOT_STATE_INTEGRATION, secret_reader=secret_reader),
+            prefix,
+        )
+    return FileSnapshotStore(Path(location) / prefix)
+
+
+def encode_snapshot(snapshot: Mapping[str, Any]) -> bytes:
+    return zlib.compress(json_dumps(snapshot).encode())
+
+
+def decode_snapshot(data: bytes) -> dict[str, Any]:
+    return json.loads(zlib.decompress(data))
+
+
+class DesiredStateSnapshots:
+    """
+    Loads the snapshots of keys whose input digest did not change and
+    collects the rendered items of the other keys for new snapshots. Thread
+    safe, items can be recorded while rendering concurrently.
+
+    read_only snapshots are only loaded, e.g. in dry-runs whose inputs are
+    not merged yet.
+    """
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+        read_only: bool = False,
+    ) -> None:
+        self.store = store
+        self.thread_pool_size = thread_pool_size
+        self.read_only = read_only
+        self._digests: dict[str, str] = {}
+        self._loaded: dict[str, dict[str, Any]] = {}
+        self._recorded: dict[str, dict[str, Any]] = defaultdict(dict)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self, key: str) -> dict[str, Any] | None:
+        try:
+            data = self.store.get(key)
+            return decode_snapshot(data) if data is not None else None
+        except Exception as e:
+            logging.warning(f"could not load desired state snapshot {key}: {e}")
+            return None
+
+    def load(self, inputs: Mapping[str, Any]) -> None:
+        """
+        Loads the snapshots of all keys. inputs maps each key to everything
+        its items are rendered from. Snapshots of keys whose inputs changed
+        are ignored.
+        """
+        self._digests = {key: canonical_hash(obj) for key, obj in inputs.items()}
+        keys = list(self._digests)
+        snapshots = threaded.run(self._load, keys, self.thread_pool_size)
+        for key, snapshot in zip(keys, snapshots, strict=True):
+            if snapshot and snapshot.get("digest") == self._digests[key]:
+                self._loaded[key] = snapshot["items"]
+
+    def get(self, key: str, item_key: str) -> Any | None:
+        value = self._loaded.get(key, {}).get(item_key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def record(self, key: str, item_key: str, value: Any) -> None:
+        """
+        Records a copy of a rendered item for the new snapshot. Items already
+        in the loaded snapshot of the key are skipped.
+        """
+        if self.read_only or item_key in self._loaded.get(key, {}):
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._recorded[key][item_key] = value
+
+    def _save(self, key: str) -> None:
+        items = self._loaded.get(key, {}) | self._recorded[key]
+        snapshot = {"digest": self._digests[key], "items": items}
+        try:
+            self.store.put(key, encode_snapshot(snapshot))
+        except Exception as e:
+            logging.warning(f"could not save desired state snapshot {key}: {e}")
+
+    def save(self) -> None:
+        """Stores the snapshots of all keys with recorded items."""
+        keys = [
+            key
+            for key, items in self._recorded.items()
+            if items and key in self._digests and not self.read_only
+        ]
+        threaded.run(self._save, keys, self.thread_pool_size)
+        logging.info(
+            f"desired state snapshots: {self.hits} items loaded, "
+            f"{self.misses} rendered, {len(keys)} snapshots updated"
+        )
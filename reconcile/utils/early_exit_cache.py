@@ -5,9 +5,9 @@ from enum import Enum
 from functools import cached_property
 from typing import TYPE_CHECKING, Self
 
-from deepdiff import DeepHash
 from pydantic import BaseModel, ConfigDict
 
+from reconcile.utils.canonical_hash import canonical_hash
 from reconcile.utils.datetime_util import utc_now
 from reconcile.utils.state import State, init_state
 
@@ -93,7 +93,7 @@ class CacheKey(BaseModel):
 
         :return: hash of the cache source
         """
-        return DeepHash(self.cache_source)[self.cache_source]
+        return canonical_hash(self.cache_source)
 
     @cached_property
     def cache_key_with_digest(self) -> CacheKeyWithDigest:
@@ -27,6 +27,26 @@ def rev_parse(ref: str, wd: str) -> str:
     return result.stdout.strip()
 
 
+def ls_remote(repo_url: str, ref: str, verify: bool = True) -> str | None:
+    """
+    Returns the commit sha of ref in the remote repository, None if ref is
+    not a branch or tag (e.g. a commit sha).
+    """
+    cmd = ["git"]
+    if not verify:
+        cmd += ["-c", "http.sslVerify=false"]
+    cmd += ["ls-remote", repo_url, ref]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        raise GitError(f"git ls-remote failed for {repo_url}: {result.stderr}")
+    shas = dict(line.split("\t")[::-1] for line in result.stdout.splitlines())
+    # ls-remote matches ref as a suffix of any ref name, only take exact
+    # matches. annotated tags are listed twice, the peeled ref points to
+    # the commit
+    names = [f"refs/heads/{ref}", f"refs/tags/{ref}^{{}}", f"refs/tags/{ref}"]
+    return next((shas[name] for name in names if name in shas), None)
+
+
 def is_current_ref(ref: str, wd: str) -> bool:
     return rev_parse("HEAD", wd) == rev_parse(ref, wd)
 
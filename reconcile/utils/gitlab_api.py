@@ -56,6 +56,7 @@ from reconcile.utils.secret_reader import SecretReader, SecretReaderBase
 if TYPE_CHECKING:
     from collections.abc import (
         Iterable,
+        Iterator,
         Mapping,
     )
 
@@ -116,6 +117,18 @@ class Comment:
     note: ProjectMergeRequestNote | None = None
 
 
+def _iter_archive_files(archive: bytes) -> Iterator[tuple[str, bytes]]:
+    # stream mode decompresses member by member
+    with tarfile.open(fileobj=io.BytesIO(archive), mode="r|gz") as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            # skip leading prefix xxx/
+            file_path = member.name.split("/", 1)[-1]
+            if file_path and (file := tar.extractfile(member)):
+                yield file_path, file.read()
+
+
 class GitLabApi:
     def __init__(
         self,
@@ -832,14 +845,19 @@ class GitLabApi:
         :param path: The subpath of the repository to download. If an empty string, defaults to the whole repository.
         :return: A dictionary with the file path as keys and the file content bytes as values.
         """
+        return dict(GitLabApi.iter_directory_contents(project, ref=ref, path=path))
+
+    @staticmethod
+    def iter_directory_contents(
+        project: Project,
+        ref: str | None = None,
+        path: str | None = None,
+    ) -> Iterator[tuple[str, bytes]]:
+        """
+        Like get_directory_contents, but the files are extracted lazily one
+        by one. The archive is downloaded right away.
+
+        :return: An iterator of (file path, file content bytes) tuples.
+        """
         archive = project.repository_archive(format="tar.gz", sha=ref, path=path)
-        tar_bytes = io.BytesIO(archive)
-        with tarfile.open(fileobj=tar_bytes, mode="r:gz") as tar:
-            return {
-                file_path: file.read()
-                for member in tar.getmembers()
-                if member.isfile()
-                # skip leading prefix xxx/
-                and (file_path := member.name.split("/", 1)[-1])
-                and (file := tar.extractfile(member))
-            }
+        return _iter_archive_files(archive)
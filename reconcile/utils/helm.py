@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import shutil
 import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from subprocess import (
     CalledProcessError,
+    CompletedProcess,
     run,
 )
 from typing import TYPE_CHECKING, Any
@@ -16,7 +24,17 @@ from reconcile.utils.json import json_dumps
 from reconcile.utils.runtime.sharding import ShardSpec
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Generator, Iterable, Mapping
+
+# checkouts of chart repositories are kept in this directory, a temporary
+# directory per process if not set
+HELM_CACHE_DIR = os.environ.get("HELM_CACHE_DIR")
+HELM_CACHE_MAX_CHECKOUTS = int(os.environ.get("HELM_CACHE_MAX_CHECKOUTS", "20"))
+HELM_RENDER_CACHE_SIZE = int(os.environ.get("HELM_RENDER_CACHE_SIZE", "256"))
+# max number of helm processes running at the same time
+HELM_MAX_CONCURRENCY = int(os.environ.get("HELM_MAX_CONCURRENCY", "4"))
+
+_helm_processes = threading.BoundedSemaphore(HELM_MAX_CONCURRENCY)
 
 
 class HelmTemplateError(Exception):
@@ -30,76 +48,79 @@ class JSONEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+def _run_helm(cmd: list[str]) -> CompletedProcess[bytes]:
+    with _helm_processes:
+        return run(cmd, capture_output=True, check=True)
+
+
+def _helm_template_error(e: CalledProcessError) -> HelmTemplateError:
+    msg = f"Error running helm template [{' '.join(e.cmd)}]"
+    if e.stdout:
+        msg += f" {e.stdout.decode()}"
+    if e.stderr:
+        msg += f" {e.stderr.decode()}"
+    return HelmTemplateError(msg)
+
+
+@contextmanager
+def _repository_args() -> Generator[list[str]]:
+    """A temporary repository config and cache as helm arguments."""
+    with (
+        tempfile.NamedTemporaryFile(
+            mode="w+", encoding="locale"
+        ) as repository_config_file,
+        tempfile.TemporaryDirectory() as repository_cache_dir,
+    ):
+        yield [
+            "--repository-config",
+            repository_config_file.name,
+            "--repository-cache",
+            repository_cache_dir,
+        ]
+
+
+def _build_dependencies(path: str, repository_args: list[str]) -> None:
+    with open(os.path.join(path, "Chart.yaml"), encoding="locale") as chart_file:
+        chart = yaml.safe_load(chart_file)
+    if dependencies := chart.get("dependencies"):
+        for dep in dependencies:
+            if repo := dep.get("repository"):
+                _run_helm(["helm", "repo", "add", dep["name"], repo, *repository_args])
+        _run_helm(["helm", "dependency", "build", path, *repository_args])
+
+
+def _template(
+    values: str, path: str, namespace: str, repository_args: list[str]
+) -> str:
+    with tempfile.NamedTemporaryFile(mode="w+", encoding="locale") as values_file:
+        values_file.write(values)
+        values_file.flush()
+        cmd = [
+            "helm",
+            "template",
+            path,
+            "--namespace",
+            namespace,
+            "--values",
+            values_file.name,
+            *repository_args,
+        ]
+        return _run_helm(cmd).stdout.decode()
+
+
 def do_template(
     values: Mapping[str, Any],
     path: str,
     namespace: str,
 ) -> str:
     try:
-        with (
-            tempfile.NamedTemporaryFile(
-                mode="w+", encoding="locale"
-            ) as repository_config_file,
-            tempfile.TemporaryDirectory() as repository_cache_dir,
-        ):
-            with open(
-                os.path.join(path, "Chart.yaml"), encoding="locale"
-            ) as chart_file:
-                chart = yaml.safe_load(chart_file)
-                if dependencies := chart.get("dependencies"):
-                    for dep in dependencies:
-                        if repo := dep.get("repository"):
-                            cmd = [
-                                "helm",
-                                "repo",
-                                "add",
-                                dep["name"],
-                                repo,
-                                "--repository-config",
-                                repository_config_file.name,
-                                "--repository-cache",
-                                repository_cache_dir,
-                            ]
-                            run(cmd, capture_output=True, check=True)
-                    cmd = [
-                        "helm",
-                        "dependency",
-                        "build",
-                        path,
-                        "--repository-config",
-                        repository_config_file.name,
-                        "--repository-cache",
-                        repository_cache_dir,
-                    ]
-                    run(cmd, capture_output=True, check=True)
-            with tempfile.NamedTemporaryFile(
-                mode="w+", encoding="locale"
-            ) as values_file:
-                values_file.write(json_dumps(values, cls=JSONEncoder))
-                values_file.flush()
-                cmd = [
-                    "helm",
-                    "template",
-                    path,
-                    "--namespace",
-                    namespace,
-                    "--values",
-                    values_file.name,
-                    "--repository-config",
-                    repository_config_file.name,
-                    "--repository-cache",
-                    repository_cache_dir,
-                ]
-                result = run(cmd, capture_output=True, check=True)
+        with _repository_args() as repository_args:
+            _build_dependencies(path, repository_args)
+            return _template(
+                json_dumps(values, cls=JSONEncoder), path, namespace, repository_args
+            )
     except CalledProcessError as e:
-        msg = f"Error running helm template [{' '.join(cmd)}]"
-        if e.stdout:
-            msg += f" {e.stdout.decode()}"
-        if e.stderr:
-            msg += f" {e.stderr.decode()}"
-        raise HelmTemplateError(msg) from None
-
-    return result.stdout.decode()
+        raise _helm_template_error(e) from None
 
 
 def template(
@@ -110,6 +131,104 @@ def template(
     return yaml.safe_load(do_template(values=values, path=path, namespace=namespace))
 
 
+@dataclass
+class _Checkout:
+    directory: str
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    cloned: bool = False
+    charts: set[str] = field(default_factory=set)
+    users: int = 0
+
+
+class ChartCache:
+    """
+    Checkouts of chart repositories per (repo url, commit sha). Chart
+    dependencies are built once per chart path. The least recently used
+    checkouts not in use are removed above max_checkouts.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = HELM_CACHE_DIR,
+        max_checkouts: int = HELM_CACHE_MAX_CHECKOUTS,
+    ) -> None:
+        self._directory = directory
+        self.max_checkouts = max_checkouts
+        self._checkouts: OrderedDict[tuple[str, str], _Checkout] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="helm-cache-")
+        return self._directory
+
+    def _evict(self) -> None:
+        unused = [k for k, c in self._checkouts.items() if not c.users]
+        for key in unused[: max(0, len(self._checkouts) - self.max_checkouts)]:
+            shutil.rmtree(self._checkouts.pop(key).directory, ignore_errors=True)
+
+    @staticmethod
+    def _prepare(
+        checkout: _Checkout, url: str, commit_sha: str, path: str, ssl_verify: bool
+    ) -> str:
+        chart_path = f"{checkout.directory}{path}"
+        with checkout.lock:
+            if not checkout.cloned:
+                shutil.rmtree(checkout.directory, ignore_errors=True)
+                os.makedirs(checkout.directory)
+                git.clone(url, checkout.directory, depth=1, verify=ssl_verify)
+                git.checkout(commit_sha, checkout.directory, verify=ssl_verify)
+                checkout.cloned = True
+            if path not in checkout.charts:
+                with _repository_args() as repository_args:
+                    _build_dependencies(chart_path, repository_args)
+                checkout.charts.add(path)
+        return chart_path
+
+    @contextmanager
+    def chart(
+        self, url: str, commit_sha: str, path: str, ssl_verify: bool = True
+    ) -> Generator[str]:
+        """The directory of the chart with its dependencies built."""
+        key = (url, commit_sha)
+        with self._lock:
+            if (checkout := self._checkouts.get(key)) is None:
+                digest = hashlib.sha256(f"{url}@{commit_sha}".encode()).hexdigest()
+                checkout = _Checkout(os.path.join(self.directory, digest[:16]))
+                self._checkouts[key] = checkout
+            self._checkouts.move_to_end(key)
+            checkout.users += 1
+        try:
+            yield self._prepare(checkout, url, commit_sha, path, ssl_verify)
+        finally:
+            with self._lock:
+                checkout.users -= 1
+                self._evict()
+
+
+_chart_cache = ChartCache()
+
+
+@lru_cache(maxsize=HELM_RENDER_CACHE_SIZE)
+def _render(
+    url: str,
+    commit_sha: str,
+    path: str,
+    namespace: str,
+    values: str,
+    ssl_verify: bool,
+) -> str:
+    try:
+        with (
+            _chart_cache.chart(url, commit_sha, path, ssl_verify) as chart_path,
+            _repository_args() as repository_args,
+        ):
+            return _template(values, chart_path, namespace, repository_args)
+    except CalledProcessError as e:
+        raise _helm_template_error(e) from None
+
+
 def template_all(
     url: str,
     path: str,
@@ -118,9 +237,19 @@ def template_all(
     values: Mapping[str, Any],
     ssl_verify: bool = True,
 ) -> Iterable[Mapping[str, Any]]:
-    with tempfile.TemporaryDirectory() as wd:
-        git.clone(url, wd, depth=1, verify=ssl_verify)
-        git.checkout(ref, wd, verify=ssl_verify)
-        return yaml.safe_load_all(
-            do_template(values=values, path=f"{wd}{path}", namespace=namespace)
+    """
+    Renders the chart at path of the repository for ref. Charts are
+    rendered once per (commit, values, namespace), their checkouts and
+    dependencies are cached per commit.
+    """
+    commit_sha = git.ls_remote(url, ref, verify=ssl_verify) or ref
+    return yaml.safe_load_all(
+        _render(
+            url,
+            commit_sha,
+            path,
+            namespace,
+            json_dumps(values, cls=JSONEncoder),
+            ssl_verify,
         )
+    )
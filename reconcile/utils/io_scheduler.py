@@ -0,0 +1,260 @@
+"""
+Process wide I/O scheduler with per-endpoint concurrency limits.
+
+threaded.run sizes a thread pool per call site and is unaware of the
+endpoint (a cluster, GitHub, a container registry, ...) its work items hit.
+Call sites (and nested calls) hitting the same endpoint add up and trigger
+API throttling.
+
+io_scheduler.run is a drop-in replacement for threaded.run which maps every
+work item to an endpoint. Work items wait for a slot of their endpoint. The
+slots of an endpoint are shared by all call sites of the process. Nested runs
+inherit the slots held by their parent work item, so a work item can submit
+more work for its endpoint without deadlocking.
+
+The limit of an endpoint is taken from IO_SCHEDULER_ENDPOINT_LIMITS (e.g.
+"github=5,registry:quay.io=8"), matching the endpoint or its kind (the part
+before the first ':'), and defaults to IO_SCHEDULER_DEFAULT_ENDPOINT_LIMIT.
+Endpoints without a limit (0, the default) are not limited, their work items
+never wait and keep the throughput of threaded.run.
+With IO_SCHEDULER_ADAPTIVE the limit is halved whenever a work item is
+throttled (HTTP 429) and grows back by one slot per limit-many successful
+work items (AIMD). A work item counts as throttled if it raises a 429 error
+or if code handling the 429 itself calls report_throttled.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import Counter, Gauge, Histogram
+from sretoolbox.utils import threaded
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable, Mapping
+
+# 0: endpoints without a configured limit are not limited
+IO_SCHEDULER_DEFAULT_ENDPOINT_LIMIT = int(
+    os.environ.get("IO_SCHEDULER_DEFAULT_ENDPOINT_LIMIT", "0")
+)
+IO_SCHEDULER_ENDPOINT_LIMITS = os.environ.get("IO_SCHEDULER_ENDPOINT_LIMITS", "")
+IO_SCHEDULER_ADAPTIVE = (
+    os.environ.get("IO_SCHEDULER_ADAPTIVE", "true").lower() == "true"
+)
+THROTTLED_STATUS_CODE = 429
+
+io_scheduler_queue_depth = Gauge(
+    "qontract_reconcile_io_scheduler_queue_depth",
+    "Number of work items waiting for a slot of an endpoint",
+    ["endpoint"],
+)
+io_scheduler_wait_time = Histogram(
+    "qontract_reconcile_io_scheduler_wait_seconds",
+    "Time work items waited for a slot of an endpoint",
+    ["endpoint"],
+)
+io_scheduler_limit = Gauge(
+    "qontract_reconcile_io_scheduler_concurrency_limit",
+    "Current concurrency limit of an endpoint",
+    ["endpoint"],
+)
+io_scheduler_throttled = Counter(
+    "qontract_reconcile_io_scheduler_throttled_total",
+    "Total number of throttled work items of an endpoint",
+    ["endpoint"],
+)
+
+
+class HeldSlot:
+    def __init__(self) -> None:
+        self.throttled = False
+
+
+# slots held by the current work item (and its nested runs) by endpoint
+_held_slots: contextvars.ContextVar[Mapping[str, HeldSlot]] = contextvars.ContextVar(
+    "io_scheduler_held_slots", default=MappingProxyType({})
+)
+
+
+def parse_endpoint_limits(limits: str) -> dict[str, int]:
+    """Parses "github=5,cluster=20" into {"github": 5, "cluster": 20}."""
+    result = {}
+    for item in limits.split(","):
+        if not item.strip():
+            continue
+        endpoint, _, limit = item.partition("=")
+        result[endpoint.strip()] = int(limit)
+    return result
+
+
+def report_throttled(endpoint: str | None = None) -> None:
+    """
+    Reports that the current work item was throttled by endpoint (default:
+    all endpoints it holds a slot of). For call sites which handle the 429
+    error themselves, so it never reaches the scheduler.
+    """
+    for held_endpoint, held_slot in _held_slots.get().items():
+        if endpoint is None or held_endpoint == endpoint:
+            held_slot.throttled = True
+
+
+def is_throttled(error: BaseException) -> bool:
+    """Whether error is an HTTP 429 response of requests, httpx, PyGithub, ..."""
+    for obj in (error, getattr(error, "response", None)):
+        for attr in ("status_code", "status"):
+            if getattr(obj, attr, None) == THROTTLED_STATUS_CODE:
+                return True
+    return False
+
+
+class EndpointLimiter:
+    """Adaptive (AIMD) concurrency limit of a single endpoint."""
+
+    def __init__(self, endpoint: str, limit: int, adaptive: bool) -> None:
+        self.endpoint = endpoint
+        self.max_limit = limit
+        self.limit = limit
+        self.adaptive = adaptive
+        self.in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+        io_scheduler_limit.labels(endpoint).set(limit)
+
+    def acquire(self) -> None:
+        start = time.monotonic()
+        with self._cond:
+            if self.in_flight >= self.limit:
+                io_scheduler_queue_depth.labels(self.endpoint).inc()
+                try:
+                    self._cond.wait_for(lambda: self.in_flight < self.limit)
+                finally:
+                    io_scheduler_queue_depth.labels(self.endpoint).dec()
+            self.in_flight += 1
+        io_scheduler_wait_time.labels(self.endpoint).observe(time.monotonic() - start)
+
+    def release(self, throttled: bool = False) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                io_scheduler_throttled.labels(self.endpoint).inc()
+            if self.adaptive:
+                self._adapt(throttled)
+            self._cond.notify_all()
+
+    def _adapt(self, throttled: bool) -> None:
+        if throttled:
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+        elif self.limit < self.max_limit:
+            self._successes += 1
+            if self._successes >= self.limit:
+                self.limit += 1
+                self._successes = 0
+        io_scheduler_limit.labels(self.endpoint).set(self.limit)
+
+
+class IOScheduler:
+    def __init__(
+        self,
+        default_limit: int = IO_SCHEDULER_DEFAULT_ENDPOINT_LIMIT,
+        limits: dict[str, int] | None = None,
+        adaptive: bool = IO_SCHEDULER_ADAPTIVE,
+    ) -> None:
+        self.default_limit = default_limit
+        self.limits = limits or {}
+        self.adaptive = adaptive
+        self._limiters: dict[str, EndpointLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limit_of(self, endpoint: str) -> int:
+        """The configured limit of endpoint, 0 if it is not limited."""
+        kind = endpoint.split(":", 1)[0]
+        return self.limits.get(endpoint, self.limits.get(kind, self.default_limit))
+
+    def limiter(self, endpoint: str) -> EndpointLimiter:
+        with self._lock:
+            if endpoint not in self._limiters:
+                self._limiters[endpoint] = EndpointLimiter(
+                    endpoint, self.limit_of(endpoint), self.adaptive
+                )
+            return self._limiters[endpoint]
+
+    @contextmanager
+    def slot(self, endpoint: str) -> Generator[None]:
+        """
+        Holds a slot of endpoint while in the context. Re-entrant for the
+        holder of the slot, including its nested runs.
+        """
+        held = _held_slots.get()
+        if endpoint in held or not self.limit_of(endpoint):
+            yield
+            return
+        limiter = self.limiter(endpoint)
+        limiter.acquire()
+        held_slot = HeldSlot()
+        token = _held_slots.set({**held, endpoint: held_slot})
+        try:
+            yield
+        except BaseException as e:
+            held_slot.throttled |= is_throttled(e)
+            raise
+        finally:
+            _held_slots.reset(token)
+            limiter.release(held_slot.throttled)
+
+    def run(
+        self,
+        func: Callable[..., Any],
+        iterable: Iterable[Any],
+        thread_pool_size: int,
+        endpoint: str | Callable[[Any], str],
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """
+        Like threaded.run, but every item waits for a slot of its endpoint
+        (a string or a function of the item) before func is called.
+        """
+        endpoint_of = endpoint if callable(endpoint) else lambda _: endpoint
+        # run the items in (copies of) the caller's context, so nested runs
+        # see the slots held by the caller
+        context = contextvars.copy_context()
+
+        def call(item: Any) -> Any:
+            with self.slot(endpoint_of(item)):
+                return func(item, **kwargs)
+
+        return threaded.run(
+            lambda item: context.copy().run(call, item),
+            iterable,
+            thread_pool_size,
+            return_exceptions=return_exceptions,
+        )
+
+
+scheduler = IOScheduler(limits=parse_endpoint_limits(IO_SCHEDULER_ENDPOINT_LIMITS))
+
+
+def run(
+    func: Callable[..., Any],
+    iterable: Iterable[Any],
+    thread_pool_size: int,
+    endpoint: str | Callable[[Any], str],
+    return_exceptions: bool = False,
+    **kwargs: Any,
+) -> list[Any]:
+    """threaded.run with the per-endpoint limits of the process wide scheduler."""
+    return scheduler.run(
+        func,
+        iterable,
+        thread_pool_size,
+        endpoint,
+        return_exceptions=return_exceptions,
+        **kwargs,
+    )
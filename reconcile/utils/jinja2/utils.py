@@ -3,12 +3,14 @@ from __future__ import annotations
 import datetime
 import json
 import os
+import re
 import threading
 from functools import cache
 from typing import TYPE_CHECKING, Any, Self
 
 import jinja2
 from github import Github
+from jinja2 import nodes
 from jinja2.sandbox import SandboxedEnvironment
 from pydantic import BaseModel
 from sretoolbox.utils import retry
@@ -134,6 +136,8 @@ class Jinja2TemplateCache:
 
     def __init__(self) -> None:
         self._stores: dict[str, dict[Any, Any]] = {ns: {} for ns in self._NAMESPACES}
+        self.hits: dict[str, int] = dict.fromkeys(self._NAMESPACES, 0)
+        self.misses: dict[str, int] = dict.fromkeys(self._NAMESPACES, 0)
         self._locks: dict[str, dict[Any, threading.Lock]] = {
             ns: {} for ns in self._NAMESPACES
         }
@@ -151,10 +155,21 @@ class Jinja2TemplateCache:
 
     def get_or_set(self, namespace: str, key: Any, compute: Callable[[], Any]) -> Any:
         with self._lock_for(namespace, key):
-            if key not in self._stores[namespace]:
+            if key in self._stores[namespace]:
+                self.hits[namespace] += 1
+            else:
+                self.misses[namespace] += 1
                 self._stores[namespace][key] = compute()
         return self._stores[namespace][key]
 
+    def reset_stats(self) -> None:
+        self.hits = dict.fromkeys(self._NAMESPACES, 0)
+        self.misses = dict.fromkeys(self._NAMESPACES, 0)
+
+    def hit_rate(self, namespace: str) -> float:
+        lookups = self.hits[namespace] + self.misses[namespace]
+        return self.hits[namespace] / lookups if lookups else 0.0
+
 
 def _fetch_github_file_content(
     repo: str, path: str, ref: str, cache: Jinja2TemplateCache
@@ -279,6 +294,109 @@ def list_s3_objects(
     return cache.get_or_set(Jinja2TemplateCache.S3_LS, cache_key, _fetch)
 
 
+def vault_cache_key(path: str, version: str | int | None) -> tuple[str, str | None]:
+    # Normalize "LATEST" to None — both mean "current version" in Vault KV v2,
+    # sharing a single cache entry avoids a redundant Vault read.
+    if version is None or str(version).upper() == "LATEST":
+        return path, None
+    return path, str(version)
+
+
+@retry(no_retry_exceptions=(SecretNotFoundError,))
+def read_vault_secret(
+    secret_reader: SecretReaderBase,
+    path: str,
+    version: str | int | None,
+    cache: Jinja2TemplateCache,
+) -> dict[str, str]:
+    """
+    Read all keys of a vault secret via the VAULT namespace of the cache,
+    the same cache entries the vault() template lookup uses.
+
+    :raises SecretNotFoundError: if the secret does not exist
+    """
+    cache_key = vault_cache_key(path, version)
+    if cache_key[1] is None:
+        version = None
+    secret_data = cache.get_or_set(
+        Jinja2TemplateCache.VAULT,
+        cache_key,
+        lambda: secret_reader.read_all({"path": path, "version": version}),
+    )
+    if secret_data is None:
+        raise SecretNotFoundError(path)
+    return secret_data
+
+
+def find_vault_lookups(
+    body: str, extra_curly: bool = False
+) -> set[tuple[str, str | None]]:
+    """
+    Find all vault() lookups with literal path and version arguments in a
+    template. Returns their vault cache keys.
+    """
+    try:
+        ast = compile_jinja2_template(body, extra_curly).environment.parse(body)
+    except jinja2.TemplateError:
+        return set()
+    lookups: set[tuple[str, str | None]] = set()
+    for call in ast.find_all(nodes.Call):
+        if not (isinstance(call.node, nodes.Name) and call.node.name == "vault"):
+            continue
+        if not call.args or not isinstance(call.args[0], nodes.Const):
+            continue
+        version_arg = next((kw.value for kw in call.kwargs if kw.key == "v"), None)
+        if len(call.args) > 2:
+            version_arg = call.args[2]
+        if version_arg is not None and not isinstance(version_arg, nodes.Const):
+            continue
+        version = version_arg.value if version_arg is not None else None
+        lookups.add(vault_cache_key(call.args[0].value, version))
+    return lookups
+
+
+# template functions whose results change independently of their arguments
+# or which return secrets
+NON_STATIC_TEMPLATE_FUNCTIONS = frozenset({
+    "query",
+    "s3",
+    "s3_ls",
+    "url",
+    "vault",
+    "yesterday",
+})
+GIT_COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
+
+def is_static_template(body: str, extra_curly: bool = False) -> bool:
+    """
+    Check if the rendering result of a template only depends on the template
+    and its variables: no secret lookups, no lookups with changing results
+    and only github() lookups pinned to a commit sha.
+    """
+    try:
+        ast = compile_jinja2_template(body, extra_curly).environment.parse(body)
+    except jinja2.TemplateError:
+        return False
+    pinned_github_lookups: set[int] = set()
+    for call in ast.find_all(nodes.Call):
+        if not (isinstance(call.node, nodes.Name) and call.node.name == "github"):
+            continue
+        ref = call.args[2] if len(call.args) > 2 else None
+        if (
+            isinstance(ref, nodes.Const)
+            and isinstance(ref.value, str)
+            and GIT_COMMIT_SHA_RE.match(ref.value)
+        ):
+            pinned_github_lookups.add(id(call.node))
+    for name in ast.find_all(nodes.Name):
+        if name.name in NON_STATIC_TEMPLATE_FUNCTIONS:
+            return False
+        if name.name == "github" and id(name) not in pinned_github_lookups:
+            return False
+    return True
+
+
 @retry()
 def _vault_read_all(
     secret_reader: SecretReaderBase,
@@ -324,11 +442,9 @@ def lookup_secret(
             )
     if not secret_reader:
         secret_reader = SecretReader(settings)
-    # Normalize "LATEST" to None — both mean "current version" in Vault KV v2,
-    # sharing a single cache entry avoids a redundant Vault read.
-    if version is not None and str(version).upper() == "LATEST":
+    cache_key = vault_cache_key(path, version)
+    if cache_key[1] is None:
         version = None
-    cache_key = (path, str(version) if version is not None else None)
 
     sr = secret_reader
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import difflib
 import filecmp
+import glob
+import hashlib
 import logging
 import os
 import re
@@ -22,9 +24,10 @@ import yaml
 from jenkins_jobs.errors import JenkinsJobsException
 from jenkins_jobs.loader import load_files
 from jenkins_jobs.roots import Roots
-from sretoolbox.utils import retry
+from sretoolbox.utils import retry, threaded
 
 from reconcile.utils import throughput
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.helpers import toggle_logger
 from reconcile.utils.json import json_dumps
 from reconcile.utils.vcs import GITHUB_BASE_URL
@@ -36,6 +39,8 @@ if TYPE_CHECKING:
     from reconcile.utils.state import State
 
 JJB_INI = "[jenkins]\nurl = https://JENKINS_URL"
+# state key prefix of the per instance job XML digests of incremental updates
+JOB_DIGESTS_STATE_PREFIX = "job-digests"
 
 
 class MissingJobUrlError(Exception):
@@ -253,25 +258,111 @@ class JJB:
             return file_name.replace("desired", "current")
         return file_name.replace("current", "desired")
 
-    def update(self) -> None:
-        for name, wd in self.working_dirs.items():
-            ini_path = f"{wd}/{name}.ini"
-            config_path = f"{wd}/config.yaml"
+    def update(
+        self,
+        state: State | None = None,
+        thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
+    ) -> None:
+        """
+        Updates the jobs of all instances. With state, instances are
+        updated incrementally and in parallel: only jobs whose generated XML
+        changed since the last update are pushed, see update_instance_jobs.
+        """
+        if state is None:
+            for name in self.working_dirs:
+                self.update_instance(name)
+        else:
+            threaded.run(
+                self.update_instance_jobs,
+                self.working_dirs,
+                thread_pool_size,
+                state=state,
+            )
+
+    def update_instance(
+        self, name: str, job_names: Iterable[str] | None = None
+    ) -> None:
+        """
+        Runs jenkins-jobs update for an instance, restricted to job_names if
+        given. Old jobs are only deleted by unrestricted updates, as
+        jenkins-jobs would delete all jobs not in job_names otherwise.
+        """
+        wd = self.working_dirs[name]
+        ini_path = f"{wd}/{name}.ini"
+        config_path = f"{wd}/config.yaml"
 
-            os.environ["PYTHONHTTPSVERIFY"] = self.python_https_verify
-            cmd = ["jenkins-jobs", "--conf", ini_path, "update", config_path]
-            delete_method = self.instances[name]["delete_method"]
-            if delete_method != "manual":
-                cmd.append("--delete-old")
-            try:
-                result = subprocess.run(
-                    cmd, check=True, stdout=PIPE, stderr=STDOUT, encoding="utf-8"
-                )
-                if re.search(r"updated: [1-9]", result.stdout):
-                    logging.info(result.stdout)
-            except CalledProcessError as ex:
-                logging.error(ex.stdout)
-                raise
+        os.environ["PYTHONHTTPSVERIFY"] = self.python_https_verify
+        cmd = ["jenkins-jobs", "--conf", ini_path, "update", config_path]
+        if job_names is not None:
+            # job names are glob patterns for jenkins-jobs
+            cmd.extend(glob.escape(job_name) for job_name in job_names)
+        elif self.instances[name]["delete_method"] != "manual":
+            cmd.append("--delete-old")
+        try:
+            result = subprocess.run(
+                cmd, check=True, stdout=PIPE, stderr=STDOUT, encoding="utf-8"
+            )
+            if re.search(r"updated: [1-9]", result.stdout):
+                logging.info(result.stdout)
+        except CalledProcessError as ex:
+            logging.error(ex.stdout)
+            raise
+
+    def get_job_digests(self, name: str) -> dict[str, str]:
+        """
+        Generates the XML of the jobs and views of an instance and returns
+        the sha256 digest of each XML by job name.
+        """
+        wd = self.working_dirs[name]
+        output_dir = tempfile.mkdtemp(dir=wd)
+        cmd = [
+            "jenkins-jobs",
+            "--conf",
+            f"{wd}/{name}.ini",
+            "test",
+            f"{wd}/config.yaml",
+            "-o",
+            output_dir,
+            "--config-xml",
+        ]
+        try:
+            subprocess.run(
+                cmd, check=True, stdout=PIPE, stderr=STDOUT, encoding="utf-8"
+            )
+        except CalledProcessError as ex:
+            logging.error(ex.stdout)
+            raise
+        try:
+            return {
+                str(f.parent.relative_to(output_dir)): hashlib.sha256(
+                    f.read_bytes()
+                ).hexdigest()
+                for f in Path(output_dir).rglob("config.xml")
+            }
+        finally:
+            shutil.rmtree(output_dir)
+
+    def update_instance_jobs(self, name: str, state: State) -> None:
+        """
+        Pushes only the jobs of an instance whose XML digest differs from
+        the one stored in state by the last update. Without stored digests
+        or if jobs were removed, the whole instance is updated.
+        """
+        digests = self.get_job_digests(name)
+        state_key = f"{JOB_DIGESTS_STATE_PREFIX}/{name}"
+        previous_digests = state.get(state_key, None)
+        if previous_digests is None or previous_digests.keys() - digests.keys():
+            self.update_instance(name)
+        else:
+            changed = sorted(
+                job_name
+                for job_name, digest in digests.items()
+                if previous_digests.get(job_name) != digest
+            )
+            logging.debug(f"[{name}] {len(changed)} changed jobs to update")
+            if changed:
+                self.update_instance(name, changed)
+        state.add(state_key, value=digests, force=True)
 
     @staticmethod
     def get_jjb(args: Iterable[str]) -> Any:
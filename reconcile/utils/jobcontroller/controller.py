@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Protocol, TextIO
+from typing import TYPE_CHECKING, Any, Protocol, TextIO
 
 from kubernetes.client import (
     ApiClient,
@@ -21,10 +21,18 @@ from reconcile.utils.jobcontroller.models import (
     JobValidationError,
     K8sJob,
 )
+from reconcile.utils.jobcontroller.watcher import (
+    JOB_KIND,
+    JobWatcher,
+    get_job_watcher,
+)
+from reconcile.utils.oc import OCNative
 from reconcile.utils.oc_map import init_oc_map_from_clusters
 from reconcile.utils.openshift_resource import OpenshiftResource
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from reconcile.utils.oc import OCCli
     from reconcile.utils.secret_reader import SecretReaderBase
 
@@ -82,6 +90,7 @@ class K8sJobController:
         integration_version: str,
         dry_run: bool = False,
         time_module: TimeProtocol = time,
+        watch_jobs: bool = True,
     ) -> None:
         self.cluster = cluster
         self.namespace = namespace
@@ -90,6 +99,7 @@ class K8sJobController:
         self.oc = oc
         self.dry_run = dry_run
         self.time_module = time_module
+        self.watch_jobs = watch_jobs
         self._cache: dict[str, OpenshiftResource] | None = None
 
     @property
@@ -102,11 +112,18 @@ class K8sJobController:
         """
         Updates the cache with the latest jobs in the namespace.
         """
+        return self._set_cache(
+            self.oc.get_items(
+                kind=JOB_KIND,
+                namespace=self.namespace,
+            )
+        )
+
+    def _set_cache(
+        self, items: Iterable[dict[str, Any]]
+    ) -> dict[str, OpenshiftResource]:
         new_cache = {}
-        for item in self.oc.get_items(
-            kind="Job.batch",
-            namespace=self.namespace,
-        ):
+        for item in items:
             openshift_resource = OpenshiftResource(
                 body=item,
                 integration=self.integration,
@@ -116,6 +133,55 @@ class K8sJobController:
         self._cache = new_cache
         return self._cache
 
+    def _job_watcher(self) -> JobWatcher | None:
+        """
+        The shared job watcher of the namespace. Watching requires the
+        kubernetes API client of OCNative, OCCli based controllers poll.
+        """
+        if not self.watch_jobs or not isinstance(self.oc, OCNative):
+            return None
+        return get_job_watcher(self.oc, self.namespace)
+
+    def _refresh_jobs(self) -> int | None:
+        """
+        Updates the cache from the job watcher or, if it is not in sync, by
+        listing the jobs. Returns the watcher generation the cache reflects
+        or None if the jobs were listed.
+        """
+        watcher = self._job_watcher()
+        if watcher:
+            # read the generation first to not miss changes in between
+            generation = watcher.generation
+            jobs = watcher.jobs()
+            if jobs is not None:
+                self._set_cache(jobs.values())
+                return generation
+        self.update_cache()
+        return None
+
+    def _wait_for_job_changes(
+        self,
+        generation: int | None,
+        elapsed_time: float,
+        timeout_seconds: float,
+        check_interval_seconds: float,
+    ) -> None:
+        """
+        Waits for the next job change reported by the job watcher, at most
+        check_interval_seconds. Sleeps for check_interval_seconds if the jobs
+        were listed.
+        """
+        if generation is None or (watcher := self._job_watcher()) is None:
+            self._sleep_until_timeout(
+                elapsed_time, timeout_seconds, check_interval_seconds
+            )
+            return
+        wait_seconds = check_interval_seconds
+        if timeout_seconds >= 0:
+            wait_seconds = min(check_interval_seconds, timeout_seconds - elapsed_time)
+        if wait_seconds > 0:
+            watcher.wait_for_change(generation, wait_seconds)
+
     def get_job_generation(self, job_name: str) -> str | None:
         """
         Returns the generation annotation for a job.
@@ -189,7 +255,7 @@ class K8sJobController:
 
         start_time = self.time_module.time()
         while jobs_left:
-            self.update_cache()
+            generation = self._refresh_jobs()
             for job_name in list(jobs_left):
                 status = self.get_job_status(job_name)
                 job_statuses[job_name] = status
@@ -205,8 +271,8 @@ class K8sJobController:
                 logging.info(
                     f"Waiting for {jobs_left} to complete. Rechecking in {check_interval_seconds} seconds"
                 )
-                self._sleep_until_timeout(
-                    elapsed_time, timeout_seconds, check_interval_seconds
+                self._wait_for_job_changes(
+                    generation, elapsed_time, timeout_seconds, check_interval_seconds
                 )
         return job_statuses
 
@@ -370,7 +436,7 @@ class K8sJobController:
         """
         start_time = self.time_module.time()
         while True:
-            self.update_cache()
+            generation = self._refresh_jobs()
             status = self.get_job_status(job_name)
             match status:
                 case JobStatus.SUCCESS:
@@ -380,8 +446,8 @@ class K8sJobController:
             elapsed_time = self.time_module.time() - start_time
             if timeout_seconds >= 0 and elapsed_time >= timeout_seconds:
                 raise TimeoutError(f"Timeout waiting for job {job_name} to complete")
-            self._sleep_until_timeout(
-                elapsed_time, timeout_seconds, check_interval_seconds
+            self._wait_for_job_changes(
+                generation, elapsed_time, timeout_seconds, check_interval_seconds
             )
 
     def _sleep_until_timeout(
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from reconcile.utils.oc import OCNative
+
+JOB_KIND = "Job.batch"
+# wait before relisting after a broken watch stream
+RESTART_BACKOFF_SECONDS = 5
+# stop watching a namespace nobody is interested in anymore
+IDLE_STOP_SECONDS = 10 * 60
+
+
+class JobWatcher:
+    """
+    Keeps the jobs of a namespace up to date with a single watch stream on a
+    background thread. Any number of threads can wait for job changes via
+    `wait_for_change`.
+
+    As long as the watcher is not in sync (before the initial list and after
+    the stream broke), `jobs` returns None and consumers are expected to fall
+    back to listing the jobs themselves. A watcher stops itself when it was
+    not used for IDLE_STOP_SECONDS.
+    """
+
+    def __init__(self, oc: OCNative, namespace: str) -> None:
+        self.oc = oc
+        self.namespace = namespace
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._synced = False
+        self._generation = 0
+        self._changed = threading.Condition()
+        self._stopped = threading.Event()
+        self._last_used = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name=f"job-watcher-{namespace}", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        with self._changed:
+            self._synced = False
+            self._changed.notify_all()
+
+    def jobs(self) -> dict[str, dict[str, Any]] | None:
+        """
+        A snapshot of the jobs in the namespace by name, None if the
+        watcher is not in sync.
+        """
+        self._last_used = time.monotonic()
+        with self._changed:
+            if not self._synced:
+                return None
+            return dict(self._jobs)
+
+    @property
+    def generation(self) -> int:
+        """Increases with every change."""
+        return self._generation
+
+    def wait_for_change(self, generation: int, timeout: float) -> None:
+        """
+        Waits until a change after `generation` happened, the watcher lost
+        sync or the timeout is reached.
+        """
+        self._last_used = time.monotonic()
+        with self._changed:
+            self._changed.wait_for(
+                lambda: (
+                    self._generation != generation
+                    or not self._synced
+                    or self._stopped.is_set()
+                ),
+                timeout=timeout,
+            )
+
+    def _update(
+        self,
+        synced: bool,
+        jobs: dict[str, dict[str, Any]] | None = None,
+        changed_job: tuple[str, dict[str, Any]] | None = None,
+    ) -> None:
+        with self._changed:
+            if jobs is not None:
+                self._jobs = jobs
+            if changed_job is not None:
+                event_type, job = changed_job
+                if event_type == "DELETED":
+                    self._jobs.pop(job["metadata"]["name"], None)
+                else:
+                    self._jobs[job["metadata"]["name"]] = job
+            self._synced = synced
+            self._generation += 1
+            self._changed.notify_all()
+
+    def _idle(self) -> bool:
+        return time.monotonic() - self._last_used > IDLE_STOP_SECONDS
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            if self._idle():
+                self.stop()
+                return
+            try:
+                self._list_and_watch()
+            except Exception as e:
+                logging.warning(
+                    f"Watching jobs in {self.oc.cluster_name}/{self.namespace} "
+                    f"failed, falling back to polling: {e}"
+                )
+                self._update(synced=False)
+                self._stopped.wait(RESTART_BACKOFF_SECONDS)
+
+    def _list_and_watch(self) -> None:
+        job_list = self.oc.get(self.namespace, JOB_KIND)
+        resource_version = job_list["metadata"]["resourceVersion"]
+        self._update(
+            synced=True,
+            jobs={job["metadata"]["name"]: job for job in job_list["items"]},
+        )
+        # a watch stream ends after a server side timeout. continue from
+        # the last seen resource version, relist if that is too old.
+        while not self._stopped.is_set() and not self._idle():
+            for event_type, job in self.oc.watch_items(
+                JOB_KIND, self.namespace, resource_version=resource_version
+            ):
+                if self._stopped.is_set():
+                    return
+                if event_type == "ERROR":
+                    # e.g. 410 Gone, the resource version is too old
+                    raise RuntimeError(job.get("message", "watch error"))
+                resource_version = job["metadata"]["resourceVersion"]
+                if event_type != "BOOKMARK":
+                    self._update(synced=True, changed_job=(event_type, job))
+
+
+_watchers: dict[tuple[str, str], JobWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def get_job_watcher(oc: OCNative, namespace: str) -> JobWatcher:
+    """
+    Returns the shared, running job watcher for the namespace of a cluster,
+    so concurrent waiters are served by one watch stream per namespace.
+    A watcher belongs to the client it was created with, it is replaced
+    when a different client for the cluster asks for it.
+    """
+    key = (str(oc.cluster_name), namespace)
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is not None and watcher.oc is not oc:
+            watcher.stop()
+            watcher = None
+        if watcher is None or watcher.stopped:
+            watcher = JobWatcher(oc, namespace)
+            watcher.start()
+            _watchers[key] = watcher
+        return watcher
+
+
+def stop_job_watchers(oc: OCNative | None = None) -> None:
+    """
+    Stops the job watchers using the given client, all of them if no client
+    is given. Called when a client is cleaned up.
+    """
+    with _watchers_lock:
+        for key, watcher in list(_watchers.items()):
+            if oc is None or watcher.oc is oc:
+                watcher.stop()
+                del _watchers[key]
@@ -84,6 +84,45 @@ oc_get_items_duration = Histogram(
     buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf")),
 )
 
+oc_request = Counter(
+    name="qontract_reconcile_oc_request_total",
+    documentation="Number of calls made to OpenShift clusters",
+    labelnames=["integration", "cluster", "kind"],
+)
+
+rollout_validation_ready_duration = Histogram(
+    name="qontract_reconcile_rollout_validation_ready_seconds",
+    documentation="Time until an applied resource passed the rollout validation",
+    labelnames=["integration", "kind"],
+    buckets=(5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0, float("inf")),
+)
+
+rollout_validation_result = Counter(
+    name="qontract_reconcile_rollout_validation_total",
+    documentation="Rollout validation results of applied resources",
+    labelnames=["integration", "kind", "result"],
+)
+
+terraform_output_phase_duration = Histogram(
+    name="qontract_reconcile_terraform_output_phase_seconds",
+    documentation="Duration of the phases of processing terraform outputs after apply",
+    labelnames=["integration", "phase"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, float("inf")),
+)
+
+vault_prefetch_duration = Histogram(
+    name="qontract_reconcile_vault_prefetch_seconds",
+    documentation="Duration of prefetching vault secrets before rendering",
+    labelnames=["integration"],
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, float("inf")),
+)
+
+vault_cache_hit_rate = Gauge(
+    name="qontract_reconcile_vault_cache_hit_rate",
+    documentation="Hit rate of vault lookups on the scoped template cache",
+    labelnames=["integration"],
+)
+
 registry_reachouts = Counter(
     name="qontract_reconcile_registry_get_manifest_total",
     documentation="Number of GET requests on image registries",
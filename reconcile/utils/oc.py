@@ -47,6 +47,8 @@ from sretoolbox.utils import (
 )
 
 from reconcile.status import RunningState
+from reconcile.utils import io_scheduler
+from reconcile.utils.jobcontroller.watcher import stop_job_watchers
 from reconcile.utils.json import json_dumps
 from reconcile.utils.metrics import oc_get_items_duration, reconcile_time
 from reconcile.utils.openshift_resource import OpenshiftResource as OR
@@ -57,7 +59,7 @@ from reconcile.utils.secret_reader import (
 from reconcile.utils.unleash import get_feature_toggle_state
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
 
     from reconcile.utils.oc_connection_parameters import OCConnectionParameters
 
@@ -675,6 +677,9 @@ class OCCli:
         cmd = ["delete", "group", group]
         self._run(cmd)
 
+    def get_groups(self) -> Iterable[dict[str, Any]]:
+        return self.get_all(GROUP_KIND)["items"]
+
     def get_users(self) -> Iterable[dict[str, Any]]:
         return self.get_all(USER_KIND)["items"]
 
@@ -1147,6 +1152,8 @@ class OCCli:
         err = result.stderr.decode("utf-8") if result.stderr else ""
         allow_not_found = kwargs.get("allow_not_found")
         if result.returncode != 0:
+            if "(TooManyRequests)" in err:
+                io_scheduler.report_throttled()
             if "Unable to connect to the server" in err:
                 raise StatusCodeError(f"[{self.server}]: {err}")
             if kwargs.get("apply"):
@@ -1287,6 +1294,7 @@ class OCCli:
 
 
 REQUEST_TIMEOUT = 60
+WATCH_TIMEOUT = 300
 
 
 class OCNative(OCCli):
@@ -1342,6 +1350,8 @@ class OCNative(OCCli):
 
     def cleanup(self) -> None:
         super().cleanup()
+        # job watchers stream through this client, they must not outlive it
+        stop_job_watchers(self)
         if hasattr(self, "client") and self.client is not None:
             self.client.client.close()
 
@@ -1465,6 +1475,29 @@ class OCNative(OCCli):
         except NotFoundError as e:
             raise StatusCodeError(f"[{self.server}]: {e}") from None
 
+    def watch_items(
+        self,
+        kind: str,
+        namespace: str,
+        resource_version: str | None = None,
+        timeout_seconds: int = WATCH_TIMEOUT,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Streams (event type, object) tuples for changes of a kind within a
+        namespace, e.g. ("MODIFIED", {...}). Only changes after
+        resource_version are streamed. The stream ends after timeout_seconds.
+        """
+        resource = self.get_api_resource(kind)
+        obj_client = self._get_obj_client(
+            group_version=resource.group_version, kind=resource.kind
+        )
+        for event in obj_client.watch(
+            namespace=namespace,
+            resource_version=resource_version,
+            timeout=timeout_seconds,
+        ):
+            yield event["type"], event["raw_object"]
+
 
 OCClient = OCNative | OCCli
 
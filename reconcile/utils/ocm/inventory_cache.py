@@ -0,0 +1,82 @@
+"""
+Process wide TTL cache for OCM inventory listings (clusters, addons, version
+gates).
+
+Every OCM instance lists the inventory of its org on initialization. Several
+integrations running in the same process (and OCMMaps with multiple OCM
+names pointing to the same org) would otherwise repeat the same listings
+every loop. Concurrent lookups of the same key wait for a single fetch.
+
+Cached values are handed out as copies, so callers are free to modify them.
+The cache is disabled by default, integrations opt in by setting
+OCM_INVENTORY_CACHE_TTL. Writes through the OCM class invalidate the entries
+of its org, writes through other OCM clients are only picked up after the
+ttl, so only opt in where that staleness is acceptable.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import Counter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+OCM_INVENTORY_CACHE_TTL = int(os.getenv("OCM_INVENTORY_CACHE_TTL", "0"))
+
+ocm_inventory_cache_request = Counter(
+    "qontract_reconcile_ocm_inventory_cache_requests_total",
+    "Total number of OCM inventory cache lookups",
+    ["result"],
+)
+
+
+class OCMInventoryCache:
+    def __init__(self, ttl: int) -> None:
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Returns a copy of the cached value for key. Calls fetch on a miss or
+        if the cached value is older than the ttl.
+        """
+        if self.ttl <= 0:
+            return fetch()
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                ocm_inventory_cache_request.labels("hit").inc()
+                return copy.deepcopy(entry[1])
+            ocm_inventory_cache_request.labels("miss").inc()
+            value = fetch()
+            self._entries[key] = (time.monotonic(), value)
+            return copy.deepcopy(value)
+
+    def invalidate(self, *key_prefix: Hashable) -> None:
+        """
+        Drops all entries whose key starts with key_prefix, e.g.
+        invalidate(url, org_id) after creating a cluster in an org.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if isinstance(key, tuple) and key[: len(key_prefix)] == key_prefix:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+ocm_inventory_cache = OCMInventoryCache(OCM_INVENTORY_CACHE_TTL)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import functools
+import math
 from typing import TYPE_CHECKING, Any
 
-from sretoolbox.utils import retry
+from sretoolbox.utils import retry, threaded
 
 import reconcile.utils.aws_helper as awsh
 from reconcile.gql_definitions.fragments.vault_secret import VaultSecret
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.ocm.clusters import get_node_pools
+from reconcile.utils.ocm.inventory_cache import ocm_inventory_cache
 from reconcile.utils.ocm.products import (
     OCMProduct,
     OCMProductPortfolio,
@@ -21,7 +24,7 @@ from reconcile.utils.ocm_base_client import (
 from reconcile.utils.secret_reader import SecretReader
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping, MutableMapping
+    from collections.abc import Callable, Iterable, Mapping, MutableMapping
 
     from reconcile.ocm.types import OCMSpec
 
@@ -43,6 +46,8 @@ ROUTER_DESIRED_KEYS = {"id", "listening", "dns_name", "route_selectors"}
 CLUSTER_ADDON_DESIRED_KEYS = {"id", "parameters"}
 
 REQUEST_TIMEOUT_SEC = 60
+# concurrent page fetches for large listings, e.g. the clusters of an org
+PAGE_FETCH_WORKERS = 4
 
 
 class OCM:
@@ -110,13 +115,40 @@ class OCM:
             and cluster["product"]["id"] in self.product_portfolio.product_names
         )
 
+    def _invalidate_inventory(self) -> None:
+        """Any write can change the inventory of the org."""
+        ocm_inventory_cache.invalidate(self._ocm_client.url, self.org_id)
+
+    def _inventory_cache_key(self, *parts: str) -> tuple[str, ...]:
+        return (
+            self._ocm_client.url,
+            self.org_id,
+            self._ocm_client.access_token_client_id,
+            *parts,
+        )
+
+    def _list_inventory(
+        self, api: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Lists an OCM inventory API via the process wide inventory cache.
+        The credentials are part of the cache key, because the visibility of
+        OCM resources depends on them.
+        """
+        return ocm_inventory_cache.get_or_fetch(
+            self._inventory_cache_key(api, str(sorted((params or {}).items()))),
+            lambda: self._get_json(
+                api, params=params, max_workers=PAGE_FETCH_WORKERS
+            ).get("items", []),
+        )
+
     def _init_clusters(self, init_provision_shards: bool) -> None:
         api = f"{CS_API_BASE}/v1/clusters"
         product_csv = ",".join([f"'{p}'" for p in self.product_portfolio.product_names])
         params = {
             "search": f"organization.id='{self.org_id}' and managed='true' and product.id in ({product_csv})"
         }
-        clusters = self._get_json(api, params=params).get("items", [])
+        clusters = self._list_inventory(api, params=params)
         self.cluster_ids: dict[str, str] = {c["name"]: c["id"] for c in clusters}
 
         self.clusters: dict[str, OCMSpec] = {}
@@ -151,6 +183,8 @@ class OCM:
     def create_cluster(self, name: str, cluster: OCMSpec, dry_run: bool) -> None:
         impl = self.get_product_impl(cluster.spec.product, cluster.spec.hypershift)
         impl.create_cluster(self.ocm_api, self.org_id, name, cluster, dry_run)
+        if not dry_run:
+            self._invalidate_inventory()
 
     def update_cluster(
         self, cluster_name: str, update_spec: Mapping[str, Any], dry_run: bool = False
@@ -161,6 +195,8 @@ class OCM:
         impl.update_cluster(
             self.ocm_api, cluster_id, update_spec, cluster.spec.version, dry_run
         )
+        if not dry_run:
+            self._invalidate_inventory()
 
     def get_group_if_exists(self, cluster: str, group_id: str) -> dict[str, Any] | None:
         """Returns a list of users in a group in a cluster.
@@ -582,14 +618,14 @@ class OCM:
     def _init_addons(self) -> None:
         """Returns a list of Addons"""
         api = f"{CS_API_BASE}/v1/addons"
-        self.addons = self._get_json(api).get("items", [])
+        self.addons = self._list_inventory(api)
 
     def _init_version_gates(self) -> None:
         """Returns a list of version gates"""
         if self.version_gates:
             return
         api = f"{CS_API_BASE}/v1/version_gates"
-        self.version_gates = self._get_json(api).get("items", [])
+        self.version_gates = self._list_inventory(api)
 
     def get_addon(self, id: str) -> dict[str, Any] | None:
         for addon in self.addons:
@@ -666,23 +702,56 @@ class OCM:
     def _response_is_list(rs: Mapping[str, Any]) -> bool:
         return rs["kind"].endswith("List")
 
+    @classmethod
+    def _response_is_full_page(cls, rs: Mapping[str, Any], page_size: int) -> bool:
+        return (
+            cls._response_is_list(rs)
+            and rs.get("size", len(rs.get("items", []))) == page_size
+        )
+
+    def _get_page(
+        self, page: int, api: str, params: Mapping[str, Any]
+    ) -> dict[str, Any]:
+        return self._do_get_request(api, params={**params, "page": page})
+
     def _get_json(
-        self, api: str, params: dict[str, Any] | None = None, page_size: int = 100
+        self,
+        api: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = 100,
+        max_workers: int = 1,
     ) -> dict[str, Any]:
-        responses = []
+        """
+        GETs an OCM API and collects the items of all pages of a list.
+        With max_workers > 1, the pages after the first one are fetched
+        concurrently, based on the total reported by the first page.
+        """
         if not params:
             params = {}
         params["size"] = page_size
-        while True:
-            rs = self._do_get_request(api, params=params)
-            responses.append(rs)
-            if (
-                self._response_is_list(rs)
-                and rs.get("size", len(rs.get("items", []))) == params["size"]
-            ):
-                params["page"] = rs.get("page", 1) + 1
-            else:
-                break
+        responses = [self._do_get_request(api, params=params)]
+        first = responses[0]
+        if (
+            max_workers > 1
+            and self._response_is_full_page(first, page_size)
+            and first.get("total")
+        ):
+            responses.extend(
+                threaded.run(
+                    self._get_page,
+                    range(
+                        first.get("page", 1) + 1,
+                        math.ceil(first["total"] / page_size) + 1,
+                    ),
+                    max_workers,
+                    api=api,
+                    params=params,
+                )
+            )
+        # continue page by page, e.g. if items were added in the meantime
+        while self._response_is_full_page(responses[-1], page_size):
+            params["page"] = responses[-1].get("page", len(responses)) + 1
+            responses.append(self._do_get_request(api, params=params))
 
         if self._response_is_list(responses[0]):
             items = []
@@ -705,25 +774,29 @@ class OCM:
         data: Mapping[str, Any] | None = None,
         params: Mapping[str, str] | None = None,
     ) -> Any:
-        return self._ocm_client.post(
+        result = self._ocm_client.post(
             api_path=api,
             data=data,
             params=params,
         )
+        self._invalidate_inventory()
+        return result
 
     def _patch(
         self, api: str, data: Mapping[str, Any], params: Mapping[str, str] | None = None
     ) -> None:
-        return self._ocm_client.patch(
+        self._ocm_client.patch(
             api_path=api,
             data=data,
             params=params,
         )
+        self._invalidate_inventory()
 
     def _delete(self, api: str) -> None:
-        return self._ocm_client.delete(
+        self._ocm_client.delete(
             api_path=api,
         )
+        self._invalidate_inventory()
 
 
 class OCMMap:
@@ -743,6 +816,7 @@ class OCMMap:
     :param settings: App Interface settings
     :param init_provision_shards: should initiate provision shards
     :param init_addons: should initiate addons
+    :param thread_pool_size: number of OCM instances initiated concurrently
     :type clusters: list
     :type namespaces: list
     :type integration: string
@@ -750,6 +824,7 @@ class OCMMap:
     :type init_provision_shards: bool
     :type init_addons: bool
     :type init_version_gates bool
+    :type thread_pool_size: int
     """
 
     def __init__(
@@ -763,12 +838,15 @@ class OCMMap:
         init_addons: bool = False,
         init_version_gates: bool = False,
         product_portfolio: OCMProductPortfolio | None = None,
+        thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE,
     ) -> None:
         """Initiates OCM instances for each OCM referenced in a cluster."""
         self.clusters_map: dict[str, str] = {}
         self.ocm_map: dict[str, OCM] = {}
         self.calling_integration = integration
         self.settings = settings
+        # OCM instances are collected first and initialized concurrently
+        self._pending_ocm_inits: dict[str, Callable[[], None]] = {}
 
         inputs = [i for i in [clusters, namespaces, ocms] if i]
         if len(inputs) > 1:
@@ -794,7 +872,8 @@ class OCMMap:
                 )
         elif ocms:
             for ocm in ocms:
-                self.init_ocm_client(
+                self._pending_ocm_inits[ocm["name"]] = functools.partial(
+                    self.init_ocm_client,
                     ocm,
                     init_provision_shards,
                     init_addons,
@@ -804,6 +883,13 @@ class OCMMap:
         else:
             raise KeyError("expected one of clusters, namespaces or ocm.")
 
+        threaded.run(
+            lambda init: init(),
+            self._pending_ocm_inits.values(),
+            thread_pool_size,
+        )
+        self._pending_ocm_inits.clear()
+
     def __getitem__(self, ocm_name: str) -> OCM:
         return self.ocm_map[ocm_name]
 
@@ -823,8 +909,9 @@ class OCMMap:
         # pointer from each cluster to its referenced OCM instance
         self.clusters_map[cluster_name] = ocm_name
 
-        if ocm_name not in self.ocm_map:
-            self.init_ocm_client(
+        if ocm_name not in self.ocm_map and ocm_name not in self._pending_ocm_inits:
+            self._pending_ocm_inits[ocm_name] = functools.partial(
+                self.init_ocm_client,
                 ocm_info,
                 init_provision_shards,
                 init_addons,
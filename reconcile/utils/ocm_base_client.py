@@ -60,6 +60,14 @@ class OCMBaseClient:
         self._init_access_token()
         self._init_request_headers()
 
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def access_token_client_id(self) -> str:
+        return self._access_token_client_id
+
     @retry()
     def _init_access_token(self) -> None:
         data = {
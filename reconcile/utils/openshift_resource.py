@@ -5,8 +5,11 @@ import base64
 import contextlib
 import copy
 import hashlib
+import json
 import logging
+import os
 import re
+import zlib
 from threading import Lock
 from typing import TYPE_CHECKING, Any
 
@@ -19,7 +22,7 @@ from reconcile.utils.json import json_dumps
 from reconcile.utils.metrics import GaugeMetric
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping
+    from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
 
 SECRET_MAX_KEY_LENGTH = 253
 
@@ -67,6 +70,12 @@ QONTRACT_ANNOTATION_SHA256SUM = "qontract.sha256sum"
 QONTRACT_ANNOTATION_UPDATE = "qontract.update"
 QONTRACT_ANNOTATION_CALLER_NAME = "qontract.caller_name"
 
+# keep the bodies of ResourceInventory resources compressed, see
+# OpenshiftResource.compact
+RESOURCE_INVENTORY_COMPACT = os.environ.get("RESOURCE_INVENTORY_COMPACT") == "true"
+# serializes inflating compacted bodies, so concurrent readers share one body
+_inflate_lock = Lock()
+
 QONTRACT_ANNOTATIONS = {
     QONTRACT_ANNOTATION_INTEGRATION,
     QONTRACT_ANNOTATION_INTEGRATION_VERSION,
@@ -77,6 +86,13 @@ QONTRACT_ANNOTATIONS = {
 
 
 class OpenshiftResource:
+    # memoized by canonical_json and sha256sum
+    _canonical_json: str | None
+    _sha256sum: str | None
+    # set by compact
+    _compressed_body: bytes | None
+    _head: dict[str, Any] | None
+
     def __init__(
         self,
         body: dict[str, Any],
@@ -94,6 +110,93 @@ class OpenshiftResource:
         if validate_k8s_object:
             self.verify_valid_k8s_object()
 
+    @property
+    def body(self) -> dict[str, Any]:
+        if self._compressed_body is not None:
+            self._inflate()
+        return self._body
+
+    @body.setter
+    def body(self, body: dict[str, Any]) -> None:
+        self._body = body
+        self._compressed_body = None
+        self._head = None
+        self.invalidate_cache()
+
+    @property
+    def _metadata_body(self) -> dict[str, Any]:
+        """
+        The body or, if compacted, the part of it needed to identify the
+        resource and to read its annotations.
+        """
+        head = self._head
+        return head if head is not None else self.body
+
+    @property
+    def compacted(self) -> bool:
+        return self._compressed_body is not None
+
+    def read_body(self) -> dict[str, Any]:
+        """
+        The body for read-only use. A compacted resource stays compacted,
+        the returned body is a temporary copy decompressed for the caller.
+        """
+        compressed_body = self._compressed_body
+        if compressed_body is None:
+            return self._body
+        return json.loads(zlib.decompress(compressed_body))
+
+    def compact(self) -> None:
+        """
+        Replaces the body with its zlib compressed JSON serialization to save
+        memory. Kind, apiVersion, name and annotations stay available, the
+        body is inflated again on first access. The sha256sum is memoized
+        before, the canonical JSON is dropped.
+        """
+        if self._compressed_body is not None:
+            return
+        # compared while diffing, memoize it to not inflate the body again
+        self.sha256sum()
+        body = self._body
+        metadata = body["metadata"]
+        head_metadata = {
+            k: metadata[k]
+            for k in ("name", "generateName", "annotations")
+            if k in metadata
+        }
+        head = {k: body[k] for k in ("kind", "apiVersion") if k in body}
+        head["metadata"] = copy.deepcopy(head_metadata)
+        self._head = head
+        self._compressed_body = zlib.compress(
+            json_dumps(body, compact=True).encode(), level=1
+        )
+        self._body = {}
+        self._canonical_json = None
+
+    def _inflate(self) -> None:
+        with _inflate_lock:
+            if self._compressed_body is None:
+                return
+            self._body = json.loads(zlib.decompress(self._compressed_body))
+            self._compressed_body = None
+            self._head = None
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops the memoized canonical JSON and sha256sum. Must be called after
+        modifying the body in place, see edit_body.
+        """
+        self._canonical_json = None
+        self._sha256sum = None
+
+    @contextlib.contextmanager
+    def edit_body(self) -> Generator[dict[str, Any]]:
+        """Modify the body in place, the memoized hashes are dropped after."""
+        try:
+            yield self.body
+        finally:
+            self.invalidate_cache()
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, OpenshiftResource):
             return False
@@ -213,30 +316,33 @@ class OpenshiftResource:
 
     @property
     def name(self) -> str:
+        metadata = self._metadata_body["metadata"]
         # PipelineRun name can be empty when creating
-        if self.kind == "PipelineRun" and "name" not in self.body["metadata"]:
-            return self.body["metadata"]["generateName"][:-1]
+        if self.kind == "PipelineRun" and "name" not in metadata:
+            return metadata["generateName"][:-1]
         else:
-            return self.body["metadata"]["name"]
+            return metadata["name"]
 
     @property
     def kind(self) -> str:
-        return self.body["kind"]
+        return self._metadata_body["kind"]
 
     @property
     def annotations(self) -> dict[str, str]:
-        return self.body["metadata"].get("annotations", {})
+        return self._metadata_body["metadata"].get("annotations", {})
 
     @property
     def kind_and_group(self) -> str:
-        return fully_qualified_kind(self.kind, self.body["apiVersion"])
+        return fully_qualified_kind(self.kind, self._metadata_body["apiVersion"])
 
     @property
     def caller(self) -> str | None:
         try:
             return (
                 self.caller_name
-                or self.body["metadata"]["annotations"]["qontract.caller_name"]
+                or self._metadata_body["metadata"]["annotations"][
+                    "qontract.caller_name"
+                ]
             )
         except KeyError:
             return None
@@ -309,7 +415,7 @@ class OpenshiftResource:
 
     def has_qontract_annotations(self) -> bool:
         try:
-            annotations = self.body["metadata"]["annotations"]
+            annotations = self._metadata_body["metadata"]["annotations"]
 
             assert annotations[QONTRACT_ANNOTATION_INTEGRATION] == self.integration
 
@@ -335,7 +441,7 @@ class OpenshiftResource:
 
     def has_valid_sha256sum(self) -> bool:
         try:
-            current_sha256sum = self.body["metadata"]["annotations"][
+            current_sha256sum = self._metadata_body["metadata"]["annotations"][
                 "qontract.sha256sum"
             ]
             return current_sha256sum == self.sha256sum()
@@ -351,9 +457,11 @@ class OpenshiftResource:
             openshift_resource: new OpenshiftResource object with
                 annotations.
         """
-        body = self.canonicalize(self.body) if canonicalize else self.body
-
-        sha256sum = self.calculate_sha256sum(self.serialize(body))
+        sha256sum = (
+            self.sha256sum()
+            if canonicalize
+            else self.calculate_sha256sum(self.serialize(self.body))
+        )
 
         # create new body object
         body = copy.deepcopy(self.body)
@@ -374,160 +482,41 @@ class OpenshiftResource:
         if self.caller_name:
             annotations[QONTRACT_ANNOTATION_CALLER_NAME] = self.caller_name
 
-        return OpenshiftResource(body, self.integration, self.integration_version)
+        annotated = OpenshiftResource(body, self.integration, self.integration_version)
+        if canonicalize:
+            # the qontract annotations are not part of the canonical body
+            annotated._canonical_json = self._canonical_json
+            annotated._sha256sum = sha256sum
+        return annotated
 
-    def sha256sum(self) -> str:
-        body = self.annotate().body
+    def canonical_json(self) -> str:
+        """The serialized canonical body, memoized."""
+        if self._canonical_json is None:
+            self._canonical_json = self.serialize(self.canonicalize(self.body))
+        return self._canonical_json
 
-        annotations = body["metadata"]["annotations"]
-        return annotations["qontract.sha256sum"]
+    def sha256sum(self) -> str:
+        if self._sha256sum is None:
+            self._sha256sum = self.calculate_sha256sum(self.canonical_json())
+        return self._sha256sum
 
     def to_json(self) -> str:
         return self.serialize(self.body)
 
     @staticmethod
     def canonicalize(body: dict[str, Any]) -> dict[str, Any]:
-        body = copy.deepcopy(body)
-
-        # create annotations if not present
-        body["metadata"].setdefault("annotations", {})
-        if body["metadata"]["annotations"] is None:
-            body["metadata"]["annotations"] = {}
-        annotations = body["metadata"]["annotations"]
-
-        # remove openshift specific params
-        body["metadata"].pop("creationTimestamp", None)
-        body["metadata"].pop("resourceVersion", None)
-        body["metadata"].pop("generation", None)
-        body["metadata"].pop("selfLink", None)
-        body["metadata"].pop("uid", None)
-        body["metadata"].pop("namespace", None)
-        body["metadata"].pop("managedFields", None)
-        annotations.pop("kubectl.kubernetes.io/last-applied-configuration", None)
-
-        # remove status
-        body.pop("status", None)
-
-        # remove controller managed labels
-        labels = body["metadata"].get("labels", {})
-        for label in set(labels.keys()):
-            if OpenshiftResource.is_controller_managed_label(body["kind"], label):
-                labels.pop(label)
-
-        # Default fields for specific resource types
-        # ConfigMaps and Secrets are by default Opaque
-        if body["kind"] in {"ConfigMap", "Secret"} and body.get("type") == "Opaque":
-            body.pop("type")
-
-        if body["kind"] == "Secret":
-            string_data = body.pop("stringData", None)
-            if string_data:
-                body.setdefault("data", {})
-                for k, v in string_data.items():
-                    v = base64_encode_secret_field_value(str(v))
-                    body["data"][k] = v
-
-        if body["kind"] == "Deployment":
-            annotations.pop("deployment.kubernetes.io/revision", None)
-
-        if body["kind"] == "Route":
-            if body["spec"].get("wildcardPolicy") == "None":
-                body["spec"].pop("wildcardPolicy")
-            # remove tls-acme specific params from Route
-            if "kubernetes.io/tls-acme" in annotations:
-                annotations.pop(
-                    "kubernetes.io/tls-acme-awaiting-authorization-owner", None
-                )
-                annotations.pop(
-                    "kubernetes.io/tls-acme-awaiting-authorization-at-url", None
-                )
-                if "tls" in body["spec"]:
-                    tls = body["spec"]["tls"]
-                    tls.pop("key", None)
-                    tls.pop("certificate", None)
-            subdomain = body["spec"].get("subdomain", None)
-            if not subdomain:
-                body["spec"].pop("subdomain", None)
-
-        if body["kind"] == "ServiceAccount":
-            if "imagePullSecrets" in body:
-                # remove default pull secrets added by k8s
-                if imagepullsecrets := [
-                    s
-                    for s in body.pop("imagePullSecrets")
-                    if "-dockercfg-" not in s["name"]
-                ]:
-                    body["imagePullSecrets"] = imagepullsecrets
-            if "secrets" in body:
-                body.pop("secrets")
-
-        if body["kind"] == "Role":
-            for rule in body["rules"]:
-                if "resources" in rule:
-                    rule["resources"].sort()
-
-                if "verbs" in rule:
-                    rule["verbs"].sort()
-
-                if (
-                    "attributeRestrictions" in rule
-                    and not rule["attributeRestrictions"]
-                ):
-                    rule.pop("attributeRestrictions")
-
-        if body["kind"] == "OperatorGroup":
-            annotations.pop("olm.providedAPIs", None)
-
-        if body["kind"] == "RoleBinding":
-            if "groupNames" in body:
-                body.pop("groupNames")
-            if "userNames" in body:
-                body.pop("userNames")
-            if "roleRef" in body:
-                if "namespace" in body["roleRef"]:
-                    body["roleRef"].pop("namespace")
-                if (
-                    "apiGroup" in body["roleRef"]
-                    and body["roleRef"]["apiGroup"] in body["apiVersion"]
-                ):
-                    body["roleRef"].pop("apiGroup")
-                if "kind" in body["roleRef"]:
-                    body["roleRef"].pop("kind")
-            for subject in body["subjects"]:
-                if "namespace" in subject:
-                    subject.pop("namespace")
-                if "apiGroup" in subject and (
-                    not subject["apiGroup"] or subject["apiGroup"] in body["apiVersion"]
-                ):
-                    subject.pop("apiGroup")
+        """
+        Returns the canonical form of a resource body, which is used to
+        calculate the sha256sum and to compare resources.
 
-        if body["kind"] == "ClusterRoleBinding":
-            if "userNames" in body:
-                body.pop("userNames")
-            if "roleRef" in body:
-                if (
-                    "apiGroup" in body["roleRef"]
-                    and body["roleRef"]["apiGroup"] in body["apiVersion"]
-                ):
-                    body["roleRef"].pop("apiGroup")
-                if "kind" in body["roleRef"]:
-                    body["roleRef"].pop("kind")
-            if "groupNames" in body:
-                body.pop("groupNames")
-        if body["kind"] == "Service":
-            spec = body["spec"]
-            if spec.get("sessionAffinity") == "None":
-                spec.pop("sessionAffinity")
-            if spec.get("type") == "ClusterIP":
-                spec.pop("clusterIP", None)
-
-        # remove qontract specific params
-        for a in QONTRACT_ANNOTATIONS:
-            annotations.pop(a, None)
-
-        # Remove external resources annotation used for optimistic locking
-        annotations.pop(SECRET_UPDATED_AT, None)
-        return body
+        The input body is not modified. Only the modified parts of the body
+        are copied (copy-on-write), so the result shares unmodified subtrees
+        with the input body and must not be modified in place.
+        """
+        canonical = CanonicalBody(body)
+        for rule in CANONICALIZE_RULES.get(body["kind"], COMMON_CANONICALIZE_RULES):
+            rule(canonical)
+        return canonical.body
 
     @staticmethod
     def serialize(body: dict[str, Any]) -> str:
@@ -540,6 +529,253 @@ class OpenshiftResource:
         return m.hexdigest()
 
 
+class CanonicalBody:
+    """
+    Copy-on-write wrapper around a resource body used by the canonicalization
+    rules. Containers are shallow copied the first time they are modified,
+    the input body is never modified.
+    """
+
+    __slots__ = ("_copied", "body")
+
+    def __init__(self, body: Mapping[str, Any]) -> None:
+        self.body: dict[str, Any] = dict(body)
+        self._copied: set[tuple[str, ...]] = {()}
+
+    def writable(self, *path: str) -> Any:
+        """
+        Returns the container at path, copying it and its parents on first
+        access.
+        """
+        node = self.body
+        for depth in range(1, len(path) + 1):
+            key = path[depth - 1]
+            if path[:depth] not in self._copied:
+                node[key] = copy.copy(node[key])
+                self._copied.add(path[:depth])
+            node = node[key]
+        return node
+
+    def get(self, *path: str) -> Any:
+        """Returns the (read-only) value at path or None."""
+        node: Any = self.body
+        for key in path:
+            if not isinstance(node, dict):
+                return None
+            node = node.get(key)
+        return node
+
+    def pop(self, path: tuple[str, ...], *keys: str) -> None:
+        """Removes keys from the container at path, if present."""
+        node = self.get(*path)
+        if not node or not any(k in node for k in keys):
+            return
+        node = self.writable(*path)
+        for k in keys:
+            node.pop(k, None)
+
+
+type CanonicalizeRule = Callable[[CanonicalBody], None]
+
+
+def drop_fields(path: tuple[str, ...], *keys: str) -> CanonicalizeRule:
+    def rule(body: CanonicalBody) -> None:
+        body.pop(path, *keys)
+
+    return rule
+
+
+def drop_field_if(path: tuple[str, ...], key: str, value: Any) -> CanonicalizeRule:
+    def rule(body: CanonicalBody) -> None:
+        # path must exist, e.g. Routes and Services without spec are invalid
+        node = body.body
+        for k in path:
+            node = node[k]
+        if node.get(key) == value:
+            body.writable(*path).pop(key)
+
+    return rule
+
+
+def drop_annotations(*names: str) -> CanonicalizeRule:
+    return drop_fields(("metadata", "annotations"), *names)
+
+
+def _ensure_annotations(body: CanonicalBody) -> None:
+    # create annotations if not present
+    if body.get("metadata", "annotations") is None:
+        body.writable("metadata")["annotations"] = {}
+
+
+def _drop_controller_managed_labels(body: CanonicalBody) -> None:
+    labels = body.get("metadata", "labels") or {}
+    managed = [
+        label
+        for label in labels
+        if OpenshiftResource.is_controller_managed_label(body.body["kind"], label)
+    ]
+    body.pop(("metadata", "labels"), *managed)
+
+
+def _secret_string_data(body: CanonicalBody) -> None:
+    string_data = body.body.pop("stringData", None)
+    if string_data:
+        data = body.writable("data") if "data" in body.body else {}
+        for k, v in string_data.items():
+            data[k] = base64_encode_secret_field_value(str(v))
+        body.body["data"] = data
+
+
+def _route_tls_acme(body: CanonicalBody) -> None:
+    # remove tls-acme specific params from Route
+    if "kubernetes.io/tls-acme" not in body.body["metadata"]["annotations"]:
+        return
+    body.pop(
+        ("metadata", "annotations"),
+        "kubernetes.io/tls-acme-awaiting-authorization-owner",
+        "kubernetes.io/tls-acme-awaiting-authorization-at-url",
+    )
+    body.pop(("spec", "tls"), "key", "certificate")
+
+
+def _route_subdomain(body: CanonicalBody) -> None:
+    if not body.body["spec"].get("subdomain"):
+        body.pop(("spec",), "subdomain")
+
+
+def _service_account_secrets(body: CanonicalBody) -> None:
+    if "imagePullSecrets" in body.body:
+        # remove default pull secrets added by k8s
+        if imagepullsecrets := [
+            s
+            for s in body.body.pop("imagePullSecrets")
+            if "-dockercfg-" not in s["name"]
+        ]:
+            body.body["imagePullSecrets"] = imagepullsecrets
+    body.body.pop("secrets", None)
+
+
+def _role_rules(body: CanonicalBody) -> None:
+    rules = []
+    for rule in body.body["rules"]:
+        rule = dict(rule)
+        if "resources" in rule:
+            rule["resources"] = sorted(rule["resources"])
+        if "verbs" in rule:
+            rule["verbs"] = sorted(rule["verbs"])
+        if "attributeRestrictions" in rule and not rule["attributeRestrictions"]:
+            rule.pop("attributeRestrictions")
+        rules.append(rule)
+    body.body["rules"] = rules
+
+
+def _role_ref(body: CanonicalBody) -> None:
+    role_ref = body.get("roleRef")
+    if role_ref is None:
+        return
+    if "apiGroup" in role_ref and role_ref["apiGroup"] in body.body["apiVersion"]:
+        body.pop(("roleRef",), "apiGroup")
+    body.pop(("roleRef",), "kind")
+
+
+def _role_binding_subjects(body: CanonicalBody) -> None:
+    api_version = body.body["apiVersion"]
+    subjects = []
+    for subject in body.body["subjects"]:
+        subject = dict(subject)
+        subject.pop("namespace", None)
+        if "apiGroup" in subject and (
+            not subject["apiGroup"] or subject["apiGroup"] in api_version
+        ):
+            subject.pop("apiGroup")
+        subjects.append(subject)
+    body.body["subjects"] = subjects
+
+
+def _service_cluster_ip(body: CanonicalBody) -> None:
+    if body.body["spec"].get("type") == "ClusterIP":
+        body.pop(("spec",), "clusterIP")
+
+
+COMMON_CANONICALIZE_RULES: tuple[CanonicalizeRule, ...] = (
+    _ensure_annotations,
+    # remove openshift specific params
+    drop_fields(
+        ("metadata",),
+        "creationTimestamp",
+        "resourceVersion",
+        "generation",
+        "selfLink",
+        "uid",
+        "namespace",
+        "managedFields",
+    ),
+    # remove status
+    drop_fields((), "status"),
+    # remove qontract specific params, the last applied configuration and the
+    # external resources annotation used for optimistic locking
+    drop_annotations(
+        "kubectl.kubernetes.io/last-applied-configuration",
+        *sorted(QONTRACT_ANNOTATIONS),
+        SECRET_UPDATED_AT,
+    ),
+)
+
+# ConfigMaps and Secrets are by default Opaque
+_DROP_OPAQUE_TYPE = drop_field_if((), "type", "Opaque")
+
+KIND_CANONICALIZE_RULES: dict[str, tuple[CanonicalizeRule, ...]] = {
+    "ConfigMap": (_DROP_OPAQUE_TYPE,),
+    "Secret": (_DROP_OPAQUE_TYPE, _secret_string_data),
+    "Deployment": (drop_annotations("deployment.kubernetes.io/revision"),),
+    "Route": (
+        drop_field_if(("spec",), "wildcardPolicy", "None"),
+        _route_tls_acme,
+        _route_subdomain,
+    ),
+    "ServiceAccount": (_service_account_secrets,),
+    "Role": (_role_rules,),
+    "OperatorGroup": (drop_annotations("olm.providedAPIs"),),
+    "RoleBinding": (
+        drop_fields((), "groupNames", "userNames"),
+        drop_fields(("roleRef",), "namespace"),
+        _role_ref,
+        _role_binding_subjects,
+    ),
+    "ClusterRoleBinding": (
+        drop_fields((), "userNames", "groupNames"),
+        _role_ref,
+    ),
+    "Service": (
+        drop_field_if(("spec",), "sessionAffinity", "None"),
+        _service_cluster_ip,
+    ),
+}
+
+
+def _compile_canonicalize_rules(
+    kind_rules: Mapping[str, tuple[CanonicalizeRule, ...]],
+    controller_managed_kinds: Iterable[str],
+) -> dict[str, tuple[CanonicalizeRule, ...]]:
+    """
+    The common rules followed by the rules of the kind and, for kinds with
+    controller managed labels, dropping those labels.
+    """
+    managed = set(controller_managed_kinds)
+    return {
+        kind: COMMON_CANONICALIZE_RULES
+        + kind_rules.get(kind, ())
+        + ((_drop_controller_managed_labels,) if kind in managed else ())
+        for kind in kind_rules.keys() | managed
+    }
+
+
+# per kind rules compiled into a single dispatch table
+CANONICALIZE_RULES = _compile_canonicalize_rules(
+    KIND_CANONICALIZE_RULES, CONTROLLER_MANAGED_LABELS
+)
+
+
 def fully_qualified_kind(kind: str, api_version: str) -> str:
     if "/" in api_version:
         group = api_version.split("/")[0]  # ruff: ignore[missing-maxsplit-arg]
@@ -567,7 +803,15 @@ class OpenshiftResourceInventoryGauge(OpenshiftResourceBaseMetric, GaugeMetric):
 
 
 class ResourceInventory:
-    def __init__(self) -> None:
+    """
+    The current and desired resources per cluster, namespace and resource
+    type. In compact mode the added resources are compacted (see
+    OpenshiftResource.compact), their bodies are only inflated when a diff or
+    an apply needs them.
+    """
+
+    def __init__(self, compact: bool = RESOURCE_INVENTORY_COMPACT) -> None:
+        self.compact = compact
         self._clusters: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
         self._error_registered = False
         self._error_registered_clusters: dict[str, bool] = {}
@@ -645,6 +889,8 @@ class ResourceInventory:
             desired = self._clusters[cluster][namespace][resource_type]["desired"]
             if name in desired:
                 raise ResourceKeyExistsError(name)
+            if self.compact:
+                value.compact()
             desired[name] = value
             admin_token_usage = self._clusters[cluster][namespace][resource_type][
                 "use_admin_token"
@@ -683,10 +929,23 @@ class ResourceInventory:
         name: str,
         value: OpenshiftResource,
     ) -> None:
+        if self.compact:
+            value.compact()
         with self._lock:
             current = self._clusters[cluster][namespace][resource_type]["current"]
             current[name] = value
 
+    def compact_resources(self, data: Mapping[str, Any]) -> None:
+        """
+        Compacts the resources of an inventory item again, e.g. after their
+        bodies were inflated to realize them. No-op if not in compact mode.
+        """
+        if not self.compact:
+            return
+        for state in ("current", "desired"):
+            for resource in data[state].values():
+                resource.compact()
+
     def __iter__(self) -> Iterator[tuple[str, str, str, dict[str, Any]]]:
         for cluster_name, cluster in self._clusters.items():
             for namespace_name, namespace in cluster.items():
@@ -58,7 +58,7 @@ class PromotionState:
         to lookup locally if a key exists on S3
         before querying.
         """
-        all_keys = self._state.ls()
+        all_keys = self._state.ls("promotions_v2/")
         for commit in all_keys:
             # Format: /promotions_v2/{channel}/{publisher-target-uid}/{commit-sha}
             if not commit.startswith("/promotions_v2/"):
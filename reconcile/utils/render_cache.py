@@ -0,0 +1,91 @@
+"""
+Result cache of template tests (resource-template-tester, template-validator).
+
+A template test passes if the rendered template equals its expected result.
+Passing tests are recorded under the digest of everything they are rendered
+from (template source, variables, test data and the qontract-reconcile
+version). Tests whose digest is recorded are skipped, only templates with
+changed inputs are rendered again.
+
+Lookups done while rendering (vault secrets, gql queries, urls) are not
+part of the digest, tests of templates using them are not recorded and
+always rendered. Recorded results expire after RENDER_CACHE_TTL_SECONDS.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from reconcile.utils.canonical_hash import canonical_hash
+from reconcile.utils.datetime_util import utc_now
+from reconcile.utils.desired_state_snapshot import code_version, init_snapshot_store
+
+if TYPE_CHECKING:
+    from reconcile.utils.desired_state_snapshot import SnapshotStore
+    from reconcile.utils.secret_reader import SecretReaderBase
+
+# "s3" for the app-interface state bucket or a local directory.
+# the cache is disabled if not set.
+RENDER_CACHE_LOCATION = os.environ.get("RENDER_CACHE_LOCATION")
+RENDER_CACHE_TTL_SECONDS = int(os.environ.get("RENDER_CACHE_TTL_SECONDS", "86400"))
+
+
+class RenderCache:
+    def __init__(
+        self,
+        store: SnapshotStore | None,
+        ttl_seconds: int = RENDER_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(*sources: Any) -> str:
+        return canonical_hash({"version": code_version(), "sources": sources})
+
+    def _expire_at(self, digest: str) -> float:
+        if self.store is None:
+            return 0
+        try:
+            data = self.store.get(digest)
+            return json.loads(data)["expire_at"] if data is not None else 0
+        except Exception as e:
+            logging.warning(f"could not load render cache entry {digest}: {e}")
+            return 0
+
+    def passed(self, digest: str) -> bool:
+        """Whether the test with this digest passed and did not expire yet."""
+        if utc_now().timestamp() < self._expire_at(digest):
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def record_passed(self, digest: str) -> None:
+        if self.store is None:
+            return
+        expire_at = utc_now() + timedelta(seconds=self.ttl_seconds)
+        try:
+            self.store.put(
+                digest, json.dumps({"expire_at": expire_at.timestamp()}).encode()
+            )
+        except Exception as e:
+            logging.warning(f"could not save render cache entry {digest}: {e}")
+
+
+def init_render_cache(
+    prefix: str,
+    location: str | None = RENDER_CACHE_LOCATION,
+    secret_reader: SecretReaderBase | None = None,
+) -> RenderCache:
+    return RenderCache(
+        init_snapshot_store(
+            f"render-cache/{prefix}", location=location, secret_reader=secret_reader
+        )
+    )
@@ -1,17 +1,24 @@
 import logging
-import multiprocessing
-from collections.abc import Callable, Iterable, Mapping
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
-from deepdiff import DeepHash
+import jsonpath_ng
 from jsonpath_ng.ext.parser import parse
 
 from reconcile.change_owners.diff import (
     Diff,
     DiffType,
+    _extract_identifier_from_object,
     extract_diffs,
 )
+from reconcile.utils.canonical_hash import (
+    CanonicalHasher,
+    DeepHasher,
+    HashMode,
+    new_hasher,
+)
 from reconcile.utils.jsonpath import apply_constraint_to_path
 from reconcile.utils.runtime.integration import (
     DesiredStateShardConfig,
@@ -59,9 +66,13 @@ def find_changed_shards(
     provided `DesiredStateShardConfig`.
     """
     affected_shards = set()
+    shard_path_selectors = [
+        parse(shard_path_spec)
+        for shard_path_spec in sharding_config.shard_path_selectors
+    ]
     for d in diffs:
-        for shard_path_spec in sharding_config.shard_path_selectors:
-            shard_path = apply_constraint_to_path(parse(shard_path_spec), d.path)
+        for shard_path_selector in shard_path_selectors:
+            shard_path = apply_constraint_to_path(shard_path_selector, d.path)
             if shard_path:
                 if d.diff_type in {DiffType.CHANGED, d.diff_type.REMOVED}:
                     affected_shards.update({
@@ -74,102 +85,200 @@ def find_changed_shards(
     return affected_shards
 
 
-EXTRACT_TASK_RESULT_KEY_DIFFS = "diffs"
-EXTRACT_TASK_RESULT_KEY_ERROR = "error"
-
-
-def _extract_diffs_task(
-    extraction_function: Callable[
-        [Mapping[str, Any], Mapping[str, Any]], Iterable[Diff]
-    ],
-    previous_desired_state: Mapping[str, Any],
-    current_desired_state: Mapping[str, Any],
-    return_value: dict,
-) -> None:
+class _MerkleDiff:
     """
-    A multiprocessing task that extracts diffs from two desired states
-    and stores them in a return value dictionary.
+    Compares two desired states top down by their subtree digests
+    and only descends into branches whose digests differ.
+
+    Paths are tracked per side, because list items are matched independent
+    of their position (see `_diff_lists`). A change of an item that moved
+    within a list is reported as a REMOVED diff on its previous path and an
+    ADDED diff on its current path, so that shard lookups happen on the right
+    item in both desired states.
     """
-    try:
-        diffs = extraction_function(previous_desired_state, current_desired_state)
-        return_value[EXTRACT_TASK_RESULT_KEY_DIFFS] = diffs
-    except BaseException as e:
-        return_value[EXTRACT_TASK_RESULT_KEY_ERROR] = e
 
+    def __init__(self, hasher: CanonicalHasher | DeepHasher) -> None:
+        self.hasher = hasher
+        self.diffs: list[Diff] = []
 
-class DiffDetectionTimeoutError(Exception):
-    """
-    Raised when the fine grained diff detection takes too long.
-    """
+    def diff(
+        self,
+        previous_path: jsonpath_ng.JSONPath,
+        current_path: jsonpath_ng.JSONPath,
+        previous: Any,
+        current: Any,
+    ) -> None:
+        if self.hasher.digest(previous) == self.hasher.digest(current):
+            return
+        if isinstance(previous, dict) and isinstance(current, dict):
+            self._diff_dicts(previous_path, current_path, previous, current)
+        elif isinstance(previous, list) and isinstance(current, list):
+            self._diff_lists(previous_path, current_path, previous, current)
+        elif previous_path == current_path:
+            self.diffs.append(
+                Diff(
+                    path=previous_path,
+                    diff_type=DiffType.CHANGED,
+                    old=previous,
+                    new=current,
+                )
+            )
+        else:
+            self.removed(previous_path, previous)
+            self.added(current_path, current)
 
+    def added(self, path: jsonpath_ng.JSONPath, value: Any) -> None:
+        self.diffs.append(
+            Diff(path=path, diff_type=DiffType.ADDED, old=None, new=value)
+        )
 
-class DiffDetectionFailureError(Exception):
-    """
-    Raised when the fine grained diff detection fails.
-    """
+    def removed(self, path: jsonpath_ng.JSONPath, value: Any) -> None:
+        self.diffs.append(
+            Diff(path=path, diff_type=DiffType.REMOVED, old=value, new=None)
+        )
+
+    def _diff_dicts(
+        self,
+        previous_path: jsonpath_ng.JSONPath,
+        current_path: jsonpath_ng.JSONPath,
+        previous: dict[Any, Any],
+        current: dict[Any, Any],
+    ) -> None:
+        for key, value in previous.items():
+            field = jsonpath_ng.Fields(key)
+            if key in current:
+                self.diff(
+                    previous_path.child(field),
+                    current_path.child(field),
+                    value,
+                    current[key],
+                )
+            else:
+                self.removed(previous_path.child(field), value)
+        for key, value in current.items():
+            if key not in previous:
+                self.added(current_path.child(jsonpath_ng.Fields(key)), value)
+
+    def _diff_lists(
+        self,
+        previous_path: jsonpath_ng.JSONPath,
+        current_path: jsonpath_ng.JSONPath,
+        previous: list[Any],
+        current: list[Any],
+    ) -> None:
+        """
+        Lists are compared ignoring the order of their items, like
+        `extract_diffs` does. Identical items are matched by digest, the
+        remaining items by their context identifier (see
+        `compare_object_ctx_identifier`) and the remaining objects without
+        identifier by position. Everything left over was added or removed.
+        """
+        unmatched_current: dict[bytes, list[int]] = defaultdict(list)
+        for index, item in enumerate(current):
+            unmatched_current[self.hasher.digest(item)].append(index)
+        changed_previous = []
+        for index, item in enumerate(previous):
+            if indices := unmatched_current.get(self.hasher.digest(item)):
+                indices.pop(0)
+            else:
+                changed_previous.append(index)
+        changed_current = sorted(
+            i for indices in unmatched_current.values() for i in indices
+        )
+
+        current_by_identifier: dict[str, int] = {}
+        current_objects: list[int] = []
+        for index in changed_current:
+            identifier = _extract_identifier_from_object(current[index])
+            if identifier:
+                current_by_identifier[identifier] = index
+            elif isinstance(current[index], dict):
+                current_objects.append(index)
+            else:
+                self.added(current_path.child(jsonpath_ng.Index(index)), current[index])
+
+        previous_objects: list[int] = []
+        for index in changed_previous:
+            identifier = _extract_identifier_from_object(previous[index])
+            if identifier and identifier in current_by_identifier:
+                self._diff_items(
+                    previous_path,
+                    current_path,
+                    previous,
+                    current,
+                    index,
+                    current_by_identifier.pop(identifier),
+                )
+            elif not identifier and isinstance(previous[index], dict):
+                previous_objects.append(index)
+            else:
+                self.removed(
+                    previous_path.child(jsonpath_ng.Index(index)), previous[index]
+                )
+
+        for previous_index, current_index in zip(
+            previous_objects, current_objects, strict=False
+        ):
+            self._diff_items(
+                previous_path,
+                current_path,
+                previous,
+                current,
+                previous_index,
+                current_index,
+            )
+        for index in previous_objects[len(current_objects) :]:
+            self.removed(previous_path.child(jsonpath_ng.Index(index)), previous[index])
+        for index in [
+            *current_objects[len(previous_objects) :],
+            *current_by_identifier.values(),
+        ]:
+            self.added(current_path.child(jsonpath_ng.Index(index)), current[index])
+
+    def _diff_items(
+        self,
+        previous_path: jsonpath_ng.JSONPath,
+        current_path: jsonpath_ng.JSONPath,
+        previous: list[Any],
+        current: list[Any],
+        previous_index: int,
+        current_index: int,
+    ) -> None:
+        self.diff(
+            previous_path.child(jsonpath_ng.Index(previous_index)),
+            current_path.child(jsonpath_ng.Index(current_index)),
+            previous[previous_index],
+            current[current_index],
+        )
 
 
-def extract_diffs_with_timeout(
-    extraction_function: Callable[
-        [Mapping[str, Any], Mapping[str, Any]], Iterable[Diff]
-    ],
+def extract_merkle_diffs(
     previous_desired_state: Mapping[str, Any],
     current_desired_state: Mapping[str, Any],
-    timeout_seconds: int,
+    hasher: CanonicalHasher | DeepHasher | None = None,
+    mode: HashMode | None = None,
 ) -> list[Diff]:
     """
-    Extracts diffs from two desired states using a dedicated extraction function.
-    If the timeout is reached, a `DiffDetectionTimeout` exception is raised.
-
-    The diff extraction is performed in a separate process for the sole purpose
-    to be able to enforce a timeout. This is necessary because the diff extraction
-    can take a long time for large desired states. Stoping the process is reasonable
-    for multiple reasons:
-        * the process can potentially take minutes to complete. that would deminish
-          the value derived from the detected diffs (e.g. sharded runs)
-        * the process can potentially take a lot of memory the longer it runs,
-          which would put more pressure on the system executing the process, e.g.
-          Jenkins
-        * experience has shown that the diff extraction process yields the most
-          valueable results when it is fast. if it takes too long, the results
-          yield contain too many diffs to be meaningful for followup processing
-    """
-    ctx = multiprocessing.get_context("fork")
-    m = ctx.Manager()
-    result_value = m.dict()
-
-    process = ctx.Process(
-        target=_extract_diffs_task,
-        args=(
-            extraction_function,
-            previous_desired_state,
-            current_desired_state,
-            result_value,
-        ),
-    )
-    process.start()
-    process.join(timeout_seconds)
-    if process.is_alive():
-        logging.info(
-            f"timeout {timeout_seconds}s reached to find fine grained diffs. "
-            "no shard detection or sharded runs will be performed."
-        )
-        process.terminate()
-        process.join()
-        raise DiffDetectionTimeoutError()
-
-    if EXTRACT_TASK_RESULT_KEY_DIFFS in result_value:
-        return result_value[EXTRACT_TASK_RESULT_KEY_DIFFS]
+    Extracts the diffs between two desired states in-process. Only branches
+    with differing subtree digests are visited, so the effort depends on the
+    size of the change, not on the size of the desired states. Pass the
+    `hasher` that was used to compare the desired states to reuse their
+    digests. Otherwise a hasher for `mode` is used, which defaults to
+    CANONICAL_HASH_MODE.
 
-    original_error = result_value.get(EXTRACT_TASK_RESULT_KEY_ERROR)
-    if original_error:
-        raise DiffDetectionFailureError() from original_error
-
-    # not every error situation of the diff extraction process
-    # will result in an exception. the lack of a result is an error
-    # indicator as well. in those cases, we raise at least
-    # a generic exception to indicate that something went wrong
-    raise DiffDetectionFailureError("unknown error during fine grained diff detection")
+    Like `extract_diffs`, a removed or added desired state as a whole is
+    reported as a single diff on the root path.
+    """
+    if not previous_desired_state or not current_desired_state:
+        return extract_diffs(previous_desired_state, current_desired_state)
+    merkle_diff = _MerkleDiff(hasher or new_hasher(mode))
+    merkle_diff.diff(
+        jsonpath_ng.Root(),
+        jsonpath_ng.Root(),
+        previous_desired_state,
+        current_desired_state,
+    )
+    return merkle_diff.diffs
 
 
 def build_desired_state_diff(
@@ -182,23 +291,21 @@ def build_desired_state_diff(
     If sharding config is provided, the diff will also contain the affected
     shards introduced by the change between the two desired states.
     """
-    # is there even a difference?
-    previous_hash = DeepHash(previous_desired_state)
-    current_hash = DeepHash(current_desired_state)
-    desired_state_diff_found = previous_hash.get(
-        previous_desired_state
-    ) != current_hash.get(current_desired_state)
+    # is there even a difference? the digests of all subtrees are kept
+    # in the hasher and reused by the diff extraction
+    hasher = new_hasher()
+    desired_state_diff_found = hasher.digest(previous_desired_state) != hasher.digest(
+        current_desired_state
+    )
 
     shards = set()
-    exract_diff_timeout_seconds = 10
     try:
         if desired_state_diff_found and sharding_config:
             # detect shards based on fine grained diffs
-            diffs = extract_diffs_with_timeout(
-                extraction_function=extract_diffs,
+            diffs = extract_merkle_diffs(
                 previous_desired_state=previous_desired_state,
                 current_desired_state=current_desired_state,
-                timeout_seconds=exract_diff_timeout_seconds,
+                hasher=hasher,
             )
             changed_shards = find_changed_shards(
                 diffs=diffs,
@@ -212,14 +319,10 @@ def build_desired_state_diff(
                     ShardedRunProposal(proposed_shards=changed_shards)
                 ):
                     shards = changed_shards
-    except DiffDetectionTimeoutError:
-        logging.warning(
-            f"unable to extract fine grained diffs for shard extraction "
-            f"within {exract_diff_timeout_seconds} seconds. continue without sharding"
-        )
-    except DiffDetectionFailureError as e:
+    except Exception as e:
         logging.warning(
-            f"unable to extract fine grained diffs for shard extraction: {e}"
+            f"unable to extract fine grained diffs for shard extraction: {e}. "
+            "continue without sharding"
         )
 
     return DesiredStateDiff(
@@ -22,6 +22,7 @@ from reconcile.utils.runtime.integration import (
     RunParams,
     setup_qontract_api_client,
 )
+from reconcile.utils.weighted_sharding import weighted_sharding
 
 RunParamsTypeVar = TypeVar("RunParamsTypeVar", bound=RunParams)
 
@@ -162,10 +163,12 @@ def run_integration_cfg(run_cfg: IntegrationRunConfiguration) -> None:
     if run_cfg.dry_run:
         desired_state_diff = get_desired_state_diff(run_cfg)
         run_cfg.switch_to_main_bundle()
-        _integration_dry_run(run_cfg.integration, desired_state_diff)
+        with weighted_sharding(run_cfg.integration.name, record=False):
+            _integration_dry_run(run_cfg.integration, desired_state_diff)
     else:
         run_cfg.switch_to_main_bundle()
-        _integration_wet_run(run_cfg.integration)
+        with weighted_sharding(run_cfg.integration.name, record=True):
+            _integration_wet_run(run_cfg.integration)
 
 
 async def _run_api_integration(
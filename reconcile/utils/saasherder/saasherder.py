@@ -13,6 +13,7 @@ from collections import (
 from contextlib import suppress
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Self
+from urllib.parse import urlparse
 
 import yaml
 from github import (
@@ -30,9 +31,9 @@ from sretoolbox.utils import (
 
 from reconcile.github_org import get_default_config
 from reconcile.status import RunningState
-from reconcile.utils import helm
+from reconcile.utils import helm, io_scheduler
 from reconcile.utils.datetime_util import utc_now
-from reconcile.utils.github_api import GithubRepositoryApi
+from reconcile.utils.github_api import GithubRepositoryApi, UnsupportedDirectoryError
 from reconcile.utils.json import json_dumps
 from reconcile.utils.oc import (
     OCLocal,
@@ -85,12 +86,15 @@ if TYPE_CHECKING:
     from collections.abc import (
         Generator,
         Iterable,
+        Iterator,
         Mapping,
         MutableMapping,
         Sequence,
     )
     from types import TracebackType
 
+    from github.Repository import Repository
+
     from reconcile.utils.gitlab_api import GitLabApi
     from reconcile.utils.jenkins_api import JenkinsApi, JobBuildState
     from reconcile.utils.jjb_client import JJB
@@ -101,6 +105,8 @@ TARGET_CONFIG_HASH = "target_config_hash"
 TEMPLATE_API_VERSION = "template.openshift.io/v1"
 UNIQUE_SAAS_FILE_ENV_COMBO_LEN = 56
 REQUEST_TIMEOUT = 60
+# libyaml's loader parses several times faster than the pure python one
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def is_commit_sha(ref: str) -> bool:
@@ -780,48 +786,62 @@ class SaasHerder:
             case _:
                 raise Exception(f"Only GitHub and GitLab are supported: {url}")
 
-        return yaml.safe_load(content), commit_sha
+        return yaml.load(content, Loader=YAML_SAFE_LOADER), commit_sha
 
     @retry()
     def _get_directory_contents(
         self, url: str, path: str, ref: str, github: Github
-    ) -> tuple[list[Any], str]:
+    ) -> tuple[Iterator[Any], str]:
+        """
+        Returns the resources of all files in path and the commit sha.
+
+        The files are listed right away, but fetched and parsed lazily while
+        iterating the resources, so the raw files are never held in memory
+        all at once.
+        """
         commit_sha = self._get_commit_sha(url, ref, github)
-        resources: list[Any] = []
         repo_info = VCS.parse_repo_url(url)
+        files: Iterable[bytes]
         match repo_info.platform:
             case "github":
                 repo = github.get_repo(repo_info.name)
                 directory = repo.get_contents(path, commit_sha)
                 if isinstance(directory, ContentFile):
                     raise TypeError(f"Path {path} and sha {commit_sha} is a file!")
-                for f in directory:
-                    file_path = os.path.join(path, f.name)
-                    raw_file = GithubRepositoryApi.get_raw_file(
-                        repo=repo,
-                        path=file_path,
-                        ref=commit_sha,
+                if dirs := [f.path for f in directory if f.type != "file"]:
+                    raise UnsupportedDirectoryError(
+                        f"Path {path} of ref {commit_sha} contains directories: {dirs}"
                     )
-                    result_resources = yaml.safe_load_all(raw_file)
-                    resources.extend(result_resources)
+                # the listing contains the blob shas, fetch the blobs directly
+                files = (self._get_github_blob(repo, f.sha) for f in directory)
             case "gitlab":
                 if not self.gitlab:
                     raise Exception("gitlab is not initialized")
                 if not (project := self.gitlab.get_project(url)):
                     raise Exception(f"Could not find gitlab project for {url}")
-                dir_contents = self.gitlab.get_directory_contents(
-                    project,
-                    ref=commit_sha,
-                    path=path,
+                files = (
+                    content
+                    for _, content in self.gitlab.iter_directory_contents(
+                        project,
+                        ref=commit_sha,
+                        path=path,
+                    )
                 )
-                for content in dir_contents.values():
-                    result_resources = yaml.safe_load_all(content)
-                    resources.extend(result_resources)
             case _:
                 raise Exception(f"Only GitHub and GitLab are supported: {url}")
 
+        resources = (
+            resource
+            for content in files
+            for resource in yaml.load_all(content, Loader=YAML_SAFE_LOADER)
+        )
         return resources, commit_sha
 
+    @staticmethod
+    @retry()
+    def _get_github_blob(repo: Repository, sha: str) -> bytes:
+        return base64.b64decode(repo.get_git_blob(sha).content)
+
     @retry()
     def _get_commit_sha(self, url: str, ref: str, github: Github) -> str:
         repo_info = VCS.parse_repo_url(url)
@@ -1187,6 +1207,8 @@ class SaasHerder:
                     f"{error_prefix} Image : {full_image_path} does not exist"
                 )
         except Exception as e:
+            if io_scheduler.is_throttled(e):
+                io_scheduler.report_throttled()
             logging.error(
                 f"{error_prefix} Image is invalid: {full_image_path}. "
                 + f"details: {e!s}"
@@ -1278,10 +1300,11 @@ class SaasHerder:
             return True  # violations found
 
         # imagePatterns validation
-        images = threaded.run(
+        images = io_scheduler.run(
             self._get_image,
             images_set,
             self.available_thread_pool_size,
+            endpoint=lambda image: f"registry:{image.split('/', 1)[0]}",
             image_patterns=spec.image_patterns,
             image_auth=spec.image_auth,
             error_prefix=spec.error_prefix,
@@ -1348,10 +1371,11 @@ class SaasHerder:
         desired_state_specs: list[TargetSpec] = list(
             itertools.chain.from_iterable(results)
         )
-        promotions = threaded.run(
+        promotions = io_scheduler.run(
             self.populate_desired_state_saas_file,
             desired_state_specs,
             self.thread_pool_size,
+            endpoint=lambda spec: f"vcs:{urlparse(spec.url).netloc}",
             ri=ri,
         )
         self.promotions: list[Promotion | None] = promotions
@@ -1406,24 +1430,8 @@ class SaasHerder:
 
         return specs
 
-    def populate_desired_state_saas_file(
-        self, spec: TargetSpec, ri: ResourceInventory
-    ) -> Promotion | None:
-        if spec.delete:
-            # to delete resources, we avoid adding them to the desired state
-            return None
-
-        html_url = spec.html_url
-        try:
-            resources, promotion = self._process_template(spec)
-        except Exception as e:
-            # error log message send in _process_template. We cannot just
-            # register an error without logging as inventory errors don't have details.
-            logging.error(f"Error in populate_desired_state_saas_file: {e}")
-            ri.register_error()
-            return None
-
-        # filter resources
+    @staticmethod
+    def _filter_resources(spec: TargetSpec, resources: Iterable[Any]) -> Resources:
         rs: Resources = []
         for r in resources:
             if isinstance(r, dict) and "kind" in r and "apiVersion" in r:
@@ -1444,6 +1452,29 @@ class SaasHerder:
                     "Skipping non-dictionary resource on "
                     f"{spec.cluster}/{spec.namespace}"
                 )
+        return rs
+
+    def populate_desired_state_saas_file(
+        self, spec: TargetSpec, ri: ResourceInventory
+    ) -> Promotion | None:
+        if spec.delete:
+            # to delete resources, we avoid adding them to the desired state
+            return None
+
+        html_url = spec.html_url
+        try:
+            resources, promotion = self._process_template(spec)
+            # directory resources are fetched and parsed while filtering
+            rs = self._filter_resources(spec, resources)
+        except Exception as e:
+            if io_scheduler.is_throttled(e):
+                io_scheduler.report_throttled()
+            # error log message send in _process_template. We cannot just
+            # register an error without logging as inventory errors don't have details.
+            logging.error(f"Error in populate_desired_state_saas_file: {e}")
+            ri.register_error()
+            return None
+
         # additional processing of resources
         resources = rs
         self._additional_resource_process(resources, html_url)
@@ -2249,78 +2280,80 @@ class SaasHerder:
             raise Exception("state is not initialized")
 
         now = utc_now()
-        for promotion in self.promotions:
-            if promotion is None:
-                continue
-
-            if promotion.publish:
-                all_subscribed_saas_file_paths = set()
-                all_subscribed_target_paths = set()
-                for channel in promotion.publish:
-                    # make sure we keep some attributes on re-deployments of same ref
-                    has_succeeded_once = success
-                    # pre_check_sha_exists=False: _commits_by_channel is never
-                    # populated in the saasherder flow (only SAPM calls
-                    # cache_commit_shas_from_s3), so the default True would
-                    # always short-circuit to None and lose the old check_in.
-                    current_state = self._promotion_state.get_promotion_data(
-                        sha=promotion.commit_sha,
-                        channel=channel,
-                        target_uid=promotion.saas_target_uid,
-                        use_cache=True,
-                        pre_check_sha_exists=False,
-                    )
-                    if current_state and current_state.has_succeeded_once:
-                        has_succeeded_once = True
-
-                    check_in = str(now)
-                    if (
-                        success
-                        and current_state
-                        and current_state.check_in
-                        and current_state.success
-                    ):
-                        # We want to avoid an override of the timestamp.
-                        # This can happen on re-deployments of the same ref.
-                        # We only re-use the check_in time if the previous
-                        # and current deployment was successful.
-                        # On unsuccessful deployments, we
-                        # update the check_in time to current time.
-                        check_in = current_state.check_in
-
-                    # publish to state to pass promotion gate
-                    self._promotion_state.publish_promotion_data(
-                        sha=promotion.commit_sha,
-                        channel=channel,
-                        target_uid=promotion.saas_target_uid,
-                        data=PromotionData(
-                            saas_file=promotion.saas_file,
-                            success=success,
-                            target_config_hash=promotion.target_config_hash,
-                            has_succeeded_once=has_succeeded_once,
-                            check_in=check_in,
-                        ),
-                    )
-                    logging.info(
-                        f"Commit {promotion.commit_sha} was published "
-                        + f"with success {success} to channel {channel}"
-                    )
-                    # collect data to trigger promotion
-                    subscribed_saas_file_paths = subscribe_saas_file_path_map.get(
-                        channel
-                    )
+        # the promotion data of all channels is written at once at the end
+        with self.state.write_behind(self.thread_pool_size):
+            for promotion in self.promotions:
+                if promotion is None:
+                    continue
 
-                    if subscribed_saas_file_paths:
-                        all_subscribed_saas_file_paths.update(
-                            subscribed_saas_file_paths
+                if promotion.publish:
+                    all_subscribed_saas_file_paths = set()
+                    all_subscribed_target_paths = set()
+                    for channel in promotion.publish:
+                        # make sure we keep some attributes on re-deployments of same ref
+                        has_succeeded_once = success
+                        # pre_check_sha_exists=False: _commits_by_channel is never
+                        # populated in the saasherder flow (only SAPM calls
+                        # cache_commit_shas_from_s3), so the default True would
+                        # always short-circuit to None and lose the old check_in.
+                        current_state = self._promotion_state.get_promotion_data(
+                            sha=promotion.commit_sha,
+                            channel=channel,
+                            target_uid=promotion.saas_target_uid,
+                            use_cache=True,
+                            pre_check_sha_exists=False,
+                        )
+                        if current_state and current_state.has_succeeded_once:
+                            has_succeeded_once = True
+
+                        check_in = str(now)
+                        if (
+                            success
+                            and current_state
+                            and current_state.check_in
+                            and current_state.success
+                        ):
+                            # We want to avoid an override of the timestamp.
+                            # This can happen on re-deployments of the same ref.
+                            # We only re-use the check_in time if the previous
+                            # and current deployment was successful.
+                            # On unsuccessful deployments, we
+                            # update the check_in time to current time.
+                            check_in = current_state.check_in
+
+                        # publish to state to pass promotion gate
+                        self._promotion_state.publish_promotion_data(
+                            sha=promotion.commit_sha,
+                            channel=channel,
+                            target_uid=promotion.saas_target_uid,
+                            data=PromotionData(
+                                saas_file=promotion.saas_file,
+                                success=success,
+                                target_config_hash=promotion.target_config_hash,
+                                has_succeeded_once=has_succeeded_once,
+                                check_in=check_in,
+                            ),
                         )
+                        logging.info(
+                            f"Commit {promotion.commit_sha} was published "
+                            + f"with success {success} to channel {channel}"
+                        )
+                        # collect data to trigger promotion
+                        subscribed_saas_file_paths = subscribe_saas_file_path_map.get(
+                            channel
+                        )
+
+                        if subscribed_saas_file_paths:
+                            all_subscribed_saas_file_paths.update(
+                                subscribed_saas_file_paths
+                            )
 
-                    subscribed_target_paths = subscribe_target_path_map.get(channel)
-                    if subscribed_target_paths:
-                        all_subscribed_target_paths.update(subscribed_target_paths)
+                        subscribed_target_paths = subscribe_target_path_map.get(channel)
+                        if subscribed_target_paths:
+                            all_subscribed_target_paths.update(subscribed_target_paths)
 
-                promotion.saas_file_paths = list(all_subscribed_saas_file_paths)
-                promotion.target_paths = list(all_subscribed_target_paths)
+                    promotion.saas_file_paths = list(all_subscribed_saas_file_paths)
+                    promotion.target_paths = list(all_subscribed_target_paths)
 
     @staticmethod
     def _get_subscribe_path_map(
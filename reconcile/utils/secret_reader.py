@@ -245,18 +245,25 @@ class SecretReader(SecretReaderBase):
     Consider using create_secret_reader() instead.
     """
 
-    def __init__(self, settings: Mapping | None = None) -> None:
+    def __init__(
+        self, settings: Mapping | None = None, thread_pool_size: int | None = None
+    ) -> None:
         """
         :param settings: app-interface-settings object. It is a dictionary
         containing `value: true` if Vault is to be used as the secret backend.
+        :param thread_pool_size: number of threads reading concurrently, the
+        vault connection pool is sized for it.
         """
         self.settings = settings
+        self.thread_pool_size = thread_pool_size
         self._vault_client: VaultClient | None = None
 
     @property
     def vault_client(self) -> VaultClient:
         if self._vault_client is None:
-            self._vault_client = VaultClient.get_instance()
+            self._vault_client = VaultClient.get_instance(
+                thread_pool_size=self.thread_pool_size
+            )
         return self._vault_client
 
     def _read(
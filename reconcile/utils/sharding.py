@@ -1,23 +1,51 @@
+from __future__ import annotations
+
 import hashlib
 import logging
 import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 LOG = logging.getLogger(__name__)
 
 SHARDS = int(os.environ.get("SHARDS", "1"))
 SHARD_ID = int(os.environ.get("SHARD_ID", "0"))
 
+# key -> shard_id assignment computed by the weighted sharding strategy.
+# keys not present in the assignment fall back to md5 based sharding.
+_WEIGHTED_ASSIGNMENT: dict[str, int] = {}
 
-def is_in_shard(value: str) -> bool:
-    if SHARDS == 1:
-        return True
 
+def shard_for_key(value: str, shards: int) -> int:
     h = hashlib.new("md5", usedforsecurity=False)
     h.update(value.encode())
     value_hex = h.hexdigest()
     value_int = int(value_hex, base=16)
+    return value_int % shards
 
-    in_shard = value_int % SHARDS == SHARD_ID
+
+def set_weighted_assignment(assignment: Mapping[str, int]) -> None:
+    """
+    Activate a weighted shard assignment for is_in_shard.
+
+    Every shard of an integration must activate the same assignment, otherwise
+    keys can end up in none or multiple shards.
+    """
+    _WEIGHTED_ASSIGNMENT.clear()
+    _WEIGHTED_ASSIGNMENT.update(assignment)
+
+
+def is_in_shard(value: str) -> bool:
+    if SHARDS == 1:
+        return True
+
+    shard = _WEIGHTED_ASSIGNMENT.get(value)
+    if shard is None:
+        shard = shard_for_key(value, SHARDS)
+
+    in_shard = shard == SHARD_ID
 
     if in_shard:
         LOG.debug("IN_SHARD TRUE: %s", value)
@@ -25,3 +53,58 @@ def is_in_shard(value: str) -> bool:
         LOG.debug("IN_SHARD FALSE: %s", value)
 
     return in_shard
+
+
+def balance_shards(
+    weights: Mapping[str, float],
+    shards: int,
+    previous: Mapping[str, int] | None = None,
+    tolerance: float = 0.1,
+) -> dict[str, int]:
+    """
+    Calculate a balanced key -> shard assignment based on per key weights
+    (e.g. reconcile durations).
+
+    Keys are placed heaviest first (longest processing time first). A key stays
+    on its home shard (the previous assignment or its md5 shard) as long as the
+    home shard does not exceed the average shard load by more than `tolerance`.
+    Only keys that don't fit are moved to the least loaded shard. This keeps the
+    assignment stable when weights change slightly.
+    """
+    if shards < 1:
+        raise ValueError("shards must be a positive integer")
+    previous = previous or {}
+    capacity = sum(weights.values()) / shards * (1 + tolerance)
+    loads = [0.0] * shards
+    assignment: dict[str, int] = {}
+    for key in sorted(weights, key=lambda k: (-weights[k], k)):
+        weight = weights[key]
+        home = previous.get(key)
+        if home is None or home >= shards:
+            home = shard_for_key(key, shards)
+        if loads[home] + weight <= capacity:
+            shard = home
+        else:
+            shard = min(range(shards), key=lambda s: (loads[s], s != home, s))
+        assignment[key] = shard
+        loads[shard] += weight
+    return assignment
+
+
+def shard_loads(
+    weights: Mapping[str, float],
+    shards: int,
+    assignment: Mapping[str, int] | None = None,
+) -> list[float]:
+    """
+    Expected load per shard for the given assignment. Keys without an
+    assignment are counted on their md5 shard.
+    """
+    assignment = assignment or {}
+    loads = [0.0] * shards
+    for key, weight in weights.items():
+        shard = assignment.get(key)
+        if shard is None or shard >= shards:
+            shard = shard_for_key(key, shards)
+        loads[shard] += weight
+    return loads
@@ -4,7 +4,9 @@ import contextlib
 import json
 import logging
 import os
+import threading
 from abc import abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import (
     TYPE_CHECKING,
@@ -15,6 +17,7 @@ from typing import (
 import boto3
 from botocore.errorfactory import ClientError
 from pydantic import BaseModel
+from sretoolbox.utils import threaded
 
 from reconcile.gql_definitions.common.app_interface_state_settings import (
     AppInterfaceStateConfigurationS3V1,
@@ -28,6 +31,7 @@ from reconcile.typed_queries.app_interface_vault_settings import (
 )
 from reconcile.typed_queries.get_state_aws_account import get_state_aws_account
 from reconcile.utils.aws_api import aws_config_file_path
+from reconcile.utils.constants import DEFAULT_THREAD_POOL_SIZE
 from reconcile.utils.json import json_dumps
 from reconcile.utils.secret_reader import (
     SecretReaderBase,
@@ -35,7 +39,7 @@ from reconcile.utils.secret_reader import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Mapping
+    from collections.abc import Callable, Generator, Iterable, Mapping
 
     from mypy_boto3_s3 import S3Client
 
@@ -219,6 +223,55 @@ def acquire_state_settings(
     )
 
 
+# marks a key that does not exist or has no valid JSON value
+_MISSING = object()
+
+# upper bound of the raw object bodies cached by a State instance
+STATE_OBJECT_CACHE_MAX_BYTES = int(
+    os.environ.get("STATE_OBJECT_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+
+@dataclass(frozen=True)
+class _CachedObject:
+    etag: str
+    body: bytes
+    metadata: dict[str, str]
+
+
+class _ObjectCache:
+    """
+    LRU of raw state objects, bounded by the total size of their bodies.
+    Not thread safe, guarded by the lock of its State.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._objects: OrderedDict[str, _CachedObject] = OrderedDict()
+
+    def get(self, key: str) -> _CachedObject | None:
+        obj = self._objects.get(key)
+        if obj is not None:
+            self._objects.move_to_end(key)
+        return obj
+
+    def put(self, key: str, obj: _CachedObject) -> None:
+        self.pop(key)
+        if len(obj.body) > self.max_bytes:
+            return
+        self._objects[key] = obj
+        self.size += len(obj.body)
+        while self.size > self.max_bytes:
+            _, evicted = self._objects.popitem(last=False)
+            self.size -= len(evicted.body)
+
+    def pop(self, key: str) -> None:
+        obj = self._objects.pop(key, None)
+        if obj is not None:
+            self.size -= len(obj.body)
+
+
 class AbortStateTransactionError(Exception):
     """Raise to abort a state transaction."""
 
@@ -245,6 +298,13 @@ class State:
         self.state_path = f"state/{integration}" if integration else "state"
         self.bucket = bucket
         self.client = client
+        # raw objects by key as last read or written. unchanged objects are
+        # served from here without downloading them again. only repeated
+        # reads through this State instance benefit, it is not shared.
+        self._object_cache = _ObjectCache(STATE_OBJECT_CACHE_MAX_BYTES)
+        self._object_cache_lock = threading.Lock()
+        # buffered writes of a write_behind session, None outside a session
+        self._pending_writes: dict[str, tuple[bytes, dict[str, str]]] | None = None
 
         # check if the bucket exists
         try:
@@ -291,6 +351,9 @@ class State:
         :raises StateInaccessibleException: if the bucket is missing or
         permissions are insufficient or a general AWS error occurred
         """
+        pending = self._pending_write(key)
+        if pending is not None:
+            return True, pending[1]
         key_path = f"{self.state_path}/{key}"
         try:
             response = self.client.head_object(Bucket=self.bucket, Key=key_path)
@@ -305,29 +368,37 @@ class State:
                 f"in bucket {self.bucket} - {details!s}"
             ) from None
 
-    def ls(self) -> list[str]:
-        """
-        Returns a list of keys in the state
-        """
-        objects = self.client.list_objects_v2(
-            Bucket=self.bucket, Prefix=f"{self.state_path}/"
-        )
+    def _list_objects(self, prefix: str) -> list[dict[str, Any]]:
+        objects = self.client.list_objects_v2(Bucket=self.bucket, Prefix=prefix)
 
         if "Contents" not in objects:
             return []
 
-        contents = objects["Contents"]
+        contents: list[dict[str, Any]] = list(objects["Contents"])
 
         while objects["IsTruncated"]:
             objects = self.client.list_objects_v2(
                 Bucket=self.bucket,
-                Prefix=f"{self.state_path}/",
+                Prefix=prefix,
                 ContinuationToken=objects["NextContinuationToken"],
             )
 
             contents += objects["Contents"]
 
-        return [c["Key"].replace(self.state_path, "") for c in contents]
+        return contents
+
+    def ls(self, prefix: str = "") -> list[str]:
+        """
+        Returns a list of keys in the state
+
+        :param prefix: (optional) only list keys starting with this prefix,
+        e.g. "promotions_v2/some-channel". The prefix is passed to S3, so
+        only the matching keys are listed.
+        """
+        return [
+            c["Key"].replace(self.state_path, "")
+            for c in self._list_objects(f"{self.state_path}/{prefix}")
+        ]
 
     def add(
         self,
@@ -353,12 +424,69 @@ class State:
     def _set(
         self, key: str, value: Any, metadata: Mapping[str, str] | None = None
     ) -> None:
-        self.client.put_object(
+        body = json_dumps(value).encode()
+        with self._object_cache_lock:
+            if self._pending_writes is not None:
+                cached = self._object_cache.get(key)
+                if cached and (cached.body, cached.metadata) == (body, metadata or {}):
+                    # the object in the bucket has this content already
+                    self._pending_writes.pop(key, None)
+                else:
+                    self._pending_writes[key] = (body, dict(metadata or {}))
+                return
+        self._put(key, body, dict(metadata or {}))
+
+    def _put(self, key: str, body: bytes, metadata: dict[str, str]) -> None:
+        response = self.client.put_object(
             Bucket=self.bucket,
             Key=f"{self.state_path}/{key}",
-            Body=json_dumps(value),
-            Metadata=metadata or {},
+            Body=body,
+            Metadata=metadata,
         )
+        self._cache_object(key, response.get("ETag"), body, metadata)
+
+    def _pending_write(self, key: str) -> tuple[bytes, dict[str, str]] | None:
+        with self._object_cache_lock:
+            if self._pending_writes is None:
+                return None
+            return self._pending_writes.get(key)
+
+    @contextlib.contextmanager
+    def write_behind(
+        self, thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE
+    ) -> Generator[None]:
+        """
+        Buffers all writes to the state and flushes them concurrently when
+        the context exits - also if it exits with an exception, so the
+        writes of completed transactions are not lost. Writes with the
+        content and metadata the object was last read with are skipped.
+
+        Reads of buffered keys return the buffered value, but buffered keys
+        are not part of `ls` and `get_all` before they are flushed. Nested
+        sessions are flushed by the outermost one.
+
+        Buffered writes are lost if the process dies within the session, only
+        use it for writes that are safe to repeat in the next run.
+        """
+        with self._object_cache_lock:
+            if self._pending_writes is not None:
+                nested = True
+            else:
+                nested = False
+                self._pending_writes = {}
+        if nested:
+            yield
+            return
+        try:
+            yield
+        finally:
+            with self._object_cache_lock:
+                pending, self._pending_writes = self._pending_writes or {}, None
+            threaded.run(
+                lambda write: self._put(write[0], *write[1]),
+                list(pending.items()),
+                thread_pool_size,
+            )
 
     def rm(self, key: str) -> None:
         """
@@ -368,9 +496,16 @@ class State:
 
         :type key: string
         """
-        if not self.exists(key):
+        with self._object_cache_lock:
+            pending = (
+                self._pending_writes.pop(key, None)
+                if self._pending_writes is not None
+                else None
+            )
+        if pending is None and not self.exists(key):
             raise KeyError(f"[state] key {key} does not exists in {self.state_path}")
         self.client.delete_object(Bucket=self.bucket, Key=f"{self.state_path}/{key}")
+        self._cache_object(key, None, None)
 
     def get(self, key: str, *args: Any) -> Any:
         """
@@ -390,28 +525,101 @@ class State:
                 return args[0]
             raise
 
-    def get_all(self, path: str) -> dict[str, Any]:
+    def get_all(
+        self, path: str, thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE
+    ) -> dict[str, Any]:
         """
         Gets all keys and values from the state in the specified path.
+
+        Only the keys below path are listed and the values are fetched
+        concurrently. Values that did not change since they were last
+        read by this State object are not downloaded again.
         """
+        etags = {
+            c["Key"].replace(self.state_path, ""): c.get("ETag")
+            for c in self._list_objects(f"{self.state_path}/{path}")
+        }
+        keys = [k for k in etags if k.startswith(f"/{path}")]
+        values = threaded.run(
+            lambda k: self._get_value(k.lstrip("/"), etag=etags[k]),
+            keys,
+            thread_pool_size,
+        )
         return {
-            k.replace(f"{path}/", "").strip("/"): self.get(k.lstrip("/"))
-            for k in self.ls()
-            if k.startswith(f"/{path}")
+            k.replace(f"{path}/", "").strip("/"): value
+            for k, value in zip(keys, values, strict=True)
+            if value is not _MISSING
         }
 
-    def __getitem__(self, item: str) -> Any:
+    def get_many(
+        self, keys: Iterable[str], thread_pool_size: int = DEFAULT_THREAD_POOL_SIZE
+    ) -> dict[str, Any]:
+        """
+        Gets the values of multiple keys concurrently. Keys that do not
+        exist in the state are missing in the result.
+        """
+        keys = list(keys)
+        values = threaded.run(self._get_value, keys, thread_pool_size)
+        return {
+            k: value
+            for k, value in zip(keys, values, strict=True)
+            if value is not _MISSING
+        }
+
+    def _cache_object(
+        self,
+        key: str,
+        etag: str | None,
+        body: bytes | None,
+        metadata: dict[str, str] | None = None,
+    ) -> None:
+        with self._object_cache_lock:
+            if etag is None or body is None:
+                self._object_cache.pop(key)
+            else:
+                self._object_cache.put(key, _CachedObject(etag, body, metadata or {}))
+
+    def _get_value(self, key: str, etag: str | None = None) -> Any:
+        """
+        Returns the value of a key or _MISSING. The cached object is used
+        if its ETag matches the listed etag, otherwise the object is fetched
+        with a conditional GET.
+        """
+        pending = self._pending_write(key)
+        if pending is not None:
+            return json.loads(pending[0])
+        with self._object_cache_lock:
+            cached = self._object_cache.get(key)
+        if cached is not None and etag is not None and cached.etag == etag:
+            return json.loads(cached.body)
+        kwargs: dict[str, Any] = {}
+        if cached is not None:
+            kwargs["IfNoneMatch"] = cached.etag
         try:
             response = self.client.get_object(
-                Bucket=self.bucket, Key=f"{self.state_path}/{item}"
+                Bucket=self.bucket, Key=f"{self.state_path}/{key}", **kwargs
             )
-            return json.loads(response["Body"].read())
         except ClientError as details:
-            if details.response["Error"]["Code"] == "NoSuchKey":
-                raise KeyError(item) from None
+            error_code = details.response["Error"]["Code"]
+            if error_code == "304" and cached is not None:
+                return json.loads(cached.body)
+            if error_code == "NoSuchKey":
+                self._cache_object(key, None, None)
+                return _MISSING
             raise
+        body = response["Body"].read()
+        try:
+            value = json.loads(body)
         except json.decoder.JSONDecodeError:
-            raise KeyError(item) from None
+            return _MISSING
+        self._cache_object(key, response.get("ETag"), body, response.get("Metadata"))
+        return value
+
+    def __getitem__(self, item: str) -> Any:
+        value = self._get_value(item)
+        if value is _MISSING:
+            raise KeyError(item)
+        return value
 
     def __setitem__(self, key: str, value: Any) -> None:
         self._set(key, value)
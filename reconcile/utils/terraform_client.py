@@ -5,6 +5,7 @@ import logging
 import re
 import shutil
 import tempfile
+import time
 from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -34,6 +35,7 @@ from reconcile.typed_queries.app_interface_custom_messages import (
 )
 from reconcile.utils.aws_helper import get_region_from_availability_zone
 from reconcile.utils.datetime_util import ensure_utc, utc_now
+from reconcile.utils.metrics import terraform_output_phase_duration
 
 if TYPE_CHECKING:
     from collections.abc import (
@@ -120,10 +122,25 @@ class TerraformClient:
             self.init_existing_users()
 
     def init_existing_users(self) -> None:
-        self.users = {
-            account: list(self.format_output(output, self.OUTPUT_TYPE_PASSWORDS).keys())
-            for account, output in self.outputs.items()
-        }
+        accounts = list(self.outputs)
+        users = threaded.run(
+            lambda account: list(
+                self.format_output(self.outputs[account], self.OUTPUT_TYPE_PASSWORDS)
+            ),
+            accounts,
+            self.thread_pool_size,
+        )
+        self.users = dict(zip(accounts, users, strict=True))
+
+    @contextmanager
+    def _timed_phase(self, phase: str) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            terraform_output_phase_duration.labels(
+                integration=self.integration, phase=phase
+            ).observe(time.monotonic() - start)
 
     def increment_apply_count(self) -> None:
         self.apply_count += 1
@@ -464,11 +481,15 @@ class TerraformClient:
         return error
 
     def get_terraform_output_secrets(self) -> dict[str, dict[str, dict[str, str]]]:
-        data = {}
-        for account, output in self.outputs.items():
-            data[account] = self.format_output(output, self.OUTPUT_TYPE_SECRETS)
-
-        return data
+        accounts = list(self.outputs)
+        data = threaded.run(
+            lambda account: self.format_output(
+                self.outputs[account], self.OUTPUT_TYPE_SECRETS
+            ),
+            accounts,
+            self.thread_pool_size,
+        )
+        return dict(zip(accounts, data, strict=True))
 
     @staticmethod
     def get_replicas_info(
@@ -535,18 +556,13 @@ class TerraformClient:
             ):
                 continue
 
-            k_split = k.split("__")
-            resource_name = k_split[0]
-            field_key = k_split[1]
+            resource_name, field_key = k.split("__", 2)[:2]
             if field_key.startswith("db"):
                 # since we can't use '.' in output keys
                 # and we want to maintain compatability
                 # replace '_' with '.' when this is a db secret
                 field_key = field_key.replace("db_", "db.")
-            field_value = v["value"]
-            if resource_name not in data:
-                data[resource_name] = {}
-            data[resource_name][field_key] = field_value
+            data.setdefault(resource_name, {})[field_key] = v["value"]
 
         if len(data) == 1 and type in {
             self.OUTPUT_TYPE_PASSWORDS,
@@ -565,20 +581,41 @@ class TerraformClient:
         if the `init_rds_replica_source` a replica RDS gets its DB user and password fields
         populated by looking at the replica source DB.
         """
-        self.init_outputs()  # get updated output
-        terraform_output_secrets = self.get_terraform_output_secrets()
+        with self._timed_phase("output"):
+            self.init_outputs()  # get updated output
         if init_rds_replica_source:
             replicas_info = self.get_replicas_info(resource_specs.values())
         else:
             replicas_info = {}
 
-        self._populate_terraform_output_secrets(
-            resource_specs,
-            terraform_output_secrets,
-            self.integration_prefix,
-            replicas_info,
+        # the outputs of an account are formatted and consumed by its specs in
+        # one go, so only the formatted outputs of the accounts in flight are
+        # kept in memory
+        specs_by_account: dict[str, ExternalResourceSpecInventory] = defaultdict(dict)
+        for key, spec in resource_specs.items():
+            specs_by_account[spec.provisioner_name][key] = spec
+        threaded.run(
+            self._populate_account_output_secrets,
+            list(specs_by_account.items()),
+            self.thread_pool_size,
+            replicas_info=replicas_info,
         )
 
+    def _populate_account_output_secrets(
+        self,
+        account_specs: tuple[str, ExternalResourceSpecInventory],
+        replicas_info: Mapping[str, Mapping[str, str]],
+    ) -> None:
+        account, specs = account_specs
+        with self._timed_phase("format_output"):
+            secrets = self.format_output(
+                self.outputs.get(account), self.OUTPUT_TYPE_SECRETS
+            )
+        with self._timed_phase("populate_secrets"):
+            self._populate_terraform_output_secrets(
+                specs, {account: secrets}, self.integration_prefix, replicas_info
+            )
+
     @staticmethod
     def _populate_terraform_output_secrets(
         resource_specs: ExternalResourceSpecInventory,
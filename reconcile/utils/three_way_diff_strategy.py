@@ -123,7 +123,7 @@ def is_valid_change(current: OR, desired: OR, patch: Mapping[str, Any]) -> bool:
 def three_way_diff_using_hash(c_item: OR, d_item: OR) -> bool:
     c_item_sha256 = ""
     try:
-        annotations = c_item.body["metadata"]["annotations"]
+        annotations = c_item.annotations
         c_item_sha256 = annotations["qontract.sha256sum"]
     except KeyError:
         logging.debug("Current object QR hash is missing -> Apply")
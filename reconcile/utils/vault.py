@@ -6,11 +6,17 @@ import os
 import threading
 import time
 from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Self
 
 import hvac
 import requests
 from hvac.exceptions import InvalidPath
+from qontract_utils.secret_reader.cache import (
+    DEFAULT_SECRET_CACHE_MAX_ENTRIES,
+    DEFAULT_SECRET_CACHE_TTL,
+    SecretCache,
+)
 from requests.adapters import HTTPAdapter
 from sretoolbox.utils import retry
 
@@ -22,6 +28,19 @@ if TYPE_CHECKING:
 
 LOG = logging.getLogger(__name__)
 VAULT_AUTO_REFRESH_INTERVAL = int(os.getenv("VAULT_AUTO_REFRESH_INTERVAL") or 600)
+# connections for the default 10 working threads plus 1 for auto refresh,
+# grown to the thread pool size of the integration, see ensure_pool_size
+VAULT_POOL_MAXSIZE = 11
+# encrypted on-disk cache for KV v2 secret versions, shared by all processes
+# using the same directory and key. disabled if not configured.
+VAULT_SECRET_CACHE_DIR = os.getenv("VAULT_SECRET_CACHE_DIR")
+VAULT_SECRET_CACHE_KEY = os.getenv("VAULT_SECRET_CACHE_KEY")
+VAULT_SECRET_CACHE_TTL = int(
+    os.getenv("VAULT_SECRET_CACHE_TTL") or DEFAULT_SECRET_CACHE_TTL
+)
+VAULT_SECRET_CACHE_MAX_ENTRIES = int(
+    os.getenv("VAULT_SECRET_CACHE_MAX_ENTRIES") or DEFAULT_SECRET_CACHE_MAX_ENTRIES
+)
 
 
 class PathAccessForbiddenError(Exception):
@@ -61,13 +80,28 @@ class VaultClient:
     The client caches read requests in-memory if the request is made
     to a versioned KV engine (v2), since that includes both a path
     and a version (no invalidation required).
+    If VAULT_SECRET_CACHE_DIR and VAULT_SECRET_CACHE_KEY are set, KV v2
+    secret versions are additionally cached encrypted on disk, so other
+    processes and runs don't have to read them again.
     """
 
     _instance = None
     _lock = threading.Lock()
+    _secret_cache: SecretCache | None = None
 
     @classmethod
-    def get_instance(cls) -> Self:
+    def get_instance(cls, thread_pool_size: int | None = None) -> Self:
+        """
+        The shared client. With thread_pool_size, its connection pool is
+        grown to serve that many threads concurrently.
+        """
+        instance = cls._get_instance()
+        if thread_pool_size:
+            instance.ensure_pool_size(thread_pool_size)
+        return instance
+
+    @classmethod
+    def _get_instance(cls) -> Self:
         with cls._lock:
             if cls._instance is None:
                 cls._instance = cls()
@@ -122,12 +156,19 @@ class VaultClient:
 
         self._get_mount_version = lru_cache(maxsize=128)(self.__get_mount_version)
         self._read_all_v2 = lru_cache(maxsize=2048)(self.__read_all_v2)
+        if VAULT_SECRET_CACHE_DIR and VAULT_SECRET_CACHE_KEY:
+            self._secret_cache = SecretCache(
+                directory=Path(VAULT_SECRET_CACHE_DIR),
+                key=VAULT_SECRET_CACHE_KEY,
+                ttl=VAULT_SECRET_CACHE_TTL,
+                max_entries=VAULT_SECRET_CACHE_MAX_ENTRIES,
+            )
 
-        session = requests.Session()
-        # There are at most 10 working threads in reconcile, plus 1 daemon thread for auto refresh
-        adapter = HTTPAdapter(pool_maxsize=11)
-        session.mount("https://", adapter)
-        self._client = hvac.Client(url=server, session=session)
+        self._session = requests.Session()
+        self._pool_maxsize = 0
+        self._pool_lock = threading.Lock()
+        self._mount_pool(VAULT_POOL_MAXSIZE)
+        self._client = hvac.Client(url=server, session=self._session)
         self._close_lock = threading.Lock()
         self._closed = False
 
@@ -156,6 +197,21 @@ class VaultClient:
     def __exit__(self, *exc: object) -> None:
         self.close()
 
+    def _mount_pool(self, pool_maxsize: int) -> None:
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=pool_maxsize))
+        self._pool_maxsize = pool_maxsize
+
+    def ensure_pool_size(self, thread_pool_size: int) -> None:
+        """
+        Grows the connection pool to thread_pool_size connections plus one
+        for the auto refresh thread. Connections beyond the pool size are
+        discarded after each request, so a too small pool makes concurrent
+        reads reconnect.
+        """
+        with self._pool_lock:
+            if thread_pool_size + 1 > self._pool_maxsize:
+                self._mount_pool(thread_pool_size + 1)
+
     def close(self) -> None:
         """
         Close the client and release any resources associated with it.
@@ -265,6 +321,52 @@ class VaultClient:
             # ec048ded30d21c13c21cfa950d148c8bfc1467b0/
             # hvac/api/secrets_engines/kv_v2.py#L85
             version = None
+
+        if self._secret_cache is None:
+            return self._read_secret_version(path, mount_point, read_path, version)
+
+        # secret versions are immutable. resolve the latest version via
+        # the secret metadata, which is cheaper than reading the secret.
+        cache_version = (
+            int(version)
+            if version is not None
+            else self._read_current_version(path, mount_point, read_path)
+        )
+        if cache_version is not None:
+            data = self._secret_cache.get(self._client.url, path, cache_version)
+            if data is not None:
+                return data, cache_version
+            version = str(cache_version)
+
+        data, secret_version = self._read_secret_version(
+            path, mount_point, read_path, version
+        )
+        self._secret_cache.set(self._client.url, path, secret_version, data)
+        return data, secret_version
+
+    def _read_current_version(
+        self, path: str, mount_point: str, read_path: str
+    ) -> int | None:
+        """
+        Returns the current version of a KV v2 secret or None if the
+        secret metadata is not readable.
+        """
+        try:
+            metadata = self._client.secrets.kv.v2.read_secret_metadata(
+                mount_point=mount_point,
+                path=read_path,
+            )
+        except InvalidPath:
+            msg = f"version 'None' not found for secret with path '{path}'."
+            raise SecretVersionNotFoundError(msg) from None
+        except hvac.exceptions.Forbidden:
+            LOG.debug(f"metadata of secret '{path}' is not readable, skipping cache")
+            return None
+        return metadata["data"]["current_version"]
+
+    def _read_secret_version(
+        self, path: str, mount_point: str, read_path: str, version: str | None
+    ) -> tuple[dict[str, Any], int]:
         try:
             secret = self._client.secrets.kv.v2.read_secret_version(
                 mount_point=mount_point,
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Self
+
+from pydantic import BaseModel
+
+from reconcile.utils import sharding
+from reconcile.utils.state import State, init_state
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable, Mapping
+
+    from reconcile.utils.secret_reader import SecretReaderBase
+
+STATE_INTEGRATION = "shard-weights"
+DURATIONS_KEY = "durations"
+ASSIGNMENT_KEY = "assignment"
+
+# use the stored shard assignment in sharded (SHARDS > 1) integration runs and
+# record the reconcile durations per shard key
+WEIGHTED_SHARDING = os.environ.get("WEIGHTED_SHARDING") == "true"
+
+# weight of the latest observation in the exponential moving average
+DEFAULT_SMOOTHING = 0.3
+
+# a new assignment becomes active at the start of the next epoch of this
+# length, so all shards switch at the same boundary. should be much longer
+# than an integration run, only runs crossing the boundary overlap.
+WEIGHTED_SHARDING_EPOCH_SECONDS = int(
+    os.environ.get("WEIGHTED_SHARDING_EPOCH_SECONDS", "3600")
+)
+
+
+def current_epoch() -> int:
+    return int(time.time() // WEIGHTED_SHARDING_EPOCH_SECONDS)
+
+
+class ShardAssignment(BaseModel):
+    shards: int
+    assignment: dict[str, int]
+    # the assignment active before the epoch active_from
+    previous: dict[str, int] = {}
+    active_from: int = 0
+
+    def active(self, epoch: int) -> dict[str, int]:
+        return self.assignment if epoch >= self.active_from else self.previous
+
+
+class ShardKeyDurations:
+    """
+    Collects reconcile durations per shard key during an integration run.
+    """
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def measure(self, key: str) -> Generator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            duration = time.monotonic() - start
+            with self._lock:
+                self.durations[key] = self.durations.get(key, 0.0) + duration
+
+    def iterate[T](self, items: Iterable[T], key: Callable[[T], str]) -> Generator[T]:
+        """
+        Yields the items, measuring the loop body processing an item under
+        the shard key of the item.
+        """
+        for item in items:
+            with self.measure(key(item)):
+                yield item
+
+    def clear(self) -> None:
+        with self._lock:
+            self.durations.clear()
+
+
+# durations of the integration running in this process
+shard_key_durations = ShardKeyDurations()
+
+
+class ShardWeights:
+    """
+    Per integration shard key weights and shard assignments stored in the
+    app-interface state.
+
+    <integration>/durations/<shard_id> holds the smoothed reconcile duration
+    per shard key of a shard, <integration>/assignment the balanced
+    key -> shard_id assignment. Every shard only writes its own durations.
+
+    A stored assignment is versioned by the epoch it becomes active in and
+    keeps the assignment it replaces, so every shard uses the same
+    assignment within an epoch no matter when it reads the state.
+    """
+
+    def __init__(self, state: State, integration: str):
+        self.state = state
+        self.integration = integration
+
+    @classmethod
+    def build(
+        cls,
+        integration: str,
+        secret_reader: SecretReaderBase | None = None,
+    ) -> Self:
+        state = init_state(STATE_INTEGRATION, secret_reader)
+        return cls(state, integration)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.cleanup()
+
+    def cleanup(self) -> None:
+        self.state.cleanup()
+
+    def _key(self, name: str) -> str:
+        return f"{self.integration}/{name}"
+
+    def get_weights(self) -> dict[str, float]:
+        """The durations of all shards. Keys which moved shards take the max."""
+        weights: dict[str, float] = {}
+        for durations in self.state.get_all(self._key(DURATIONS_KEY)).values():
+            for key, duration in durations.items():
+                weights[key] = max(weights.get(key, 0.0), duration)
+        return weights
+
+    def record(
+        self,
+        durations: Mapping[str, float],
+        shard_id: int,
+        smoothing: float = DEFAULT_SMOOTHING,
+    ) -> None:
+        """
+        Merge observed durations into the stored durations of shard_id using
+        an exponential moving average. Only the keys observed in this run are
+        kept, keys which moved to another shard are dropped.
+        """
+        if not durations:
+            return
+        key = self._key(f"{DURATIONS_KEY}/{shard_id}")
+        previous = self.state.get(key, {})
+        self.state[key] = {
+            k: smoothing * duration + (1 - smoothing) * previous[k]
+            if k in previous
+            else duration
+            for k, duration in durations.items()
+        }
+
+    def _get_stored(self, shards: int) -> ShardAssignment | None:
+        value = self.state.get(self._key(ASSIGNMENT_KEY), None)
+        if not value:
+            return None
+        stored = ShardAssignment.model_validate(value)
+        if stored.shards != shards:
+            return None
+        return stored
+
+    def get_assignment(self, shards: int, epoch: int | None = None) -> dict[str, int]:
+        """
+        The assignment active in epoch (default: the current one), or an
+        empty one if it was computed for a different number of shards.
+        """
+        stored = self._get_stored(shards)
+        if stored is None:
+            return {}
+        return stored.active(current_epoch() if epoch is None else epoch)
+
+    def plan(self, shards: int, tolerance: float = 0.1) -> dict[str, int]:
+        """
+        Calculate a new balanced assignment, keeping keys on their current
+        shard where possible.
+        """
+        return sharding.balance_shards(
+            self.get_weights(),
+            shards,
+            previous=self.get_assignment(shards),
+            tolerance=tolerance,
+        )
+
+    def set_assignment(self, shards: int, assignment: Mapping[str, int]) -> None:
+        """Store assignment to become active in the next epoch."""
+        epoch = current_epoch()
+        self.state[self._key(ASSIGNMENT_KEY)] = ShardAssignment(
+            shards=shards,
+            assignment=dict(assignment),
+            previous=self.get_assignment(shards, epoch),
+            active_from=epoch + 1,
+        ).model_dump()
+
+    def rebalance(self, shards: int, tolerance: float = 0.1) -> bool:
+        """
+        Store a new balanced assignment if it differs from the active one.
+        Nothing is stored while the last stored assignment is not active yet.
+        """
+        epoch = current_epoch()
+        stored = self._get_stored(shards)
+        if stored is not None and stored.active_from > epoch:
+            return False
+        assignment = self.plan(shards, tolerance=tolerance)
+        if assignment == self.get_assignment(shards, epoch):
+            return False
+        self.set_assignment(shards, assignment)
+        return True
+
+    def activate(self) -> None:
+        """
+        Make is_in_shard use the assignment active in the current epoch for
+        the current SHARDS.
+        """
+        sharding.set_weighted_assignment(self.get_assignment(sharding.SHARDS))
+
+
+@contextlib.contextmanager
+def weighted_sharding(integration: str, record: bool) -> Generator[None]:
+    """
+    Runs the context with the stored shard assignment of integration
+    activated. With record, the shard key durations measured in the context
+    are recorded and shard 0 rebalances the assignment for the next epoch of
+    all shards. No-op unless WEIGHTED_SHARDING is set and SHARDS > 1.
+    """
+    if not (WEIGHTED_SHARDING and sharding.SHARDS > 1):
+        yield
+        return
+    with ShardWeights.build(integration) as shard_weights:
+        shard_weights.activate()
+        shard_key_durations.clear()
+        try:
+            yield
+        finally:
+            sharding.set_weighted_assignment({})
+        if not record:
+            return
+        shard_weights.record(shard_key_durations.durations, sharding.SHARD_ID)
+        if sharding.SHARD_ID == 0 and shard_weights.rebalance(sharding.SHARDS):
+            logging.info(f"rebalanced the shard assignment of {integration}")
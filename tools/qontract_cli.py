@@ -177,8 +177,10 @@ from reconcile.utils.secret_reader import (
     create_secret_reader,
 )
 from reconcile.utils.semver_helper import parse_semver
+from reconcile.utils.sharding import shard_for_key, shard_loads
 from reconcile.utils.state import init_state
 from reconcile.utils.terraform_client import TerraformClient as Terraform
+from reconcile.utils.weighted_sharding import ShardWeights
 from tools.cli_commands.cost_report.aws import AwsCostReportCommand
 from tools.cli_commands.cost_report.openshift import OpenShiftCostReportCommand
 from tools.cli_commands.cost_report.openshift_cost_optimization import (
@@ -3450,6 +3452,58 @@ def rm(ctx: click.Context, integration: str, key: str) -> None:
     state.rm(key)
 
 
+@state.command()
+@click.argument("integration")
+@click.option("--shards", help="number of shards", required=True, type=int)
+@click.option(
+    "--tolerance",
+    help="allowed load above the average shard load before keys are moved",
+    default=0.1,
+    type=float,
+)
+@click.option(
+    "--apply",
+    help="store the balanced assignment, active from the next sharding epoch",
+    is_flag=True,
+    default=False,
+)
+@click.pass_context
+def shard_weights(
+    ctx: click.Context, integration: str, shards: int, tolerance: float, apply: bool
+) -> None:
+    """Simulate the expected per shard load of weighted sharding."""
+    with ShardWeights.build(integration) as shard_weights:
+        weights = shard_weights.get_weights()
+        assignment = shard_weights.plan(shards, tolerance=tolerance)
+        current = shard_weights.get_assignment(shards)
+        md5_loads = shard_loads(weights, shards)
+        current_loads = shard_loads(weights, shards, current)
+        weighted_loads = shard_loads(weights, shards, assignment)
+        moved = sum(
+            1
+            for k, s in assignment.items()
+            if s != current.get(k, shard_for_key(k, shards))
+        )
+        results = [
+            {
+                "shard": s,
+                "keys": sum(1 for v in assignment.values() if v == s),
+                "md5": round(md5_loads[s], 2),
+                "current": round(current_loads[s], 2),
+                "weighted": round(weighted_loads[s], 2),
+            }
+            for s in range(shards)
+        ]
+        print_output(
+            {"output": "table", "sort": False},
+            results,
+            ["shard", "keys", "md5", "current", "weighted"],
+        )
+        print(f"keys moving to another shard: {moved}")
+        if apply:
+            shard_weights.set_assignment(shards, assignment)
+
+
 @root.group()
 @environ(["APP_INTERFACE_STATE_BUCKET"])
 @click.pass_context
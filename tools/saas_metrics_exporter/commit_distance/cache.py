@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import re
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from reconcile.utils.state import State
+
+STATE_KEY = "commit-distances"
+
+COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
+# repo_url -> from_sha -> to_sha -> distance
+Distances = dict[str, dict[str, dict[str, int]]]
+
+
+def is_commit_sha(ref: str) -> bool:
+    return bool(COMMIT_SHA_RE.match(ref))
+
+
+class CommitDistanceCache:
+    """
+    Cache for commit distances between two commit SHAs.
+
+    The distance between two fixed SHAs never changes, so cached distances
+    never expire. The cache is stored as a single document in the state and
+    only keeps the distances used in the latest run, which prunes entries of
+    SHAs that are not referenced anymore.
+    """
+
+    def __init__(self, state: State) -> None:
+        self._state = state
+        self._previous: Distances = state.get(STATE_KEY, {})
+        self._current: Distances = {}
+        self._lock = threading.Lock()
+
+    def get(self, repo_url: str, ref_from: str, ref_to: str) -> int | None:
+        distance = self._previous.get(repo_url, {}).get(ref_from, {}).get(ref_to)
+        if distance is not None:
+            self.set(repo_url, ref_from, ref_to, distance)
+        return distance
+
+    def set(self, repo_url: str, ref_from: str, ref_to: str, distance: int) -> None:
+        with self._lock:
+            self._current.setdefault(repo_url, {}).setdefault(ref_from, {})[ref_to] = (
+                distance
+            )
+
+    def persist(self) -> None:
+        if self._current != self._previous:
+            self._state[STATE_KEY] = self._current
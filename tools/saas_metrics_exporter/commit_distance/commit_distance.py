@@ -6,6 +6,10 @@ from typing import TYPE_CHECKING
 from sretoolbox.utils import threaded
 
 from reconcile.utils.secret_reader import HasSecret
+from tools.saas_metrics_exporter.commit_distance.cache import (
+    CommitDistanceCache,
+    is_commit_sha,
+)
 from tools.saas_metrics_exporter.commit_distance.channel import (
     SaasTarget,
     build_channels,
@@ -34,20 +38,35 @@ class DistanceKey:
 
 
 class CommitDistanceFetcher:
-    def __init__(self, vcs: VCS):
+    def __init__(self, vcs: VCS, cache: CommitDistanceCache | None = None):
         self._vcs = vcs
+        self._cache = cache
 
-    def _calculate_commit_distance(self, key: DistanceKey) -> tuple[DistanceKey, int]:
-        if key.ref_from == key.ref_to:
-            return key, 0
-
+    def _count_commits_between(
+        self, key: DistanceKey, ref_from: str, ref_to: str
+    ) -> int:
         commits = self._vcs.get_commits_between(
             repo_url=key.repo_url,
             auth_code=key.auth_code,
-            commit_from=key.ref_from,
-            commit_to=key.ref_to,
+            commit_from=ref_from,
+            commit_to=ref_to,
         )
-        return key, len(commits)
+        return len(commits)
+
+    def _calculate_commit_distance(self, key: DistanceKey) -> tuple[DistanceKey, int]:
+        if key.ref_from == key.ref_to:
+            return key, 0
+
+        if not (
+            self._cache and is_commit_sha(key.ref_from) and is_commit_sha(key.ref_to)
+        ):
+            return key, self._count_commits_between(key, key.ref_from, key.ref_to)
+
+        distance = self._cache.get(key.repo_url, key.ref_from, key.ref_to)
+        if distance is None:
+            distance = self._count_commits_between(key, key.ref_from, key.ref_to)
+        self._cache.set(key.repo_url, key.ref_from, key.ref_to, distance)
+        return key, distance
 
     @staticmethod
     def _build_distance_key(
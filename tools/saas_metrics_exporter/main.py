@@ -20,7 +20,9 @@ from reconcile.utils import metrics
 from reconcile.utils.defer import defer
 from reconcile.utils.runtime.environment import init_env
 from reconcile.utils.secret_reader import create_secret_reader
+from reconcile.utils.state import State, init_state
 from reconcile.utils.vcs import VCS
+from tools.saas_metrics_exporter.commit_distance.cache import CommitDistanceCache
 from tools.saas_metrics_exporter.commit_distance.commit_distance import (
     CommitDistanceFetcher,
 )
@@ -28,6 +30,8 @@ from tools.saas_metrics_exporter.commit_distance.commit_distance import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+QONTRACT_INTEGRATION = "saas-metrics-exporter"
+
 
 class SaasMetricsExporter:
     """
@@ -36,12 +40,15 @@ class SaasMetricsExporter:
     Note, that by design we store metrics exporters as a tool in the tools directory.
     """
 
-    def __init__(self, vcs: VCS, dry_run: bool) -> None:
+    def __init__(self, vcs: VCS, dry_run: bool, state: State | None = None) -> None:
         self._vcs = vcs
         self._dry_run = dry_run
+        self._state = state
 
     @staticmethod
-    def create(dry_run: bool) -> SaasMetricsExporter:
+    def create(
+        dry_run: bool, use_commit_distance_cache: bool = False
+    ) -> SaasMetricsExporter:
         vault_settings = get_app_interface_vault_settings()
         secret_reader = create_secret_reader(use_vault=vault_settings.vault)
         vcs = VCS(
@@ -51,7 +58,12 @@ class SaasMetricsExporter:
             app_interface_repo_url=get_app_interface_repo_url(),
             dry_run=dry_run,
         )
-        return SaasMetricsExporter(vcs=vcs, dry_run=dry_run)
+        state = (
+            init_state(integration=QONTRACT_INTEGRATION, secret_reader=secret_reader)
+            if use_commit_distance_cache
+            else None
+        )
+        return SaasMetricsExporter(vcs=vcs, dry_run=dry_run, state=state)
 
     @defer
     def run(
@@ -65,10 +77,18 @@ class SaasMetricsExporter:
         if defer:
             defer(self._vcs.cleanup)
 
-        commit_distance_fetcher = CommitDistanceFetcher(vcs=self._vcs)
+        cache = None
+        if self._state:
+            if defer:
+                defer(self._state.cleanup)
+            cache = CommitDistanceCache(state=self._state)
+
+        commit_distance_fetcher = CommitDistanceFetcher(vcs=self._vcs, cache=cache)
         commit_distance_metrics = commit_distance_fetcher.fetch(
             saas_files=saas_files, thread_pool_size=thread_pool_size
         )
+        if cache and not self._dry_run:
+            cache.persist()
         for m in commit_distance_metrics:
             metrics.set_gauge(
                 metric=m.metric,
@@ -80,6 +100,11 @@ class SaasMetricsExporter:
 @click.option("--env-name", default=None, help="environment to filter saas files by")
 @click.option("--app-name", default=None, help="app to filter saas files by")
 @click.option("--thread-pool-size", default=1, help="threadpool size")
+@click.option(
+    "--use-commit-distance-cache/--no-use-commit-distance-cache",
+    default=False,
+    help="cache commit distances between commit SHAs in the app-interface state",
+)
 @dry_run
 @config_file
 @log_level
@@ -88,11 +113,14 @@ def main(
     app_name: str | None,
     dry_run: bool,
     thread_pool_size: int,
+    use_commit_distance_cache: bool,
     configfile: str,
     log_level: str | None,
 ) -> None:
     init_env(log_level=log_level, config_file=configfile)
-    exporter = SaasMetricsExporter.create(dry_run=dry_run)
+    exporter = SaasMetricsExporter.create(
+        dry_run=dry_run, use_commit_distance_cache=use_commit_distance_cache
+    )
     exporter.run(
         env_name=env_name, app_name=app_name, thread_pool_size=thread_pool_size
     )
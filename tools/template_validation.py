@@ -8,8 +8,13 @@ from yamllint import linter
 from yamllint.config import YamlLintConfig
 
 from reconcile.gql_definitions.templating.templates import TemplateV1
-from reconcile.templating.validator import TemplateDiff, TemplateValidatorIntegration
+from reconcile.templating.validator import (
+    TemplateDiff,
+    TemplateValidatorIntegration,
+    is_static,
+)
 from reconcile.utils.models import data_default_none
+from reconcile.utils.render_cache import RenderCache, init_render_cache
 
 
 def load_clean_yaml(path: str) -> dict:
@@ -55,6 +60,9 @@ def print_test_diffs(diffs: list[TemplateDiff]) -> None:
     nargs=-1,
 )
 def main(templates: tuple[str]) -> None:
+    render_cache = init_render_cache("template-validation")
+    with open(".yamllint", encoding="utf-8") as f:
+        yamllint_config = f.read()
     for template_path in templates:
         okay = True
         template_raw = load_clean_yaml(template_path)
@@ -73,8 +81,13 @@ def main(templates: tuple[str]) -> None:
 
         # templates_to_validate = {}
         for test in template.template_test:
+            digest = RenderCache.digest(template, test, yamllint_config)
+            if render_cache.passed(digest):
+                print("Skipping unchanged test:", test.name)
+                continue
             ruaml_instance = create_ruamel_instance(explicit_start=True)
             diffs: list[TemplateDiff] = []
+            lint_problems: list[linter.LintProblem] = []
             print("Running tests:", test.name)
             diffs.extend(
                 TemplateValidatorIntegration.validate_template(
@@ -88,7 +101,7 @@ def main(templates: tuple[str]) -> None:
             if renderer.render_condition():
                 output = renderer.render_output()
                 lint_problems = list(
-                    linter.run(output, YamlLintConfig(file=".yamllint"), "")
+                    linter.run(output, YamlLintConfig(yamllint_config), "")
                 )
                 if lint_problems:
                     okay = False
@@ -98,6 +111,9 @@ def main(templates: tuple[str]) -> None:
                 okay = False
                 print_test_diffs(diffs)
 
+            if not diffs and not lint_problems and is_static(template):
+                render_cache.record_passed(digest)
+
     if okay:
         print("... passed")
         sys.exit(0)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import create_autospec
+
+from reconcile.utils.state import State
+from reconcile.utils.vcs import VCS
+from tools.saas_metrics_exporter.commit_distance.cache import (
+    STATE_KEY,
+    CommitDistanceCache,
+    is_commit_sha,
+)
+from tools.saas_metrics_exporter.commit_distance.commit_distance import (
+    CommitDistanceFetcher,
+    DistanceKey,
+)
+
+REPO = "https://github.com/org/repo"
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+SHA_C = "c" * 40
+
+
+def build_state(data: dict[str, Any]) -> State:
+    state = create_autospec(spec=State)
+    state.get.side_effect = data.get
+    return state
+
+
+def build_vcs(distances: dict[tuple[str, str], int]) -> VCS:
+    vcs = create_autospec(spec=VCS)
+    vcs.get_commits_between.side_effect = lambda **kwargs: (
+        [1] * distances[kwargs["commit_from"], kwargs["commit_to"]]
+    )
+    return vcs
+
+
+def test_is_commit_sha() -> None:
+    assert is_commit_sha(SHA_A)
+    assert not is_commit_sha("main")
+
+
+def test_cache_hit_does_not_call_vcs() -> None:
+    state = build_state({STATE_KEY: {REPO: {SHA_A: {SHA_B: 3}}}})
+    vcs = build_vcs({})
+    cache = CommitDistanceCache(state=state)
+    fetcher = CommitDistanceFetcher(vcs=vcs, cache=cache)
+
+    key = DistanceKey(repo_url=REPO, auth_code=None, ref_from=SHA_A, ref_to=SHA_B)
+    assert fetcher._calculate_commit_distance(key) == (key, 3)
+
+    vcs.get_commits_between.assert_not_called()
+    cache.persist()
+    state.__setitem__.assert_not_called()
+
+
+def test_distance_of_moved_head_is_counted() -> None:
+    state = build_state({STATE_KEY: {REPO: {SHA_A: {SHA_B: 3}}}})
+    vcs = build_vcs({(SHA_A, SHA_C): 1})
+    cache = CommitDistanceCache(state=state)
+    fetcher = CommitDistanceFetcher(vcs=vcs, cache=cache)
+
+    key = DistanceKey(repo_url=REPO, auth_code=None, ref_from=SHA_A, ref_to=SHA_C)
+    assert fetcher._calculate_commit_distance(key) == (key, 1)
+
+    cache.persist()
+    state.__setitem__.assert_called_once_with(STATE_KEY, {REPO: {SHA_A: {SHA_C: 1}}})
+
+
+def test_branch_refs_are_not_cached() -> None:
+    state = build_state({})
+    vcs = build_vcs({(SHA_A, "main"): 4})
+    cache = CommitDistanceCache(state=state)
+    fetcher = CommitDistanceFetcher(vcs=vcs, cache=cache)
+
+    key = DistanceKey(repo_url=REPO, auth_code=None, ref_from=SHA_A, ref_to="main")
+    assert fetcher._calculate_commit_distance(key) == (key, 4)
+
+    cache.persist()
+    state.__setitem__.assert_not_called()